@@ -485,7 +485,7 @@ across_aspect
     ;
 
 actual_designator
-    : expression
+    : expression (direction simple_expression)? // the direction is for the slices of name_part
     | OPEN
     ;
 
@@ -493,9 +493,17 @@ actual_parameter_part
     : association_list
     ;
 
+// was
+//   actual_part
+//     : name LPAREN actual_designator RPAREN
+//     | actual_designator
+//     ;
+// the conversion function call is also an actual_designator (expression -> primary -> name),
+// SLL prediction took the first alternative for every call argument and then failed on the
+// name swallowing the parenthesis, e.g. in to_integer(unsigned(a))
+
 actual_part
-    : name LPAREN actual_designator RPAREN
-    | actual_designator
+    : actual_designator
     ;
 
 adding_operator
@@ -857,7 +865,7 @@ element_subtype_definition
     ;
 
 entity_aspect
-    : ENTITY name (LPAREN identifier RPAREN)?
+    : ENTITY name // was ENTITY name (LPAREN identifier RPAREN)?, the architecture is a name_part
     | CONFIGURATION name
     | OPEN
     ;
@@ -1089,7 +1097,7 @@ index_subtype_definition
 
 instantiated_unit
     : (COMPONENT)? name
-    | ENTITY name ( LPAREN identifier RPAREN)?
+    | ENTITY name // was ENTITY name ( LPAREN identifier RPAREN)?, the architecture is a name_part
     | CONFIGURATION name
     ;
 
@@ -1233,8 +1241,7 @@ name
 
 name_part
     : selected_name_part
-    | function_call_or_indexed_name_part
-    | slice_name_part
+    | function_call_or_indexed_name_part // also the slices, was | slice_name_part
     | attribute_name_part
     ;
 
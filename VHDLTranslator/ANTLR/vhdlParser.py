@@ -1,4 +1,4 @@
-# Generated from vhdl.g4 by ANTLR 4.10
+# Generated from vhdl.g4 by ANTLR 4.13.2
 # encoding: utf-8
 from antlr4 import *
 from io import StringIO
@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,1,162,2599,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
+        4,1,162,2585,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
         7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,
         13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,
         20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,
@@ -54,1046 +54,1040 @@ def serializedATN():
         7,241,2,242,7,242,2,243,7,243,2,244,7,244,2,245,7,245,2,246,7,246,
         2,247,7,247,2,248,7,248,2,249,7,249,2,250,7,250,2,251,7,251,2,252,
         7,252,2,253,7,253,2,254,7,254,1,0,1,0,1,1,1,1,1,1,1,2,1,2,3,2,518,
-        8,2,1,2,1,2,3,2,522,8,2,1,2,1,2,1,3,1,3,3,3,528,8,3,1,4,1,4,1,5,
-        1,5,1,5,1,5,1,5,1,5,3,5,538,8,5,1,6,1,6,1,7,1,7,1,7,1,7,5,7,546,
-        8,7,10,7,12,7,549,9,7,1,7,1,7,1,8,1,8,1,8,1,8,3,8,557,8,8,1,8,1,
-        8,1,8,3,8,562,8,8,1,8,1,8,1,9,1,9,1,9,3,9,569,8,9,1,10,1,10,3,10,
-        573,8,10,1,11,1,11,1,11,3,11,578,8,11,1,12,1,12,1,12,1,12,1,12,1,
-        12,1,12,1,12,1,12,1,12,3,12,590,8,12,1,12,3,12,593,8,12,1,12,1,12,
-        1,13,5,13,598,8,13,10,13,12,13,601,9,13,1,14,1,14,1,14,3,14,606,
-        8,14,1,14,1,14,3,14,610,8,14,1,14,1,14,3,14,614,8,14,1,14,3,14,617,
-        8,14,1,14,1,14,1,14,1,14,1,14,3,14,624,8,14,1,15,5,15,627,8,15,10,
-        15,12,15,630,9,15,1,16,1,16,3,16,634,8,16,1,17,1,17,3,17,638,8,17,
-        1,18,1,18,1,18,1,18,3,18,644,8,18,1,18,1,18,3,18,648,8,18,1,19,3,
-        19,651,8,19,1,19,1,19,1,19,1,20,1,20,1,20,3,20,659,8,20,1,20,1,20,
-        1,21,1,21,1,21,5,21,666,8,21,10,21,12,21,669,9,21,1,22,1,22,1,22,
-        1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,3,23,683,8,23,1,24,
+        8,2,1,2,1,2,3,2,522,8,2,1,2,1,2,1,3,1,3,1,3,1,3,3,3,530,8,3,1,3,
+        3,3,533,8,3,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,7,1,7,5,7,545,8,7,
+        10,7,12,7,548,9,7,1,7,1,7,1,8,1,8,1,8,1,8,3,8,556,8,8,1,8,1,8,1,
+        8,3,8,561,8,8,1,8,1,8,1,9,1,9,1,9,3,9,568,8,9,1,10,1,10,3,10,572,
+        8,10,1,11,1,11,1,11,3,11,577,8,11,1,12,1,12,1,12,1,12,1,12,1,12,
+        1,12,1,12,1,12,1,12,3,12,589,8,12,1,12,3,12,592,8,12,1,12,1,12,1,
+        13,5,13,597,8,13,10,13,12,13,600,9,13,1,14,1,14,1,14,3,14,605,8,
+        14,1,14,1,14,3,14,609,8,14,1,14,1,14,3,14,613,8,14,1,14,3,14,616,
+        8,14,1,14,1,14,1,14,1,14,1,14,3,14,623,8,14,1,15,5,15,626,8,15,10,
+        15,12,15,629,9,15,1,16,1,16,3,16,633,8,16,1,17,1,17,3,17,637,8,17,
+        1,18,1,18,1,18,1,18,3,18,643,8,18,1,18,1,18,3,18,647,8,18,1,19,3,
+        19,650,8,19,1,19,1,19,1,19,1,20,1,20,1,20,3,20,658,8,20,1,20,1,20,
+        1,21,1,21,1,21,5,21,665,8,21,10,21,12,21,668,9,21,1,22,1,22,1,22,
+        1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,3,23,682,8,23,1,24,
         1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,26,1,26,3,26,
-        698,8,26,1,26,3,26,701,8,26,1,26,3,26,704,8,26,1,27,1,27,1,27,5,
-        27,709,8,27,10,27,12,27,712,9,27,1,27,5,27,715,8,27,10,27,12,27,
-        718,9,27,1,27,1,27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        697,8,26,1,26,3,26,700,8,26,1,26,3,26,703,8,26,1,27,1,27,1,27,5,
+        27,708,8,27,10,27,12,27,711,9,27,1,27,5,27,714,8,27,10,27,12,27,
+        717,9,27,1,27,1,27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
         1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
-        1,28,1,28,3,28,746,8,28,1,29,5,29,749,8,29,10,29,12,29,752,9,29,
-        1,30,1,30,1,30,1,30,3,30,758,8,30,3,30,760,8,30,1,30,1,30,1,30,1,
-        30,3,30,766,8,30,3,30,768,8,30,1,31,1,31,1,31,1,31,1,31,3,31,775,
-        8,31,1,31,3,31,778,8,31,1,32,1,32,1,32,1,32,1,32,1,32,3,32,786,8,
-        32,1,32,3,32,789,8,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,798,
-        8,32,1,32,1,32,1,33,5,33,803,8,33,10,33,12,33,806,9,33,1,34,1,34,
-        3,34,810,8,34,1,34,3,34,813,8,34,1,34,1,34,1,34,1,35,3,35,819,8,
-        35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,5,36,828,8,36,10,36,12,36,
-        831,9,36,1,37,1,37,1,37,1,37,1,38,3,38,838,8,38,1,38,1,38,3,38,842,
-        8,38,1,38,1,38,3,38,846,8,38,1,38,1,38,1,39,3,39,851,8,39,1,39,1,
-        39,1,39,1,39,4,39,857,8,39,11,39,12,39,858,1,39,1,39,1,39,3,39,864,
+        1,28,1,28,3,28,745,8,28,1,29,5,29,748,8,29,10,29,12,29,751,9,29,
+        1,30,1,30,1,30,1,30,3,30,757,8,30,3,30,759,8,30,1,30,1,30,1,30,1,
+        30,3,30,765,8,30,3,30,767,8,30,1,31,1,31,1,31,1,31,1,31,3,31,774,
+        8,31,1,31,3,31,777,8,31,1,32,1,32,1,32,1,32,1,32,1,32,3,32,785,8,
+        32,1,32,3,32,788,8,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,797,
+        8,32,1,32,1,32,1,33,5,33,802,8,33,10,33,12,33,805,9,33,1,34,1,34,
+        3,34,809,8,34,1,34,3,34,812,8,34,1,34,1,34,1,34,1,35,3,35,818,8,
+        35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,5,36,827,8,36,10,36,12,36,
+        830,9,36,1,37,1,37,1,37,1,37,1,38,3,38,837,8,38,1,38,1,38,3,38,841,
+        8,38,1,38,1,38,3,38,845,8,38,1,38,1,38,1,39,3,39,850,8,39,1,39,1,
+        39,1,39,1,39,4,39,856,8,39,11,39,12,39,857,1,39,1,39,1,39,3,39,863,
         8,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,3,41,
-        877,8,41,1,42,1,42,1,42,5,42,882,8,42,10,42,12,42,885,9,42,1,43,
-        1,43,1,43,1,43,1,43,3,43,892,8,43,1,43,3,43,895,8,43,1,43,1,43,1,
-        43,1,43,1,44,1,44,1,44,3,44,904,8,44,1,44,3,44,907,8,44,1,44,3,44,
-        910,8,44,1,44,1,44,1,44,3,44,915,8,44,1,44,1,44,1,45,1,45,1,45,3,
-        45,922,8,45,1,45,3,45,925,8,45,1,45,1,45,1,46,1,46,1,46,1,46,1,47,
-        1,47,3,47,935,8,47,1,48,1,48,3,48,939,8,48,1,49,3,49,942,8,49,1,
-        49,3,49,945,8,49,1,49,1,49,1,49,1,50,3,50,951,8,50,1,50,1,50,3,50,
-        955,8,50,1,50,3,50,958,8,50,1,50,1,50,3,50,962,8,50,1,50,1,50,1,
-        51,3,51,967,8,51,1,51,3,51,970,8,51,1,51,1,51,1,51,1,52,3,52,976,
-        8,52,1,52,3,52,979,8,52,1,52,1,52,3,52,983,8,52,1,53,1,53,1,54,1,
+        876,8,41,1,42,1,42,1,42,5,42,881,8,42,10,42,12,42,884,9,42,1,43,
+        1,43,1,43,1,43,1,43,3,43,891,8,43,1,43,3,43,894,8,43,1,43,1,43,1,
+        43,1,43,1,44,1,44,1,44,3,44,903,8,44,1,44,3,44,906,8,44,1,44,3,44,
+        909,8,44,1,44,1,44,1,44,3,44,914,8,44,1,44,1,44,1,45,1,45,1,45,3,
+        45,921,8,45,1,45,3,45,924,8,45,1,45,1,45,1,46,1,46,1,46,1,46,1,47,
+        1,47,3,47,934,8,47,1,48,1,48,3,48,938,8,48,1,49,3,49,941,8,49,1,
+        49,3,49,944,8,49,1,49,1,49,1,49,1,50,3,50,950,8,50,1,50,1,50,3,50,
+        954,8,50,1,50,3,50,957,8,50,1,50,1,50,3,50,961,8,50,1,50,1,50,1,
+        51,3,51,966,8,51,1,51,3,51,969,8,51,1,51,1,51,1,51,1,52,3,52,975,
+        8,52,1,52,3,52,978,8,52,1,52,1,52,3,52,982,8,52,1,53,1,53,1,54,1,
         54,1,54,1,55,1,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,3,
-        56,1001,8,56,3,56,1003,8,56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,
-        57,1,57,3,57,1014,8,57,1,57,3,57,1017,8,57,1,57,1,57,1,58,1,58,1,
-        58,3,58,1024,8,58,1,59,5,59,1027,8,59,10,59,12,59,1030,9,59,1,60,
-        1,60,3,60,1034,8,60,1,61,1,61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,
-        1,62,1,62,3,62,1047,8,62,1,62,1,62,1,63,1,63,1,63,1,63,1,63,1,64,
-        1,64,1,64,1,64,1,64,1,65,1,65,3,65,1063,8,65,1,66,5,66,1066,8,66,
-        10,66,12,66,1069,9,66,1,67,1,67,3,67,1073,8,67,1,68,1,68,1,68,3,
-        68,1078,8,68,1,68,3,68,1081,8,68,1,69,5,69,1084,8,69,10,69,12,69,
-        1087,9,69,1,69,1,69,1,70,1,70,1,70,1,71,1,71,3,71,1096,8,71,1,72,
-        1,72,1,73,1,73,1,73,1,73,1,73,1,73,1,74,1,74,3,74,1108,8,74,1,75,
-        1,75,1,75,3,75,1113,8,75,1,75,1,75,1,76,1,76,1,76,1,76,1,76,1,77,
-        1,77,1,78,1,78,1,79,1,79,1,79,1,79,1,79,1,79,3,79,1132,8,79,1,79,
-        1,79,1,79,3,79,1137,8,79,1,80,1,80,1,81,1,81,3,81,1143,8,81,1,82,
-        1,82,1,82,5,82,1148,8,82,10,82,12,82,1151,9,82,1,83,1,83,1,83,1,
-        83,1,83,1,83,1,83,3,83,1160,8,83,1,83,1,83,3,83,1164,8,83,1,83,3,
-        83,1167,8,83,1,83,1,83,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,
-        84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,3,84,1191,
-        8,84,1,85,5,85,1194,8,85,10,85,12,85,1197,9,85,1,86,1,86,3,86,1201,
-        8,86,1,87,3,87,1204,8,87,1,87,3,87,1207,8,87,1,88,1,88,1,88,5,88,
-        1212,8,88,10,88,12,88,1215,9,88,1,88,1,88,3,88,1219,8,88,1,89,1,
-        89,1,89,1,89,1,90,1,90,1,90,3,90,1228,8,90,1,91,5,91,1231,8,91,10,
-        91,12,91,1234,9,91,1,92,1,92,1,92,3,92,1239,8,92,1,93,1,93,3,93,
-        1243,8,93,1,94,1,94,1,94,1,94,5,94,1249,8,94,10,94,12,94,1252,9,
-        94,1,94,1,94,1,95,3,95,1257,8,95,1,95,1,95,3,95,1261,8,95,1,95,1,
-        95,3,95,1265,8,95,1,95,1,95,1,96,1,96,1,96,1,96,5,96,1273,8,96,10,
-        96,12,96,1276,9,96,1,97,1,97,1,97,3,97,1281,8,97,1,97,1,97,1,97,
-        1,97,3,97,1287,8,97,1,98,1,98,1,98,1,98,1,98,3,98,1294,8,98,1,98,
-        1,98,1,99,1,99,1,100,1,100,3,100,1302,8,100,1,100,1,100,1,100,1,
-        101,1,101,1,101,1,101,1,102,1,102,1,103,1,103,1,103,1,103,1,103,
-        1,103,3,103,1319,8,103,1,104,1,104,1,104,1,104,1,104,1,104,3,104,
-        1327,8,104,1,104,1,104,1,105,1,105,1,105,1,105,5,105,1335,8,105,
-        10,105,12,105,1338,9,105,1,105,3,105,1341,8,105,1,105,5,105,1344,
-        8,105,10,105,12,105,1347,9,105,1,105,1,105,1,105,3,105,1352,8,105,
-        1,105,1,105,1,106,1,106,1,106,1,106,3,106,1360,8,106,1,107,1,107,
-        1,107,1,107,1,107,1,107,1,108,1,108,1,108,5,108,1371,8,108,10,108,
-        12,108,1374,9,108,1,109,1,109,1,109,1,109,1,109,1,109,1,110,1,110,
-        3,110,1384,8,110,1,111,1,111,1,111,5,111,1389,8,111,10,111,12,111,
-        1392,9,111,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,113,
-        1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,114,1,114,1,114,1,114,
-        1,115,1,115,1,116,1,116,1,116,5,116,1419,8,116,10,116,12,116,1422,
-        9,116,1,117,3,117,1425,8,117,1,117,1,117,1,117,1,117,1,117,1,117,
-        1,117,1,117,1,117,5,117,1436,8,117,10,117,12,117,1439,9,117,1,117,
-        1,117,3,117,1443,8,117,1,117,1,117,1,117,3,117,1448,8,117,1,117,
-        1,117,1,118,1,118,1,118,1,118,5,118,1456,8,118,10,118,12,118,1459,
-        9,118,1,118,1,118,1,119,1,119,3,119,1465,8,119,1,120,1,120,1,120,
-        1,120,1,121,3,121,1472,8,121,1,121,1,121,1,121,1,121,1,121,1,121,
-        1,121,3,121,1481,8,121,1,121,1,121,3,121,1485,8,121,1,122,1,122,
-        1,122,5,122,1490,8,122,10,122,12,122,1493,9,122,1,122,1,122,3,122,
-        1497,8,122,1,123,3,123,1500,8,123,1,123,1,123,1,123,3,123,1505,8,
-        123,1,123,1,123,1,123,3,123,1510,8,123,1,124,1,124,1,124,1,124,1,
-        124,1,124,3,124,1518,8,124,1,125,1,125,1,126,1,126,1,126,1,126,1,
-        126,1,127,1,127,1,127,5,127,1530,8,127,10,127,12,127,1533,9,127,
-        1,128,1,128,1,128,5,128,1538,8,128,10,128,12,128,1541,9,128,1,129,
-        1,129,1,129,5,129,1546,8,129,10,129,12,129,1549,9,129,1,130,1,130,
-        1,130,1,130,3,130,1555,8,130,1,130,1,130,1,130,3,130,1560,8,130,
-        1,131,1,131,1,131,3,131,1565,8,131,1,131,1,131,3,131,1569,8,131,
-        1,131,1,131,3,131,1573,8,131,1,132,1,132,1,132,1,132,3,132,1579,
-        8,132,1,132,1,132,3,132,1583,8,132,1,132,1,132,3,132,1587,8,132,
-        1,133,1,133,1,133,1,133,1,133,1,134,3,134,1595,8,134,1,134,1,134,
-        1,134,3,134,1600,8,134,1,134,1,134,1,134,3,134,1605,8,134,1,135,
-        1,135,1,135,1,135,3,135,1611,8,135,1,136,1,136,1,136,1,137,1,137,
-        1,137,1,137,1,138,1,138,3,138,1622,8,138,1,139,1,139,1,139,1,139,
-        1,139,3,139,1629,8,139,1,140,1,140,1,141,1,141,1,141,5,141,1636,
-        8,141,10,141,12,141,1639,9,141,1,142,1,142,1,143,3,143,1644,8,143,
-        1,143,3,143,1647,8,143,1,143,1,143,1,143,1,143,1,143,3,143,1654,
-        8,143,1,143,1,143,1,144,1,144,1,145,1,145,1,146,1,146,3,146,1664,
-        8,146,1,146,5,146,1667,8,146,10,146,12,146,1670,9,146,1,147,1,147,
-        1,147,1,147,3,147,1676,8,147,1,148,1,148,1,148,5,148,1681,8,148,
-        10,148,12,148,1684,9,148,1,149,1,149,4,149,1688,8,149,11,149,12,
-        149,1689,1,150,1,150,1,150,1,150,1,151,1,151,1,151,1,151,1,152,3,
-        152,1701,8,152,1,152,1,152,1,152,1,152,1,152,1,152,3,152,1709,8,
-        152,1,153,1,153,1,153,1,153,1,153,1,153,1,154,1,154,3,154,1719,8,
-        154,1,155,1,155,1,155,1,155,1,156,3,156,1726,8,156,1,156,1,156,3,
-        156,1730,8,156,1,156,1,156,3,156,1734,8,156,1,156,1,156,1,157,1,
-        157,3,157,1740,8,157,1,158,1,158,1,158,1,158,1,158,1,158,3,158,1748,
-        8,158,1,159,3,159,1751,8,159,1,159,3,159,1754,8,159,1,160,1,160,
-        1,160,1,160,1,160,1,160,1,160,1,160,3,160,1764,8,160,1,160,3,160,
-        1767,8,160,1,160,1,160,1,161,1,161,1,161,1,161,1,161,1,161,1,161,
-        1,161,1,161,1,161,1,161,3,161,1782,8,161,1,162,5,162,1785,8,162,
-        10,162,12,162,1788,9,162,1,163,1,163,1,163,1,163,1,163,1,163,3,163,
-        1796,8,163,1,163,3,163,1799,8,163,1,163,1,163,1,164,1,164,1,164,
+        56,1000,8,56,3,56,1002,8,56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,
+        57,1,57,3,57,1013,8,57,1,57,3,57,1016,8,57,1,57,1,57,1,58,1,58,1,
+        58,3,58,1023,8,58,1,59,5,59,1026,8,59,10,59,12,59,1029,9,59,1,60,
+        1,60,3,60,1033,8,60,1,61,1,61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,
+        1,62,1,62,3,62,1046,8,62,1,62,1,62,1,63,1,63,1,63,1,63,1,63,1,64,
+        1,64,1,64,1,64,1,64,1,65,1,65,3,65,1062,8,65,1,66,5,66,1065,8,66,
+        10,66,12,66,1068,9,66,1,67,1,67,3,67,1072,8,67,1,68,1,68,1,68,3,
+        68,1077,8,68,1,68,3,68,1080,8,68,1,69,5,69,1083,8,69,10,69,12,69,
+        1086,9,69,1,69,1,69,1,70,1,70,1,70,1,71,1,71,3,71,1095,8,71,1,72,
+        1,72,1,73,1,73,1,73,1,73,1,73,1,73,1,74,1,74,3,74,1107,8,74,1,75,
+        1,75,1,75,3,75,1112,8,75,1,75,1,75,1,76,1,76,1,76,1,76,1,76,1,77,
+        1,77,1,78,1,78,1,79,1,79,1,79,1,79,1,79,3,79,1130,8,79,1,80,1,80,
+        1,81,1,81,3,81,1136,8,81,1,82,1,82,1,82,5,82,1141,8,82,10,82,12,
+        82,1144,9,82,1,83,1,83,1,83,1,83,1,83,1,83,1,83,3,83,1153,8,83,1,
+        83,1,83,3,83,1157,8,83,1,83,3,83,1160,8,83,1,83,1,83,1,84,1,84,1,
+        84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,
+        84,1,84,1,84,1,84,1,84,3,84,1184,8,84,1,85,5,85,1187,8,85,10,85,
+        12,85,1190,9,85,1,86,1,86,3,86,1194,8,86,1,87,3,87,1197,8,87,1,87,
+        3,87,1200,8,87,1,88,1,88,1,88,5,88,1205,8,88,10,88,12,88,1208,9,
+        88,1,88,1,88,3,88,1212,8,88,1,89,1,89,1,89,1,89,1,90,1,90,1,90,3,
+        90,1221,8,90,1,91,5,91,1224,8,91,10,91,12,91,1227,9,91,1,92,1,92,
+        1,92,3,92,1232,8,92,1,93,1,93,3,93,1236,8,93,1,94,1,94,1,94,1,94,
+        5,94,1242,8,94,10,94,12,94,1245,9,94,1,94,1,94,1,95,3,95,1250,8,
+        95,1,95,1,95,3,95,1254,8,95,1,95,1,95,3,95,1258,8,95,1,95,1,95,1,
+        96,1,96,1,96,1,96,5,96,1266,8,96,10,96,12,96,1269,9,96,1,97,1,97,
+        1,97,3,97,1274,8,97,1,97,1,97,1,97,1,97,3,97,1280,8,97,1,98,1,98,
+        1,98,1,98,1,98,3,98,1287,8,98,1,98,1,98,1,99,1,99,1,100,1,100,3,
+        100,1295,8,100,1,100,1,100,1,100,1,101,1,101,1,101,1,101,1,102,1,
+        102,1,103,1,103,1,103,1,103,1,103,1,103,3,103,1312,8,103,1,104,1,
+        104,1,104,1,104,1,104,1,104,3,104,1320,8,104,1,104,1,104,1,105,1,
+        105,1,105,1,105,5,105,1328,8,105,10,105,12,105,1331,9,105,1,105,
+        3,105,1334,8,105,1,105,5,105,1337,8,105,10,105,12,105,1340,9,105,
+        1,105,1,105,1,105,3,105,1345,8,105,1,105,1,105,1,106,1,106,1,106,
+        1,106,3,106,1353,8,106,1,107,1,107,1,107,1,107,1,107,1,107,1,108,
+        1,108,1,108,5,108,1364,8,108,10,108,12,108,1367,9,108,1,109,1,109,
+        1,109,1,109,1,109,1,109,1,110,1,110,3,110,1377,8,110,1,111,1,111,
+        1,111,5,111,1382,8,111,10,111,12,111,1385,9,111,1,112,1,112,1,112,
+        1,112,1,112,1,112,1,112,1,112,1,113,1,113,1,113,1,113,1,113,1,113,
+        1,113,1,113,1,114,1,114,1,114,1,114,1,115,1,115,1,116,1,116,1,116,
+        5,116,1412,8,116,10,116,12,116,1415,9,116,1,117,3,117,1418,8,117,
+        1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,5,117,1429,
+        8,117,10,117,12,117,1432,9,117,1,117,1,117,3,117,1436,8,117,1,117,
+        1,117,1,117,3,117,1441,8,117,1,117,1,117,1,118,1,118,1,118,1,118,
+        5,118,1449,8,118,10,118,12,118,1452,9,118,1,118,1,118,1,119,1,119,
+        3,119,1458,8,119,1,120,1,120,1,120,1,120,1,121,3,121,1465,8,121,
+        1,121,1,121,1,121,1,121,1,121,3,121,1472,8,121,1,122,1,122,1,122,
+        5,122,1477,8,122,10,122,12,122,1480,9,122,1,122,1,122,3,122,1484,
+        8,122,1,123,3,123,1487,8,123,1,123,1,123,1,123,3,123,1492,8,123,
+        1,123,1,123,1,123,3,123,1497,8,123,1,124,1,124,1,124,1,124,1,124,
+        1,124,3,124,1505,8,124,1,125,1,125,1,126,1,126,1,126,1,126,1,126,
+        1,127,1,127,1,127,5,127,1517,8,127,10,127,12,127,1520,9,127,1,128,
+        1,128,1,128,5,128,1525,8,128,10,128,12,128,1528,9,128,1,129,1,129,
+        1,129,5,129,1533,8,129,10,129,12,129,1536,9,129,1,130,1,130,1,130,
+        1,130,3,130,1542,8,130,1,130,1,130,1,130,3,130,1547,8,130,1,131,
+        1,131,1,131,3,131,1552,8,131,1,131,1,131,3,131,1556,8,131,1,131,
+        1,131,3,131,1560,8,131,1,132,1,132,1,132,1,132,3,132,1566,8,132,
+        1,132,1,132,3,132,1570,8,132,1,132,1,132,3,132,1574,8,132,1,133,
+        1,133,1,133,1,133,1,133,1,134,3,134,1582,8,134,1,134,1,134,1,134,
+        3,134,1587,8,134,1,134,1,134,1,134,3,134,1592,8,134,1,135,1,135,
+        1,135,1,135,3,135,1598,8,135,1,136,1,136,1,136,1,137,1,137,1,137,
+        1,137,1,138,1,138,3,138,1609,8,138,1,139,1,139,1,139,1,139,1,139,
+        3,139,1616,8,139,1,140,1,140,1,141,1,141,1,141,5,141,1623,8,141,
+        10,141,12,141,1626,9,141,1,142,1,142,1,143,3,143,1631,8,143,1,143,
+        3,143,1634,8,143,1,143,1,143,1,143,1,143,1,143,3,143,1641,8,143,
+        1,143,1,143,1,144,1,144,1,145,1,145,1,146,1,146,3,146,1651,8,146,
+        1,146,5,146,1654,8,146,10,146,12,146,1657,9,146,1,147,1,147,1,147,
+        3,147,1662,8,147,1,148,1,148,1,148,5,148,1667,8,148,10,148,12,148,
+        1670,9,148,1,149,1,149,4,149,1674,8,149,11,149,12,149,1675,1,150,
+        1,150,1,150,1,150,1,151,1,151,1,151,1,151,1,152,3,152,1687,8,152,
+        1,152,1,152,1,152,1,152,1,152,1,152,3,152,1695,8,152,1,153,1,153,
+        1,153,1,153,1,153,1,153,1,154,1,154,3,154,1705,8,154,1,155,1,155,
+        1,155,1,155,1,156,3,156,1712,8,156,1,156,1,156,3,156,1716,8,156,
+        1,156,1,156,3,156,1720,8,156,1,156,1,156,1,157,1,157,3,157,1726,
+        8,157,1,158,1,158,1,158,1,158,1,158,1,158,3,158,1734,8,158,1,159,
+        3,159,1737,8,159,1,159,3,159,1740,8,159,1,160,1,160,1,160,1,160,
+        1,160,1,160,1,160,1,160,3,160,1750,8,160,1,160,3,160,1753,8,160,
+        1,160,1,160,1,161,1,161,1,161,1,161,1,161,1,161,1,161,1,161,1,161,
+        1,161,1,161,3,161,1768,8,161,1,162,5,162,1771,8,162,10,162,12,162,
+        1774,9,162,1,163,1,163,1,163,1,163,1,163,1,163,3,163,1782,8,163,
+        1,163,3,163,1785,8,163,1,163,1,163,1,164,1,164,1,164,1,164,1,164,
         1,164,1,164,1,164,1,164,1,164,1,164,1,164,1,164,1,164,1,164,1,164,
-        1,164,1,164,1,164,1,164,1,164,3,164,1822,8,164,1,165,5,165,1825,
-        8,165,10,165,12,165,1828,9,165,1,166,1,166,1,166,1,166,1,167,1,167,
-        1,167,1,168,1,168,1,168,1,168,5,168,1841,8,168,10,168,12,168,1844,
-        9,168,1,168,1,168,1,168,3,168,1849,8,168,1,169,1,169,1,169,1,169,
-        1,169,1,169,1,170,1,170,1,171,1,171,1,171,1,171,1,171,1,171,1,172,
-        1,172,1,172,1,172,1,172,1,172,1,172,1,172,1,172,3,172,1874,8,172,
-        1,173,1,173,1,173,3,173,1879,8,173,1,174,1,174,1,174,1,174,1,174,
-        1,174,1,174,1,174,1,174,1,174,1,174,1,174,3,174,1893,8,174,1,175,
-        5,175,1896,8,175,10,175,12,175,1899,9,175,1,176,5,176,1902,8,176,
-        10,176,12,176,1905,9,176,1,177,1,177,1,177,1,177,1,177,3,177,1912,
-        8,177,1,178,3,178,1915,8,178,1,178,1,178,1,178,1,179,1,179,1,179,
-        1,179,1,179,1,179,1,179,1,179,1,179,1,179,1,179,1,179,1,179,3,179,
-        1933,8,179,1,180,5,180,1936,8,180,10,180,12,180,1939,9,180,1,181,
-        3,181,1942,8,181,1,181,3,181,1945,8,181,1,181,1,181,1,181,1,181,
-        1,181,3,181,1952,8,181,1,181,3,181,1955,8,181,1,181,1,181,1,181,
-        1,181,1,181,3,181,1962,8,181,1,181,1,181,3,181,1966,8,181,1,181,
-        1,181,1,182,5,182,1971,8,182,10,182,12,182,1974,9,182,1,183,1,183,
-        1,183,1,183,1,183,1,183,1,183,3,183,1983,8,183,1,184,1,184,1,184,
-        3,184,1988,8,184,1,185,1,185,1,185,5,185,1993,8,185,10,185,12,185,
-        1996,9,185,1,185,1,185,3,185,2000,8,185,1,186,1,186,1,186,1,186,
-        1,187,1,187,3,187,2008,8,187,1,188,1,188,1,188,1,188,3,188,2014,
-        8,188,1,189,1,189,1,189,1,190,1,190,4,190,2021,8,190,11,190,12,190,
-        2022,1,190,1,190,1,190,3,190,2028,8,190,1,191,1,191,4,191,2032,8,
-        191,11,191,12,191,2033,1,191,1,191,1,191,3,191,2039,8,191,1,192,
-        1,192,1,192,1,192,3,192,2045,8,192,1,193,1,193,1,194,3,194,2050,
-        8,194,1,194,1,194,1,194,1,194,3,194,2056,8,194,1,194,1,194,1,195,
-        3,195,2061,8,195,1,195,1,195,3,195,2065,8,195,1,195,1,195,1,196,
-        1,196,1,196,1,196,1,196,1,196,1,196,1,197,1,197,1,197,3,197,2079,
-        8,197,1,198,1,198,3,198,2083,8,198,1,199,1,199,1,199,1,199,1,199,
-        1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,201,1,201,
-        1,201,1,201,1,201,1,201,1,201,1,201,5,201,2107,8,201,10,201,12,201,
-        2110,9,201,1,202,1,202,1,202,1,203,1,203,1,203,5,203,2118,8,203,
-        10,203,12,203,2121,9,203,1,204,5,204,2124,8,204,10,204,12,204,2127,
-        9,204,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,
-        1,205,1,205,3,205,2141,8,205,1,205,1,205,1,205,1,205,3,205,2147,
-        8,205,1,206,1,206,1,206,1,206,3,206,2153,8,206,1,207,1,207,1,208,
-        3,208,2158,8,208,1,208,1,208,1,208,3,208,2163,8,208,1,208,1,208,
-        1,208,1,209,1,209,1,209,1,209,1,209,3,209,2173,8,209,1,209,1,209,
-        3,209,2177,8,209,1,209,1,209,1,210,1,210,1,211,1,211,1,211,5,211,
-        2186,8,211,10,211,12,211,2189,9,211,1,211,1,211,3,211,2193,8,211,
-        1,212,1,212,1,212,1,212,5,212,2199,8,212,10,212,12,212,2202,9,212,
-        3,212,2204,8,212,1,212,1,212,3,212,2208,8,212,1,212,1,212,1,213,
-        3,213,2213,8,213,1,213,1,213,1,213,1,213,5,213,2219,8,213,10,213,
-        12,213,2222,9,213,1,214,3,214,2225,8,214,1,214,1,214,1,214,1,214,
-        3,214,2231,8,214,1,214,1,214,1,215,1,215,1,215,1,215,1,215,1,216,
-        3,216,2241,8,216,1,216,1,216,1,216,1,216,4,216,2247,8,216,11,216,
-        12,216,2248,1,216,1,216,1,216,3,216,2254,8,216,1,216,1,216,1,217,
-        3,217,2259,8,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,
-        1,217,5,217,2270,8,217,10,217,12,217,2273,9,217,1,217,1,217,3,217,
-        2277,8,217,1,217,1,217,1,217,3,217,2282,8,217,1,217,1,217,1,218,
-        3,218,2287,8,218,1,218,1,218,3,218,2291,8,218,1,218,1,218,1,218,
-        1,218,1,218,1,218,3,218,2299,8,218,1,218,1,218,1,219,1,219,1,219,
-        1,219,1,219,3,219,2308,8,219,1,219,1,219,3,219,2312,8,219,1,220,
-        5,220,2315,8,220,10,220,12,220,2318,9,220,1,221,1,221,1,221,1,221,
-        1,221,1,221,1,221,3,221,2327,8,221,1,222,1,222,1,222,1,222,1,222,
-        1,222,1,222,1,223,1,223,1,223,1,223,1,223,1,223,1,224,1,224,1,224,
-        1,224,1,224,1,224,1,225,1,225,3,225,2350,8,225,1,225,1,225,1,225,
-        1,225,1,225,1,225,3,225,2358,8,225,1,226,1,226,1,226,1,226,1,226,
-        1,226,1,226,3,226,2367,8,226,1,226,3,226,2370,8,226,1,226,1,226,
-        1,227,1,227,1,227,1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,228,
-        1,228,1,228,1,228,1,228,1,228,3,228,2390,8,228,1,229,5,229,2393,
-        8,229,10,229,12,229,2396,9,229,1,230,1,230,1,231,1,231,3,231,2402,
-        8,231,1,232,1,232,1,232,1,232,1,232,1,232,3,232,2410,8,232,1,233,
-        3,233,2413,8,233,1,233,1,233,1,233,1,233,1,233,1,233,3,233,2421,
-        8,233,1,233,1,233,1,233,1,234,5,234,2427,8,234,10,234,12,234,2430,
-        9,234,1,235,1,235,1,235,1,235,1,235,1,235,1,236,1,236,3,236,2440,
-        8,236,1,236,3,236,2443,8,236,1,236,3,236,2446,8,236,1,237,1,237,
-        1,237,1,237,3,237,2452,8,237,1,238,1,238,3,238,2456,8,238,1,239,
-        1,239,1,239,1,239,5,239,2462,8,239,10,239,12,239,2465,9,239,1,240,
-        1,240,1,240,3,240,2470,8,240,1,241,1,241,1,241,1,241,1,241,1,241,
-        1,242,1,242,3,242,2480,8,242,1,242,1,242,3,242,2484,8,242,1,242,
-        1,242,1,243,1,243,1,243,1,244,1,244,1,244,1,245,1,245,1,245,1,245,
-        3,245,2498,8,245,1,245,1,245,1,246,1,246,1,246,1,246,3,246,2506,
-        8,246,1,247,1,247,1,247,1,247,1,247,5,247,2513,8,247,10,247,12,247,
-        2516,9,247,1,247,1,247,1,247,1,247,1,248,1,248,1,248,1,248,1,248,
-        5,248,2527,8,248,10,248,12,248,2530,9,248,1,248,1,248,1,248,1,248,
-        1,249,1,249,1,249,1,249,5,249,2540,8,249,10,249,12,249,2543,9,249,
-        1,249,1,249,1,250,3,250,2548,8,250,1,250,1,250,1,250,1,250,1,250,
-        1,251,3,251,2556,8,251,1,251,1,251,1,251,1,251,1,251,1,251,3,251,
-        2564,8,251,1,251,1,251,1,252,3,252,2569,8,252,1,252,1,252,3,252,
-        2573,8,252,1,252,3,252,2576,8,252,1,252,3,252,2579,8,252,1,252,1,
-        252,1,253,1,253,1,253,5,253,2586,8,253,10,253,12,253,2589,9,253,
-        1,253,3,253,2592,8,253,1,254,1,254,1,254,3,254,2597,8,254,1,254,
-        0,0,255,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
-        42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,
-        86,88,90,92,94,96,98,100,102,104,106,108,110,112,114,116,118,120,
-        122,124,126,128,130,132,134,136,138,140,142,144,146,148,150,152,
-        154,156,158,160,162,164,166,168,170,172,174,176,178,180,182,184,
-        186,188,190,192,194,196,198,200,202,204,206,208,210,212,214,216,
-        218,220,222,224,226,228,230,232,234,236,238,240,242,244,246,248,
-        250,252,254,256,258,260,262,264,266,268,270,272,274,276,278,280,
-        282,284,286,288,290,292,294,296,298,300,302,304,306,308,310,312,
-        314,316,318,320,322,324,326,328,330,332,334,336,338,340,342,344,
-        346,348,350,352,354,356,358,360,362,364,366,368,370,372,374,376,
-        378,380,382,384,386,388,390,392,394,396,398,400,402,404,406,408,
-        410,412,414,416,418,420,422,424,426,428,430,432,434,436,438,440,
-        442,444,446,448,450,452,454,456,458,460,462,464,466,468,470,472,
-        474,476,478,480,482,484,486,488,490,492,494,496,498,500,502,504,
-        506,508,0,15,3,0,112,112,117,117,158,158,2,0,140,140,148,149,2,0,
-        23,23,97,97,17,0,8,8,19,21,25,25,29,29,31,31,34,34,42,42,46,46,51,
-        51,64,64,68,68,71,71,86,86,92,94,100,100,102,102,105,105,1,0,118,
-        119,2,0,38,38,63,63,5,0,7,7,50,50,55,55,61,61,110,111,5,0,16,16,
-        38,38,40,40,45,45,63,63,3,0,49,49,75,75,146,147,3,0,131,132,134,
-        134,150,152,3,0,81,82,87,88,90,91,2,0,17,17,78,78,1,0,148,149,2,
-        0,31,31,68,68,2,0,37,37,70,70,2797,0,510,1,0,0,0,2,512,1,0,0,0,4,
-        515,1,0,0,0,6,527,1,0,0,0,8,529,1,0,0,0,10,537,1,0,0,0,12,539,1,
-        0,0,0,14,541,1,0,0,0,16,552,1,0,0,0,18,568,1,0,0,0,20,572,1,0,0,
-        0,22,574,1,0,0,0,24,579,1,0,0,0,26,599,1,0,0,0,28,623,1,0,0,0,30,
-        628,1,0,0,0,32,633,1,0,0,0,34,637,1,0,0,0,36,639,1,0,0,0,38,650,
-        1,0,0,0,40,658,1,0,0,0,42,662,1,0,0,0,44,670,1,0,0,0,46,682,1,0,
-        0,0,48,684,1,0,0,0,50,692,1,0,0,0,52,697,1,0,0,0,54,705,1,0,0,0,
-        56,745,1,0,0,0,58,750,1,0,0,0,60,759,1,0,0,0,62,777,1,0,0,0,64,779,
-        1,0,0,0,66,804,1,0,0,0,68,807,1,0,0,0,70,818,1,0,0,0,72,824,1,0,
-        0,0,74,832,1,0,0,0,76,837,1,0,0,0,78,850,1,0,0,0,80,867,1,0,0,0,
-        82,876,1,0,0,0,84,878,1,0,0,0,86,886,1,0,0,0,88,900,1,0,0,0,90,918,
-        1,0,0,0,92,928,1,0,0,0,94,934,1,0,0,0,96,938,1,0,0,0,98,941,1,0,
-        0,0,100,950,1,0,0,0,102,966,1,0,0,0,104,975,1,0,0,0,106,984,1,0,
-        0,0,108,986,1,0,0,0,110,989,1,0,0,0,112,995,1,0,0,0,114,1004,1,0,
-        0,0,116,1023,1,0,0,0,118,1028,1,0,0,0,120,1033,1,0,0,0,122,1035,
-        1,0,0,0,124,1040,1,0,0,0,126,1050,1,0,0,0,128,1055,1,0,0,0,130,1062,
-        1,0,0,0,132,1067,1,0,0,0,134,1072,1,0,0,0,136,1080,1,0,0,0,138,1085,
-        1,0,0,0,140,1090,1,0,0,0,142,1095,1,0,0,0,144,1097,1,0,0,0,146,1099,
-        1,0,0,0,148,1107,1,0,0,0,150,1112,1,0,0,0,152,1116,1,0,0,0,154,1121,
-        1,0,0,0,156,1123,1,0,0,0,158,1136,1,0,0,0,160,1138,1,0,0,0,162,1140,
-        1,0,0,0,164,1144,1,0,0,0,166,1152,1,0,0,0,168,1190,1,0,0,0,170,1195,
-        1,0,0,0,172,1198,1,0,0,0,174,1203,1,0,0,0,176,1218,1,0,0,0,178,1220,
-        1,0,0,0,180,1227,1,0,0,0,182,1232,1,0,0,0,184,1238,1,0,0,0,186,1242,
-        1,0,0,0,188,1244,1,0,0,0,190,1256,1,0,0,0,192,1268,1,0,0,0,194,1286,
-        1,0,0,0,196,1288,1,0,0,0,198,1297,1,0,0,0,200,1301,1,0,0,0,202,1306,
-        1,0,0,0,204,1310,1,0,0,0,206,1318,1,0,0,0,208,1320,1,0,0,0,210,1330,
-        1,0,0,0,212,1359,1,0,0,0,214,1361,1,0,0,0,216,1367,1,0,0,0,218,1375,
-        1,0,0,0,220,1383,1,0,0,0,222,1385,1,0,0,0,224,1393,1,0,0,0,226,1401,
-        1,0,0,0,228,1409,1,0,0,0,230,1413,1,0,0,0,232,1415,1,0,0,0,234,1424,
-        1,0,0,0,236,1451,1,0,0,0,238,1464,1,0,0,0,240,1466,1,0,0,0,242,1484,
-        1,0,0,0,244,1496,1,0,0,0,246,1499,1,0,0,0,248,1517,1,0,0,0,250,1519,
-        1,0,0,0,252,1521,1,0,0,0,254,1526,1,0,0,0,256,1534,1,0,0,0,258,1542,
-        1,0,0,0,260,1550,1,0,0,0,262,1561,1,0,0,0,264,1574,1,0,0,0,266,1588,
-        1,0,0,0,268,1594,1,0,0,0,270,1610,1,0,0,0,272,1612,1,0,0,0,274,1615,
-        1,0,0,0,276,1621,1,0,0,0,278,1628,1,0,0,0,280,1630,1,0,0,0,282,1632,
-        1,0,0,0,284,1640,1,0,0,0,286,1643,1,0,0,0,288,1657,1,0,0,0,290,1659,
-        1,0,0,0,292,1663,1,0,0,0,294,1675,1,0,0,0,296,1677,1,0,0,0,298,1687,
-        1,0,0,0,300,1691,1,0,0,0,302,1695,1,0,0,0,304,1700,1,0,0,0,306,1710,
-        1,0,0,0,308,1718,1,0,0,0,310,1720,1,0,0,0,312,1725,1,0,0,0,314,1739,
-        1,0,0,0,316,1747,1,0,0,0,318,1750,1,0,0,0,320,1755,1,0,0,0,322,1781,
-        1,0,0,0,324,1786,1,0,0,0,326,1789,1,0,0,0,328,1821,1,0,0,0,330,1826,
-        1,0,0,0,332,1829,1,0,0,0,334,1833,1,0,0,0,336,1836,1,0,0,0,338,1850,
-        1,0,0,0,340,1856,1,0,0,0,342,1858,1,0,0,0,344,1873,1,0,0,0,346,1878,
-        1,0,0,0,348,1892,1,0,0,0,350,1897,1,0,0,0,352,1903,1,0,0,0,354,1906,
-        1,0,0,0,356,1914,1,0,0,0,358,1932,1,0,0,0,360,1937,1,0,0,0,362,1941,
-        1,0,0,0,364,1972,1,0,0,0,366,1975,1,0,0,0,368,1987,1,0,0,0,370,1999,
-        1,0,0,0,372,2001,1,0,0,0,374,2007,1,0,0,0,376,2009,1,0,0,0,378,2015,
-        1,0,0,0,380,2018,1,0,0,0,382,2029,1,0,0,0,384,2040,1,0,0,0,386,2046,
-        1,0,0,0,388,2049,1,0,0,0,390,2060,1,0,0,0,392,2068,1,0,0,0,394,2078,
-        1,0,0,0,396,2082,1,0,0,0,398,2084,1,0,0,0,400,2089,1,0,0,0,402,2098,
-        1,0,0,0,404,2111,1,0,0,0,406,2114,1,0,0,0,408,2125,1,0,0,0,410,2146,
-        1,0,0,0,412,2148,1,0,0,0,414,2154,1,0,0,0,416,2157,1,0,0,0,418,2167,
-        1,0,0,0,420,2180,1,0,0,0,422,2192,1,0,0,0,424,2194,1,0,0,0,426,2212,
-        1,0,0,0,428,2224,1,0,0,0,430,2234,1,0,0,0,432,2240,1,0,0,0,434,2258,
-        1,0,0,0,436,2286,1,0,0,0,438,2311,1,0,0,0,440,2316,1,0,0,0,442,2326,
-        1,0,0,0,444,2328,1,0,0,0,446,2335,1,0,0,0,448,2341,1,0,0,0,450,2347,
-        1,0,0,0,452,2359,1,0,0,0,454,2373,1,0,0,0,456,2389,1,0,0,0,458,2394,
-        1,0,0,0,460,2397,1,0,0,0,462,2401,1,0,0,0,464,2403,1,0,0,0,466,2412,
-        1,0,0,0,468,2428,1,0,0,0,470,2431,1,0,0,0,472,2437,1,0,0,0,474,2451,
-        1,0,0,0,476,2455,1,0,0,0,478,2457,1,0,0,0,480,2466,1,0,0,0,482,2471,
-        1,0,0,0,484,2477,1,0,0,0,486,2487,1,0,0,0,488,2490,1,0,0,0,490,2493,
-        1,0,0,0,492,2505,1,0,0,0,494,2507,1,0,0,0,496,2521,1,0,0,0,498,2535,
-        1,0,0,0,500,2547,1,0,0,0,502,2555,1,0,0,0,504,2568,1,0,0,0,506,2591,
-        1,0,0,0,508,2593,1,0,0,0,510,511,7,0,0,0,511,1,1,0,0,0,512,513,5,
-        2,0,0,513,514,3,472,236,0,514,3,1,0,0,0,515,517,3,232,116,0,516,
-        518,3,488,244,0,517,516,1,0,0,0,517,518,1,0,0,0,518,521,1,0,0,0,
-        519,520,5,135,0,0,520,522,3,192,96,0,521,519,1,0,0,0,521,522,1,0,
-        0,0,522,523,1,0,0,0,523,524,5,3,0,0,524,5,1,0,0,0,525,528,3,192,
-        96,0,526,528,5,60,0,0,527,525,1,0,0,0,527,526,1,0,0,0,528,7,1,0,
-        0,0,529,530,3,42,21,0,530,9,1,0,0,0,531,532,3,292,146,0,532,533,
-        5,141,0,0,533,534,3,6,3,0,534,535,5,142,0,0,535,538,1,0,0,0,536,
-        538,3,6,3,0,537,531,1,0,0,0,537,536,1,0,0,0,538,11,1,0,0,0,539,540,
-        7,1,0,0,540,13,1,0,0,0,541,542,5,141,0,0,542,547,3,150,75,0,543,
-        544,5,139,0,0,544,546,3,150,75,0,545,543,1,0,0,0,546,549,1,0,0,0,
-        547,545,1,0,0,0,547,548,1,0,0,0,548,550,1,0,0,0,549,547,1,0,0,0,
-        550,551,5,142,0,0,551,15,1,0,0,0,552,553,5,5,0,0,553,556,3,18,9,
-        0,554,555,5,145,0,0,555,557,3,20,10,0,556,554,1,0,0,0,556,557,1,
-        0,0,0,557,558,1,0,0,0,558,559,5,41,0,0,559,561,3,292,146,0,560,562,
-        3,424,212,0,561,560,1,0,0,0,561,562,1,0,0,0,562,563,1,0,0,0,563,
-        564,5,138,0,0,564,17,1,0,0,0,565,569,3,230,115,0,566,569,5,126,0,
-        0,567,569,5,127,0,0,568,565,1,0,0,0,568,566,1,0,0,0,568,567,1,0,
-        0,0,569,19,1,0,0,0,570,573,3,450,225,0,571,573,3,472,236,0,572,570,
-        1,0,0,0,572,571,1,0,0,0,573,21,1,0,0,0,574,577,5,52,0,0,575,578,
-        3,366,183,0,576,578,3,472,236,0,577,575,1,0,0,0,577,576,1,0,0,0,
-        578,23,1,0,0,0,579,580,5,8,0,0,580,581,3,230,115,0,581,582,5,58,
-        0,0,582,583,3,230,115,0,583,584,5,41,0,0,584,585,3,26,13,0,585,586,
-        5,12,0,0,586,587,3,30,15,0,587,589,5,24,0,0,588,590,5,8,0,0,589,
-        588,1,0,0,0,589,590,1,0,0,0,590,592,1,0,0,0,591,593,3,230,115,0,
-        592,591,1,0,0,0,592,593,1,0,0,0,593,594,1,0,0,0,594,595,5,138,0,
-        0,595,25,1,0,0,0,596,598,3,56,28,0,597,596,1,0,0,0,598,601,1,0,0,
-        0,599,597,1,0,0,0,599,600,1,0,0,0,600,27,1,0,0,0,601,599,1,0,0,0,
-        602,624,3,64,32,0,603,624,3,362,181,0,604,606,3,272,136,0,605,604,
-        1,0,0,0,605,606,1,0,0,0,606,607,1,0,0,0,607,624,3,102,51,0,608,610,
-        3,272,136,0,609,608,1,0,0,0,609,610,1,0,0,0,610,611,1,0,0,0,611,
-        624,3,98,49,0,612,614,3,272,136,0,613,612,1,0,0,0,613,614,1,0,0,
-        0,614,616,1,0,0,0,615,617,5,66,0,0,616,615,1,0,0,0,616,617,1,0,0,
-        0,617,618,1,0,0,0,618,624,3,104,52,0,619,624,3,90,45,0,620,624,3,
-        210,105,0,621,624,3,100,50,0,622,624,3,438,219,0,623,602,1,0,0,0,
-        623,603,1,0,0,0,623,605,1,0,0,0,623,609,1,0,0,0,623,613,1,0,0,0,
-        623,619,1,0,0,0,623,620,1,0,0,0,623,621,1,0,0,0,623,622,1,0,0,0,
-        624,29,1,0,0,0,625,627,3,28,14,0,626,625,1,0,0,0,627,630,1,0,0,0,
-        628,626,1,0,0,0,628,629,1,0,0,0,629,31,1,0,0,0,630,628,1,0,0,0,631,
-        634,3,496,248,0,632,634,3,128,64,0,633,631,1,0,0,0,633,632,1,0,0,
-        0,634,33,1,0,0,0,635,638,3,494,247,0,636,638,3,126,63,0,637,635,
-        1,0,0,0,637,636,1,0,0,0,638,35,1,0,0,0,639,640,5,10,0,0,640,643,
-        3,106,53,0,641,642,5,79,0,0,642,644,3,192,96,0,643,641,1,0,0,0,643,
-        644,1,0,0,0,644,647,1,0,0,0,645,646,5,84,0,0,646,648,3,192,96,0,
-        647,645,1,0,0,0,647,648,1,0,0,0,648,37,1,0,0,0,649,651,3,272,136,
-        0,650,649,1,0,0,0,650,651,1,0,0,0,651,652,1,0,0,0,652,653,3,36,18,
-        0,653,654,5,138,0,0,654,39,1,0,0,0,655,656,3,206,103,0,656,657,5,
-        133,0,0,657,659,1,0,0,0,658,655,1,0,0,0,658,659,1,0,0,0,659,660,
-        1,0,0,0,660,661,3,10,5,0,661,41,1,0,0,0,662,667,3,40,20,0,663,664,
-        5,139,0,0,664,666,3,40,20,0,665,663,1,0,0,0,666,669,1,0,0,0,667,
-        665,1,0,0,0,667,668,1,0,0,0,668,43,1,0,0,0,669,667,1,0,0,0,670,671,
-        5,11,0,0,671,672,3,272,136,0,672,673,3,292,146,0,673,674,5,138,0,
-        0,674,45,1,0,0,0,675,683,3,230,115,0,676,683,5,72,0,0,677,683,5,
-        73,0,0,678,683,5,3,0,0,679,683,5,96,0,0,680,683,5,77,0,0,681,683,
-        5,98,0,0,682,675,1,0,0,0,682,676,1,0,0,0,682,677,1,0,0,0,682,678,
-        1,0,0,0,682,679,1,0,0,0,682,680,1,0,0,0,682,681,1,0,0,0,683,47,1,
-        0,0,0,684,685,5,11,0,0,685,686,3,46,23,0,686,687,5,58,0,0,687,688,
-        3,178,89,0,688,689,5,41,0,0,689,690,3,192,96,0,690,691,5,138,0,0,
-        691,49,1,0,0,0,692,693,3,230,115,0,693,694,5,138,0,0,694,51,1,0,
-        0,0,695,696,5,104,0,0,696,698,3,158,79,0,697,695,1,0,0,0,697,698,
-        1,0,0,0,698,700,1,0,0,0,699,701,3,218,109,0,700,699,1,0,0,0,700,
-        701,1,0,0,0,701,703,1,0,0,0,702,704,3,342,171,0,703,702,1,0,0,0,
-        703,704,1,0,0,0,704,53,1,0,0,0,705,706,5,30,0,0,706,710,3,62,31,
-        0,707,709,3,498,249,0,708,707,1,0,0,0,709,712,1,0,0,0,710,708,1,
-        0,0,0,710,711,1,0,0,0,711,716,1,0,0,0,712,710,1,0,0,0,713,715,3,
-        120,60,0,714,713,1,0,0,0,715,718,1,0,0,0,716,714,1,0,0,0,716,717,
-        1,0,0,0,717,719,1,0,0,0,718,716,1,0,0,0,719,720,5,24,0,0,720,721,
-        5,30,0,0,721,722,5,138,0,0,722,55,1,0,0,0,723,746,3,454,227,0,724,
-        746,3,452,226,0,725,746,3,490,245,0,726,746,3,470,235,0,727,746,
-        3,124,62,0,728,746,3,418,209,0,729,746,3,502,251,0,730,746,3,196,
-        98,0,731,746,3,16,8,0,732,746,3,88,44,0,733,746,3,44,22,0,734,746,
-        3,48,24,0,735,746,3,122,61,0,736,746,3,146,73,0,737,746,3,446,223,
-        0,738,746,3,498,249,0,739,746,3,226,113,0,740,746,3,224,112,0,741,
-        746,3,306,153,0,742,746,3,448,224,0,743,746,3,368,184,0,744,746,
-        3,482,241,0,745,723,1,0,0,0,745,724,1,0,0,0,745,725,1,0,0,0,745,
-        726,1,0,0,0,745,727,1,0,0,0,745,728,1,0,0,0,745,729,1,0,0,0,745,
-        730,1,0,0,0,745,731,1,0,0,0,745,732,1,0,0,0,745,733,1,0,0,0,745,
-        734,1,0,0,0,745,735,1,0,0,0,745,736,1,0,0,0,745,737,1,0,0,0,745,
-        738,1,0,0,0,745,739,1,0,0,0,745,740,1,0,0,0,745,741,1,0,0,0,745,
-        742,1,0,0,0,745,743,1,0,0,0,745,744,1,0,0,0,746,57,1,0,0,0,747,749,
-        3,56,28,0,748,747,1,0,0,0,749,752,1,0,0,0,750,748,1,0,0,0,750,751,
-        1,0,0,0,751,59,1,0,0,0,752,750,1,0,0,0,753,757,3,214,107,0,754,755,
-        3,218,109,0,755,756,5,138,0,0,756,758,1,0,0,0,757,754,1,0,0,0,757,
-        758,1,0,0,0,758,760,1,0,0,0,759,753,1,0,0,0,759,760,1,0,0,0,760,
-        767,1,0,0,0,761,765,3,338,169,0,762,763,3,342,171,0,763,764,5,138,
-        0,0,764,766,1,0,0,0,765,762,1,0,0,0,765,766,1,0,0,0,766,768,1,0,
-        0,0,767,761,1,0,0,0,767,768,1,0,0,0,768,61,1,0,0,0,769,774,3,230,
-        115,0,770,771,5,141,0,0,771,772,3,238,119,0,772,773,5,142,0,0,773,
-        775,1,0,0,0,774,770,1,0,0,0,774,775,1,0,0,0,775,778,1,0,0,0,776,
-        778,3,292,146,0,777,769,1,0,0,0,777,776,1,0,0,0,778,63,1,0,0,0,779,
-        780,3,272,136,0,780,785,5,13,0,0,781,782,5,141,0,0,782,783,3,192,
-        96,0,783,784,5,142,0,0,784,786,1,0,0,0,785,781,1,0,0,0,785,786,1,
-        0,0,0,786,788,1,0,0,0,787,789,5,41,0,0,788,787,1,0,0,0,788,789,1,
-        0,0,0,789,790,1,0,0,0,790,791,3,60,30,0,791,792,3,58,29,0,792,793,
-        5,12,0,0,793,794,3,66,33,0,794,795,5,24,0,0,795,797,5,13,0,0,796,
-        798,3,230,115,0,797,796,1,0,0,0,797,798,1,0,0,0,798,799,1,0,0,0,
-        799,800,5,138,0,0,800,65,1,0,0,0,801,803,3,28,14,0,802,801,1,0,0,
-        0,803,806,1,0,0,0,804,802,1,0,0,0,804,805,1,0,0,0,805,67,1,0,0,0,
-        806,804,1,0,0,0,807,809,5,71,0,0,808,810,3,4,2,0,809,808,1,0,0,0,
-        809,810,1,0,0,0,810,812,1,0,0,0,811,813,3,484,242,0,812,811,1,0,
-        0,0,812,813,1,0,0,0,813,814,1,0,0,0,814,815,3,480,240,0,815,816,
-        5,138,0,0,816,69,1,0,0,0,817,819,3,74,37,0,818,817,1,0,0,0,818,819,
-        1,0,0,0,819,820,1,0,0,0,820,821,3,292,146,0,821,822,5,133,0,0,822,
-        823,3,192,96,0,823,71,1,0,0,0,824,829,3,70,35,0,825,826,5,139,0,
-        0,826,828,3,70,35,0,827,825,1,0,0,0,828,831,1,0,0,0,829,827,1,0,
-        0,0,829,830,1,0,0,0,830,73,1,0,0,0,831,829,1,0,0,0,832,833,5,30,
-        0,0,833,834,3,292,146,0,834,835,5,104,0,0,835,75,1,0,0,0,836,838,
-        3,272,136,0,837,836,1,0,0,0,837,838,1,0,0,0,838,839,1,0,0,0,839,
-        841,5,15,0,0,840,842,3,72,36,0,841,840,1,0,0,0,841,842,1,0,0,0,842,
-        845,1,0,0,0,843,844,5,108,0,0,844,846,3,106,53,0,845,843,1,0,0,0,
-        845,846,1,0,0,0,846,847,1,0,0,0,847,848,5,138,0,0,848,77,1,0,0,0,
-        849,851,3,272,136,0,850,849,1,0,0,0,850,851,1,0,0,0,851,852,1,0,
-        0,0,852,853,5,18,0,0,853,854,3,192,96,0,854,856,5,41,0,0,855,857,
-        3,80,40,0,856,855,1,0,0,0,857,858,1,0,0,0,858,856,1,0,0,0,858,859,
-        1,0,0,0,859,860,1,0,0,0,860,861,5,24,0,0,861,863,5,18,0,0,862,864,
-        3,230,115,0,863,862,1,0,0,0,863,864,1,0,0,0,864,865,1,0,0,0,865,
-        866,5,138,0,0,866,79,1,0,0,0,867,868,5,108,0,0,868,869,3,84,42,0,
-        869,870,5,133,0,0,870,871,3,408,204,0,871,81,1,0,0,0,872,877,3,230,
-        115,0,873,877,3,148,74,0,874,877,3,426,213,0,875,877,5,62,0,0,876,
-        872,1,0,0,0,876,873,1,0,0,0,876,874,1,0,0,0,876,875,1,0,0,0,877,
-        83,1,0,0,0,878,883,3,82,41,0,879,880,5,153,0,0,880,882,3,82,41,0,
-        881,879,1,0,0,0,882,885,1,0,0,0,883,881,1,0,0,0,883,884,1,0,0,0,
-        884,85,1,0,0,0,885,883,1,0,0,0,886,887,5,30,0,0,887,891,3,92,46,
-        0,888,889,3,52,26,0,889,890,5,138,0,0,890,892,1,0,0,0,891,888,1,
-        0,0,0,891,892,1,0,0,0,892,894,1,0,0,0,893,895,3,54,27,0,894,893,
-        1,0,0,0,894,895,1,0,0,0,895,896,1,0,0,0,896,897,5,24,0,0,897,898,
-        5,30,0,0,898,899,5,138,0,0,899,87,1,0,0,0,900,901,5,19,0,0,901,903,
-        3,230,115,0,902,904,5,41,0,0,903,902,1,0,0,0,903,904,1,0,0,0,904,
-        906,1,0,0,0,905,907,3,214,107,0,906,905,1,0,0,0,906,907,1,0,0,0,
-        907,909,1,0,0,0,908,910,3,338,169,0,909,908,1,0,0,0,909,910,1,0,
-        0,0,910,911,1,0,0,0,911,912,5,24,0,0,912,914,5,19,0,0,913,915,3,
-        230,115,0,914,913,1,0,0,0,914,915,1,0,0,0,915,916,1,0,0,0,916,917,
-        5,138,0,0,917,89,1,0,0,0,918,919,3,272,136,0,919,921,3,242,121,0,
-        920,922,3,218,109,0,921,920,1,0,0,0,921,922,1,0,0,0,922,924,1,0,
-        0,0,923,925,3,342,171,0,924,923,1,0,0,0,924,925,1,0,0,0,925,926,
-        1,0,0,0,926,927,5,138,0,0,927,91,1,0,0,0,928,929,3,244,122,0,929,
-        930,5,145,0,0,930,931,3,292,146,0,931,93,1,0,0,0,932,935,3,32,16,
-        0,933,935,3,380,190,0,934,932,1,0,0,0,934,933,1,0,0,0,935,95,1,0,
-        0,0,936,939,3,34,17,0,937,939,3,382,191,0,938,936,1,0,0,0,938,937,
-        1,0,0,0,939,97,1,0,0,0,940,942,3,272,136,0,941,940,1,0,0,0,941,942,
-        1,0,0,0,942,944,1,0,0,0,943,945,5,66,0,0,944,943,1,0,0,0,944,945,
-        1,0,0,0,945,946,1,0,0,0,946,947,3,36,18,0,947,948,5,138,0,0,948,
-        99,1,0,0,0,949,951,3,272,136,0,950,949,1,0,0,0,950,951,1,0,0,0,951,
-        952,1,0,0,0,952,954,5,15,0,0,953,955,3,72,36,0,954,953,1,0,0,0,954,
-        955,1,0,0,0,955,957,1,0,0,0,956,958,3,404,202,0,957,956,1,0,0,0,
-        957,958,1,0,0,0,958,961,1,0,0,0,959,960,5,108,0,0,960,962,3,106,
-        53,0,961,959,1,0,0,0,961,962,1,0,0,0,962,963,1,0,0,0,963,964,5,138,
-        0,0,964,101,1,0,0,0,965,967,3,272,136,0,966,965,1,0,0,0,966,967,
-        1,0,0,0,967,969,1,0,0,0,968,970,5,66,0,0,969,968,1,0,0,0,969,970,
-        1,0,0,0,970,971,1,0,0,0,971,972,3,354,177,0,972,973,5,138,0,0,973,
-        103,1,0,0,0,974,976,3,272,136,0,975,974,1,0,0,0,975,976,1,0,0,0,
-        976,978,1,0,0,0,977,979,5,66,0,0,978,977,1,0,0,0,978,979,1,0,0,0,
-        979,982,1,0,0,0,980,983,3,110,55,0,981,983,3,400,200,0,982,980,1,
-        0,0,0,982,981,1,0,0,0,983,105,1,0,0,0,984,985,3,192,96,0,985,107,
-        1,0,0,0,986,987,5,103,0,0,987,988,3,106,53,0,988,109,1,0,0,0,989,
-        990,3,476,238,0,990,991,5,131,0,0,991,992,3,318,159,0,992,993,3,
-        112,56,0,993,994,5,138,0,0,994,111,1,0,0,0,995,1002,3,506,253,0,
-        996,997,5,108,0,0,997,1000,3,106,53,0,998,999,5,26,0,0,999,1001,
-        3,112,56,0,1000,998,1,0,0,0,1000,1001,1,0,0,0,1001,1003,1,0,0,0,
-        1002,996,1,0,0,0,1002,1003,1,0,0,0,1003,113,1,0,0,0,1004,1005,5,
-        20,0,0,1005,1006,3,230,115,0,1006,1007,5,58,0,0,1007,1008,3,292,
-        146,0,1008,1009,5,41,0,0,1009,1010,3,118,59,0,1010,1011,3,54,27,
-        0,1011,1013,5,24,0,0,1012,1014,5,20,0,0,1013,1012,1,0,0,0,1013,1014,
-        1,0,0,0,1014,1016,1,0,0,0,1015,1017,3,230,115,0,1016,1015,1,0,0,
-        0,1016,1017,1,0,0,0,1017,1018,1,0,0,0,1018,1019,5,138,0,0,1019,115,
-        1,0,0,0,1020,1024,3,498,249,0,1021,1024,3,48,24,0,1022,1024,3,224,
-        112,0,1023,1020,1,0,0,0,1023,1021,1,0,0,0,1023,1022,1,0,0,0,1024,
-        117,1,0,0,0,1025,1027,3,116,58,0,1026,1025,1,0,0,0,1027,1030,1,0,
-        0,0,1028,1026,1,0,0,0,1028,1029,1,0,0,0,1029,119,1,0,0,0,1030,1028,
-        1,0,0,0,1031,1034,3,54,27,0,1032,1034,3,86,43,0,1033,1031,1,0,0,
-        0,1033,1032,1,0,0,0,1034,121,1,0,0,0,1035,1036,5,30,0,0,1036,1037,
-        3,92,46,0,1037,1038,3,52,26,0,1038,1039,5,138,0,0,1039,123,1,0,0,
-        0,1040,1041,5,21,0,0,1041,1042,3,232,116,0,1042,1043,5,145,0,0,1043,
-        1046,3,472,236,0,1044,1045,5,135,0,0,1045,1047,3,192,96,0,1046,1044,
-        1,0,0,0,1046,1047,1,0,0,0,1047,1048,1,0,0,0,1048,1049,5,138,0,0,
-        1049,125,1,0,0,0,1050,1051,5,9,0,0,1051,1052,3,236,118,0,1052,1053,
-        5,58,0,0,1053,1054,3,472,236,0,1054,127,1,0,0,0,1055,1056,5,9,0,
-        0,1056,1057,3,236,118,0,1057,1058,5,58,0,0,1058,1059,3,450,225,0,
-        1059,129,1,0,0,0,1060,1063,3,378,189,0,1061,1063,3,236,118,0,1062,
-        1060,1,0,0,0,1062,1061,1,0,0,0,1063,131,1,0,0,0,1064,1066,3,134,
-        67,0,1065,1064,1,0,0,0,1066,1069,1,0,0,0,1067,1065,1,0,0,0,1067,
-        1068,1,0,0,0,1068,133,1,0,0,0,1069,1067,1,0,0,0,1070,1073,3,274,
-        137,0,1071,1073,3,498,249,0,1072,1070,1,0,0,0,1072,1071,1,0,0,0,
-        1073,135,1,0,0,0,1074,1081,5,99,0,0,1075,1076,5,74,0,0,1076,1078,
-        3,192,96,0,1077,1075,1,0,0,0,1077,1078,1,0,0,0,1078,1079,1,0,0,0,
-        1079,1081,5,39,0,0,1080,1074,1,0,0,0,1080,1077,1,0,0,0,1081,137,
-        1,0,0,0,1082,1084,3,140,70,0,1083,1082,1,0,0,0,1084,1087,1,0,0,0,
-        1085,1083,1,0,0,0,1085,1086,1,0,0,0,1086,1088,1,0,0,0,1087,1085,
-        1,0,0,0,1088,1089,5,0,0,1,1089,139,1,0,0,0,1090,1091,3,132,66,0,
-        1091,1092,3,276,138,0,1092,141,1,0,0,0,1093,1096,3,230,115,0,1094,
-        1096,5,127,0,0,1095,1093,1,0,0,0,1095,1094,1,0,0,0,1096,143,1,0,
-        0,0,1097,1098,7,2,0,0,1098,145,1,0,0,0,1099,1100,5,22,0,0,1100,1101,
-        3,228,114,0,1101,1102,5,4,0,0,1102,1103,3,192,96,0,1103,1104,5,138,
-        0,0,1104,147,1,0,0,0,1105,1108,3,374,187,0,1106,1108,3,472,236,0,
-        1107,1105,1,0,0,0,1107,1106,1,0,0,0,1108,149,1,0,0,0,1109,1110,3,
-        84,42,0,1110,1111,5,133,0,0,1111,1113,1,0,0,0,1112,1109,1,0,0,0,
-        1112,1113,1,0,0,0,1113,1114,1,0,0,0,1114,1115,3,192,96,0,1115,151,
-        1,0,0,0,1116,1117,3,232,116,0,1117,1118,5,145,0,0,1118,1119,3,156,
-        78,0,1119,1120,5,138,0,0,1120,153,1,0,0,0,1121,1122,3,450,225,0,
-        1122,155,1,0,0,0,1123,1124,3,472,236,0,1124,157,1,0,0,0,1125,1126,
-        5,25,0,0,1126,1131,3,292,146,0,1127,1128,5,141,0,0,1128,1129,3,230,
-        115,0,1129,1130,5,142,0,0,1130,1132,1,0,0,0,1131,1127,1,0,0,0,1131,
-        1132,1,0,0,0,1132,1137,1,0,0,0,1133,1134,5,20,0,0,1134,1137,3,292,
-        146,0,1135,1137,5,60,0,0,1136,1125,1,0,0,0,1136,1133,1,0,0,0,1136,
-        1135,1,0,0,0,1137,159,1,0,0,0,1138,1139,7,3,0,0,1139,161,1,0,0,0,
-        1140,1142,3,160,80,0,1141,1143,5,136,0,0,1142,1141,1,0,0,0,1142,
-        1143,1,0,0,0,1143,163,1,0,0,0,1144,1149,3,162,81,0,1145,1146,5,139,
-        0,0,1146,1148,3,162,81,0,1147,1145,1,0,0,0,1148,1151,1,0,0,0,1149,
-        1147,1,0,0,0,1149,1150,1,0,0,0,1150,165,1,0,0,0,1151,1149,1,0,0,
-        0,1152,1153,5,25,0,0,1153,1154,3,230,115,0,1154,1155,5,41,0,0,1155,
-        1156,3,174,87,0,1156,1159,3,170,85,0,1157,1158,5,12,0,0,1158,1160,
-        3,182,91,0,1159,1157,1,0,0,0,1159,1160,1,0,0,0,1160,1161,1,0,0,0,
-        1161,1163,5,24,0,0,1162,1164,5,25,0,0,1163,1162,1,0,0,0,1163,1164,
-        1,0,0,0,1164,1166,1,0,0,0,1165,1167,3,230,115,0,1166,1165,1,0,0,
-        0,1166,1167,1,0,0,0,1167,1168,1,0,0,0,1168,1169,5,138,0,0,1169,167,
-        1,0,0,0,1170,1191,3,454,227,0,1171,1191,3,452,226,0,1172,1191,3,
-        490,245,0,1173,1191,3,470,235,0,1174,1191,3,124,62,0,1175,1191,3,
-        418,209,0,1176,1191,3,502,251,0,1177,1191,3,196,98,0,1178,1191,3,
-        16,8,0,1179,1191,3,44,22,0,1180,1191,3,48,24,0,1181,1191,3,146,73,
-        0,1182,1191,3,446,223,0,1183,1191,3,498,249,0,1184,1191,3,226,113,
-        0,1185,1191,3,224,112,0,1186,1191,3,306,153,0,1187,1191,3,448,224,
-        0,1188,1191,3,368,184,0,1189,1191,3,482,241,0,1190,1170,1,0,0,0,
-        1190,1171,1,0,0,0,1190,1172,1,0,0,0,1190,1173,1,0,0,0,1190,1174,
-        1,0,0,0,1190,1175,1,0,0,0,1190,1176,1,0,0,0,1190,1177,1,0,0,0,1190,
-        1178,1,0,0,0,1190,1179,1,0,0,0,1190,1180,1,0,0,0,1190,1181,1,0,0,
-        0,1190,1182,1,0,0,0,1190,1183,1,0,0,0,1190,1184,1,0,0,0,1190,1185,
-        1,0,0,0,1190,1186,1,0,0,0,1190,1187,1,0,0,0,1190,1188,1,0,0,0,1190,
-        1189,1,0,0,0,1191,169,1,0,0,0,1192,1194,3,168,84,0,1193,1192,1,0,
-        0,0,1194,1197,1,0,0,0,1195,1193,1,0,0,0,1195,1196,1,0,0,0,1196,171,
-        1,0,0,0,1197,1195,1,0,0,0,1198,1200,3,184,92,0,1199,1201,3,424,212,
-        0,1200,1199,1,0,0,0,1200,1201,1,0,0,0,1201,173,1,0,0,0,1202,1204,
-        3,214,107,0,1203,1202,1,0,0,0,1203,1204,1,0,0,0,1204,1206,1,0,0,
-        0,1205,1207,3,338,169,0,1206,1205,1,0,0,0,1206,1207,1,0,0,0,1207,
-        175,1,0,0,0,1208,1213,3,172,86,0,1209,1210,5,139,0,0,1210,1212,3,
-        172,86,0,1211,1209,1,0,0,0,1212,1215,1,0,0,0,1213,1211,1,0,0,0,1213,
-        1214,1,0,0,0,1214,1219,1,0,0,0,1215,1213,1,0,0,0,1216,1219,5,62,
-        0,0,1217,1219,5,6,0,0,1218,1208,1,0,0,0,1218,1216,1,0,0,0,1218,1217,
-        1,0,0,0,1219,177,1,0,0,0,1220,1221,3,176,88,0,1221,1222,5,145,0,
-        0,1222,1223,3,160,80,0,1223,179,1,0,0,0,1224,1228,3,98,49,0,1225,
-        1228,3,362,181,0,1226,1228,3,102,51,0,1227,1224,1,0,0,0,1227,1225,
-        1,0,0,0,1227,1226,1,0,0,0,1228,181,1,0,0,0,1229,1231,3,180,90,0,
-        1230,1229,1,0,0,0,1231,1234,1,0,0,0,1232,1230,1,0,0,0,1232,1233,
-        1,0,0,0,1233,183,1,0,0,0,1234,1232,1,0,0,0,1235,1239,3,230,115,0,
-        1236,1239,5,126,0,0,1237,1239,5,127,0,0,1238,1235,1,0,0,0,1238,1236,
-        1,0,0,0,1238,1237,1,0,0,0,1239,185,1,0,0,0,1240,1243,3,230,115,0,
-        1241,1243,5,126,0,0,1242,1240,1,0,0,0,1242,1241,1,0,0,0,1243,187,
-        1,0,0,0,1244,1245,5,141,0,0,1245,1250,3,186,93,0,1246,1247,5,139,
-        0,0,1247,1249,3,186,93,0,1248,1246,1,0,0,0,1249,1252,1,0,0,0,1250,
-        1248,1,0,0,0,1250,1251,1,0,0,0,1251,1253,1,0,0,0,1252,1250,1,0,0,
-        0,1253,1254,5,142,0,0,1254,189,1,0,0,0,1255,1257,3,272,136,0,1256,
-        1255,1,0,0,0,1256,1257,1,0,0,0,1257,1258,1,0,0,0,1258,1260,5,28,
-        0,0,1259,1261,3,230,115,0,1260,1259,1,0,0,0,1260,1261,1,0,0,0,1261,
-        1264,1,0,0,0,1262,1263,5,108,0,0,1263,1265,3,106,53,0,1264,1262,
-        1,0,0,0,1264,1265,1,0,0,0,1265,1266,1,0,0,0,1266,1267,5,138,0,0,
-        1267,191,1,0,0,0,1268,1274,3,384,192,0,1269,1270,3,284,142,0,1270,
-        1271,3,384,192,0,1271,1273,1,0,0,0,1272,1269,1,0,0,0,1273,1276,1,
-        0,0,0,1274,1272,1,0,0,0,1274,1275,1,0,0,0,1275,193,1,0,0,0,1276,
-        1274,1,0,0,0,1277,1280,3,344,172,0,1278,1279,5,129,0,0,1279,1281,
-        3,344,172,0,1280,1278,1,0,0,0,1280,1281,1,0,0,0,1281,1287,1,0,0,
-        0,1282,1283,5,1,0,0,1283,1287,3,344,172,0,1284,1285,5,56,0,0,1285,
-        1287,3,344,172,0,1286,1277,1,0,0,0,1286,1282,1,0,0,0,1286,1284,1,
-        0,0,0,1287,195,1,0,0,0,1288,1289,5,29,0,0,1289,1290,3,232,116,0,
-        1290,1291,5,145,0,0,1291,1293,3,472,236,0,1292,1294,3,200,100,0,
-        1293,1292,1,0,0,0,1293,1294,1,0,0,0,1294,1295,1,0,0,0,1295,1296,
-        5,138,0,0,1296,197,1,0,0,0,1297,1298,3,192,96,0,1298,199,1,0,0,0,
-        1299,1300,5,60,0,0,1300,1302,3,192,96,0,1301,1299,1,0,0,0,1301,1302,
-        1,0,0,0,1302,1303,1,0,0,0,1303,1304,5,41,0,0,1304,1305,3,198,99,
-        0,1305,201,1,0,0,0,1306,1307,5,29,0,0,1307,1308,5,58,0,0,1308,1309,
-        3,472,236,0,1309,203,1,0,0,0,1310,1311,3,258,129,0,1311,205,1,0,
-        0,0,1312,1319,3,230,115,0,1313,1314,3,230,115,0,1314,1315,5,141,
-        0,0,1315,1316,3,376,188,0,1316,1317,5,142,0,0,1317,1319,1,0,0,0,
-        1318,1312,1,0,0,0,1318,1313,1,0,0,0,1319,207,1,0,0,0,1320,1321,5,
-        71,0,0,1321,1322,3,232,116,0,1322,1323,5,145,0,0,1323,1326,3,472,
-        236,0,1324,1325,5,135,0,0,1325,1327,3,192,96,0,1326,1324,1,0,0,0,
-        1326,1327,1,0,0,0,1327,1328,1,0,0,0,1328,1329,5,138,0,0,1329,209,
-        1,0,0,0,1330,1331,3,272,136,0,1331,1332,3,212,106,0,1332,1340,5,
-        32,0,0,1333,1335,3,56,28,0,1334,1333,1,0,0,0,1335,1338,1,0,0,0,1336,
-        1334,1,0,0,0,1336,1337,1,0,0,0,1337,1339,1,0,0,0,1338,1336,1,0,0,
-        0,1339,1341,5,12,0,0,1340,1336,1,0,0,0,1340,1341,1,0,0,0,1341,1345,
-        1,0,0,0,1342,1344,3,28,14,0,1343,1342,1,0,0,0,1344,1347,1,0,0,0,
-        1345,1343,1,0,0,0,1345,1346,1,0,0,0,1346,1348,1,0,0,0,1347,1345,
-        1,0,0,0,1348,1349,5,24,0,0,1349,1351,5,32,0,0,1350,1352,3,230,115,
-        0,1351,1350,1,0,0,0,1351,1352,1,0,0,0,1352,1353,1,0,0,0,1353,1354,
-        5,138,0,0,1354,211,1,0,0,0,1355,1356,5,30,0,0,1356,1360,3,332,166,
-        0,1357,1358,5,36,0,0,1358,1360,3,106,53,0,1359,1355,1,0,0,0,1359,
-        1357,1,0,0,0,1360,213,1,0,0,0,1361,1362,5,33,0,0,1362,1363,5,141,
-        0,0,1363,1364,3,216,108,0,1364,1365,5,142,0,0,1365,1366,5,138,0,
-        0,1366,215,1,0,0,0,1367,1372,3,246,123,0,1368,1369,5,138,0,0,1369,
-        1371,3,246,123,0,1370,1368,1,0,0,0,1371,1374,1,0,0,0,1372,1370,1,
-        0,0,0,1372,1373,1,0,0,0,1373,217,1,0,0,0,1374,1372,1,0,0,0,1375,
-        1376,5,33,0,0,1376,1377,5,48,0,0,1377,1378,5,141,0,0,1378,1379,3,
-        42,21,0,1379,1380,5,142,0,0,1380,219,1,0,0,0,1381,1384,3,292,146,
-        0,1382,1384,5,126,0,0,1383,1381,1,0,0,0,1383,1382,1,0,0,0,1384,221,
-        1,0,0,0,1385,1390,3,220,110,0,1386,1387,5,139,0,0,1387,1389,3,220,
-        110,0,1388,1386,1,0,0,0,1389,1392,1,0,0,0,1390,1388,1,0,0,0,1390,
-        1391,1,0,0,0,1391,223,1,0,0,0,1392,1390,1,0,0,0,1393,1394,5,34,0,
-        0,1394,1395,3,272,136,0,1395,1396,3,292,146,0,1396,1397,5,141,0,
-        0,1397,1398,3,222,111,0,1398,1399,5,142,0,0,1399,1400,5,138,0,0,
-        1400,225,1,0,0,0,1401,1402,5,34,0,0,1402,1403,3,230,115,0,1403,1404,
-        5,41,0,0,1404,1405,5,141,0,0,1405,1406,3,164,82,0,1406,1407,5,142,
-        0,0,1407,1408,5,138,0,0,1408,227,1,0,0,0,1409,1410,3,422,211,0,1410,
-        1411,5,145,0,0,1411,1412,3,292,146,0,1412,229,1,0,0,0,1413,1414,
-        7,4,0,0,1414,231,1,0,0,0,1415,1420,3,230,115,0,1416,1417,5,139,0,
-        0,1417,1419,3,230,115,0,1418,1416,1,0,0,0,1419,1422,1,0,0,0,1420,
-        1418,1,0,0,0,1420,1421,1,0,0,0,1421,233,1,0,0,0,1422,1420,1,0,0,
-        0,1423,1425,3,272,136,0,1424,1423,1,0,0,0,1424,1425,1,0,0,0,1425,
-        1426,1,0,0,0,1426,1427,5,36,0,0,1427,1428,3,106,53,0,1428,1429,5,
-        95,0,0,1429,1437,3,408,204,0,1430,1431,5,27,0,0,1431,1432,3,106,
-        53,0,1432,1433,5,95,0,0,1433,1434,3,408,204,0,1434,1436,1,0,0,0,
-        1435,1430,1,0,0,0,1436,1439,1,0,0,0,1437,1435,1,0,0,0,1437,1438,
-        1,0,0,0,1438,1442,1,0,0,0,1439,1437,1,0,0,0,1440,1441,5,26,0,0,1441,
-        1443,3,408,204,0,1442,1440,1,0,0,0,1442,1443,1,0,0,0,1443,1444,1,
-        0,0,0,1444,1445,5,24,0,0,1445,1447,5,36,0,0,1446,1448,3,230,115,
-        0,1447,1446,1,0,0,0,1447,1448,1,0,0,0,1448,1449,1,0,0,0,1449,1450,
-        5,138,0,0,1450,235,1,0,0,0,1451,1452,5,141,0,0,1452,1457,3,148,74,
-        0,1453,1454,5,139,0,0,1454,1456,3,148,74,0,1455,1453,1,0,0,0,1456,
-        1459,1,0,0,0,1457,1455,1,0,0,0,1457,1458,1,0,0,0,1458,1460,1,0,0,
-        0,1459,1457,1,0,0,0,1460,1461,5,142,0,0,1461,237,1,0,0,0,1462,1465,
-        3,148,74,0,1463,1465,3,192,96,0,1464,1462,1,0,0,0,1464,1463,1,0,
-        0,0,1465,239,1,0,0,0,1466,1467,3,292,146,0,1467,1468,5,72,0,0,1468,
-        1469,5,136,0,0,1469,241,1,0,0,0,1470,1472,5,19,0,0,1471,1470,1,0,
-        0,0,1471,1472,1,0,0,0,1472,1473,1,0,0,0,1473,1485,3,292,146,0,1474,
-        1475,5,25,0,0,1475,1480,3,292,146,0,1476,1477,5,141,0,0,1477,1478,
-        3,230,115,0,1478,1479,5,142,0,0,1479,1481,1,0,0,0,1480,1476,1,0,
-        0,0,1480,1481,1,0,0,0,1481,1485,1,0,0,0,1482,1483,5,20,0,0,1483,
-        1485,3,292,146,0,1484,1471,1,0,0,0,1484,1474,1,0,0,0,1484,1482,1,
-        0,0,0,1485,243,1,0,0,0,1486,1491,3,230,115,0,1487,1488,5,139,0,0,
-        1488,1490,3,230,115,0,1489,1487,1,0,0,0,1490,1493,1,0,0,0,1491,1489,
-        1,0,0,0,1491,1492,1,0,0,0,1492,1497,1,0,0,0,1493,1491,1,0,0,0,1494,
-        1497,5,62,0,0,1495,1497,5,6,0,0,1496,1486,1,0,0,0,1496,1494,1,0,
-        0,0,1496,1495,1,0,0,0,1497,245,1,0,0,0,1498,1500,5,21,0,0,1499,1498,
-        1,0,0,0,1499,1500,1,0,0,0,1500,1501,1,0,0,0,1501,1502,3,232,116,
-        0,1502,1504,5,145,0,0,1503,1505,5,38,0,0,1504,1503,1,0,0,0,1504,
-        1505,1,0,0,0,1505,1506,1,0,0,0,1506,1509,3,472,236,0,1507,1508,5,
-        135,0,0,1508,1510,3,192,96,0,1509,1507,1,0,0,0,1509,1510,1,0,0,0,
-        1510,247,1,0,0,0,1511,1518,3,246,123,0,1512,1518,3,264,132,0,1513,
-        1518,3,268,134,0,1514,1518,3,252,126,0,1515,1518,3,266,133,0,1516,
-        1518,3,260,130,0,1517,1511,1,0,0,0,1517,1512,1,0,0,0,1517,1513,1,
-        0,0,0,1517,1514,1,0,0,0,1517,1515,1,0,0,0,1517,1516,1,0,0,0,1518,
-        249,1,0,0,0,1519,1520,3,248,124,0,1520,251,1,0,0,0,1521,1522,5,29,
-        0,0,1522,1523,3,232,116,0,1523,1524,5,145,0,0,1524,1525,3,472,236,
-        0,1525,253,1,0,0,0,1526,1531,3,264,132,0,1527,1528,5,138,0,0,1528,
-        1530,3,264,132,0,1529,1527,1,0,0,0,1530,1533,1,0,0,0,1531,1529,1,
-        0,0,0,1531,1532,1,0,0,0,1532,255,1,0,0,0,1533,1531,1,0,0,0,1534,
-        1539,3,262,131,0,1535,1536,5,138,0,0,1536,1538,3,262,131,0,1537,
-        1535,1,0,0,0,1538,1541,1,0,0,0,1539,1537,1,0,0,0,1539,1540,1,0,0,
-        0,1540,257,1,0,0,0,1541,1539,1,0,0,0,1542,1547,3,250,125,0,1543,
-        1544,5,138,0,0,1544,1546,3,250,125,0,1545,1543,1,0,0,0,1546,1549,
-        1,0,0,0,1547,1545,1,0,0,0,1547,1548,1,0,0,0,1548,259,1,0,0,0,1549,
-        1547,1,0,0,0,1550,1551,5,71,0,0,1551,1552,3,232,116,0,1552,1554,
-        5,145,0,0,1553,1555,7,5,0,0,1554,1553,1,0,0,0,1554,1555,1,0,0,0,
-        1555,1556,1,0,0,0,1556,1559,3,472,236,0,1557,1558,5,135,0,0,1558,
-        1560,3,192,96,0,1559,1557,1,0,0,0,1559,1560,1,0,0,0,1560,261,1,0,
-        0,0,1561,1562,3,232,116,0,1562,1564,5,145,0,0,1563,1565,3,288,144,
-        0,1564,1563,1,0,0,0,1564,1565,1,0,0,0,1565,1566,1,0,0,0,1566,1568,
-        3,472,236,0,1567,1569,5,17,0,0,1568,1567,1,0,0,0,1568,1569,1,0,0,
-        0,1569,1572,1,0,0,0,1570,1571,5,135,0,0,1571,1573,3,192,96,0,1572,
-        1570,1,0,0,0,1572,1573,1,0,0,0,1573,263,1,0,0,0,1574,1575,5,86,0,
-        0,1575,1576,3,232,116,0,1576,1578,5,145,0,0,1577,1579,3,288,144,
-        0,1578,1577,1,0,0,0,1578,1579,1,0,0,0,1579,1580,1,0,0,0,1580,1582,
-        3,472,236,0,1581,1583,5,17,0,0,1582,1581,1,0,0,0,1582,1583,1,0,0,
-        0,1583,1586,1,0,0,0,1584,1585,5,135,0,0,1585,1587,3,192,96,0,1586,
-        1584,1,0,0,0,1586,1587,1,0,0,0,1587,265,1,0,0,0,1588,1589,5,94,0,
-        0,1589,1590,3,232,116,0,1590,1591,5,145,0,0,1591,1592,3,450,225,
-        0,1592,267,1,0,0,0,1593,1595,5,105,0,0,1594,1593,1,0,0,0,1594,1595,
-        1,0,0,0,1595,1596,1,0,0,0,1596,1597,3,232,116,0,1597,1599,5,145,
-        0,0,1598,1600,3,288,144,0,1599,1598,1,0,0,0,1599,1600,1,0,0,0,1600,
-        1601,1,0,0,0,1601,1604,3,472,236,0,1602,1603,5,135,0,0,1603,1605,
-        3,192,96,0,1604,1602,1,0,0,0,1604,1605,1,0,0,0,1605,269,1,0,0,0,
-        1606,1607,5,109,0,0,1607,1611,3,106,53,0,1608,1609,5,30,0,0,1609,
-        1611,3,332,166,0,1610,1606,1,0,0,0,1610,1608,1,0,0,0,1611,271,1,
-        0,0,0,1612,1613,3,230,115,0,1613,1614,5,145,0,0,1614,273,1,0,0,0,
-        1615,1616,5,43,0,0,1616,1617,3,282,141,0,1617,1618,5,138,0,0,1618,
-        275,1,0,0,0,1619,1622,3,396,198,0,1620,1622,3,346,173,0,1621,1619,
-        1,0,0,0,1621,1620,1,0,0,0,1622,277,1,0,0,0,1623,1629,5,57,0,0,1624,
-        1629,5,113,0,0,1625,1629,5,127,0,0,1626,1629,3,186,93,0,1627,1629,
-        3,314,157,0,1628,1623,1,0,0,0,1628,1624,1,0,0,0,1628,1625,1,0,0,
-        0,1628,1626,1,0,0,0,1628,1627,1,0,0,0,1629,279,1,0,0,0,1630,1631,
-        3,230,115,0,1631,281,1,0,0,0,1632,1637,3,280,140,0,1633,1634,5,139,
-        0,0,1634,1636,3,280,140,0,1635,1633,1,0,0,0,1636,1639,1,0,0,0,1637,
-        1635,1,0,0,0,1637,1638,1,0,0,0,1638,283,1,0,0,0,1639,1637,1,0,0,
-        0,1640,1641,7,6,0,0,1641,285,1,0,0,0,1642,1644,3,272,136,0,1643,
-        1642,1,0,0,0,1643,1644,1,0,0,0,1644,1646,1,0,0,0,1645,1647,3,270,
-        135,0,1646,1645,1,0,0,0,1646,1647,1,0,0,0,1647,1648,1,0,0,0,1648,
-        1649,5,47,0,0,1649,1650,3,408,204,0,1650,1651,5,24,0,0,1651,1653,
-        5,47,0,0,1652,1654,3,230,115,0,1653,1652,1,0,0,0,1653,1654,1,0,0,
-        0,1654,1655,1,0,0,0,1655,1656,5,138,0,0,1656,287,1,0,0,0,1657,1658,
-        7,7,0,0,1658,289,1,0,0,0,1659,1660,7,8,0,0,1660,291,1,0,0,0,1661,
-        1664,3,230,115,0,1662,1664,5,127,0,0,1663,1661,1,0,0,0,1663,1662,
-        1,0,0,0,1664,1668,1,0,0,0,1665,1667,3,294,147,0,1666,1665,1,0,0,
-        0,1667,1670,1,0,0,0,1668,1666,1,0,0,0,1668,1669,1,0,0,0,1669,293,
-        1,0,0,0,1670,1668,1,0,0,0,1671,1676,3,298,149,0,1672,1676,3,300,
-        150,0,1673,1676,3,302,151,0,1674,1676,3,304,152,0,1675,1671,1,0,
-        0,0,1675,1672,1,0,0,0,1675,1673,1,0,0,0,1675,1674,1,0,0,0,1676,295,
-        1,0,0,0,1677,1682,3,230,115,0,1678,1679,5,154,0,0,1679,1681,3,474,
-        237,0,1680,1678,1,0,0,0,1681,1684,1,0,0,0,1682,1680,1,0,0,0,1682,
-        1683,1,0,0,0,1683,297,1,0,0,0,1684,1682,1,0,0,0,1685,1686,5,154,
-        0,0,1686,1688,3,474,237,0,1687,1685,1,0,0,0,1688,1689,1,0,0,0,1689,
-        1687,1,0,0,0,1689,1690,1,0,0,0,1690,299,1,0,0,0,1691,1692,5,141,
-        0,0,1692,1693,3,8,4,0,1693,1694,5,142,0,0,1694,301,1,0,0,0,1695,
-        1696,5,141,0,0,1696,1697,3,148,74,0,1697,1698,5,142,0,0,1698,303,
-        1,0,0,0,1699,1701,3,424,212,0,1700,1699,1,0,0,0,1700,1701,1,0,0,
-        0,1701,1702,1,0,0,0,1702,1703,5,162,0,0,1703,1708,3,46,23,0,1704,
-        1705,5,141,0,0,1705,1706,3,192,96,0,1706,1707,5,142,0,0,1707,1709,
-        1,0,0,0,1708,1704,1,0,0,0,1708,1709,1,0,0,0,1709,305,1,0,0,0,1710,
-        1711,5,51,0,0,1711,1712,3,230,115,0,1712,1713,5,41,0,0,1713,1714,
-        3,308,154,0,1714,1715,5,138,0,0,1715,307,1,0,0,0,1716,1719,3,392,
-        196,0,1717,1719,3,94,47,0,1718,1716,1,0,0,0,1718,1717,1,0,0,0,1719,
-        309,1,0,0,0,1720,1721,3,232,116,0,1721,1722,5,145,0,0,1722,1723,
-        3,154,77,0,1723,311,1,0,0,0,1724,1726,3,272,136,0,1725,1724,1,0,
-        0,0,1725,1726,1,0,0,0,1726,1727,1,0,0,0,1727,1729,5,53,0,0,1728,
-        1730,3,230,115,0,1729,1728,1,0,0,0,1729,1730,1,0,0,0,1730,1733,1,
-        0,0,0,1731,1732,5,108,0,0,1732,1734,3,106,53,0,1733,1731,1,0,0,0,
-        1733,1734,1,0,0,0,1734,1735,1,0,0,0,1735,1736,5,138,0,0,1736,313,
-        1,0,0,0,1737,1740,3,0,0,0,1738,1740,3,334,167,0,1739,1737,1,0,0,
-        0,1739,1738,1,0,0,0,1740,315,1,0,0,0,1741,1748,3,124,62,0,1742,1748,
-        3,418,209,0,1743,1748,3,502,251,0,1744,1748,3,196,98,0,1745,1748,
-        3,482,241,0,1746,1748,3,368,184,0,1747,1741,1,0,0,0,1747,1742,1,
-        0,0,0,1747,1743,1,0,0,0,1747,1744,1,0,0,0,1747,1745,1,0,0,0,1747,
-        1746,1,0,0,0,1748,317,1,0,0,0,1749,1751,5,35,0,0,1750,1749,1,0,0,
-        0,1750,1751,1,0,0,0,1751,1753,1,0,0,0,1752,1754,3,136,68,0,1753,
-        1752,1,0,0,0,1753,1754,1,0,0,0,1754,319,1,0,0,0,1755,1756,5,64,0,
-        0,1756,1757,5,14,0,0,1757,1758,3,230,115,0,1758,1759,5,41,0,0,1759,
-        1760,3,324,162,0,1760,1763,5,24,0,0,1761,1762,5,64,0,0,1762,1764,
-        5,14,0,0,1763,1761,1,0,0,0,1763,1764,1,0,0,0,1764,1766,1,0,0,0,1765,
-        1767,3,230,115,0,1766,1765,1,0,0,0,1766,1767,1,0,0,0,1767,1768,1,
-        0,0,0,1768,1769,5,138,0,0,1769,321,1,0,0,0,1770,1782,3,454,227,0,
-        1771,1782,3,452,226,0,1772,1782,3,490,245,0,1773,1782,3,470,235,
-        0,1774,1782,3,124,62,0,1775,1782,3,502,251,0,1776,1782,3,196,98,
-        0,1777,1782,3,16,8,0,1778,1782,3,498,249,0,1779,1782,3,226,113,0,
-        1780,1782,3,224,112,0,1781,1770,1,0,0,0,1781,1771,1,0,0,0,1781,1772,
-        1,0,0,0,1781,1773,1,0,0,0,1781,1774,1,0,0,0,1781,1775,1,0,0,0,1781,
-        1776,1,0,0,0,1781,1777,1,0,0,0,1781,1778,1,0,0,0,1781,1779,1,0,0,
-        0,1781,1780,1,0,0,0,1782,323,1,0,0,0,1783,1785,3,322,161,0,1784,
-        1783,1,0,0,0,1785,1788,1,0,0,0,1786,1784,1,0,0,0,1786,1787,1,0,0,
-        0,1787,325,1,0,0,0,1788,1786,1,0,0,0,1789,1790,5,64,0,0,1790,1791,
-        3,230,115,0,1791,1792,5,41,0,0,1792,1793,3,330,165,0,1793,1795,5,
-        24,0,0,1794,1796,5,64,0,0,1795,1794,1,0,0,0,1795,1796,1,0,0,0,1796,
-        1798,1,0,0,0,1797,1799,3,230,115,0,1798,1797,1,0,0,0,1798,1799,1,
-        0,0,0,1799,1800,1,0,0,0,1800,1801,5,138,0,0,1801,327,1,0,0,0,1802,
-        1822,3,454,227,0,1803,1822,3,452,226,0,1804,1822,3,490,245,0,1805,
-        1822,3,470,235,0,1806,1822,3,124,62,0,1807,1822,3,418,209,0,1808,
-        1822,3,502,251,0,1809,1822,3,196,98,0,1810,1822,3,16,8,0,1811,1822,
-        3,88,44,0,1812,1822,3,44,22,0,1813,1822,3,48,24,0,1814,1822,3,146,
-        73,0,1815,1822,3,498,249,0,1816,1822,3,226,113,0,1817,1822,3,224,
-        112,0,1818,1822,3,306,153,0,1819,1822,3,448,224,0,1820,1822,3,482,
-        241,0,1821,1802,1,0,0,0,1821,1803,1,0,0,0,1821,1804,1,0,0,0,1821,
-        1805,1,0,0,0,1821,1806,1,0,0,0,1821,1807,1,0,0,0,1821,1808,1,0,0,
-        0,1821,1809,1,0,0,0,1821,1810,1,0,0,0,1821,1811,1,0,0,0,1821,1812,
-        1,0,0,0,1821,1813,1,0,0,0,1821,1814,1,0,0,0,1821,1815,1,0,0,0,1821,
-        1816,1,0,0,0,1821,1817,1,0,0,0,1821,1818,1,0,0,0,1821,1819,1,0,0,
-        0,1821,1820,1,0,0,0,1822,329,1,0,0,0,1823,1825,3,328,164,0,1824,
-        1823,1,0,0,0,1825,1828,1,0,0,0,1826,1824,1,0,0,0,1826,1827,1,0,0,
-        0,1827,331,1,0,0,0,1828,1826,1,0,0,0,1829,1830,3,230,115,0,1830,
-        1831,5,38,0,0,1831,1832,3,148,74,0,1832,333,1,0,0,0,1833,1834,3,
-        0,0,0,1834,1835,3,230,115,0,1835,335,1,0,0,0,1836,1837,3,378,189,
-        0,1837,1838,5,102,0,0,1838,1842,3,50,25,0,1839,1841,3,398,199,0,
-        1840,1839,1,0,0,0,1841,1844,1,0,0,0,1842,1840,1,0,0,0,1842,1843,
-        1,0,0,0,1843,1845,1,0,0,0,1844,1842,1,0,0,0,1845,1846,5,24,0,0,1846,
-        1848,5,102,0,0,1847,1849,3,230,115,0,1848,1847,1,0,0,0,1848,1849,
-        1,0,0,0,1849,337,1,0,0,0,1850,1851,5,65,0,0,1851,1852,5,141,0,0,
-        1852,1853,3,340,170,0,1853,1854,5,142,0,0,1854,1855,5,138,0,0,1855,
-        339,1,0,0,0,1856,1857,3,256,128,0,1857,341,1,0,0,0,1858,1859,5,65,
-        0,0,1859,1860,5,48,0,0,1860,1861,5,141,0,0,1861,1862,3,42,21,0,1862,
-        1863,5,142,0,0,1863,343,1,0,0,0,1864,1874,3,278,139,0,1865,1874,
-        3,366,183,0,1866,1867,5,141,0,0,1867,1868,3,192,96,0,1868,1869,5,
-        142,0,0,1869,1874,1,0,0,0,1870,1874,3,22,11,0,1871,1874,3,14,7,0,
-        1872,1874,3,292,146,0,1873,1864,1,0,0,0,1873,1865,1,0,0,0,1873,1866,
-        1,0,0,0,1873,1870,1,0,0,0,1873,1871,1,0,0,0,1873,1872,1,0,0,0,1874,
-        345,1,0,0,0,1875,1879,3,166,83,0,1876,1879,3,114,57,0,1877,1879,
-        3,326,163,0,1878,1875,1,0,0,0,1878,1876,1,0,0,0,1878,1877,1,0,0,
-        0,1879,347,1,0,0,0,1880,1893,3,454,227,0,1881,1893,3,452,226,0,1882,
-        1893,3,490,245,0,1883,1893,3,470,235,0,1884,1893,3,124,62,0,1885,
-        1893,3,502,251,0,1886,1893,3,16,8,0,1887,1893,3,44,22,0,1888,1893,
-        3,48,24,0,1889,1893,3,498,249,0,1890,1893,3,226,113,0,1891,1893,
-        3,224,112,0,1892,1880,1,0,0,0,1892,1881,1,0,0,0,1892,1882,1,0,0,
-        0,1892,1883,1,0,0,0,1892,1884,1,0,0,0,1892,1885,1,0,0,0,1892,1886,
-        1,0,0,0,1892,1887,1,0,0,0,1892,1888,1,0,0,0,1892,1889,1,0,0,0,1892,
-        1890,1,0,0,0,1892,1891,1,0,0,0,1893,349,1,0,0,0,1894,1896,3,348,
-        174,0,1895,1894,1,0,0,0,1896,1899,1,0,0,0,1897,1895,1,0,0,0,1897,
-        1898,1,0,0,0,1898,351,1,0,0,0,1899,1897,1,0,0,0,1900,1902,3,410,
-        205,0,1901,1900,1,0,0,0,1902,1905,1,0,0,0,1903,1901,1,0,0,0,1903,
-        1904,1,0,0,0,1904,353,1,0,0,0,1905,1903,1,0,0,0,1906,1911,3,296,
-        148,0,1907,1908,5,141,0,0,1908,1909,3,8,4,0,1909,1910,5,142,0,0,
-        1910,1912,1,0,0,0,1911,1907,1,0,0,0,1911,1912,1,0,0,0,1912,355,1,
-        0,0,0,1913,1915,3,272,136,0,1914,1913,1,0,0,0,1914,1915,1,0,0,0,
-        1915,1916,1,0,0,0,1916,1917,3,354,177,0,1917,1918,5,138,0,0,1918,
-        357,1,0,0,0,1919,1933,3,454,227,0,1920,1933,3,452,226,0,1921,1933,
-        3,490,245,0,1922,1933,3,470,235,0,1923,1933,3,124,62,0,1924,1933,
-        3,502,251,0,1925,1933,3,196,98,0,1926,1933,3,16,8,0,1927,1933,3,
-        44,22,0,1928,1933,3,48,24,0,1929,1933,3,498,249,0,1930,1933,3,226,
-        113,0,1931,1933,3,224,112,0,1932,1919,1,0,0,0,1932,1920,1,0,0,0,
-        1932,1921,1,0,0,0,1932,1922,1,0,0,0,1932,1923,1,0,0,0,1932,1924,
-        1,0,0,0,1932,1925,1,0,0,0,1932,1926,1,0,0,0,1932,1927,1,0,0,0,1932,
-        1928,1,0,0,0,1932,1929,1,0,0,0,1932,1930,1,0,0,0,1932,1931,1,0,0,
-        0,1933,359,1,0,0,0,1934,1936,3,358,179,0,1935,1934,1,0,0,0,1936,
-        1939,1,0,0,0,1937,1935,1,0,0,0,1937,1938,1,0,0,0,1938,361,1,0,0,
-        0,1939,1937,1,0,0,0,1940,1942,3,272,136,0,1941,1940,1,0,0,0,1941,
-        1942,1,0,0,0,1942,1944,1,0,0,0,1943,1945,5,66,0,0,1944,1943,1,0,
-        0,0,1944,1945,1,0,0,0,1945,1946,1,0,0,0,1946,1951,5,67,0,0,1947,
-        1948,5,141,0,0,1948,1949,3,406,203,0,1949,1950,5,142,0,0,1950,1952,
-        1,0,0,0,1951,1947,1,0,0,0,1951,1952,1,0,0,0,1952,1954,1,0,0,0,1953,
-        1955,5,41,0,0,1954,1953,1,0,0,0,1954,1955,1,0,0,0,1955,1956,1,0,
-        0,0,1956,1957,3,360,180,0,1957,1958,5,12,0,0,1958,1959,3,364,182,
-        0,1959,1961,5,24,0,0,1960,1962,5,66,0,0,1961,1960,1,0,0,0,1961,1962,
-        1,0,0,0,1962,1963,1,0,0,0,1963,1965,5,67,0,0,1964,1966,3,230,115,
-        0,1965,1964,1,0,0,0,1965,1966,1,0,0,0,1966,1967,1,0,0,0,1967,1968,
-        5,138,0,0,1968,363,1,0,0,0,1969,1971,3,410,205,0,1970,1969,1,0,0,
-        0,1971,1974,1,0,0,0,1972,1970,1,0,0,0,1972,1973,1,0,0,0,1973,365,
-        1,0,0,0,1974,1972,1,0,0,0,1975,1976,3,472,236,0,1976,1982,5,162,
-        0,0,1977,1983,3,14,7,0,1978,1979,5,141,0,0,1979,1980,3,192,96,0,
-        1980,1981,5,142,0,0,1981,1983,1,0,0,0,1982,1977,1,0,0,0,1982,1978,
-        1,0,0,0,1983,367,1,0,0,0,1984,1988,3,208,104,0,1985,1988,3,68,34,
-        0,1986,1988,3,444,222,0,1987,1984,1,0,0,0,1987,1985,1,0,0,0,1987,
-        1986,1,0,0,0,1988,369,1,0,0,0,1989,1994,3,292,146,0,1990,1991,5,
-        139,0,0,1991,1993,3,292,146,0,1992,1990,1,0,0,0,1993,1996,1,0,0,
-        0,1994,1992,1,0,0,0,1994,1995,1,0,0,0,1995,2000,1,0,0,0,1996,1994,
-        1,0,0,0,1997,2000,5,62,0,0,1998,2000,5,6,0,0,1999,1989,1,0,0,0,1999,
-        1997,1,0,0,0,1999,1998,1,0,0,0,2000,371,1,0,0,0,2001,2002,3,370,
-        185,0,2002,2003,5,145,0,0,2003,2004,3,292,146,0,2004,373,1,0,0,0,
-        2005,2008,3,376,188,0,2006,2008,3,292,146,0,2007,2005,1,0,0,0,2007,
-        2006,1,0,0,0,2008,375,1,0,0,0,2009,2013,3,426,213,0,2010,2011,3,
-        144,72,0,2011,2012,3,426,213,0,2012,2014,1,0,0,0,2013,2010,1,0,0,
-        0,2013,2014,1,0,0,0,2014,377,1,0,0,0,2015,2016,5,72,0,0,2016,2017,
-        3,374,187,0,2017,379,1,0,0,0,2018,2020,5,76,0,0,2019,2021,3,310,
-        155,0,2020,2019,1,0,0,0,2021,2022,1,0,0,0,2022,2020,1,0,0,0,2022,
-        2023,1,0,0,0,2023,2024,1,0,0,0,2024,2025,5,24,0,0,2025,2027,5,76,
-        0,0,2026,2028,3,230,115,0,2027,2026,1,0,0,0,2027,2028,1,0,0,0,2028,
-        381,1,0,0,0,2029,2031,5,76,0,0,2030,2032,3,152,76,0,2031,2030,1,
-        0,0,0,2032,2033,1,0,0,0,2033,2031,1,0,0,0,2033,2034,1,0,0,0,2034,
-        2035,1,0,0,0,2035,2036,5,24,0,0,2036,2038,5,76,0,0,2037,2039,3,230,
-        115,0,2038,2037,1,0,0,0,2038,2039,1,0,0,0,2039,383,1,0,0,0,2040,
-        2044,3,412,206,0,2041,2042,3,386,193,0,2042,2043,3,412,206,0,2043,
-        2045,1,0,0,0,2044,2041,1,0,0,0,2044,2045,1,0,0,0,2045,385,1,0,0,
-        0,2046,2047,7,9,0,0,2047,387,1,0,0,0,2048,2050,3,272,136,0,2049,
-        2048,1,0,0,0,2049,2050,1,0,0,0,2050,2051,1,0,0,0,2051,2052,5,79,
-        0,0,2052,2055,3,192,96,0,2053,2054,5,84,0,0,2054,2056,3,192,96,0,
-        2055,2053,1,0,0,0,2055,2056,1,0,0,0,2056,2057,1,0,0,0,2057,2058,
-        5,138,0,0,2058,389,1,0,0,0,2059,2061,3,272,136,0,2060,2059,1,0,0,
-        0,2060,2061,1,0,0,0,2061,2062,1,0,0,0,2062,2064,5,80,0,0,2063,2065,
-        3,192,96,0,2064,2063,1,0,0,0,2064,2065,1,0,0,0,2065,2066,1,0,0,0,
-        2066,2067,5,138,0,0,2067,391,1,0,0,0,2068,2069,3,292,146,0,2069,
-        2070,5,3,0,0,2070,2071,3,292,146,0,2071,2072,5,96,0,0,2072,2073,
-        3,292,146,0,2073,2074,5,77,0,0,2074,393,1,0,0,0,2075,2079,3,336,
-        168,0,2076,2079,3,188,94,0,2077,2079,3,378,189,0,2078,2075,1,0,0,
-        0,2078,2076,1,0,0,0,2078,2077,1,0,0,0,2079,395,1,0,0,0,2080,2083,
-        3,24,12,0,2081,2083,3,320,160,0,2082,2080,1,0,0,0,2082,2081,1,0,
-        0,0,2083,397,1,0,0,0,2084,2085,3,230,115,0,2085,2086,5,152,0,0,2086,
-        2087,3,334,167,0,2087,2088,5,138,0,0,2088,399,1,0,0,0,2089,2090,
-        5,107,0,0,2090,2091,3,192,96,0,2091,2092,5,83,0,0,2092,2093,3,476,
-        238,0,2093,2094,5,131,0,0,2094,2095,3,318,159,0,2095,2096,3,402,
-        201,0,2096,2097,5,138,0,0,2097,401,1,0,0,0,2098,2099,3,506,253,0,
-        2099,2100,5,108,0,0,2100,2108,3,84,42,0,2101,2102,5,139,0,0,2102,
-        2103,3,506,253,0,2103,2104,5,108,0,0,2104,2105,3,84,42,0,2105,2107,
-        1,0,0,0,2106,2101,1,0,0,0,2107,2110,1,0,0,0,2108,2106,1,0,0,0,2108,
-        2109,1,0,0,0,2109,403,1,0,0,0,2110,2108,1,0,0,0,2111,2112,5,59,0,
-        0,2112,2113,3,406,203,0,2113,405,1,0,0,0,2114,2119,3,292,146,0,2115,
-        2116,5,139,0,0,2116,2118,3,292,146,0,2117,2115,1,0,0,0,2118,2121,
-        1,0,0,0,2119,2117,1,0,0,0,2119,2120,1,0,0,0,2120,407,1,0,0,0,2121,
-        2119,1,0,0,0,2122,2124,3,410,205,0,2123,2122,1,0,0,0,2124,2127,1,
-        0,0,0,2125,2123,1,0,0,0,2125,2126,1,0,0,0,2126,409,1,0,0,0,2127,
-        2125,1,0,0,0,2128,2147,3,504,252,0,2129,2147,3,38,19,0,2130,2147,
-        3,388,194,0,2131,2147,3,416,208,0,2132,2147,3,500,250,0,2133,2147,
-        3,234,117,0,2134,2147,3,78,39,0,2135,2147,3,286,143,0,2136,2147,
-        3,312,156,0,2137,2147,3,190,95,0,2138,2147,3,390,195,0,2139,2141,
-        3,272,136,0,2140,2139,1,0,0,0,2140,2141,1,0,0,0,2141,2142,1,0,0,
-        0,2142,2143,5,57,0,0,2143,2147,5,138,0,0,2144,2147,3,76,38,0,2145,
-        2147,3,356,178,0,2146,2128,1,0,0,0,2146,2129,1,0,0,0,2146,2130,1,
-        0,0,0,2146,2131,1,0,0,0,2146,2132,1,0,0,0,2146,2133,1,0,0,0,2146,
-        2134,1,0,0,0,2146,2135,1,0,0,0,2146,2136,1,0,0,0,2146,2137,1,0,0,
-        0,2146,2138,1,0,0,0,2146,2140,1,0,0,0,2146,2144,1,0,0,0,2146,2145,
-        1,0,0,0,2147,411,1,0,0,0,2148,2152,3,426,213,0,2149,2150,3,414,207,
-        0,2150,2151,3,426,213,0,2151,2153,1,0,0,0,2152,2149,1,0,0,0,2152,
-        2153,1,0,0,0,2153,413,1,0,0,0,2154,2155,7,10,0,0,2155,415,1,0,0,
-        0,2156,2158,3,272,136,0,2157,2156,1,0,0,0,2157,2158,1,0,0,0,2158,
-        2159,1,0,0,0,2159,2160,3,476,238,0,2160,2162,5,131,0,0,2161,2163,
-        3,136,68,0,2162,2161,1,0,0,0,2162,2163,1,0,0,0,2163,2164,1,0,0,0,
-        2164,2165,3,506,253,0,2165,2166,5,138,0,0,2166,417,1,0,0,0,2167,
-        2168,5,86,0,0,2168,2169,3,232,116,0,2169,2170,5,145,0,0,2170,2172,
-        3,472,236,0,2171,2173,3,420,210,0,2172,2171,1,0,0,0,2172,2173,1,
-        0,0,0,2173,2176,1,0,0,0,2174,2175,5,135,0,0,2175,2177,3,192,96,0,
-        2176,2174,1,0,0,0,2176,2177,1,0,0,0,2177,2178,1,0,0,0,2178,2179,
-        5,138,0,0,2179,419,1,0,0,0,2180,2181,7,11,0,0,2181,421,1,0,0,0,2182,
-        2187,3,292,146,0,2183,2184,5,139,0,0,2184,2186,3,292,146,0,2185,
-        2183,1,0,0,0,2186,2189,1,0,0,0,2187,2185,1,0,0,0,2187,2188,1,0,0,
-        0,2188,2193,1,0,0,0,2189,2187,1,0,0,0,2190,2193,5,62,0,0,2191,2193,
-        5,6,0,0,2192,2182,1,0,0,0,2192,2190,1,0,0,0,2192,2191,1,0,0,0,2193,
-        423,1,0,0,0,2194,2203,5,143,0,0,2195,2200,3,292,146,0,2196,2197,
-        5,139,0,0,2197,2199,3,292,146,0,2198,2196,1,0,0,0,2199,2202,1,0,
-        0,0,2200,2198,1,0,0,0,2200,2201,1,0,0,0,2201,2204,1,0,0,0,2202,2200,
-        1,0,0,0,2203,2195,1,0,0,0,2203,2204,1,0,0,0,2204,2207,1,0,0,0,2205,
-        2206,5,80,0,0,2206,2208,3,292,146,0,2207,2205,1,0,0,0,2207,2208,
-        1,0,0,0,2208,2209,1,0,0,0,2209,2210,5,144,0,0,2210,425,1,0,0,0,2211,
-        2213,7,12,0,0,2212,2211,1,0,0,0,2212,2213,1,0,0,0,2213,2214,1,0,
-        0,0,2214,2220,3,478,239,0,2215,2216,3,12,6,0,2216,2217,3,478,239,
-        0,2217,2219,1,0,0,0,2218,2215,1,0,0,0,2219,2222,1,0,0,0,2220,2218,
-        1,0,0,0,2220,2221,1,0,0,0,2221,427,1,0,0,0,2222,2220,1,0,0,0,2223,
-        2225,3,272,136,0,2224,2223,1,0,0,0,2224,2225,1,0,0,0,2225,2226,1,
-        0,0,0,2226,2227,3,426,213,0,2227,2228,5,130,0,0,2228,2230,3,426,
-        213,0,2229,2231,3,488,244,0,2230,2229,1,0,0,0,2230,2231,1,0,0,0,
-        2231,2232,1,0,0,0,2232,2233,5,138,0,0,2233,429,1,0,0,0,2234,2235,
-        5,108,0,0,2235,2236,3,84,42,0,2236,2237,5,133,0,0,2237,2238,3,440,
-        220,0,2238,431,1,0,0,0,2239,2241,3,272,136,0,2240,2239,1,0,0,0,2240,
-        2241,1,0,0,0,2241,2242,1,0,0,0,2242,2243,5,18,0,0,2243,2244,3,192,
-        96,0,2244,2246,5,104,0,0,2245,2247,3,430,215,0,2246,2245,1,0,0,0,
-        2247,2248,1,0,0,0,2248,2246,1,0,0,0,2248,2249,1,0,0,0,2249,2250,
-        1,0,0,0,2250,2251,5,24,0,0,2251,2253,5,18,0,0,2252,2254,3,230,115,
-        0,2253,2252,1,0,0,0,2253,2254,1,0,0,0,2254,2255,1,0,0,0,2255,2256,
-        5,138,0,0,2256,433,1,0,0,0,2257,2259,3,272,136,0,2258,2257,1,0,0,
-        0,2258,2259,1,0,0,0,2259,2260,1,0,0,0,2260,2261,5,36,0,0,2261,2262,
-        3,106,53,0,2262,2263,5,104,0,0,2263,2271,3,440,220,0,2264,2265,5,
-        27,0,0,2265,2266,3,106,53,0,2266,2267,5,104,0,0,2267,2268,3,440,
-        220,0,2268,2270,1,0,0,0,2269,2264,1,0,0,0,2270,2273,1,0,0,0,2271,
-        2269,1,0,0,0,2271,2272,1,0,0,0,2272,2276,1,0,0,0,2273,2271,1,0,0,
-        0,2274,2275,5,26,0,0,2275,2277,3,440,220,0,2276,2274,1,0,0,0,2276,
-        2277,1,0,0,0,2277,2278,1,0,0,0,2278,2279,5,24,0,0,2279,2281,5,104,
-        0,0,2280,2282,3,230,115,0,2281,2280,1,0,0,0,2281,2282,1,0,0,0,2282,
-        2283,1,0,0,0,2283,2284,5,138,0,0,2284,435,1,0,0,0,2285,2287,3,272,
-        136,0,2286,2285,1,0,0,0,2286,2287,1,0,0,0,2287,2288,1,0,0,0,2288,
-        2290,5,69,0,0,2289,2291,5,41,0,0,2290,2289,1,0,0,0,2290,2291,1,0,
-        0,0,2291,2292,1,0,0,0,2292,2293,3,350,175,0,2293,2294,5,12,0,0,2294,
-        2295,3,352,176,0,2295,2296,5,24,0,0,2296,2298,5,69,0,0,2297,2299,
-        3,230,115,0,2298,2297,1,0,0,0,2298,2299,1,0,0,0,2299,2300,1,0,0,
-        0,2300,2301,5,138,0,0,2301,437,1,0,0,0,2302,2312,3,428,214,0,2303,
-        2312,3,434,217,0,2304,2312,3,432,216,0,2305,2312,3,436,218,0,2306,
-        2308,3,272,136,0,2307,2306,1,0,0,0,2307,2308,1,0,0,0,2308,2309,1,
-        0,0,0,2309,2310,5,57,0,0,2310,2312,5,138,0,0,2311,2302,1,0,0,0,2311,
-        2303,1,0,0,0,2311,2304,1,0,0,0,2311,2305,1,0,0,0,2311,2307,1,0,0,
-        0,2312,439,1,0,0,0,2313,2315,3,438,219,0,2314,2313,1,0,0,0,2315,
-        2318,1,0,0,0,2316,2314,1,0,0,0,2316,2317,1,0,0,0,2317,441,1,0,0,
-        0,2318,2316,1,0,0,0,2319,2320,5,89,0,0,2320,2321,3,426,213,0,2321,
-        2322,5,139,0,0,2322,2323,3,426,213,0,2323,2327,1,0,0,0,2324,2325,
-        5,54,0,0,2325,2327,3,426,213,0,2326,2319,1,0,0,0,2326,2324,1,0,0,
-        0,2327,443,1,0,0,0,2328,2329,5,71,0,0,2329,2330,3,232,116,0,2330,
-        2331,5,145,0,0,2331,2332,3,472,236,0,2332,2333,3,442,221,0,2333,
-        2334,5,138,0,0,2334,445,1,0,0,0,2335,2336,5,44,0,0,2336,2337,3,372,
-        186,0,2337,2338,5,107,0,0,2338,2339,3,192,96,0,2339,2340,5,138,0,
-        0,2340,447,1,0,0,0,2341,2342,5,92,0,0,2342,2343,3,230,115,0,2343,
-        2344,5,41,0,0,2344,2345,3,450,225,0,2345,2346,5,138,0,0,2346,449,
-        1,0,0,0,2347,2349,3,292,146,0,2348,2350,3,236,118,0,2349,2348,1,
-        0,0,0,2349,2350,1,0,0,0,2350,2357,1,0,0,0,2351,2352,5,98,0,0,2352,
-        2353,3,192,96,0,2353,2354,5,3,0,0,2354,2355,3,192,96,0,2355,2356,
-        5,96,0,0,2356,2358,1,0,0,0,2357,2351,1,0,0,0,2357,2358,1,0,0,0,2358,
-        451,1,0,0,0,2359,2360,3,462,231,0,2360,2361,5,41,0,0,2361,2362,3,
-        458,229,0,2362,2363,5,12,0,0,2363,2364,3,468,234,0,2364,2366,5,24,
-        0,0,2365,2367,3,460,230,0,2366,2365,1,0,0,0,2366,2367,1,0,0,0,2367,
-        2369,1,0,0,0,2368,2370,3,142,71,0,2369,2368,1,0,0,0,2369,2370,1,
-        0,0,0,2370,2371,1,0,0,0,2371,2372,5,138,0,0,2372,453,1,0,0,0,2373,
-        2374,3,462,231,0,2374,2375,5,138,0,0,2375,455,1,0,0,0,2376,2390,
-        3,454,227,0,2377,2390,3,452,226,0,2378,2390,3,490,245,0,2379,2390,
-        3,470,235,0,2380,2390,3,124,62,0,2381,2390,3,502,251,0,2382,2390,
-        3,196,98,0,2383,2390,3,16,8,0,2384,2390,3,44,22,0,2385,2390,3,48,
-        24,0,2386,2390,3,498,249,0,2387,2390,3,226,113,0,2388,2390,3,224,
-        112,0,2389,2376,1,0,0,0,2389,2377,1,0,0,0,2389,2378,1,0,0,0,2389,
-        2379,1,0,0,0,2389,2380,1,0,0,0,2389,2381,1,0,0,0,2389,2382,1,0,0,
-        0,2389,2383,1,0,0,0,2389,2384,1,0,0,0,2389,2385,1,0,0,0,2389,2386,
-        1,0,0,0,2389,2387,1,0,0,0,2389,2388,1,0,0,0,2390,457,1,0,0,0,2391,
-        2393,3,456,228,0,2392,2391,1,0,0,0,2393,2396,1,0,0,0,2394,2392,1,
-        0,0,0,2394,2395,1,0,0,0,2395,459,1,0,0,0,2396,2394,1,0,0,0,2397,
-        2398,7,13,0,0,2398,461,1,0,0,0,2399,2402,3,464,232,0,2400,2402,3,
-        466,233,0,2401,2399,1,0,0,0,2401,2400,1,0,0,0,2402,463,1,0,0,0,2403,
-        2404,5,68,0,0,2404,2409,3,142,71,0,2405,2406,5,141,0,0,2406,2407,
-        3,204,102,0,2407,2408,5,142,0,0,2408,2410,1,0,0,0,2409,2405,1,0,
-        0,0,2409,2410,1,0,0,0,2410,465,1,0,0,0,2411,2413,7,14,0,0,2412,2411,
-        1,0,0,0,2412,2413,1,0,0,0,2413,2414,1,0,0,0,2414,2415,5,31,0,0,2415,
-        2420,3,142,71,0,2416,2417,5,141,0,0,2417,2418,3,204,102,0,2418,2419,
-        5,142,0,0,2419,2421,1,0,0,0,2420,2416,1,0,0,0,2420,2421,1,0,0,0,
-        2421,2422,1,0,0,0,2422,2423,5,80,0,0,2423,2424,3,472,236,0,2424,
-        467,1,0,0,0,2425,2427,3,410,205,0,2426,2425,1,0,0,0,2427,2430,1,
-        0,0,0,2428,2426,1,0,0,0,2428,2429,1,0,0,0,2429,469,1,0,0,0,2430,
-        2428,1,0,0,0,2431,2432,5,93,0,0,2432,2433,3,230,115,0,2433,2434,
-        5,41,0,0,2434,2435,3,472,236,0,2435,2436,5,138,0,0,2436,471,1,0,
-        0,0,2437,2439,3,296,148,0,2438,2440,3,296,148,0,2439,2438,1,0,0,
-        0,2439,2440,1,0,0,0,2440,2442,1,0,0,0,2441,2443,3,130,65,0,2442,
-        2441,1,0,0,0,2442,2443,1,0,0,0,2443,2445,1,0,0,0,2444,2446,3,488,
-        244,0,2445,2444,1,0,0,0,2445,2446,1,0,0,0,2446,473,1,0,0,0,2447,
-        2452,3,230,115,0,2448,2452,5,126,0,0,2449,2452,5,127,0,0,2450,2452,
-        5,6,0,0,2451,2447,1,0,0,0,2451,2448,1,0,0,0,2451,2449,1,0,0,0,2451,
-        2450,1,0,0,0,2452,475,1,0,0,0,2453,2456,3,292,146,0,2454,2456,3,
-        14,7,0,2455,2453,1,0,0,0,2455,2454,1,0,0,0,2456,477,1,0,0,0,2457,
-        2463,3,194,97,0,2458,2459,3,290,145,0,2459,2460,3,194,97,0,2460,
-        2462,1,0,0,0,2461,2458,1,0,0,0,2462,2465,1,0,0,0,2463,2461,1,0,0,
-        0,2463,2464,1,0,0,0,2464,479,1,0,0,0,2465,2463,1,0,0,0,2466,2469,
-        3,292,146,0,2467,2468,5,97,0,0,2468,2470,3,292,146,0,2469,2467,1,
-        0,0,0,2469,2470,1,0,0,0,2470,481,1,0,0,0,2471,2472,5,94,0,0,2472,
-        2473,3,232,116,0,2473,2474,5,145,0,0,2474,2475,3,450,225,0,2475,
-        2476,5,138,0,0,2476,483,1,0,0,0,2477,2479,3,232,116,0,2478,2480,
-        3,488,244,0,2479,2478,1,0,0,0,2479,2480,1,0,0,0,2480,2483,1,0,0,
-        0,2481,2482,5,135,0,0,2482,2484,3,192,96,0,2483,2481,1,0,0,0,2483,
-        2484,1,0,0,0,2484,2485,1,0,0,0,2485,2486,5,96,0,0,2486,485,1,0,0,
-        0,2487,2488,5,30,0,0,2488,2489,3,192,96,0,2489,487,1,0,0,0,2490,
-        2491,5,98,0,0,2491,2492,3,192,96,0,2492,489,1,0,0,0,2493,2494,5,
-        100,0,0,2494,2497,3,230,115,0,2495,2496,5,41,0,0,2496,2498,3,492,
-        246,0,2497,2495,1,0,0,0,2497,2498,1,0,0,0,2498,2499,1,0,0,0,2499,
-        2500,5,138,0,0,2500,491,1,0,0,0,2501,2506,3,394,197,0,2502,2506,
-        3,96,48,0,2503,2506,3,2,1,0,2504,2506,3,202,101,0,2505,2501,1,0,
-        0,0,2505,2502,1,0,0,0,2505,2503,1,0,0,0,2505,2504,1,0,0,0,2506,493,
-        1,0,0,0,2507,2508,5,9,0,0,2508,2509,5,141,0,0,2509,2514,3,240,120,
-        0,2510,2511,5,139,0,0,2511,2513,3,240,120,0,2512,2510,1,0,0,0,2513,
+        1,164,1,164,1,164,3,164,1808,8,164,1,165,5,165,1811,8,165,10,165,
+        12,165,1814,9,165,1,166,1,166,1,166,1,166,1,167,1,167,1,167,1,168,
+        1,168,1,168,1,168,5,168,1827,8,168,10,168,12,168,1830,9,168,1,168,
+        1,168,1,168,3,168,1835,8,168,1,169,1,169,1,169,1,169,1,169,1,169,
+        1,170,1,170,1,171,1,171,1,171,1,171,1,171,1,171,1,172,1,172,1,172,
+        1,172,1,172,1,172,1,172,1,172,1,172,3,172,1860,8,172,1,173,1,173,
+        1,173,3,173,1865,8,173,1,174,1,174,1,174,1,174,1,174,1,174,1,174,
+        1,174,1,174,1,174,1,174,1,174,3,174,1879,8,174,1,175,5,175,1882,
+        8,175,10,175,12,175,1885,9,175,1,176,5,176,1888,8,176,10,176,12,
+        176,1891,9,176,1,177,1,177,1,177,1,177,1,177,3,177,1898,8,177,1,
+        178,3,178,1901,8,178,1,178,1,178,1,178,1,179,1,179,1,179,1,179,1,
+        179,1,179,1,179,1,179,1,179,1,179,1,179,1,179,1,179,3,179,1919,8,
+        179,1,180,5,180,1922,8,180,10,180,12,180,1925,9,180,1,181,3,181,
+        1928,8,181,1,181,3,181,1931,8,181,1,181,1,181,1,181,1,181,1,181,
+        3,181,1938,8,181,1,181,3,181,1941,8,181,1,181,1,181,1,181,1,181,
+        1,181,3,181,1948,8,181,1,181,1,181,3,181,1952,8,181,1,181,1,181,
+        1,182,5,182,1957,8,182,10,182,12,182,1960,9,182,1,183,1,183,1,183,
+        1,183,1,183,1,183,1,183,3,183,1969,8,183,1,184,1,184,1,184,3,184,
+        1974,8,184,1,185,1,185,1,185,5,185,1979,8,185,10,185,12,185,1982,
+        9,185,1,185,1,185,3,185,1986,8,185,1,186,1,186,1,186,1,186,1,187,
+        1,187,3,187,1994,8,187,1,188,1,188,1,188,1,188,3,188,2000,8,188,
+        1,189,1,189,1,189,1,190,1,190,4,190,2007,8,190,11,190,12,190,2008,
+        1,190,1,190,1,190,3,190,2014,8,190,1,191,1,191,4,191,2018,8,191,
+        11,191,12,191,2019,1,191,1,191,1,191,3,191,2025,8,191,1,192,1,192,
+        1,192,1,192,3,192,2031,8,192,1,193,1,193,1,194,3,194,2036,8,194,
+        1,194,1,194,1,194,1,194,3,194,2042,8,194,1,194,1,194,1,195,3,195,
+        2047,8,195,1,195,1,195,3,195,2051,8,195,1,195,1,195,1,196,1,196,
+        1,196,1,196,1,196,1,196,1,196,1,197,1,197,1,197,3,197,2065,8,197,
+        1,198,1,198,3,198,2069,8,198,1,199,1,199,1,199,1,199,1,199,1,200,
+        1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,201,1,201,1,201,
+        1,201,1,201,1,201,1,201,1,201,5,201,2093,8,201,10,201,12,201,2096,
+        9,201,1,202,1,202,1,202,1,203,1,203,1,203,5,203,2104,8,203,10,203,
+        12,203,2107,9,203,1,204,5,204,2110,8,204,10,204,12,204,2113,9,204,
+        1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,
+        1,205,3,205,2127,8,205,1,205,1,205,1,205,1,205,3,205,2133,8,205,
+        1,206,1,206,1,206,1,206,3,206,2139,8,206,1,207,1,207,1,208,3,208,
+        2144,8,208,1,208,1,208,1,208,3,208,2149,8,208,1,208,1,208,1,208,
+        1,209,1,209,1,209,1,209,1,209,3,209,2159,8,209,1,209,1,209,3,209,
+        2163,8,209,1,209,1,209,1,210,1,210,1,211,1,211,1,211,5,211,2172,
+        8,211,10,211,12,211,2175,9,211,1,211,1,211,3,211,2179,8,211,1,212,
+        1,212,1,212,1,212,5,212,2185,8,212,10,212,12,212,2188,9,212,3,212,
+        2190,8,212,1,212,1,212,3,212,2194,8,212,1,212,1,212,1,213,3,213,
+        2199,8,213,1,213,1,213,1,213,1,213,5,213,2205,8,213,10,213,12,213,
+        2208,9,213,1,214,3,214,2211,8,214,1,214,1,214,1,214,1,214,3,214,
+        2217,8,214,1,214,1,214,1,215,1,215,1,215,1,215,1,215,1,216,3,216,
+        2227,8,216,1,216,1,216,1,216,1,216,4,216,2233,8,216,11,216,12,216,
+        2234,1,216,1,216,1,216,3,216,2240,8,216,1,216,1,216,1,217,3,217,
+        2245,8,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,
+        5,217,2256,8,217,10,217,12,217,2259,9,217,1,217,1,217,3,217,2263,
+        8,217,1,217,1,217,1,217,3,217,2268,8,217,1,217,1,217,1,218,3,218,
+        2273,8,218,1,218,1,218,3,218,2277,8,218,1,218,1,218,1,218,1,218,
+        1,218,1,218,3,218,2285,8,218,1,218,1,218,1,219,1,219,1,219,1,219,
+        1,219,3,219,2294,8,219,1,219,1,219,3,219,2298,8,219,1,220,5,220,
+        2301,8,220,10,220,12,220,2304,9,220,1,221,1,221,1,221,1,221,1,221,
+        1,221,1,221,3,221,2313,8,221,1,222,1,222,1,222,1,222,1,222,1,222,
+        1,222,1,223,1,223,1,223,1,223,1,223,1,223,1,224,1,224,1,224,1,224,
+        1,224,1,224,1,225,1,225,3,225,2336,8,225,1,225,1,225,1,225,1,225,
+        1,225,1,225,3,225,2344,8,225,1,226,1,226,1,226,1,226,1,226,1,226,
+        1,226,3,226,2353,8,226,1,226,3,226,2356,8,226,1,226,1,226,1,227,
+        1,227,1,227,1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,228,
+        1,228,1,228,1,228,1,228,3,228,2376,8,228,1,229,5,229,2379,8,229,
+        10,229,12,229,2382,9,229,1,230,1,230,1,231,1,231,3,231,2388,8,231,
+        1,232,1,232,1,232,1,232,1,232,1,232,3,232,2396,8,232,1,233,3,233,
+        2399,8,233,1,233,1,233,1,233,1,233,1,233,1,233,3,233,2407,8,233,
+        1,233,1,233,1,233,1,234,5,234,2413,8,234,10,234,12,234,2416,9,234,
+        1,235,1,235,1,235,1,235,1,235,1,235,1,236,1,236,3,236,2426,8,236,
+        1,236,3,236,2429,8,236,1,236,3,236,2432,8,236,1,237,1,237,1,237,
+        1,237,3,237,2438,8,237,1,238,1,238,3,238,2442,8,238,1,239,1,239,
+        1,239,1,239,5,239,2448,8,239,10,239,12,239,2451,9,239,1,240,1,240,
+        1,240,3,240,2456,8,240,1,241,1,241,1,241,1,241,1,241,1,241,1,242,
+        1,242,3,242,2466,8,242,1,242,1,242,3,242,2470,8,242,1,242,1,242,
+        1,243,1,243,1,243,1,244,1,244,1,244,1,245,1,245,1,245,1,245,3,245,
+        2484,8,245,1,245,1,245,1,246,1,246,1,246,1,246,3,246,2492,8,246,
+        1,247,1,247,1,247,1,247,1,247,5,247,2499,8,247,10,247,12,247,2502,
+        9,247,1,247,1,247,1,247,1,247,1,248,1,248,1,248,1,248,1,248,5,248,
+        2513,8,248,10,248,12,248,2516,9,248,1,248,1,248,1,248,1,248,1,249,
+        1,249,1,249,1,249,5,249,2526,8,249,10,249,12,249,2529,9,249,1,249,
+        1,249,1,250,3,250,2534,8,250,1,250,1,250,1,250,1,250,1,250,1,251,
+        3,251,2542,8,251,1,251,1,251,1,251,1,251,1,251,1,251,3,251,2550,
+        8,251,1,251,1,251,1,252,3,252,2555,8,252,1,252,1,252,3,252,2559,
+        8,252,1,252,3,252,2562,8,252,1,252,3,252,2565,8,252,1,252,1,252,
+        1,253,1,253,1,253,5,253,2572,8,253,10,253,12,253,2575,9,253,1,253,
+        3,253,2578,8,253,1,254,1,254,1,254,3,254,2583,8,254,1,254,0,0,255,
+        0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,
+        46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,
+        90,92,94,96,98,100,102,104,106,108,110,112,114,116,118,120,122,124,
+        126,128,130,132,134,136,138,140,142,144,146,148,150,152,154,156,
+        158,160,162,164,166,168,170,172,174,176,178,180,182,184,186,188,
+        190,192,194,196,198,200,202,204,206,208,210,212,214,216,218,220,
+        222,224,226,228,230,232,234,236,238,240,242,244,246,248,250,252,
+        254,256,258,260,262,264,266,268,270,272,274,276,278,280,282,284,
+        286,288,290,292,294,296,298,300,302,304,306,308,310,312,314,316,
+        318,320,322,324,326,328,330,332,334,336,338,340,342,344,346,348,
+        350,352,354,356,358,360,362,364,366,368,370,372,374,376,378,380,
+        382,384,386,388,390,392,394,396,398,400,402,404,406,408,410,412,
+        414,416,418,420,422,424,426,428,430,432,434,436,438,440,442,444,
+        446,448,450,452,454,456,458,460,462,464,466,468,470,472,474,476,
+        478,480,482,484,486,488,490,492,494,496,498,500,502,504,506,508,
+        0,15,3,0,112,112,117,117,158,158,2,0,140,140,148,149,2,0,23,23,97,
+        97,17,0,8,8,19,21,25,25,29,29,31,31,34,34,42,42,46,46,51,51,64,64,
+        68,68,71,71,86,86,92,94,100,100,102,102,105,105,1,0,118,119,2,0,
+        38,38,63,63,5,0,7,7,50,50,55,55,61,61,110,111,5,0,16,16,38,38,40,
+        40,45,45,63,63,3,0,49,49,75,75,146,147,3,0,131,132,134,134,150,152,
+        3,0,81,82,87,88,90,91,2,0,17,17,78,78,1,0,148,149,2,0,31,31,68,68,
+        2,0,37,37,70,70,2780,0,510,1,0,0,0,2,512,1,0,0,0,4,515,1,0,0,0,6,
+        532,1,0,0,0,8,534,1,0,0,0,10,536,1,0,0,0,12,538,1,0,0,0,14,540,1,
+        0,0,0,16,551,1,0,0,0,18,567,1,0,0,0,20,571,1,0,0,0,22,573,1,0,0,
+        0,24,578,1,0,0,0,26,598,1,0,0,0,28,622,1,0,0,0,30,627,1,0,0,0,32,
+        632,1,0,0,0,34,636,1,0,0,0,36,638,1,0,0,0,38,649,1,0,0,0,40,657,
+        1,0,0,0,42,661,1,0,0,0,44,669,1,0,0,0,46,681,1,0,0,0,48,683,1,0,
+        0,0,50,691,1,0,0,0,52,696,1,0,0,0,54,704,1,0,0,0,56,744,1,0,0,0,
+        58,749,1,0,0,0,60,758,1,0,0,0,62,776,1,0,0,0,64,778,1,0,0,0,66,803,
+        1,0,0,0,68,806,1,0,0,0,70,817,1,0,0,0,72,823,1,0,0,0,74,831,1,0,
+        0,0,76,836,1,0,0,0,78,849,1,0,0,0,80,866,1,0,0,0,82,875,1,0,0,0,
+        84,877,1,0,0,0,86,885,1,0,0,0,88,899,1,0,0,0,90,917,1,0,0,0,92,927,
+        1,0,0,0,94,933,1,0,0,0,96,937,1,0,0,0,98,940,1,0,0,0,100,949,1,0,
+        0,0,102,965,1,0,0,0,104,974,1,0,0,0,106,983,1,0,0,0,108,985,1,0,
+        0,0,110,988,1,0,0,0,112,994,1,0,0,0,114,1003,1,0,0,0,116,1022,1,
+        0,0,0,118,1027,1,0,0,0,120,1032,1,0,0,0,122,1034,1,0,0,0,124,1039,
+        1,0,0,0,126,1049,1,0,0,0,128,1054,1,0,0,0,130,1061,1,0,0,0,132,1066,
+        1,0,0,0,134,1071,1,0,0,0,136,1079,1,0,0,0,138,1084,1,0,0,0,140,1089,
+        1,0,0,0,142,1094,1,0,0,0,144,1096,1,0,0,0,146,1098,1,0,0,0,148,1106,
+        1,0,0,0,150,1111,1,0,0,0,152,1115,1,0,0,0,154,1120,1,0,0,0,156,1122,
+        1,0,0,0,158,1129,1,0,0,0,160,1131,1,0,0,0,162,1133,1,0,0,0,164,1137,
+        1,0,0,0,166,1145,1,0,0,0,168,1183,1,0,0,0,170,1188,1,0,0,0,172,1191,
+        1,0,0,0,174,1196,1,0,0,0,176,1211,1,0,0,0,178,1213,1,0,0,0,180,1220,
+        1,0,0,0,182,1225,1,0,0,0,184,1231,1,0,0,0,186,1235,1,0,0,0,188,1237,
+        1,0,0,0,190,1249,1,0,0,0,192,1261,1,0,0,0,194,1279,1,0,0,0,196,1281,
+        1,0,0,0,198,1290,1,0,0,0,200,1294,1,0,0,0,202,1299,1,0,0,0,204,1303,
+        1,0,0,0,206,1311,1,0,0,0,208,1313,1,0,0,0,210,1323,1,0,0,0,212,1352,
+        1,0,0,0,214,1354,1,0,0,0,216,1360,1,0,0,0,218,1368,1,0,0,0,220,1376,
+        1,0,0,0,222,1378,1,0,0,0,224,1386,1,0,0,0,226,1394,1,0,0,0,228,1402,
+        1,0,0,0,230,1406,1,0,0,0,232,1408,1,0,0,0,234,1417,1,0,0,0,236,1444,
+        1,0,0,0,238,1457,1,0,0,0,240,1459,1,0,0,0,242,1471,1,0,0,0,244,1483,
+        1,0,0,0,246,1486,1,0,0,0,248,1504,1,0,0,0,250,1506,1,0,0,0,252,1508,
+        1,0,0,0,254,1513,1,0,0,0,256,1521,1,0,0,0,258,1529,1,0,0,0,260,1537,
+        1,0,0,0,262,1548,1,0,0,0,264,1561,1,0,0,0,266,1575,1,0,0,0,268,1581,
+        1,0,0,0,270,1597,1,0,0,0,272,1599,1,0,0,0,274,1602,1,0,0,0,276,1608,
+        1,0,0,0,278,1615,1,0,0,0,280,1617,1,0,0,0,282,1619,1,0,0,0,284,1627,
+        1,0,0,0,286,1630,1,0,0,0,288,1644,1,0,0,0,290,1646,1,0,0,0,292,1650,
+        1,0,0,0,294,1661,1,0,0,0,296,1663,1,0,0,0,298,1673,1,0,0,0,300,1677,
+        1,0,0,0,302,1681,1,0,0,0,304,1686,1,0,0,0,306,1696,1,0,0,0,308,1704,
+        1,0,0,0,310,1706,1,0,0,0,312,1711,1,0,0,0,314,1725,1,0,0,0,316,1733,
+        1,0,0,0,318,1736,1,0,0,0,320,1741,1,0,0,0,322,1767,1,0,0,0,324,1772,
+        1,0,0,0,326,1775,1,0,0,0,328,1807,1,0,0,0,330,1812,1,0,0,0,332,1815,
+        1,0,0,0,334,1819,1,0,0,0,336,1822,1,0,0,0,338,1836,1,0,0,0,340,1842,
+        1,0,0,0,342,1844,1,0,0,0,344,1859,1,0,0,0,346,1864,1,0,0,0,348,1878,
+        1,0,0,0,350,1883,1,0,0,0,352,1889,1,0,0,0,354,1892,1,0,0,0,356,1900,
+        1,0,0,0,358,1918,1,0,0,0,360,1923,1,0,0,0,362,1927,1,0,0,0,364,1958,
+        1,0,0,0,366,1961,1,0,0,0,368,1973,1,0,0,0,370,1985,1,0,0,0,372,1987,
+        1,0,0,0,374,1993,1,0,0,0,376,1995,1,0,0,0,378,2001,1,0,0,0,380,2004,
+        1,0,0,0,382,2015,1,0,0,0,384,2026,1,0,0,0,386,2032,1,0,0,0,388,2035,
+        1,0,0,0,390,2046,1,0,0,0,392,2054,1,0,0,0,394,2064,1,0,0,0,396,2068,
+        1,0,0,0,398,2070,1,0,0,0,400,2075,1,0,0,0,402,2084,1,0,0,0,404,2097,
+        1,0,0,0,406,2100,1,0,0,0,408,2111,1,0,0,0,410,2132,1,0,0,0,412,2134,
+        1,0,0,0,414,2140,1,0,0,0,416,2143,1,0,0,0,418,2153,1,0,0,0,420,2166,
+        1,0,0,0,422,2178,1,0,0,0,424,2180,1,0,0,0,426,2198,1,0,0,0,428,2210,
+        1,0,0,0,430,2220,1,0,0,0,432,2226,1,0,0,0,434,2244,1,0,0,0,436,2272,
+        1,0,0,0,438,2297,1,0,0,0,440,2302,1,0,0,0,442,2312,1,0,0,0,444,2314,
+        1,0,0,0,446,2321,1,0,0,0,448,2327,1,0,0,0,450,2333,1,0,0,0,452,2345,
+        1,0,0,0,454,2359,1,0,0,0,456,2375,1,0,0,0,458,2380,1,0,0,0,460,2383,
+        1,0,0,0,462,2387,1,0,0,0,464,2389,1,0,0,0,466,2398,1,0,0,0,468,2414,
+        1,0,0,0,470,2417,1,0,0,0,472,2423,1,0,0,0,474,2437,1,0,0,0,476,2441,
+        1,0,0,0,478,2443,1,0,0,0,480,2452,1,0,0,0,482,2457,1,0,0,0,484,2463,
+        1,0,0,0,486,2473,1,0,0,0,488,2476,1,0,0,0,490,2479,1,0,0,0,492,2491,
+        1,0,0,0,494,2493,1,0,0,0,496,2507,1,0,0,0,498,2521,1,0,0,0,500,2533,
+        1,0,0,0,502,2541,1,0,0,0,504,2554,1,0,0,0,506,2577,1,0,0,0,508,2579,
+        1,0,0,0,510,511,7,0,0,0,511,1,1,0,0,0,512,513,5,2,0,0,513,514,3,
+        472,236,0,514,3,1,0,0,0,515,517,3,232,116,0,516,518,3,488,244,0,
+        517,516,1,0,0,0,517,518,1,0,0,0,518,521,1,0,0,0,519,520,5,135,0,
+        0,520,522,3,192,96,0,521,519,1,0,0,0,521,522,1,0,0,0,522,523,1,0,
+        0,0,523,524,5,3,0,0,524,5,1,0,0,0,525,529,3,192,96,0,526,527,3,144,
+        72,0,527,528,3,426,213,0,528,530,1,0,0,0,529,526,1,0,0,0,529,530,
+        1,0,0,0,530,533,1,0,0,0,531,533,5,60,0,0,532,525,1,0,0,0,532,531,
+        1,0,0,0,533,7,1,0,0,0,534,535,3,42,21,0,535,9,1,0,0,0,536,537,3,
+        6,3,0,537,11,1,0,0,0,538,539,7,1,0,0,539,13,1,0,0,0,540,541,5,141,
+        0,0,541,546,3,150,75,0,542,543,5,139,0,0,543,545,3,150,75,0,544,
+        542,1,0,0,0,545,548,1,0,0,0,546,544,1,0,0,0,546,547,1,0,0,0,547,
+        549,1,0,0,0,548,546,1,0,0,0,549,550,5,142,0,0,550,15,1,0,0,0,551,
+        552,5,5,0,0,552,555,3,18,9,0,553,554,5,145,0,0,554,556,3,20,10,0,
+        555,553,1,0,0,0,555,556,1,0,0,0,556,557,1,0,0,0,557,558,5,41,0,0,
+        558,560,3,292,146,0,559,561,3,424,212,0,560,559,1,0,0,0,560,561,
+        1,0,0,0,561,562,1,0,0,0,562,563,5,138,0,0,563,17,1,0,0,0,564,568,
+        3,230,115,0,565,568,5,126,0,0,566,568,5,127,0,0,567,564,1,0,0,0,
+        567,565,1,0,0,0,567,566,1,0,0,0,568,19,1,0,0,0,569,572,3,450,225,
+        0,570,572,3,472,236,0,571,569,1,0,0,0,571,570,1,0,0,0,572,21,1,0,
+        0,0,573,576,5,52,0,0,574,577,3,366,183,0,575,577,3,472,236,0,576,
+        574,1,0,0,0,576,575,1,0,0,0,577,23,1,0,0,0,578,579,5,8,0,0,579,580,
+        3,230,115,0,580,581,5,58,0,0,581,582,3,230,115,0,582,583,5,41,0,
+        0,583,584,3,26,13,0,584,585,5,12,0,0,585,586,3,30,15,0,586,588,5,
+        24,0,0,587,589,5,8,0,0,588,587,1,0,0,0,588,589,1,0,0,0,589,591,1,
+        0,0,0,590,592,3,230,115,0,591,590,1,0,0,0,591,592,1,0,0,0,592,593,
+        1,0,0,0,593,594,5,138,0,0,594,25,1,0,0,0,595,597,3,56,28,0,596,595,
+        1,0,0,0,597,600,1,0,0,0,598,596,1,0,0,0,598,599,1,0,0,0,599,27,1,
+        0,0,0,600,598,1,0,0,0,601,623,3,64,32,0,602,623,3,362,181,0,603,
+        605,3,272,136,0,604,603,1,0,0,0,604,605,1,0,0,0,605,606,1,0,0,0,
+        606,623,3,102,51,0,607,609,3,272,136,0,608,607,1,0,0,0,608,609,1,
+        0,0,0,609,610,1,0,0,0,610,623,3,98,49,0,611,613,3,272,136,0,612,
+        611,1,0,0,0,612,613,1,0,0,0,613,615,1,0,0,0,614,616,5,66,0,0,615,
+        614,1,0,0,0,615,616,1,0,0,0,616,617,1,0,0,0,617,623,3,104,52,0,618,
+        623,3,90,45,0,619,623,3,210,105,0,620,623,3,100,50,0,621,623,3,438,
+        219,0,622,601,1,0,0,0,622,602,1,0,0,0,622,604,1,0,0,0,622,608,1,
+        0,0,0,622,612,1,0,0,0,622,618,1,0,0,0,622,619,1,0,0,0,622,620,1,
+        0,0,0,622,621,1,0,0,0,623,29,1,0,0,0,624,626,3,28,14,0,625,624,1,
+        0,0,0,626,629,1,0,0,0,627,625,1,0,0,0,627,628,1,0,0,0,628,31,1,0,
+        0,0,629,627,1,0,0,0,630,633,3,496,248,0,631,633,3,128,64,0,632,630,
+        1,0,0,0,632,631,1,0,0,0,633,33,1,0,0,0,634,637,3,494,247,0,635,637,
+        3,126,63,0,636,634,1,0,0,0,636,635,1,0,0,0,637,35,1,0,0,0,638,639,
+        5,10,0,0,639,642,3,106,53,0,640,641,5,79,0,0,641,643,3,192,96,0,
+        642,640,1,0,0,0,642,643,1,0,0,0,643,646,1,0,0,0,644,645,5,84,0,0,
+        645,647,3,192,96,0,646,644,1,0,0,0,646,647,1,0,0,0,647,37,1,0,0,
+        0,648,650,3,272,136,0,649,648,1,0,0,0,649,650,1,0,0,0,650,651,1,
+        0,0,0,651,652,3,36,18,0,652,653,5,138,0,0,653,39,1,0,0,0,654,655,
+        3,206,103,0,655,656,5,133,0,0,656,658,1,0,0,0,657,654,1,0,0,0,657,
+        658,1,0,0,0,658,659,1,0,0,0,659,660,3,10,5,0,660,41,1,0,0,0,661,
+        666,3,40,20,0,662,663,5,139,0,0,663,665,3,40,20,0,664,662,1,0,0,
+        0,665,668,1,0,0,0,666,664,1,0,0,0,666,667,1,0,0,0,667,43,1,0,0,0,
+        668,666,1,0,0,0,669,670,5,11,0,0,670,671,3,272,136,0,671,672,3,292,
+        146,0,672,673,5,138,0,0,673,45,1,0,0,0,674,682,3,230,115,0,675,682,
+        5,72,0,0,676,682,5,73,0,0,677,682,5,3,0,0,678,682,5,96,0,0,679,682,
+        5,77,0,0,680,682,5,98,0,0,681,674,1,0,0,0,681,675,1,0,0,0,681,676,
+        1,0,0,0,681,677,1,0,0,0,681,678,1,0,0,0,681,679,1,0,0,0,681,680,
+        1,0,0,0,682,47,1,0,0,0,683,684,5,11,0,0,684,685,3,46,23,0,685,686,
+        5,58,0,0,686,687,3,178,89,0,687,688,5,41,0,0,688,689,3,192,96,0,
+        689,690,5,138,0,0,690,49,1,0,0,0,691,692,3,230,115,0,692,693,5,138,
+        0,0,693,51,1,0,0,0,694,695,5,104,0,0,695,697,3,158,79,0,696,694,
+        1,0,0,0,696,697,1,0,0,0,697,699,1,0,0,0,698,700,3,218,109,0,699,
+        698,1,0,0,0,699,700,1,0,0,0,700,702,1,0,0,0,701,703,3,342,171,0,
+        702,701,1,0,0,0,702,703,1,0,0,0,703,53,1,0,0,0,704,705,5,30,0,0,
+        705,709,3,62,31,0,706,708,3,498,249,0,707,706,1,0,0,0,708,711,1,
+        0,0,0,709,707,1,0,0,0,709,710,1,0,0,0,710,715,1,0,0,0,711,709,1,
+        0,0,0,712,714,3,120,60,0,713,712,1,0,0,0,714,717,1,0,0,0,715,713,
+        1,0,0,0,715,716,1,0,0,0,716,718,1,0,0,0,717,715,1,0,0,0,718,719,
+        5,24,0,0,719,720,5,30,0,0,720,721,5,138,0,0,721,55,1,0,0,0,722,745,
+        3,454,227,0,723,745,3,452,226,0,724,745,3,490,245,0,725,745,3,470,
+        235,0,726,745,3,124,62,0,727,745,3,418,209,0,728,745,3,502,251,0,
+        729,745,3,196,98,0,730,745,3,16,8,0,731,745,3,88,44,0,732,745,3,
+        44,22,0,733,745,3,48,24,0,734,745,3,122,61,0,735,745,3,146,73,0,
+        736,745,3,446,223,0,737,745,3,498,249,0,738,745,3,226,113,0,739,
+        745,3,224,112,0,740,745,3,306,153,0,741,745,3,448,224,0,742,745,
+        3,368,184,0,743,745,3,482,241,0,744,722,1,0,0,0,744,723,1,0,0,0,
+        744,724,1,0,0,0,744,725,1,0,0,0,744,726,1,0,0,0,744,727,1,0,0,0,
+        744,728,1,0,0,0,744,729,1,0,0,0,744,730,1,0,0,0,744,731,1,0,0,0,
+        744,732,1,0,0,0,744,733,1,0,0,0,744,734,1,0,0,0,744,735,1,0,0,0,
+        744,736,1,0,0,0,744,737,1,0,0,0,744,738,1,0,0,0,744,739,1,0,0,0,
+        744,740,1,0,0,0,744,741,1,0,0,0,744,742,1,0,0,0,744,743,1,0,0,0,
+        745,57,1,0,0,0,746,748,3,56,28,0,747,746,1,0,0,0,748,751,1,0,0,0,
+        749,747,1,0,0,0,749,750,1,0,0,0,750,59,1,0,0,0,751,749,1,0,0,0,752,
+        756,3,214,107,0,753,754,3,218,109,0,754,755,5,138,0,0,755,757,1,
+        0,0,0,756,753,1,0,0,0,756,757,1,0,0,0,757,759,1,0,0,0,758,752,1,
+        0,0,0,758,759,1,0,0,0,759,766,1,0,0,0,760,764,3,338,169,0,761,762,
+        3,342,171,0,762,763,5,138,0,0,763,765,1,0,0,0,764,761,1,0,0,0,764,
+        765,1,0,0,0,765,767,1,0,0,0,766,760,1,0,0,0,766,767,1,0,0,0,767,
+        61,1,0,0,0,768,773,3,230,115,0,769,770,5,141,0,0,770,771,3,238,119,
+        0,771,772,5,142,0,0,772,774,1,0,0,0,773,769,1,0,0,0,773,774,1,0,
+        0,0,774,777,1,0,0,0,775,777,3,292,146,0,776,768,1,0,0,0,776,775,
+        1,0,0,0,777,63,1,0,0,0,778,779,3,272,136,0,779,784,5,13,0,0,780,
+        781,5,141,0,0,781,782,3,192,96,0,782,783,5,142,0,0,783,785,1,0,0,
+        0,784,780,1,0,0,0,784,785,1,0,0,0,785,787,1,0,0,0,786,788,5,41,0,
+        0,787,786,1,0,0,0,787,788,1,0,0,0,788,789,1,0,0,0,789,790,3,60,30,
+        0,790,791,3,58,29,0,791,792,5,12,0,0,792,793,3,66,33,0,793,794,5,
+        24,0,0,794,796,5,13,0,0,795,797,3,230,115,0,796,795,1,0,0,0,796,
+        797,1,0,0,0,797,798,1,0,0,0,798,799,5,138,0,0,799,65,1,0,0,0,800,
+        802,3,28,14,0,801,800,1,0,0,0,802,805,1,0,0,0,803,801,1,0,0,0,803,
+        804,1,0,0,0,804,67,1,0,0,0,805,803,1,0,0,0,806,808,5,71,0,0,807,
+        809,3,4,2,0,808,807,1,0,0,0,808,809,1,0,0,0,809,811,1,0,0,0,810,
+        812,3,484,242,0,811,810,1,0,0,0,811,812,1,0,0,0,812,813,1,0,0,0,
+        813,814,3,480,240,0,814,815,5,138,0,0,815,69,1,0,0,0,816,818,3,74,
+        37,0,817,816,1,0,0,0,817,818,1,0,0,0,818,819,1,0,0,0,819,820,3,292,
+        146,0,820,821,5,133,0,0,821,822,3,192,96,0,822,71,1,0,0,0,823,828,
+        3,70,35,0,824,825,5,139,0,0,825,827,3,70,35,0,826,824,1,0,0,0,827,
+        830,1,0,0,0,828,826,1,0,0,0,828,829,1,0,0,0,829,73,1,0,0,0,830,828,
+        1,0,0,0,831,832,5,30,0,0,832,833,3,292,146,0,833,834,5,104,0,0,834,
+        75,1,0,0,0,835,837,3,272,136,0,836,835,1,0,0,0,836,837,1,0,0,0,837,
+        838,1,0,0,0,838,840,5,15,0,0,839,841,3,72,36,0,840,839,1,0,0,0,840,
+        841,1,0,0,0,841,844,1,0,0,0,842,843,5,108,0,0,843,845,3,106,53,0,
+        844,842,1,0,0,0,844,845,1,0,0,0,845,846,1,0,0,0,846,847,5,138,0,
+        0,847,77,1,0,0,0,848,850,3,272,136,0,849,848,1,0,0,0,849,850,1,0,
+        0,0,850,851,1,0,0,0,851,852,5,18,0,0,852,853,3,192,96,0,853,855,
+        5,41,0,0,854,856,3,80,40,0,855,854,1,0,0,0,856,857,1,0,0,0,857,855,
+        1,0,0,0,857,858,1,0,0,0,858,859,1,0,0,0,859,860,5,24,0,0,860,862,
+        5,18,0,0,861,863,3,230,115,0,862,861,1,0,0,0,862,863,1,0,0,0,863,
+        864,1,0,0,0,864,865,5,138,0,0,865,79,1,0,0,0,866,867,5,108,0,0,867,
+        868,3,84,42,0,868,869,5,133,0,0,869,870,3,408,204,0,870,81,1,0,0,
+        0,871,876,3,230,115,0,872,876,3,148,74,0,873,876,3,426,213,0,874,
+        876,5,62,0,0,875,871,1,0,0,0,875,872,1,0,0,0,875,873,1,0,0,0,875,
+        874,1,0,0,0,876,83,1,0,0,0,877,882,3,82,41,0,878,879,5,153,0,0,879,
+        881,3,82,41,0,880,878,1,0,0,0,881,884,1,0,0,0,882,880,1,0,0,0,882,
+        883,1,0,0,0,883,85,1,0,0,0,884,882,1,0,0,0,885,886,5,30,0,0,886,
+        890,3,92,46,0,887,888,3,52,26,0,888,889,5,138,0,0,889,891,1,0,0,
+        0,890,887,1,0,0,0,890,891,1,0,0,0,891,893,1,0,0,0,892,894,3,54,27,
+        0,893,892,1,0,0,0,893,894,1,0,0,0,894,895,1,0,0,0,895,896,5,24,0,
+        0,896,897,5,30,0,0,897,898,5,138,0,0,898,87,1,0,0,0,899,900,5,19,
+        0,0,900,902,3,230,115,0,901,903,5,41,0,0,902,901,1,0,0,0,902,903,
+        1,0,0,0,903,905,1,0,0,0,904,906,3,214,107,0,905,904,1,0,0,0,905,
+        906,1,0,0,0,906,908,1,0,0,0,907,909,3,338,169,0,908,907,1,0,0,0,
+        908,909,1,0,0,0,909,910,1,0,0,0,910,911,5,24,0,0,911,913,5,19,0,
+        0,912,914,3,230,115,0,913,912,1,0,0,0,913,914,1,0,0,0,914,915,1,
+        0,0,0,915,916,5,138,0,0,916,89,1,0,0,0,917,918,3,272,136,0,918,920,
+        3,242,121,0,919,921,3,218,109,0,920,919,1,0,0,0,920,921,1,0,0,0,
+        921,923,1,0,0,0,922,924,3,342,171,0,923,922,1,0,0,0,923,924,1,0,
+        0,0,924,925,1,0,0,0,925,926,5,138,0,0,926,91,1,0,0,0,927,928,3,244,
+        122,0,928,929,5,145,0,0,929,930,3,292,146,0,930,93,1,0,0,0,931,934,
+        3,32,16,0,932,934,3,380,190,0,933,931,1,0,0,0,933,932,1,0,0,0,934,
+        95,1,0,0,0,935,938,3,34,17,0,936,938,3,382,191,0,937,935,1,0,0,0,
+        937,936,1,0,0,0,938,97,1,0,0,0,939,941,3,272,136,0,940,939,1,0,0,
+        0,940,941,1,0,0,0,941,943,1,0,0,0,942,944,5,66,0,0,943,942,1,0,0,
+        0,943,944,1,0,0,0,944,945,1,0,0,0,945,946,3,36,18,0,946,947,5,138,
+        0,0,947,99,1,0,0,0,948,950,3,272,136,0,949,948,1,0,0,0,949,950,1,
+        0,0,0,950,951,1,0,0,0,951,953,5,15,0,0,952,954,3,72,36,0,953,952,
+        1,0,0,0,953,954,1,0,0,0,954,956,1,0,0,0,955,957,3,404,202,0,956,
+        955,1,0,0,0,956,957,1,0,0,0,957,960,1,0,0,0,958,959,5,108,0,0,959,
+        961,3,106,53,0,960,958,1,0,0,0,960,961,1,0,0,0,961,962,1,0,0,0,962,
+        963,5,138,0,0,963,101,1,0,0,0,964,966,3,272,136,0,965,964,1,0,0,
+        0,965,966,1,0,0,0,966,968,1,0,0,0,967,969,5,66,0,0,968,967,1,0,0,
+        0,968,969,1,0,0,0,969,970,1,0,0,0,970,971,3,354,177,0,971,972,5,
+        138,0,0,972,103,1,0,0,0,973,975,3,272,136,0,974,973,1,0,0,0,974,
+        975,1,0,0,0,975,977,1,0,0,0,976,978,5,66,0,0,977,976,1,0,0,0,977,
+        978,1,0,0,0,978,981,1,0,0,0,979,982,3,110,55,0,980,982,3,400,200,
+        0,981,979,1,0,0,0,981,980,1,0,0,0,982,105,1,0,0,0,983,984,3,192,
+        96,0,984,107,1,0,0,0,985,986,5,103,0,0,986,987,3,106,53,0,987,109,
+        1,0,0,0,988,989,3,476,238,0,989,990,5,131,0,0,990,991,3,318,159,
+        0,991,992,3,112,56,0,992,993,5,138,0,0,993,111,1,0,0,0,994,1001,
+        3,506,253,0,995,996,5,108,0,0,996,999,3,106,53,0,997,998,5,26,0,
+        0,998,1000,3,112,56,0,999,997,1,0,0,0,999,1000,1,0,0,0,1000,1002,
+        1,0,0,0,1001,995,1,0,0,0,1001,1002,1,0,0,0,1002,113,1,0,0,0,1003,
+        1004,5,20,0,0,1004,1005,3,230,115,0,1005,1006,5,58,0,0,1006,1007,
+        3,292,146,0,1007,1008,5,41,0,0,1008,1009,3,118,59,0,1009,1010,3,
+        54,27,0,1010,1012,5,24,0,0,1011,1013,5,20,0,0,1012,1011,1,0,0,0,
+        1012,1013,1,0,0,0,1013,1015,1,0,0,0,1014,1016,3,230,115,0,1015,1014,
+        1,0,0,0,1015,1016,1,0,0,0,1016,1017,1,0,0,0,1017,1018,5,138,0,0,
+        1018,115,1,0,0,0,1019,1023,3,498,249,0,1020,1023,3,48,24,0,1021,
+        1023,3,224,112,0,1022,1019,1,0,0,0,1022,1020,1,0,0,0,1022,1021,1,
+        0,0,0,1023,117,1,0,0,0,1024,1026,3,116,58,0,1025,1024,1,0,0,0,1026,
+        1029,1,0,0,0,1027,1025,1,0,0,0,1027,1028,1,0,0,0,1028,119,1,0,0,
+        0,1029,1027,1,0,0,0,1030,1033,3,54,27,0,1031,1033,3,86,43,0,1032,
+        1030,1,0,0,0,1032,1031,1,0,0,0,1033,121,1,0,0,0,1034,1035,5,30,0,
+        0,1035,1036,3,92,46,0,1036,1037,3,52,26,0,1037,1038,5,138,0,0,1038,
+        123,1,0,0,0,1039,1040,5,21,0,0,1040,1041,3,232,116,0,1041,1042,5,
+        145,0,0,1042,1045,3,472,236,0,1043,1044,5,135,0,0,1044,1046,3,192,
+        96,0,1045,1043,1,0,0,0,1045,1046,1,0,0,0,1046,1047,1,0,0,0,1047,
+        1048,5,138,0,0,1048,125,1,0,0,0,1049,1050,5,9,0,0,1050,1051,3,236,
+        118,0,1051,1052,5,58,0,0,1052,1053,3,472,236,0,1053,127,1,0,0,0,
+        1054,1055,5,9,0,0,1055,1056,3,236,118,0,1056,1057,5,58,0,0,1057,
+        1058,3,450,225,0,1058,129,1,0,0,0,1059,1062,3,378,189,0,1060,1062,
+        3,236,118,0,1061,1059,1,0,0,0,1061,1060,1,0,0,0,1062,131,1,0,0,0,
+        1063,1065,3,134,67,0,1064,1063,1,0,0,0,1065,1068,1,0,0,0,1066,1064,
+        1,0,0,0,1066,1067,1,0,0,0,1067,133,1,0,0,0,1068,1066,1,0,0,0,1069,
+        1072,3,274,137,0,1070,1072,3,498,249,0,1071,1069,1,0,0,0,1071,1070,
+        1,0,0,0,1072,135,1,0,0,0,1073,1080,5,99,0,0,1074,1075,5,74,0,0,1075,
+        1077,3,192,96,0,1076,1074,1,0,0,0,1076,1077,1,0,0,0,1077,1078,1,
+        0,0,0,1078,1080,5,39,0,0,1079,1073,1,0,0,0,1079,1076,1,0,0,0,1080,
+        137,1,0,0,0,1081,1083,3,140,70,0,1082,1081,1,0,0,0,1083,1086,1,0,
+        0,0,1084,1082,1,0,0,0,1084,1085,1,0,0,0,1085,1087,1,0,0,0,1086,1084,
+        1,0,0,0,1087,1088,5,0,0,1,1088,139,1,0,0,0,1089,1090,3,132,66,0,
+        1090,1091,3,276,138,0,1091,141,1,0,0,0,1092,1095,3,230,115,0,1093,
+        1095,5,127,0,0,1094,1092,1,0,0,0,1094,1093,1,0,0,0,1095,143,1,0,
+        0,0,1096,1097,7,2,0,0,1097,145,1,0,0,0,1098,1099,5,22,0,0,1099,1100,
+        3,228,114,0,1100,1101,5,4,0,0,1101,1102,3,192,96,0,1102,1103,5,138,
+        0,0,1103,147,1,0,0,0,1104,1107,3,374,187,0,1105,1107,3,472,236,0,
+        1106,1104,1,0,0,0,1106,1105,1,0,0,0,1107,149,1,0,0,0,1108,1109,3,
+        84,42,0,1109,1110,5,133,0,0,1110,1112,1,0,0,0,1111,1108,1,0,0,0,
+        1111,1112,1,0,0,0,1112,1113,1,0,0,0,1113,1114,3,192,96,0,1114,151,
+        1,0,0,0,1115,1116,3,232,116,0,1116,1117,5,145,0,0,1117,1118,3,156,
+        78,0,1118,1119,5,138,0,0,1119,153,1,0,0,0,1120,1121,3,450,225,0,
+        1121,155,1,0,0,0,1122,1123,3,472,236,0,1123,157,1,0,0,0,1124,1125,
+        5,25,0,0,1125,1130,3,292,146,0,1126,1127,5,20,0,0,1127,1130,3,292,
+        146,0,1128,1130,5,60,0,0,1129,1124,1,0,0,0,1129,1126,1,0,0,0,1129,
+        1128,1,0,0,0,1130,159,1,0,0,0,1131,1132,7,3,0,0,1132,161,1,0,0,0,
+        1133,1135,3,160,80,0,1134,1136,5,136,0,0,1135,1134,1,0,0,0,1135,
+        1136,1,0,0,0,1136,163,1,0,0,0,1137,1142,3,162,81,0,1138,1139,5,139,
+        0,0,1139,1141,3,162,81,0,1140,1138,1,0,0,0,1141,1144,1,0,0,0,1142,
+        1140,1,0,0,0,1142,1143,1,0,0,0,1143,165,1,0,0,0,1144,1142,1,0,0,
+        0,1145,1146,5,25,0,0,1146,1147,3,230,115,0,1147,1148,5,41,0,0,1148,
+        1149,3,174,87,0,1149,1152,3,170,85,0,1150,1151,5,12,0,0,1151,1153,
+        3,182,91,0,1152,1150,1,0,0,0,1152,1153,1,0,0,0,1153,1154,1,0,0,0,
+        1154,1156,5,24,0,0,1155,1157,5,25,0,0,1156,1155,1,0,0,0,1156,1157,
+        1,0,0,0,1157,1159,1,0,0,0,1158,1160,3,230,115,0,1159,1158,1,0,0,
+        0,1159,1160,1,0,0,0,1160,1161,1,0,0,0,1161,1162,5,138,0,0,1162,167,
+        1,0,0,0,1163,1184,3,454,227,0,1164,1184,3,452,226,0,1165,1184,3,
+        490,245,0,1166,1184,3,470,235,0,1167,1184,3,124,62,0,1168,1184,3,
+        418,209,0,1169,1184,3,502,251,0,1170,1184,3,196,98,0,1171,1184,3,
+        16,8,0,1172,1184,3,44,22,0,1173,1184,3,48,24,0,1174,1184,3,146,73,
+        0,1175,1184,3,446,223,0,1176,1184,3,498,249,0,1177,1184,3,226,113,
+        0,1178,1184,3,224,112,0,1179,1184,3,306,153,0,1180,1184,3,448,224,
+        0,1181,1184,3,368,184,0,1182,1184,3,482,241,0,1183,1163,1,0,0,0,
+        1183,1164,1,0,0,0,1183,1165,1,0,0,0,1183,1166,1,0,0,0,1183,1167,
+        1,0,0,0,1183,1168,1,0,0,0,1183,1169,1,0,0,0,1183,1170,1,0,0,0,1183,
+        1171,1,0,0,0,1183,1172,1,0,0,0,1183,1173,1,0,0,0,1183,1174,1,0,0,
+        0,1183,1175,1,0,0,0,1183,1176,1,0,0,0,1183,1177,1,0,0,0,1183,1178,
+        1,0,0,0,1183,1179,1,0,0,0,1183,1180,1,0,0,0,1183,1181,1,0,0,0,1183,
+        1182,1,0,0,0,1184,169,1,0,0,0,1185,1187,3,168,84,0,1186,1185,1,0,
+        0,0,1187,1190,1,0,0,0,1188,1186,1,0,0,0,1188,1189,1,0,0,0,1189,171,
+        1,0,0,0,1190,1188,1,0,0,0,1191,1193,3,184,92,0,1192,1194,3,424,212,
+        0,1193,1192,1,0,0,0,1193,1194,1,0,0,0,1194,173,1,0,0,0,1195,1197,
+        3,214,107,0,1196,1195,1,0,0,0,1196,1197,1,0,0,0,1197,1199,1,0,0,
+        0,1198,1200,3,338,169,0,1199,1198,1,0,0,0,1199,1200,1,0,0,0,1200,
+        175,1,0,0,0,1201,1206,3,172,86,0,1202,1203,5,139,0,0,1203,1205,3,
+        172,86,0,1204,1202,1,0,0,0,1205,1208,1,0,0,0,1206,1204,1,0,0,0,1206,
+        1207,1,0,0,0,1207,1212,1,0,0,0,1208,1206,1,0,0,0,1209,1212,5,62,
+        0,0,1210,1212,5,6,0,0,1211,1201,1,0,0,0,1211,1209,1,0,0,0,1211,1210,
+        1,0,0,0,1212,177,1,0,0,0,1213,1214,3,176,88,0,1214,1215,5,145,0,
+        0,1215,1216,3,160,80,0,1216,179,1,0,0,0,1217,1221,3,98,49,0,1218,
+        1221,3,362,181,0,1219,1221,3,102,51,0,1220,1217,1,0,0,0,1220,1218,
+        1,0,0,0,1220,1219,1,0,0,0,1221,181,1,0,0,0,1222,1224,3,180,90,0,
+        1223,1222,1,0,0,0,1224,1227,1,0,0,0,1225,1223,1,0,0,0,1225,1226,
+        1,0,0,0,1226,183,1,0,0,0,1227,1225,1,0,0,0,1228,1232,3,230,115,0,
+        1229,1232,5,126,0,0,1230,1232,5,127,0,0,1231,1228,1,0,0,0,1231,1229,
+        1,0,0,0,1231,1230,1,0,0,0,1232,185,1,0,0,0,1233,1236,3,230,115,0,
+        1234,1236,5,126,0,0,1235,1233,1,0,0,0,1235,1234,1,0,0,0,1236,187,
+        1,0,0,0,1237,1238,5,141,0,0,1238,1243,3,186,93,0,1239,1240,5,139,
+        0,0,1240,1242,3,186,93,0,1241,1239,1,0,0,0,1242,1245,1,0,0,0,1243,
+        1241,1,0,0,0,1243,1244,1,0,0,0,1244,1246,1,0,0,0,1245,1243,1,0,0,
+        0,1246,1247,5,142,0,0,1247,189,1,0,0,0,1248,1250,3,272,136,0,1249,
+        1248,1,0,0,0,1249,1250,1,0,0,0,1250,1251,1,0,0,0,1251,1253,5,28,
+        0,0,1252,1254,3,230,115,0,1253,1252,1,0,0,0,1253,1254,1,0,0,0,1254,
+        1257,1,0,0,0,1255,1256,5,108,0,0,1256,1258,3,106,53,0,1257,1255,
+        1,0,0,0,1257,1258,1,0,0,0,1258,1259,1,0,0,0,1259,1260,5,138,0,0,
+        1260,191,1,0,0,0,1261,1267,3,384,192,0,1262,1263,3,284,142,0,1263,
+        1264,3,384,192,0,1264,1266,1,0,0,0,1265,1262,1,0,0,0,1266,1269,1,
+        0,0,0,1267,1265,1,0,0,0,1267,1268,1,0,0,0,1268,193,1,0,0,0,1269,
+        1267,1,0,0,0,1270,1273,3,344,172,0,1271,1272,5,129,0,0,1272,1274,
+        3,344,172,0,1273,1271,1,0,0,0,1273,1274,1,0,0,0,1274,1280,1,0,0,
+        0,1275,1276,5,1,0,0,1276,1280,3,344,172,0,1277,1278,5,56,0,0,1278,
+        1280,3,344,172,0,1279,1270,1,0,0,0,1279,1275,1,0,0,0,1279,1277,1,
+        0,0,0,1280,195,1,0,0,0,1281,1282,5,29,0,0,1282,1283,3,232,116,0,
+        1283,1284,5,145,0,0,1284,1286,3,472,236,0,1285,1287,3,200,100,0,
+        1286,1285,1,0,0,0,1286,1287,1,0,0,0,1287,1288,1,0,0,0,1288,1289,
+        5,138,0,0,1289,197,1,0,0,0,1290,1291,3,192,96,0,1291,199,1,0,0,0,
+        1292,1293,5,60,0,0,1293,1295,3,192,96,0,1294,1292,1,0,0,0,1294,1295,
+        1,0,0,0,1295,1296,1,0,0,0,1296,1297,5,41,0,0,1297,1298,3,198,99,
+        0,1298,201,1,0,0,0,1299,1300,5,29,0,0,1300,1301,5,58,0,0,1301,1302,
+        3,472,236,0,1302,203,1,0,0,0,1303,1304,3,258,129,0,1304,205,1,0,
+        0,0,1305,1312,3,230,115,0,1306,1307,3,230,115,0,1307,1308,5,141,
+        0,0,1308,1309,3,376,188,0,1309,1310,5,142,0,0,1310,1312,1,0,0,0,
+        1311,1305,1,0,0,0,1311,1306,1,0,0,0,1312,207,1,0,0,0,1313,1314,5,
+        71,0,0,1314,1315,3,232,116,0,1315,1316,5,145,0,0,1316,1319,3,472,
+        236,0,1317,1318,5,135,0,0,1318,1320,3,192,96,0,1319,1317,1,0,0,0,
+        1319,1320,1,0,0,0,1320,1321,1,0,0,0,1321,1322,5,138,0,0,1322,209,
+        1,0,0,0,1323,1324,3,272,136,0,1324,1325,3,212,106,0,1325,1333,5,
+        32,0,0,1326,1328,3,56,28,0,1327,1326,1,0,0,0,1328,1331,1,0,0,0,1329,
+        1327,1,0,0,0,1329,1330,1,0,0,0,1330,1332,1,0,0,0,1331,1329,1,0,0,
+        0,1332,1334,5,12,0,0,1333,1329,1,0,0,0,1333,1334,1,0,0,0,1334,1338,
+        1,0,0,0,1335,1337,3,28,14,0,1336,1335,1,0,0,0,1337,1340,1,0,0,0,
+        1338,1336,1,0,0,0,1338,1339,1,0,0,0,1339,1341,1,0,0,0,1340,1338,
+        1,0,0,0,1341,1342,5,24,0,0,1342,1344,5,32,0,0,1343,1345,3,230,115,
+        0,1344,1343,1,0,0,0,1344,1345,1,0,0,0,1345,1346,1,0,0,0,1346,1347,
+        5,138,0,0,1347,211,1,0,0,0,1348,1349,5,30,0,0,1349,1353,3,332,166,
+        0,1350,1351,5,36,0,0,1351,1353,3,106,53,0,1352,1348,1,0,0,0,1352,
+        1350,1,0,0,0,1353,213,1,0,0,0,1354,1355,5,33,0,0,1355,1356,5,141,
+        0,0,1356,1357,3,216,108,0,1357,1358,5,142,0,0,1358,1359,5,138,0,
+        0,1359,215,1,0,0,0,1360,1365,3,246,123,0,1361,1362,5,138,0,0,1362,
+        1364,3,246,123,0,1363,1361,1,0,0,0,1364,1367,1,0,0,0,1365,1363,1,
+        0,0,0,1365,1366,1,0,0,0,1366,217,1,0,0,0,1367,1365,1,0,0,0,1368,
+        1369,5,33,0,0,1369,1370,5,48,0,0,1370,1371,5,141,0,0,1371,1372,3,
+        42,21,0,1372,1373,5,142,0,0,1373,219,1,0,0,0,1374,1377,3,292,146,
+        0,1375,1377,5,126,0,0,1376,1374,1,0,0,0,1376,1375,1,0,0,0,1377,221,
+        1,0,0,0,1378,1383,3,220,110,0,1379,1380,5,139,0,0,1380,1382,3,220,
+        110,0,1381,1379,1,0,0,0,1382,1385,1,0,0,0,1383,1381,1,0,0,0,1383,
+        1384,1,0,0,0,1384,223,1,0,0,0,1385,1383,1,0,0,0,1386,1387,5,34,0,
+        0,1387,1388,3,272,136,0,1388,1389,3,292,146,0,1389,1390,5,141,0,
+        0,1390,1391,3,222,111,0,1391,1392,5,142,0,0,1392,1393,5,138,0,0,
+        1393,225,1,0,0,0,1394,1395,5,34,0,0,1395,1396,3,230,115,0,1396,1397,
+        5,41,0,0,1397,1398,5,141,0,0,1398,1399,3,164,82,0,1399,1400,5,142,
+        0,0,1400,1401,5,138,0,0,1401,227,1,0,0,0,1402,1403,3,422,211,0,1403,
+        1404,5,145,0,0,1404,1405,3,292,146,0,1405,229,1,0,0,0,1406,1407,
+        7,4,0,0,1407,231,1,0,0,0,1408,1413,3,230,115,0,1409,1410,5,139,0,
+        0,1410,1412,3,230,115,0,1411,1409,1,0,0,0,1412,1415,1,0,0,0,1413,
+        1411,1,0,0,0,1413,1414,1,0,0,0,1414,233,1,0,0,0,1415,1413,1,0,0,
+        0,1416,1418,3,272,136,0,1417,1416,1,0,0,0,1417,1418,1,0,0,0,1418,
+        1419,1,0,0,0,1419,1420,5,36,0,0,1420,1421,3,106,53,0,1421,1422,5,
+        95,0,0,1422,1430,3,408,204,0,1423,1424,5,27,0,0,1424,1425,3,106,
+        53,0,1425,1426,5,95,0,0,1426,1427,3,408,204,0,1427,1429,1,0,0,0,
+        1428,1423,1,0,0,0,1429,1432,1,0,0,0,1430,1428,1,0,0,0,1430,1431,
+        1,0,0,0,1431,1435,1,0,0,0,1432,1430,1,0,0,0,1433,1434,5,26,0,0,1434,
+        1436,3,408,204,0,1435,1433,1,0,0,0,1435,1436,1,0,0,0,1436,1437,1,
+        0,0,0,1437,1438,5,24,0,0,1438,1440,5,36,0,0,1439,1441,3,230,115,
+        0,1440,1439,1,0,0,0,1440,1441,1,0,0,0,1441,1442,1,0,0,0,1442,1443,
+        5,138,0,0,1443,235,1,0,0,0,1444,1445,5,141,0,0,1445,1450,3,148,74,
+        0,1446,1447,5,139,0,0,1447,1449,3,148,74,0,1448,1446,1,0,0,0,1449,
+        1452,1,0,0,0,1450,1448,1,0,0,0,1450,1451,1,0,0,0,1451,1453,1,0,0,
+        0,1452,1450,1,0,0,0,1453,1454,5,142,0,0,1454,237,1,0,0,0,1455,1458,
+        3,148,74,0,1456,1458,3,192,96,0,1457,1455,1,0,0,0,1457,1456,1,0,
+        0,0,1458,239,1,0,0,0,1459,1460,3,292,146,0,1460,1461,5,72,0,0,1461,
+        1462,5,136,0,0,1462,241,1,0,0,0,1463,1465,5,19,0,0,1464,1463,1,0,
+        0,0,1464,1465,1,0,0,0,1465,1466,1,0,0,0,1466,1472,3,292,146,0,1467,
+        1468,5,25,0,0,1468,1472,3,292,146,0,1469,1470,5,20,0,0,1470,1472,
+        3,292,146,0,1471,1464,1,0,0,0,1471,1467,1,0,0,0,1471,1469,1,0,0,
+        0,1472,243,1,0,0,0,1473,1478,3,230,115,0,1474,1475,5,139,0,0,1475,
+        1477,3,230,115,0,1476,1474,1,0,0,0,1477,1480,1,0,0,0,1478,1476,1,
+        0,0,0,1478,1479,1,0,0,0,1479,1484,1,0,0,0,1480,1478,1,0,0,0,1481,
+        1484,5,62,0,0,1482,1484,5,6,0,0,1483,1473,1,0,0,0,1483,1481,1,0,
+        0,0,1483,1482,1,0,0,0,1484,245,1,0,0,0,1485,1487,5,21,0,0,1486,1485,
+        1,0,0,0,1486,1487,1,0,0,0,1487,1488,1,0,0,0,1488,1489,3,232,116,
+        0,1489,1491,5,145,0,0,1490,1492,5,38,0,0,1491,1490,1,0,0,0,1491,
+        1492,1,0,0,0,1492,1493,1,0,0,0,1493,1496,3,472,236,0,1494,1495,5,
+        135,0,0,1495,1497,3,192,96,0,1496,1494,1,0,0,0,1496,1497,1,0,0,0,
+        1497,247,1,0,0,0,1498,1505,3,246,123,0,1499,1505,3,264,132,0,1500,
+        1505,3,268,134,0,1501,1505,3,252,126,0,1502,1505,3,266,133,0,1503,
+        1505,3,260,130,0,1504,1498,1,0,0,0,1504,1499,1,0,0,0,1504,1500,1,
+        0,0,0,1504,1501,1,0,0,0,1504,1502,1,0,0,0,1504,1503,1,0,0,0,1505,
+        249,1,0,0,0,1506,1507,3,248,124,0,1507,251,1,0,0,0,1508,1509,5,29,
+        0,0,1509,1510,3,232,116,0,1510,1511,5,145,0,0,1511,1512,3,472,236,
+        0,1512,253,1,0,0,0,1513,1518,3,264,132,0,1514,1515,5,138,0,0,1515,
+        1517,3,264,132,0,1516,1514,1,0,0,0,1517,1520,1,0,0,0,1518,1516,1,
+        0,0,0,1518,1519,1,0,0,0,1519,255,1,0,0,0,1520,1518,1,0,0,0,1521,
+        1526,3,262,131,0,1522,1523,5,138,0,0,1523,1525,3,262,131,0,1524,
+        1522,1,0,0,0,1525,1528,1,0,0,0,1526,1524,1,0,0,0,1526,1527,1,0,0,
+        0,1527,257,1,0,0,0,1528,1526,1,0,0,0,1529,1534,3,250,125,0,1530,
+        1531,5,138,0,0,1531,1533,3,250,125,0,1532,1530,1,0,0,0,1533,1536,
+        1,0,0,0,1534,1532,1,0,0,0,1534,1535,1,0,0,0,1535,259,1,0,0,0,1536,
+        1534,1,0,0,0,1537,1538,5,71,0,0,1538,1539,3,232,116,0,1539,1541,
+        5,145,0,0,1540,1542,7,5,0,0,1541,1540,1,0,0,0,1541,1542,1,0,0,0,
+        1542,1543,1,0,0,0,1543,1546,3,472,236,0,1544,1545,5,135,0,0,1545,
+        1547,3,192,96,0,1546,1544,1,0,0,0,1546,1547,1,0,0,0,1547,261,1,0,
+        0,0,1548,1549,3,232,116,0,1549,1551,5,145,0,0,1550,1552,3,288,144,
+        0,1551,1550,1,0,0,0,1551,1552,1,0,0,0,1552,1553,1,0,0,0,1553,1555,
+        3,472,236,0,1554,1556,5,17,0,0,1555,1554,1,0,0,0,1555,1556,1,0,0,
+        0,1556,1559,1,0,0,0,1557,1558,5,135,0,0,1558,1560,3,192,96,0,1559,
+        1557,1,0,0,0,1559,1560,1,0,0,0,1560,263,1,0,0,0,1561,1562,5,86,0,
+        0,1562,1563,3,232,116,0,1563,1565,5,145,0,0,1564,1566,3,288,144,
+        0,1565,1564,1,0,0,0,1565,1566,1,0,0,0,1566,1567,1,0,0,0,1567,1569,
+        3,472,236,0,1568,1570,5,17,0,0,1569,1568,1,0,0,0,1569,1570,1,0,0,
+        0,1570,1573,1,0,0,0,1571,1572,5,135,0,0,1572,1574,3,192,96,0,1573,
+        1571,1,0,0,0,1573,1574,1,0,0,0,1574,265,1,0,0,0,1575,1576,5,94,0,
+        0,1576,1577,3,232,116,0,1577,1578,5,145,0,0,1578,1579,3,450,225,
+        0,1579,267,1,0,0,0,1580,1582,5,105,0,0,1581,1580,1,0,0,0,1581,1582,
+        1,0,0,0,1582,1583,1,0,0,0,1583,1584,3,232,116,0,1584,1586,5,145,
+        0,0,1585,1587,3,288,144,0,1586,1585,1,0,0,0,1586,1587,1,0,0,0,1587,
+        1588,1,0,0,0,1588,1591,3,472,236,0,1589,1590,5,135,0,0,1590,1592,
+        3,192,96,0,1591,1589,1,0,0,0,1591,1592,1,0,0,0,1592,269,1,0,0,0,
+        1593,1594,5,109,0,0,1594,1598,3,106,53,0,1595,1596,5,30,0,0,1596,
+        1598,3,332,166,0,1597,1593,1,0,0,0,1597,1595,1,0,0,0,1598,271,1,
+        0,0,0,1599,1600,3,230,115,0,1600,1601,5,145,0,0,1601,273,1,0,0,0,
+        1602,1603,5,43,0,0,1603,1604,3,282,141,0,1604,1605,5,138,0,0,1605,
+        275,1,0,0,0,1606,1609,3,396,198,0,1607,1609,3,346,173,0,1608,1606,
+        1,0,0,0,1608,1607,1,0,0,0,1609,277,1,0,0,0,1610,1616,5,57,0,0,1611,
+        1616,5,113,0,0,1612,1616,5,127,0,0,1613,1616,3,186,93,0,1614,1616,
+        3,314,157,0,1615,1610,1,0,0,0,1615,1611,1,0,0,0,1615,1612,1,0,0,
+        0,1615,1613,1,0,0,0,1615,1614,1,0,0,0,1616,279,1,0,0,0,1617,1618,
+        3,230,115,0,1618,281,1,0,0,0,1619,1624,3,280,140,0,1620,1621,5,139,
+        0,0,1621,1623,3,280,140,0,1622,1620,1,0,0,0,1623,1626,1,0,0,0,1624,
+        1622,1,0,0,0,1624,1625,1,0,0,0,1625,283,1,0,0,0,1626,1624,1,0,0,
+        0,1627,1628,7,6,0,0,1628,285,1,0,0,0,1629,1631,3,272,136,0,1630,
+        1629,1,0,0,0,1630,1631,1,0,0,0,1631,1633,1,0,0,0,1632,1634,3,270,
+        135,0,1633,1632,1,0,0,0,1633,1634,1,0,0,0,1634,1635,1,0,0,0,1635,
+        1636,5,47,0,0,1636,1637,3,408,204,0,1637,1638,5,24,0,0,1638,1640,
+        5,47,0,0,1639,1641,3,230,115,0,1640,1639,1,0,0,0,1640,1641,1,0,0,
+        0,1641,1642,1,0,0,0,1642,1643,5,138,0,0,1643,287,1,0,0,0,1644,1645,
+        7,7,0,0,1645,289,1,0,0,0,1646,1647,7,8,0,0,1647,291,1,0,0,0,1648,
+        1651,3,230,115,0,1649,1651,5,127,0,0,1650,1648,1,0,0,0,1650,1649,
+        1,0,0,0,1651,1655,1,0,0,0,1652,1654,3,294,147,0,1653,1652,1,0,0,
+        0,1654,1657,1,0,0,0,1655,1653,1,0,0,0,1655,1656,1,0,0,0,1656,293,
+        1,0,0,0,1657,1655,1,0,0,0,1658,1662,3,298,149,0,1659,1662,3,300,
+        150,0,1660,1662,3,304,152,0,1661,1658,1,0,0,0,1661,1659,1,0,0,0,
+        1661,1660,1,0,0,0,1662,295,1,0,0,0,1663,1668,3,230,115,0,1664,1665,
+        5,154,0,0,1665,1667,3,474,237,0,1666,1664,1,0,0,0,1667,1670,1,0,
+        0,0,1668,1666,1,0,0,0,1668,1669,1,0,0,0,1669,297,1,0,0,0,1670,1668,
+        1,0,0,0,1671,1672,5,154,0,0,1672,1674,3,474,237,0,1673,1671,1,0,
+        0,0,1674,1675,1,0,0,0,1675,1673,1,0,0,0,1675,1676,1,0,0,0,1676,299,
+        1,0,0,0,1677,1678,5,141,0,0,1678,1679,3,8,4,0,1679,1680,5,142,0,
+        0,1680,301,1,0,0,0,1681,1682,5,141,0,0,1682,1683,3,148,74,0,1683,
+        1684,5,142,0,0,1684,303,1,0,0,0,1685,1687,3,424,212,0,1686,1685,
+        1,0,0,0,1686,1687,1,0,0,0,1687,1688,1,0,0,0,1688,1689,5,162,0,0,
+        1689,1694,3,46,23,0,1690,1691,5,141,0,0,1691,1692,3,192,96,0,1692,
+        1693,5,142,0,0,1693,1695,1,0,0,0,1694,1690,1,0,0,0,1694,1695,1,0,
+        0,0,1695,305,1,0,0,0,1696,1697,5,51,0,0,1697,1698,3,230,115,0,1698,
+        1699,5,41,0,0,1699,1700,3,308,154,0,1700,1701,5,138,0,0,1701,307,
+        1,0,0,0,1702,1705,3,392,196,0,1703,1705,3,94,47,0,1704,1702,1,0,
+        0,0,1704,1703,1,0,0,0,1705,309,1,0,0,0,1706,1707,3,232,116,0,1707,
+        1708,5,145,0,0,1708,1709,3,154,77,0,1709,311,1,0,0,0,1710,1712,3,
+        272,136,0,1711,1710,1,0,0,0,1711,1712,1,0,0,0,1712,1713,1,0,0,0,
+        1713,1715,5,53,0,0,1714,1716,3,230,115,0,1715,1714,1,0,0,0,1715,
+        1716,1,0,0,0,1716,1719,1,0,0,0,1717,1718,5,108,0,0,1718,1720,3,106,
+        53,0,1719,1717,1,0,0,0,1719,1720,1,0,0,0,1720,1721,1,0,0,0,1721,
+        1722,5,138,0,0,1722,313,1,0,0,0,1723,1726,3,0,0,0,1724,1726,3,334,
+        167,0,1725,1723,1,0,0,0,1725,1724,1,0,0,0,1726,315,1,0,0,0,1727,
+        1734,3,124,62,0,1728,1734,3,418,209,0,1729,1734,3,502,251,0,1730,
+        1734,3,196,98,0,1731,1734,3,482,241,0,1732,1734,3,368,184,0,1733,
+        1727,1,0,0,0,1733,1728,1,0,0,0,1733,1729,1,0,0,0,1733,1730,1,0,0,
+        0,1733,1731,1,0,0,0,1733,1732,1,0,0,0,1734,317,1,0,0,0,1735,1737,
+        5,35,0,0,1736,1735,1,0,0,0,1736,1737,1,0,0,0,1737,1739,1,0,0,0,1738,
+        1740,3,136,68,0,1739,1738,1,0,0,0,1739,1740,1,0,0,0,1740,319,1,0,
+        0,0,1741,1742,5,64,0,0,1742,1743,5,14,0,0,1743,1744,3,230,115,0,
+        1744,1745,5,41,0,0,1745,1746,3,324,162,0,1746,1749,5,24,0,0,1747,
+        1748,5,64,0,0,1748,1750,5,14,0,0,1749,1747,1,0,0,0,1749,1750,1,0,
+        0,0,1750,1752,1,0,0,0,1751,1753,3,230,115,0,1752,1751,1,0,0,0,1752,
+        1753,1,0,0,0,1753,1754,1,0,0,0,1754,1755,5,138,0,0,1755,321,1,0,
+        0,0,1756,1768,3,454,227,0,1757,1768,3,452,226,0,1758,1768,3,490,
+        245,0,1759,1768,3,470,235,0,1760,1768,3,124,62,0,1761,1768,3,502,
+        251,0,1762,1768,3,196,98,0,1763,1768,3,16,8,0,1764,1768,3,498,249,
+        0,1765,1768,3,226,113,0,1766,1768,3,224,112,0,1767,1756,1,0,0,0,
+        1767,1757,1,0,0,0,1767,1758,1,0,0,0,1767,1759,1,0,0,0,1767,1760,
+        1,0,0,0,1767,1761,1,0,0,0,1767,1762,1,0,0,0,1767,1763,1,0,0,0,1767,
+        1764,1,0,0,0,1767,1765,1,0,0,0,1767,1766,1,0,0,0,1768,323,1,0,0,
+        0,1769,1771,3,322,161,0,1770,1769,1,0,0,0,1771,1774,1,0,0,0,1772,
+        1770,1,0,0,0,1772,1773,1,0,0,0,1773,325,1,0,0,0,1774,1772,1,0,0,
+        0,1775,1776,5,64,0,0,1776,1777,3,230,115,0,1777,1778,5,41,0,0,1778,
+        1779,3,330,165,0,1779,1781,5,24,0,0,1780,1782,5,64,0,0,1781,1780,
+        1,0,0,0,1781,1782,1,0,0,0,1782,1784,1,0,0,0,1783,1785,3,230,115,
+        0,1784,1783,1,0,0,0,1784,1785,1,0,0,0,1785,1786,1,0,0,0,1786,1787,
+        5,138,0,0,1787,327,1,0,0,0,1788,1808,3,454,227,0,1789,1808,3,452,
+        226,0,1790,1808,3,490,245,0,1791,1808,3,470,235,0,1792,1808,3,124,
+        62,0,1793,1808,3,418,209,0,1794,1808,3,502,251,0,1795,1808,3,196,
+        98,0,1796,1808,3,16,8,0,1797,1808,3,88,44,0,1798,1808,3,44,22,0,
+        1799,1808,3,48,24,0,1800,1808,3,146,73,0,1801,1808,3,498,249,0,1802,
+        1808,3,226,113,0,1803,1808,3,224,112,0,1804,1808,3,306,153,0,1805,
+        1808,3,448,224,0,1806,1808,3,482,241,0,1807,1788,1,0,0,0,1807,1789,
+        1,0,0,0,1807,1790,1,0,0,0,1807,1791,1,0,0,0,1807,1792,1,0,0,0,1807,
+        1793,1,0,0,0,1807,1794,1,0,0,0,1807,1795,1,0,0,0,1807,1796,1,0,0,
+        0,1807,1797,1,0,0,0,1807,1798,1,0,0,0,1807,1799,1,0,0,0,1807,1800,
+        1,0,0,0,1807,1801,1,0,0,0,1807,1802,1,0,0,0,1807,1803,1,0,0,0,1807,
+        1804,1,0,0,0,1807,1805,1,0,0,0,1807,1806,1,0,0,0,1808,329,1,0,0,
+        0,1809,1811,3,328,164,0,1810,1809,1,0,0,0,1811,1814,1,0,0,0,1812,
+        1810,1,0,0,0,1812,1813,1,0,0,0,1813,331,1,0,0,0,1814,1812,1,0,0,
+        0,1815,1816,3,230,115,0,1816,1817,5,38,0,0,1817,1818,3,148,74,0,
+        1818,333,1,0,0,0,1819,1820,3,0,0,0,1820,1821,3,230,115,0,1821,335,
+        1,0,0,0,1822,1823,3,378,189,0,1823,1824,5,102,0,0,1824,1828,3,50,
+        25,0,1825,1827,3,398,199,0,1826,1825,1,0,0,0,1827,1830,1,0,0,0,1828,
+        1826,1,0,0,0,1828,1829,1,0,0,0,1829,1831,1,0,0,0,1830,1828,1,0,0,
+        0,1831,1832,5,24,0,0,1832,1834,5,102,0,0,1833,1835,3,230,115,0,1834,
+        1833,1,0,0,0,1834,1835,1,0,0,0,1835,337,1,0,0,0,1836,1837,5,65,0,
+        0,1837,1838,5,141,0,0,1838,1839,3,340,170,0,1839,1840,5,142,0,0,
+        1840,1841,5,138,0,0,1841,339,1,0,0,0,1842,1843,3,256,128,0,1843,
+        341,1,0,0,0,1844,1845,5,65,0,0,1845,1846,5,48,0,0,1846,1847,5,141,
+        0,0,1847,1848,3,42,21,0,1848,1849,5,142,0,0,1849,343,1,0,0,0,1850,
+        1860,3,278,139,0,1851,1860,3,366,183,0,1852,1853,5,141,0,0,1853,
+        1854,3,192,96,0,1854,1855,5,142,0,0,1855,1860,1,0,0,0,1856,1860,
+        3,22,11,0,1857,1860,3,14,7,0,1858,1860,3,292,146,0,1859,1850,1,0,
+        0,0,1859,1851,1,0,0,0,1859,1852,1,0,0,0,1859,1856,1,0,0,0,1859,1857,
+        1,0,0,0,1859,1858,1,0,0,0,1860,345,1,0,0,0,1861,1865,3,166,83,0,
+        1862,1865,3,114,57,0,1863,1865,3,326,163,0,1864,1861,1,0,0,0,1864,
+        1862,1,0,0,0,1864,1863,1,0,0,0,1865,347,1,0,0,0,1866,1879,3,454,
+        227,0,1867,1879,3,452,226,0,1868,1879,3,490,245,0,1869,1879,3,470,
+        235,0,1870,1879,3,124,62,0,1871,1879,3,502,251,0,1872,1879,3,16,
+        8,0,1873,1879,3,44,22,0,1874,1879,3,48,24,0,1875,1879,3,498,249,
+        0,1876,1879,3,226,113,0,1877,1879,3,224,112,0,1878,1866,1,0,0,0,
+        1878,1867,1,0,0,0,1878,1868,1,0,0,0,1878,1869,1,0,0,0,1878,1870,
+        1,0,0,0,1878,1871,1,0,0,0,1878,1872,1,0,0,0,1878,1873,1,0,0,0,1878,
+        1874,1,0,0,0,1878,1875,1,0,0,0,1878,1876,1,0,0,0,1878,1877,1,0,0,
+        0,1879,349,1,0,0,0,1880,1882,3,348,174,0,1881,1880,1,0,0,0,1882,
+        1885,1,0,0,0,1883,1881,1,0,0,0,1883,1884,1,0,0,0,1884,351,1,0,0,
+        0,1885,1883,1,0,0,0,1886,1888,3,410,205,0,1887,1886,1,0,0,0,1888,
+        1891,1,0,0,0,1889,1887,1,0,0,0,1889,1890,1,0,0,0,1890,353,1,0,0,
+        0,1891,1889,1,0,0,0,1892,1897,3,296,148,0,1893,1894,5,141,0,0,1894,
+        1895,3,8,4,0,1895,1896,5,142,0,0,1896,1898,1,0,0,0,1897,1893,1,0,
+        0,0,1897,1898,1,0,0,0,1898,355,1,0,0,0,1899,1901,3,272,136,0,1900,
+        1899,1,0,0,0,1900,1901,1,0,0,0,1901,1902,1,0,0,0,1902,1903,3,354,
+        177,0,1903,1904,5,138,0,0,1904,357,1,0,0,0,1905,1919,3,454,227,0,
+        1906,1919,3,452,226,0,1907,1919,3,490,245,0,1908,1919,3,470,235,
+        0,1909,1919,3,124,62,0,1910,1919,3,502,251,0,1911,1919,3,196,98,
+        0,1912,1919,3,16,8,0,1913,1919,3,44,22,0,1914,1919,3,48,24,0,1915,
+        1919,3,498,249,0,1916,1919,3,226,113,0,1917,1919,3,224,112,0,1918,
+        1905,1,0,0,0,1918,1906,1,0,0,0,1918,1907,1,0,0,0,1918,1908,1,0,0,
+        0,1918,1909,1,0,0,0,1918,1910,1,0,0,0,1918,1911,1,0,0,0,1918,1912,
+        1,0,0,0,1918,1913,1,0,0,0,1918,1914,1,0,0,0,1918,1915,1,0,0,0,1918,
+        1916,1,0,0,0,1918,1917,1,0,0,0,1919,359,1,0,0,0,1920,1922,3,358,
+        179,0,1921,1920,1,0,0,0,1922,1925,1,0,0,0,1923,1921,1,0,0,0,1923,
+        1924,1,0,0,0,1924,361,1,0,0,0,1925,1923,1,0,0,0,1926,1928,3,272,
+        136,0,1927,1926,1,0,0,0,1927,1928,1,0,0,0,1928,1930,1,0,0,0,1929,
+        1931,5,66,0,0,1930,1929,1,0,0,0,1930,1931,1,0,0,0,1931,1932,1,0,
+        0,0,1932,1937,5,67,0,0,1933,1934,5,141,0,0,1934,1935,3,406,203,0,
+        1935,1936,5,142,0,0,1936,1938,1,0,0,0,1937,1933,1,0,0,0,1937,1938,
+        1,0,0,0,1938,1940,1,0,0,0,1939,1941,5,41,0,0,1940,1939,1,0,0,0,1940,
+        1941,1,0,0,0,1941,1942,1,0,0,0,1942,1943,3,360,180,0,1943,1944,5,
+        12,0,0,1944,1945,3,364,182,0,1945,1947,5,24,0,0,1946,1948,5,66,0,
+        0,1947,1946,1,0,0,0,1947,1948,1,0,0,0,1948,1949,1,0,0,0,1949,1951,
+        5,67,0,0,1950,1952,3,230,115,0,1951,1950,1,0,0,0,1951,1952,1,0,0,
+        0,1952,1953,1,0,0,0,1953,1954,5,138,0,0,1954,363,1,0,0,0,1955,1957,
+        3,410,205,0,1956,1955,1,0,0,0,1957,1960,1,0,0,0,1958,1956,1,0,0,
+        0,1958,1959,1,0,0,0,1959,365,1,0,0,0,1960,1958,1,0,0,0,1961,1962,
+        3,472,236,0,1962,1968,5,162,0,0,1963,1969,3,14,7,0,1964,1965,5,141,
+        0,0,1965,1966,3,192,96,0,1966,1967,5,142,0,0,1967,1969,1,0,0,0,1968,
+        1963,1,0,0,0,1968,1964,1,0,0,0,1969,367,1,0,0,0,1970,1974,3,208,
+        104,0,1971,1974,3,68,34,0,1972,1974,3,444,222,0,1973,1970,1,0,0,
+        0,1973,1971,1,0,0,0,1973,1972,1,0,0,0,1974,369,1,0,0,0,1975,1980,
+        3,292,146,0,1976,1977,5,139,0,0,1977,1979,3,292,146,0,1978,1976,
+        1,0,0,0,1979,1982,1,0,0,0,1980,1978,1,0,0,0,1980,1981,1,0,0,0,1981,
+        1986,1,0,0,0,1982,1980,1,0,0,0,1983,1986,5,62,0,0,1984,1986,5,6,
+        0,0,1985,1975,1,0,0,0,1985,1983,1,0,0,0,1985,1984,1,0,0,0,1986,371,
+        1,0,0,0,1987,1988,3,370,185,0,1988,1989,5,145,0,0,1989,1990,3,292,
+        146,0,1990,373,1,0,0,0,1991,1994,3,376,188,0,1992,1994,3,292,146,
+        0,1993,1991,1,0,0,0,1993,1992,1,0,0,0,1994,375,1,0,0,0,1995,1999,
+        3,426,213,0,1996,1997,3,144,72,0,1997,1998,3,426,213,0,1998,2000,
+        1,0,0,0,1999,1996,1,0,0,0,1999,2000,1,0,0,0,2000,377,1,0,0,0,2001,
+        2002,5,72,0,0,2002,2003,3,374,187,0,2003,379,1,0,0,0,2004,2006,5,
+        76,0,0,2005,2007,3,310,155,0,2006,2005,1,0,0,0,2007,2008,1,0,0,0,
+        2008,2006,1,0,0,0,2008,2009,1,0,0,0,2009,2010,1,0,0,0,2010,2011,
+        5,24,0,0,2011,2013,5,76,0,0,2012,2014,3,230,115,0,2013,2012,1,0,
+        0,0,2013,2014,1,0,0,0,2014,381,1,0,0,0,2015,2017,5,76,0,0,2016,2018,
+        3,152,76,0,2017,2016,1,0,0,0,2018,2019,1,0,0,0,2019,2017,1,0,0,0,
+        2019,2020,1,0,0,0,2020,2021,1,0,0,0,2021,2022,5,24,0,0,2022,2024,
+        5,76,0,0,2023,2025,3,230,115,0,2024,2023,1,0,0,0,2024,2025,1,0,0,
+        0,2025,383,1,0,0,0,2026,2030,3,412,206,0,2027,2028,3,386,193,0,2028,
+        2029,3,412,206,0,2029,2031,1,0,0,0,2030,2027,1,0,0,0,2030,2031,1,
+        0,0,0,2031,385,1,0,0,0,2032,2033,7,9,0,0,2033,387,1,0,0,0,2034,2036,
+        3,272,136,0,2035,2034,1,0,0,0,2035,2036,1,0,0,0,2036,2037,1,0,0,
+        0,2037,2038,5,79,0,0,2038,2041,3,192,96,0,2039,2040,5,84,0,0,2040,
+        2042,3,192,96,0,2041,2039,1,0,0,0,2041,2042,1,0,0,0,2042,2043,1,
+        0,0,0,2043,2044,5,138,0,0,2044,389,1,0,0,0,2045,2047,3,272,136,0,
+        2046,2045,1,0,0,0,2046,2047,1,0,0,0,2047,2048,1,0,0,0,2048,2050,
+        5,80,0,0,2049,2051,3,192,96,0,2050,2049,1,0,0,0,2050,2051,1,0,0,
+        0,2051,2052,1,0,0,0,2052,2053,5,138,0,0,2053,391,1,0,0,0,2054,2055,
+        3,292,146,0,2055,2056,5,3,0,0,2056,2057,3,292,146,0,2057,2058,5,
+        96,0,0,2058,2059,3,292,146,0,2059,2060,5,77,0,0,2060,393,1,0,0,0,
+        2061,2065,3,336,168,0,2062,2065,3,188,94,0,2063,2065,3,378,189,0,
+        2064,2061,1,0,0,0,2064,2062,1,0,0,0,2064,2063,1,0,0,0,2065,395,1,
+        0,0,0,2066,2069,3,24,12,0,2067,2069,3,320,160,0,2068,2066,1,0,0,
+        0,2068,2067,1,0,0,0,2069,397,1,0,0,0,2070,2071,3,230,115,0,2071,
+        2072,5,152,0,0,2072,2073,3,334,167,0,2073,2074,5,138,0,0,2074,399,
+        1,0,0,0,2075,2076,5,107,0,0,2076,2077,3,192,96,0,2077,2078,5,83,
+        0,0,2078,2079,3,476,238,0,2079,2080,5,131,0,0,2080,2081,3,318,159,
+        0,2081,2082,3,402,201,0,2082,2083,5,138,0,0,2083,401,1,0,0,0,2084,
+        2085,3,506,253,0,2085,2086,5,108,0,0,2086,2094,3,84,42,0,2087,2088,
+        5,139,0,0,2088,2089,3,506,253,0,2089,2090,5,108,0,0,2090,2091,3,
+        84,42,0,2091,2093,1,0,0,0,2092,2087,1,0,0,0,2093,2096,1,0,0,0,2094,
+        2092,1,0,0,0,2094,2095,1,0,0,0,2095,403,1,0,0,0,2096,2094,1,0,0,
+        0,2097,2098,5,59,0,0,2098,2099,3,406,203,0,2099,405,1,0,0,0,2100,
+        2105,3,292,146,0,2101,2102,5,139,0,0,2102,2104,3,292,146,0,2103,
+        2101,1,0,0,0,2104,2107,1,0,0,0,2105,2103,1,0,0,0,2105,2106,1,0,0,
+        0,2106,407,1,0,0,0,2107,2105,1,0,0,0,2108,2110,3,410,205,0,2109,
+        2108,1,0,0,0,2110,2113,1,0,0,0,2111,2109,1,0,0,0,2111,2112,1,0,0,
+        0,2112,409,1,0,0,0,2113,2111,1,0,0,0,2114,2133,3,504,252,0,2115,
+        2133,3,38,19,0,2116,2133,3,388,194,0,2117,2133,3,416,208,0,2118,
+        2133,3,500,250,0,2119,2133,3,234,117,0,2120,2133,3,78,39,0,2121,
+        2133,3,286,143,0,2122,2133,3,312,156,0,2123,2133,3,190,95,0,2124,
+        2133,3,390,195,0,2125,2127,3,272,136,0,2126,2125,1,0,0,0,2126,2127,
+        1,0,0,0,2127,2128,1,0,0,0,2128,2129,5,57,0,0,2129,2133,5,138,0,0,
+        2130,2133,3,76,38,0,2131,2133,3,356,178,0,2132,2114,1,0,0,0,2132,
+        2115,1,0,0,0,2132,2116,1,0,0,0,2132,2117,1,0,0,0,2132,2118,1,0,0,
+        0,2132,2119,1,0,0,0,2132,2120,1,0,0,0,2132,2121,1,0,0,0,2132,2122,
+        1,0,0,0,2132,2123,1,0,0,0,2132,2124,1,0,0,0,2132,2126,1,0,0,0,2132,
+        2130,1,0,0,0,2132,2131,1,0,0,0,2133,411,1,0,0,0,2134,2138,3,426,
+        213,0,2135,2136,3,414,207,0,2136,2137,3,426,213,0,2137,2139,1,0,
+        0,0,2138,2135,1,0,0,0,2138,2139,1,0,0,0,2139,413,1,0,0,0,2140,2141,
+        7,10,0,0,2141,415,1,0,0,0,2142,2144,3,272,136,0,2143,2142,1,0,0,
+        0,2143,2144,1,0,0,0,2144,2145,1,0,0,0,2145,2146,3,476,238,0,2146,
+        2148,5,131,0,0,2147,2149,3,136,68,0,2148,2147,1,0,0,0,2148,2149,
+        1,0,0,0,2149,2150,1,0,0,0,2150,2151,3,506,253,0,2151,2152,5,138,
+        0,0,2152,417,1,0,0,0,2153,2154,5,86,0,0,2154,2155,3,232,116,0,2155,
+        2156,5,145,0,0,2156,2158,3,472,236,0,2157,2159,3,420,210,0,2158,
+        2157,1,0,0,0,2158,2159,1,0,0,0,2159,2162,1,0,0,0,2160,2161,5,135,
+        0,0,2161,2163,3,192,96,0,2162,2160,1,0,0,0,2162,2163,1,0,0,0,2163,
+        2164,1,0,0,0,2164,2165,5,138,0,0,2165,419,1,0,0,0,2166,2167,7,11,
+        0,0,2167,421,1,0,0,0,2168,2173,3,292,146,0,2169,2170,5,139,0,0,2170,
+        2172,3,292,146,0,2171,2169,1,0,0,0,2172,2175,1,0,0,0,2173,2171,1,
+        0,0,0,2173,2174,1,0,0,0,2174,2179,1,0,0,0,2175,2173,1,0,0,0,2176,
+        2179,5,62,0,0,2177,2179,5,6,0,0,2178,2168,1,0,0,0,2178,2176,1,0,
+        0,0,2178,2177,1,0,0,0,2179,423,1,0,0,0,2180,2189,5,143,0,0,2181,
+        2186,3,292,146,0,2182,2183,5,139,0,0,2183,2185,3,292,146,0,2184,
+        2182,1,0,0,0,2185,2188,1,0,0,0,2186,2184,1,0,0,0,2186,2187,1,0,0,
+        0,2187,2190,1,0,0,0,2188,2186,1,0,0,0,2189,2181,1,0,0,0,2189,2190,
+        1,0,0,0,2190,2193,1,0,0,0,2191,2192,5,80,0,0,2192,2194,3,292,146,
+        0,2193,2191,1,0,0,0,2193,2194,1,0,0,0,2194,2195,1,0,0,0,2195,2196,
+        5,144,0,0,2196,425,1,0,0,0,2197,2199,7,12,0,0,2198,2197,1,0,0,0,
+        2198,2199,1,0,0,0,2199,2200,1,0,0,0,2200,2206,3,478,239,0,2201,2202,
+        3,12,6,0,2202,2203,3,478,239,0,2203,2205,1,0,0,0,2204,2201,1,0,0,
+        0,2205,2208,1,0,0,0,2206,2204,1,0,0,0,2206,2207,1,0,0,0,2207,427,
+        1,0,0,0,2208,2206,1,0,0,0,2209,2211,3,272,136,0,2210,2209,1,0,0,
+        0,2210,2211,1,0,0,0,2211,2212,1,0,0,0,2212,2213,3,426,213,0,2213,
+        2214,5,130,0,0,2214,2216,3,426,213,0,2215,2217,3,488,244,0,2216,
+        2215,1,0,0,0,2216,2217,1,0,0,0,2217,2218,1,0,0,0,2218,2219,5,138,
+        0,0,2219,429,1,0,0,0,2220,2221,5,108,0,0,2221,2222,3,84,42,0,2222,
+        2223,5,133,0,0,2223,2224,3,440,220,0,2224,431,1,0,0,0,2225,2227,
+        3,272,136,0,2226,2225,1,0,0,0,2226,2227,1,0,0,0,2227,2228,1,0,0,
+        0,2228,2229,5,18,0,0,2229,2230,3,192,96,0,2230,2232,5,104,0,0,2231,
+        2233,3,430,215,0,2232,2231,1,0,0,0,2233,2234,1,0,0,0,2234,2232,1,
+        0,0,0,2234,2235,1,0,0,0,2235,2236,1,0,0,0,2236,2237,5,24,0,0,2237,
+        2239,5,18,0,0,2238,2240,3,230,115,0,2239,2238,1,0,0,0,2239,2240,
+        1,0,0,0,2240,2241,1,0,0,0,2241,2242,5,138,0,0,2242,433,1,0,0,0,2243,
+        2245,3,272,136,0,2244,2243,1,0,0,0,2244,2245,1,0,0,0,2245,2246,1,
+        0,0,0,2246,2247,5,36,0,0,2247,2248,3,106,53,0,2248,2249,5,104,0,
+        0,2249,2257,3,440,220,0,2250,2251,5,27,0,0,2251,2252,3,106,53,0,
+        2252,2253,5,104,0,0,2253,2254,3,440,220,0,2254,2256,1,0,0,0,2255,
+        2250,1,0,0,0,2256,2259,1,0,0,0,2257,2255,1,0,0,0,2257,2258,1,0,0,
+        0,2258,2262,1,0,0,0,2259,2257,1,0,0,0,2260,2261,5,26,0,0,2261,2263,
+        3,440,220,0,2262,2260,1,0,0,0,2262,2263,1,0,0,0,2263,2264,1,0,0,
+        0,2264,2265,5,24,0,0,2265,2267,5,104,0,0,2266,2268,3,230,115,0,2267,
+        2266,1,0,0,0,2267,2268,1,0,0,0,2268,2269,1,0,0,0,2269,2270,5,138,
+        0,0,2270,435,1,0,0,0,2271,2273,3,272,136,0,2272,2271,1,0,0,0,2272,
+        2273,1,0,0,0,2273,2274,1,0,0,0,2274,2276,5,69,0,0,2275,2277,5,41,
+        0,0,2276,2275,1,0,0,0,2276,2277,1,0,0,0,2277,2278,1,0,0,0,2278,2279,
+        3,350,175,0,2279,2280,5,12,0,0,2280,2281,3,352,176,0,2281,2282,5,
+        24,0,0,2282,2284,5,69,0,0,2283,2285,3,230,115,0,2284,2283,1,0,0,
+        0,2284,2285,1,0,0,0,2285,2286,1,0,0,0,2286,2287,5,138,0,0,2287,437,
+        1,0,0,0,2288,2298,3,428,214,0,2289,2298,3,434,217,0,2290,2298,3,
+        432,216,0,2291,2298,3,436,218,0,2292,2294,3,272,136,0,2293,2292,
+        1,0,0,0,2293,2294,1,0,0,0,2294,2295,1,0,0,0,2295,2296,5,57,0,0,2296,
+        2298,5,138,0,0,2297,2288,1,0,0,0,2297,2289,1,0,0,0,2297,2290,1,0,
+        0,0,2297,2291,1,0,0,0,2297,2293,1,0,0,0,2298,439,1,0,0,0,2299,2301,
+        3,438,219,0,2300,2299,1,0,0,0,2301,2304,1,0,0,0,2302,2300,1,0,0,
+        0,2302,2303,1,0,0,0,2303,441,1,0,0,0,2304,2302,1,0,0,0,2305,2306,
+        5,89,0,0,2306,2307,3,426,213,0,2307,2308,5,139,0,0,2308,2309,3,426,
+        213,0,2309,2313,1,0,0,0,2310,2311,5,54,0,0,2311,2313,3,426,213,0,
+        2312,2305,1,0,0,0,2312,2310,1,0,0,0,2313,443,1,0,0,0,2314,2315,5,
+        71,0,0,2315,2316,3,232,116,0,2316,2317,5,145,0,0,2317,2318,3,472,
+        236,0,2318,2319,3,442,221,0,2319,2320,5,138,0,0,2320,445,1,0,0,0,
+        2321,2322,5,44,0,0,2322,2323,3,372,186,0,2323,2324,5,107,0,0,2324,
+        2325,3,192,96,0,2325,2326,5,138,0,0,2326,447,1,0,0,0,2327,2328,5,
+        92,0,0,2328,2329,3,230,115,0,2329,2330,5,41,0,0,2330,2331,3,450,
+        225,0,2331,2332,5,138,0,0,2332,449,1,0,0,0,2333,2335,3,292,146,0,
+        2334,2336,3,236,118,0,2335,2334,1,0,0,0,2335,2336,1,0,0,0,2336,2343,
+        1,0,0,0,2337,2338,5,98,0,0,2338,2339,3,192,96,0,2339,2340,5,3,0,
+        0,2340,2341,3,192,96,0,2341,2342,5,96,0,0,2342,2344,1,0,0,0,2343,
+        2337,1,0,0,0,2343,2344,1,0,0,0,2344,451,1,0,0,0,2345,2346,3,462,
+        231,0,2346,2347,5,41,0,0,2347,2348,3,458,229,0,2348,2349,5,12,0,
+        0,2349,2350,3,468,234,0,2350,2352,5,24,0,0,2351,2353,3,460,230,0,
+        2352,2351,1,0,0,0,2352,2353,1,0,0,0,2353,2355,1,0,0,0,2354,2356,
+        3,142,71,0,2355,2354,1,0,0,0,2355,2356,1,0,0,0,2356,2357,1,0,0,0,
+        2357,2358,5,138,0,0,2358,453,1,0,0,0,2359,2360,3,462,231,0,2360,
+        2361,5,138,0,0,2361,455,1,0,0,0,2362,2376,3,454,227,0,2363,2376,
+        3,452,226,0,2364,2376,3,490,245,0,2365,2376,3,470,235,0,2366,2376,
+        3,124,62,0,2367,2376,3,502,251,0,2368,2376,3,196,98,0,2369,2376,
+        3,16,8,0,2370,2376,3,44,22,0,2371,2376,3,48,24,0,2372,2376,3,498,
+        249,0,2373,2376,3,226,113,0,2374,2376,3,224,112,0,2375,2362,1,0,
+        0,0,2375,2363,1,0,0,0,2375,2364,1,0,0,0,2375,2365,1,0,0,0,2375,2366,
+        1,0,0,0,2375,2367,1,0,0,0,2375,2368,1,0,0,0,2375,2369,1,0,0,0,2375,
+        2370,1,0,0,0,2375,2371,1,0,0,0,2375,2372,1,0,0,0,2375,2373,1,0,0,
+        0,2375,2374,1,0,0,0,2376,457,1,0,0,0,2377,2379,3,456,228,0,2378,
+        2377,1,0,0,0,2379,2382,1,0,0,0,2380,2378,1,0,0,0,2380,2381,1,0,0,
+        0,2381,459,1,0,0,0,2382,2380,1,0,0,0,2383,2384,7,13,0,0,2384,461,
+        1,0,0,0,2385,2388,3,464,232,0,2386,2388,3,466,233,0,2387,2385,1,
+        0,0,0,2387,2386,1,0,0,0,2388,463,1,0,0,0,2389,2390,5,68,0,0,2390,
+        2395,3,142,71,0,2391,2392,5,141,0,0,2392,2393,3,204,102,0,2393,2394,
+        5,142,0,0,2394,2396,1,0,0,0,2395,2391,1,0,0,0,2395,2396,1,0,0,0,
+        2396,465,1,0,0,0,2397,2399,7,14,0,0,2398,2397,1,0,0,0,2398,2399,
+        1,0,0,0,2399,2400,1,0,0,0,2400,2401,5,31,0,0,2401,2406,3,142,71,
+        0,2402,2403,5,141,0,0,2403,2404,3,204,102,0,2404,2405,5,142,0,0,
+        2405,2407,1,0,0,0,2406,2402,1,0,0,0,2406,2407,1,0,0,0,2407,2408,
+        1,0,0,0,2408,2409,5,80,0,0,2409,2410,3,472,236,0,2410,467,1,0,0,
+        0,2411,2413,3,410,205,0,2412,2411,1,0,0,0,2413,2416,1,0,0,0,2414,
+        2412,1,0,0,0,2414,2415,1,0,0,0,2415,469,1,0,0,0,2416,2414,1,0,0,
+        0,2417,2418,5,93,0,0,2418,2419,3,230,115,0,2419,2420,5,41,0,0,2420,
+        2421,3,472,236,0,2421,2422,5,138,0,0,2422,471,1,0,0,0,2423,2425,
+        3,296,148,0,2424,2426,3,296,148,0,2425,2424,1,0,0,0,2425,2426,1,
+        0,0,0,2426,2428,1,0,0,0,2427,2429,3,130,65,0,2428,2427,1,0,0,0,2428,
+        2429,1,0,0,0,2429,2431,1,0,0,0,2430,2432,3,488,244,0,2431,2430,1,
+        0,0,0,2431,2432,1,0,0,0,2432,473,1,0,0,0,2433,2438,3,230,115,0,2434,
+        2438,5,126,0,0,2435,2438,5,127,0,0,2436,2438,5,6,0,0,2437,2433,1,
+        0,0,0,2437,2434,1,0,0,0,2437,2435,1,0,0,0,2437,2436,1,0,0,0,2438,
+        475,1,0,0,0,2439,2442,3,292,146,0,2440,2442,3,14,7,0,2441,2439,1,
+        0,0,0,2441,2440,1,0,0,0,2442,477,1,0,0,0,2443,2449,3,194,97,0,2444,
+        2445,3,290,145,0,2445,2446,3,194,97,0,2446,2448,1,0,0,0,2447,2444,
+        1,0,0,0,2448,2451,1,0,0,0,2449,2447,1,0,0,0,2449,2450,1,0,0,0,2450,
+        479,1,0,0,0,2451,2449,1,0,0,0,2452,2455,3,292,146,0,2453,2454,5,
+        97,0,0,2454,2456,3,292,146,0,2455,2453,1,0,0,0,2455,2456,1,0,0,0,
+        2456,481,1,0,0,0,2457,2458,5,94,0,0,2458,2459,3,232,116,0,2459,2460,
+        5,145,0,0,2460,2461,3,450,225,0,2461,2462,5,138,0,0,2462,483,1,0,
+        0,0,2463,2465,3,232,116,0,2464,2466,3,488,244,0,2465,2464,1,0,0,
+        0,2465,2466,1,0,0,0,2466,2469,1,0,0,0,2467,2468,5,135,0,0,2468,2470,
+        3,192,96,0,2469,2467,1,0,0,0,2469,2470,1,0,0,0,2470,2471,1,0,0,0,
+        2471,2472,5,96,0,0,2472,485,1,0,0,0,2473,2474,5,30,0,0,2474,2475,
+        3,192,96,0,2475,487,1,0,0,0,2476,2477,5,98,0,0,2477,2478,3,192,96,
+        0,2478,489,1,0,0,0,2479,2480,5,100,0,0,2480,2483,3,230,115,0,2481,
+        2482,5,41,0,0,2482,2484,3,492,246,0,2483,2481,1,0,0,0,2483,2484,
+        1,0,0,0,2484,2485,1,0,0,0,2485,2486,5,138,0,0,2486,491,1,0,0,0,2487,
+        2492,3,394,197,0,2488,2492,3,96,48,0,2489,2492,3,2,1,0,2490,2492,
+        3,202,101,0,2491,2487,1,0,0,0,2491,2488,1,0,0,0,2491,2489,1,0,0,
+        0,2491,2490,1,0,0,0,2492,493,1,0,0,0,2493,2494,5,9,0,0,2494,2495,
+        5,141,0,0,2495,2500,3,240,120,0,2496,2497,5,139,0,0,2497,2499,3,
+        240,120,0,2498,2496,1,0,0,0,2499,2502,1,0,0,0,2500,2498,1,0,0,0,
+        2500,2501,1,0,0,0,2501,2503,1,0,0,0,2502,2500,1,0,0,0,2503,2504,
+        5,142,0,0,2504,2505,5,58,0,0,2505,2506,3,472,236,0,2506,495,1,0,
+        0,0,2507,2508,5,9,0,0,2508,2509,5,141,0,0,2509,2514,3,240,120,0,
+        2510,2511,5,139,0,0,2511,2513,3,240,120,0,2512,2510,1,0,0,0,2513,
         2516,1,0,0,0,2514,2512,1,0,0,0,2514,2515,1,0,0,0,2515,2517,1,0,0,
         0,2516,2514,1,0,0,0,2517,2518,5,142,0,0,2518,2519,5,58,0,0,2519,
-        2520,3,472,236,0,2520,495,1,0,0,0,2521,2522,5,9,0,0,2522,2523,5,
-        141,0,0,2523,2528,3,240,120,0,2524,2525,5,139,0,0,2525,2527,3,240,
-        120,0,2526,2524,1,0,0,0,2527,2530,1,0,0,0,2528,2526,1,0,0,0,2528,
-        2529,1,0,0,0,2529,2531,1,0,0,0,2530,2528,1,0,0,0,2531,2532,5,142,
-        0,0,2532,2533,5,58,0,0,2533,2534,3,450,225,0,2534,497,1,0,0,0,2535,
-        2536,5,104,0,0,2536,2541,3,296,148,0,2537,2538,5,139,0,0,2538,2540,
-        3,296,148,0,2539,2537,1,0,0,0,2540,2543,1,0,0,0,2541,2539,1,0,0,
-        0,2541,2542,1,0,0,0,2542,2544,1,0,0,0,2543,2541,1,0,0,0,2544,2545,
-        5,138,0,0,2545,499,1,0,0,0,2546,2548,3,272,136,0,2547,2546,1,0,0,
-        0,2547,2548,1,0,0,0,2548,2549,1,0,0,0,2549,2550,3,476,238,0,2550,
-        2551,5,135,0,0,2551,2552,3,192,96,0,2552,2553,5,138,0,0,2553,501,
-        1,0,0,0,2554,2556,5,85,0,0,2555,2554,1,0,0,0,2555,2556,1,0,0,0,2556,
-        2557,1,0,0,0,2557,2558,5,105,0,0,2558,2559,3,232,116,0,2559,2560,
-        5,145,0,0,2560,2563,3,472,236,0,2561,2562,5,135,0,0,2562,2564,3,
-        192,96,0,2563,2561,1,0,0,0,2563,2564,1,0,0,0,2564,2565,1,0,0,0,2565,
-        2566,5,138,0,0,2566,503,1,0,0,0,2567,2569,3,272,136,0,2568,2567,
-        1,0,0,0,2568,2569,1,0,0,0,2569,2570,1,0,0,0,2570,2572,5,106,0,0,
-        2571,2573,3,404,202,0,2572,2571,1,0,0,0,2572,2573,1,0,0,0,2573,2575,
-        1,0,0,0,2574,2576,3,108,54,0,2575,2574,1,0,0,0,2575,2576,1,0,0,0,
-        2576,2578,1,0,0,0,2577,2579,3,486,243,0,2578,2577,1,0,0,0,2578,2579,
-        1,0,0,0,2579,2580,1,0,0,0,2580,2581,5,138,0,0,2581,505,1,0,0,0,2582,
-        2587,3,508,254,0,2583,2584,5,139,0,0,2584,2586,3,508,254,0,2585,
-        2583,1,0,0,0,2586,2589,1,0,0,0,2587,2585,1,0,0,0,2587,2588,1,0,0,
-        0,2588,2592,1,0,0,0,2589,2587,1,0,0,0,2590,2592,5,101,0,0,2591,2582,
-        1,0,0,0,2591,2590,1,0,0,0,2592,507,1,0,0,0,2593,2596,3,192,96,0,
-        2594,2595,5,4,0,0,2595,2597,3,192,96,0,2596,2594,1,0,0,0,2596,2597,
-        1,0,0,0,2597,509,1,0,0,0,294,517,521,527,537,547,556,561,568,572,
-        577,589,592,599,605,609,613,616,623,628,633,637,643,647,650,658,
-        667,682,697,700,703,710,716,745,750,757,759,765,767,774,777,785,
-        788,797,804,809,812,818,829,837,841,845,850,858,863,876,883,891,
-        894,903,906,909,914,921,924,934,938,941,944,950,954,957,961,966,
-        969,975,978,982,1000,1002,1013,1016,1023,1028,1033,1046,1062,1067,
-        1072,1077,1080,1085,1095,1107,1112,1131,1136,1142,1149,1159,1163,
-        1166,1190,1195,1200,1203,1206,1213,1218,1227,1232,1238,1242,1250,
-        1256,1260,1264,1274,1280,1286,1293,1301,1318,1326,1336,1340,1345,
-        1351,1359,1372,1383,1390,1420,1424,1437,1442,1447,1457,1464,1471,
-        1480,1484,1491,1496,1499,1504,1509,1517,1531,1539,1547,1554,1559,
-        1564,1568,1572,1578,1582,1586,1594,1599,1604,1610,1621,1628,1637,
-        1643,1646,1653,1663,1668,1675,1682,1689,1700,1708,1718,1725,1729,
-        1733,1739,1747,1750,1753,1763,1766,1781,1786,1795,1798,1821,1826,
-        1842,1848,1873,1878,1892,1897,1903,1911,1914,1932,1937,1941,1944,
-        1951,1954,1961,1965,1972,1982,1987,1994,1999,2007,2013,2022,2027,
-        2033,2038,2044,2049,2055,2060,2064,2078,2082,2108,2119,2125,2140,
-        2146,2152,2157,2162,2172,2176,2187,2192,2200,2203,2207,2212,2220,
-        2224,2230,2240,2248,2253,2258,2271,2276,2281,2286,2290,2298,2307,
-        2311,2316,2326,2349,2357,2366,2369,2389,2394,2401,2409,2412,2420,
-        2428,2439,2442,2445,2451,2455,2463,2469,2479,2483,2497,2505,2514,
-        2528,2541,2547,2555,2563,2568,2572,2575,2578,2587,2591,2596
+        2520,3,450,225,0,2520,497,1,0,0,0,2521,2522,5,104,0,0,2522,2527,
+        3,296,148,0,2523,2524,5,139,0,0,2524,2526,3,296,148,0,2525,2523,
+        1,0,0,0,2526,2529,1,0,0,0,2527,2525,1,0,0,0,2527,2528,1,0,0,0,2528,
+        2530,1,0,0,0,2529,2527,1,0,0,0,2530,2531,5,138,0,0,2531,499,1,0,
+        0,0,2532,2534,3,272,136,0,2533,2532,1,0,0,0,2533,2534,1,0,0,0,2534,
+        2535,1,0,0,0,2535,2536,3,476,238,0,2536,2537,5,135,0,0,2537,2538,
+        3,192,96,0,2538,2539,5,138,0,0,2539,501,1,0,0,0,2540,2542,5,85,0,
+        0,2541,2540,1,0,0,0,2541,2542,1,0,0,0,2542,2543,1,0,0,0,2543,2544,
+        5,105,0,0,2544,2545,3,232,116,0,2545,2546,5,145,0,0,2546,2549,3,
+        472,236,0,2547,2548,5,135,0,0,2548,2550,3,192,96,0,2549,2547,1,0,
+        0,0,2549,2550,1,0,0,0,2550,2551,1,0,0,0,2551,2552,5,138,0,0,2552,
+        503,1,0,0,0,2553,2555,3,272,136,0,2554,2553,1,0,0,0,2554,2555,1,
+        0,0,0,2555,2556,1,0,0,0,2556,2558,5,106,0,0,2557,2559,3,404,202,
+        0,2558,2557,1,0,0,0,2558,2559,1,0,0,0,2559,2561,1,0,0,0,2560,2562,
+        3,108,54,0,2561,2560,1,0,0,0,2561,2562,1,0,0,0,2562,2564,1,0,0,0,
+        2563,2565,3,486,243,0,2564,2563,1,0,0,0,2564,2565,1,0,0,0,2565,2566,
+        1,0,0,0,2566,2567,5,138,0,0,2567,505,1,0,0,0,2568,2573,3,508,254,
+        0,2569,2570,5,139,0,0,2570,2572,3,508,254,0,2571,2569,1,0,0,0,2572,
+        2575,1,0,0,0,2573,2571,1,0,0,0,2573,2574,1,0,0,0,2574,2578,1,0,0,
+        0,2575,2573,1,0,0,0,2576,2578,5,101,0,0,2577,2568,1,0,0,0,2577,2576,
+        1,0,0,0,2578,507,1,0,0,0,2579,2582,3,192,96,0,2580,2581,5,4,0,0,
+        2581,2583,3,192,96,0,2582,2580,1,0,0,0,2582,2583,1,0,0,0,2583,509,
+        1,0,0,0,292,517,521,529,532,546,555,560,567,571,576,588,591,598,
+        604,608,612,615,622,627,632,636,642,646,649,657,666,681,696,699,
+        702,709,715,744,749,756,758,764,766,773,776,784,787,796,803,808,
+        811,817,828,836,840,844,849,857,862,875,882,890,893,902,905,908,
+        913,920,923,933,937,940,943,949,953,956,960,965,968,974,977,981,
+        999,1001,1012,1015,1022,1027,1032,1045,1061,1066,1071,1076,1079,
+        1084,1094,1106,1111,1129,1135,1142,1152,1156,1159,1183,1188,1193,
+        1196,1199,1206,1211,1220,1225,1231,1235,1243,1249,1253,1257,1267,
+        1273,1279,1286,1294,1311,1319,1329,1333,1338,1344,1352,1365,1376,
+        1383,1413,1417,1430,1435,1440,1450,1457,1464,1471,1478,1483,1486,
+        1491,1496,1504,1518,1526,1534,1541,1546,1551,1555,1559,1565,1569,
+        1573,1581,1586,1591,1597,1608,1615,1624,1630,1633,1640,1650,1655,
+        1661,1668,1675,1686,1694,1704,1711,1715,1719,1725,1733,1736,1739,
+        1749,1752,1767,1772,1781,1784,1807,1812,1828,1834,1859,1864,1878,
+        1883,1889,1897,1900,1918,1923,1927,1930,1937,1940,1947,1951,1958,
+        1968,1973,1980,1985,1993,1999,2008,2013,2019,2024,2030,2035,2041,
+        2046,2050,2064,2068,2094,2105,2111,2126,2132,2138,2143,2148,2158,
+        2162,2173,2178,2186,2189,2193,2198,2206,2210,2216,2226,2234,2239,
+        2244,2257,2262,2267,2272,2276,2284,2293,2297,2302,2312,2335,2343,
+        2352,2355,2375,2380,2387,2395,2398,2406,2414,2425,2428,2431,2437,
+        2441,2449,2455,2465,2469,2483,2491,2500,2514,2527,2533,2541,2549,
+        2554,2558,2561,2564,2573,2577,2582
     ]
 
 class vhdlParser ( Parser ):
@@ -1685,7 +1679,7 @@ class vhdlParser ( Parser ):
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
-        self.checkVersion("4.10")
+        self.checkVersion("4.13.2")
         self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
         self._predicates = None
 
@@ -1737,7 +1731,7 @@ class vhdlParser ( Parser ):
             self.enterOuterAlt(localctx, 1)
             self.state = 510
             _la = self._input.LA(1)
-            if not(((((_la - 112)) & ~0x3f) == 0 and ((1 << (_la - 112)) & ((1 << (vhdlParser.BASE_LITERAL - 112)) | (1 << (vhdlParser.REAL_LITERAL - 112)) | (1 << (vhdlParser.INTEGER - 112)))) != 0)):
+            if not(((((_la - 112)) & ~0x3f) == 0 and ((1 << (_la - 112)) & 70368744177697) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -1861,7 +1855,7 @@ class vhdlParser ( Parser ):
             self.state = 517
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.TOLERANCE:
+            if _la==98:
                 self.state = 516
                 self.tolerance_aspect()
 
@@ -1869,7 +1863,7 @@ class vhdlParser ( Parser ):
             self.state = 521
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
+            if _la==135:
                 self.state = 519
                 self.match(vhdlParser.VARASGN)
                 self.state = 520
@@ -1898,6 +1892,14 @@ class vhdlParser ( Parser ):
             return self.getTypedRuleContext(vhdlParser.ExpressionContext,0)
 
 
+        def direction(self):
+            return self.getTypedRuleContext(vhdlParser.DirectionContext,0)
+
+
+        def simple_expression(self):
+            return self.getTypedRuleContext(vhdlParser.Simple_expressionContext,0)
+
+
         def OPEN(self):
             return self.getToken(vhdlParser.OPEN, 0)
 
@@ -1925,18 +1927,29 @@ class vhdlParser ( Parser ):
 
         localctx = vhdlParser.Actual_designatorContext(self, self._ctx, self.state)
         self.enterRule(localctx, 6, self.RULE_actual_designator)
+        self._la = 0 # Token type
         try:
-            self.state = 527
+            self.state = 532
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ABS, vhdlParser.NEW, vhdlParser.NOT, vhdlParser.NULL_, vhdlParser.BASE_LITERAL, vhdlParser.BIT_STRING_LITERAL, vhdlParser.REAL_LITERAL, vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.CHARACTER_LITERAL, vhdlParser.STRING_LITERAL, vhdlParser.LPAREN, vhdlParser.PLUS, vhdlParser.MINUS, vhdlParser.INTEGER]:
+            if token in [1, 52, 56, 57, 112, 113, 117, 118, 119, 126, 127, 141, 148, 149, 158]:
                 self.enterOuterAlt(localctx, 1)
                 self.state = 525
                 self.expression()
+                self.state = 529
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==23 or _la==97:
+                    self.state = 526
+                    self.direction()
+                    self.state = 527
+                    self.simple_expression()
+
+
                 pass
-            elif token in [vhdlParser.OPEN]:
+            elif token in [60]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 526
+                self.state = 531
                 self.match(vhdlParser.OPEN)
                 pass
             else:
@@ -1988,7 +2001,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 8, self.RULE_actual_parameter_part)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 529
+            self.state = 534
             self.association_list()
         except RecognitionException as re:
             localctx.exception = re
@@ -2006,20 +2019,10 @@ class vhdlParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def name(self):
-            return self.getTypedRuleContext(vhdlParser.NameContext,0)
-
-
-        def LPAREN(self):
-            return self.getToken(vhdlParser.LPAREN, 0)
-
         def actual_designator(self):
             return self.getTypedRuleContext(vhdlParser.Actual_designatorContext,0)
 
 
-        def RPAREN(self):
-            return self.getToken(vhdlParser.RPAREN, 0)
-
         def getRuleIndex(self):
             return vhdlParser.RULE_actual_part
 
@@ -2045,28 +2048,9 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Actual_partContext(self, self._ctx, self.state)
         self.enterRule(localctx, 10, self.RULE_actual_part)
         try:
-            self.state = 537
-            self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
-            if la_ == 1:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 531
-                self.name()
-                self.state = 532
-                self.match(vhdlParser.LPAREN)
-                self.state = 533
-                self.actual_designator()
-                self.state = 534
-                self.match(vhdlParser.RPAREN)
-                pass
-
-            elif la_ == 2:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 536
-                self.actual_designator()
-                pass
-
-
+            self.enterOuterAlt(localctx, 1)
+            self.state = 536
+            self.actual_designator()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2119,9 +2103,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 539
+            self.state = 538
             _la = self._input.LA(1)
-            if not(((((_la - 140)) & ~0x3f) == 0 and ((1 << (_la - 140)) & ((1 << (vhdlParser.AMPERSAND - 140)) | (1 << (vhdlParser.PLUS - 140)) | (1 << (vhdlParser.MINUS - 140)))) != 0)):
+            if not(((((_la - 140)) & ~0x3f) == 0 and ((1 << (_la - 140)) & 769) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -2188,23 +2172,23 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 541
+            self.state = 540
             self.match(vhdlParser.LPAREN)
-            self.state = 542
+            self.state = 541
             self.element_association()
-            self.state = 547
+            self.state = 546
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 543
+            while _la==139:
+                self.state = 542
                 self.match(vhdlParser.COMMA)
-                self.state = 544
+                self.state = 543
                 self.element_association()
-                self.state = 549
+                self.state = 548
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 550
+            self.state = 549
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -2277,33 +2261,33 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 552
+            self.state = 551
             self.match(vhdlParser.ALIAS)
-            self.state = 553
+            self.state = 552
             self.alias_designator()
-            self.state = 556
+            self.state = 555
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.COLON:
-                self.state = 554
+            if _la==145:
+                self.state = 553
                 self.match(vhdlParser.COLON)
-                self.state = 555
+                self.state = 554
                 self.alias_indication()
 
 
-            self.state = 558
+            self.state = 557
             self.match(vhdlParser.IS)
-            self.state = 559
+            self.state = 558
             self.name()
-            self.state = 561
+            self.state = 560
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LBRACKET:
-                self.state = 560
+            if _la==143:
+                self.state = 559
                 self.signature()
 
 
-            self.state = 563
+            self.state = 562
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -2356,22 +2340,22 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Alias_designatorContext(self, self._ctx, self.state)
         self.enterRule(localctx, 18, self.RULE_alias_designator)
         try:
-            self.state = 568
+            self.state = 567
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 565
+                self.state = 564
                 self.identifier()
                 pass
-            elif token in [vhdlParser.CHARACTER_LITERAL]:
+            elif token in [126]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 566
+                self.state = 565
                 self.match(vhdlParser.CHARACTER_LITERAL)
                 pass
-            elif token in [vhdlParser.STRING_LITERAL]:
+            elif token in [127]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 567
+                self.state = 566
                 self.match(vhdlParser.STRING_LITERAL)
                 pass
             else:
@@ -2426,18 +2410,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Alias_indicationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 20, self.RULE_alias_indication)
         try:
-            self.state = 572
+            self.state = 571
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 570
+                self.state = 569
                 self.subnature_indication()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 571
+                self.state = 570
                 self.subtype_indication()
                 pass
 
@@ -2495,18 +2479,18 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_allocator)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 574
+            self.state = 573
             self.match(vhdlParser.NEW)
-            self.state = 577
+            self.state = 576
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
             if la_ == 1:
-                self.state = 575
+                self.state = 574
                 self.qualified_expression()
                 pass
 
             elif la_ == 2:
-                self.state = 576
+                self.state = 575
                 self.subtype_indication()
                 pass
 
@@ -2590,41 +2574,41 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 579
+            self.state = 578
             self.match(vhdlParser.ARCHITECTURE)
-            self.state = 580
+            self.state = 579
             self.identifier()
-            self.state = 581
+            self.state = 580
             self.match(vhdlParser.OF)
-            self.state = 582
+            self.state = 581
             self.identifier()
-            self.state = 583
+            self.state = 582
             self.match(vhdlParser.IS)
-            self.state = 584
+            self.state = 583
             self.architecture_declarative_part()
-            self.state = 585
+            self.state = 584
             self.match(vhdlParser.BEGIN)
-            self.state = 586
+            self.state = 585
             self.architecture_statement_part()
-            self.state = 587
+            self.state = 586
             self.match(vhdlParser.END)
-            self.state = 589
+            self.state = 588
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.ARCHITECTURE:
-                self.state = 588
+            if _la==8:
+                self.state = 587
                 self.match(vhdlParser.ARCHITECTURE)
 
 
-            self.state = 592
+            self.state = 591
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 591
+            if _la==118 or _la==119:
+                self.state = 590
                 self.identifier()
 
 
-            self.state = 594
+            self.state = 593
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -2676,13 +2660,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 599
+            self.state = 598
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.COMPONENT) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.DISCONNECT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FOR) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE) | (1 << vhdlParser.LIMIT) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.QUANTITY - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SIGNAL - 68)) | (1 << (vhdlParser.SUBNATURE - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TERMINAL - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 596
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 2269550383466528) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210571231245) != 0):
+                self.state = 595
                 self.block_declarative_item()
-                self.state = 601
+                self.state = 600
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2770,92 +2754,92 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Architecture_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 28, self.RULE_architecture_statement)
         try:
-            self.state = 623
+            self.state = 622
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 602
+                self.state = 601
                 self.block_statement()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 603
+                self.state = 602
                 self.process_statement()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 605
+                self.state = 604
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
                 if la_ == 1:
-                    self.state = 604
+                    self.state = 603
                     self.label_colon()
 
 
-                self.state = 607
+                self.state = 606
                 self.concurrent_procedure_call_statement()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 609
+                self.state = 608
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
                 if la_ == 1:
-                    self.state = 608
+                    self.state = 607
                     self.label_colon()
 
 
-                self.state = 611
+                self.state = 610
                 self.concurrent_assertion_statement()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 613
+                self.state = 612
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
                 if la_ == 1:
-                    self.state = 612
+                    self.state = 611
                     self.label_colon()
 
 
-                self.state = 616
+                self.state = 615
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
                 if la_ == 1:
-                    self.state = 615
+                    self.state = 614
                     self.match(vhdlParser.POSTPONED)
 
 
-                self.state = 618
+                self.state = 617
                 self.concurrent_signal_assignment_statement()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 619
+                self.state = 618
                 self.component_instantiation_statement()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 620
+                self.state = 619
                 self.generate_statement()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 621
+                self.state = 620
                 self.concurrent_break_statement()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 622
+                self.state = 621
                 self.simultaneous_statement()
                 pass
 
@@ -2910,13 +2894,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 628
+            self.state = 627
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ABS) | (1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.IF) | (1 << vhdlParser.NEW) | (1 << vhdlParser.NOT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & ((1 << (vhdlParser.POSTPONED - 66)) | (1 << (vhdlParser.PROCESS - 66)) | (1 << (vhdlParser.PROCEDURAL - 66)) | (1 << (vhdlParser.WITH - 66)) | (1 << (vhdlParser.BASE_LITERAL - 66)) | (1 << (vhdlParser.BIT_STRING_LITERAL - 66)) | (1 << (vhdlParser.REAL_LITERAL - 66)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 66)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 66)) | (1 << (vhdlParser.CHARACTER_LITERAL - 66)) | (1 << (vhdlParser.STRING_LITERAL - 66)))) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & ((1 << (vhdlParser.LPAREN - 141)) | (1 << (vhdlParser.PLUS - 141)) | (1 << (vhdlParser.MINUS - 141)) | (1 << (vhdlParser.INTEGER - 141)))) != 0):
-                self.state = 625
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 220676450460926978) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 3474740417772126219) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & 131457) != 0):
+                self.state = 624
                 self.architecture_statement()
-                self.state = 630
+                self.state = 629
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2969,18 +2953,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Array_nature_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 32, self.RULE_array_nature_definition)
         try:
-            self.state = 633
+            self.state = 632
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 631
+                self.state = 630
                 self.unconstrained_nature_definition()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 632
+                self.state = 631
                 self.constrained_nature_definition()
                 pass
 
@@ -3034,18 +3018,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Array_type_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 34, self.RULE_array_type_definition)
         try:
-            self.state = 637
+            self.state = 636
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 635
+                self.state = 634
                 self.unconstrained_array_definition()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 636
+                self.state = 635
                 self.constrained_array_definition()
                 pass
 
@@ -3113,27 +3097,27 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 639
+            self.state = 638
             self.match(vhdlParser.ASSERT)
-            self.state = 640
+            self.state = 639
             self.condition()
-            self.state = 643
+            self.state = 642
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.REPORT:
-                self.state = 641
+            if _la==79:
+                self.state = 640
                 self.match(vhdlParser.REPORT)
-                self.state = 642
+                self.state = 641
                 self.expression()
 
 
-            self.state = 647
+            self.state = 646
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.SEVERITY:
-                self.state = 645
+            if _la==84:
+                self.state = 644
                 self.match(vhdlParser.SEVERITY)
-                self.state = 646
+                self.state = 645
                 self.expression()
 
 
@@ -3191,17 +3175,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 650
+            self.state = 649
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 649
+            if _la==118 or _la==119:
+                self.state = 648
                 self.label_colon()
 
 
-            self.state = 652
+            self.state = 651
             self.assertion()
-            self.state = 653
+            self.state = 652
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -3256,17 +3240,17 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 40, self.RULE_association_element)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 658
+            self.state = 657
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
             if la_ == 1:
-                self.state = 655
+                self.state = 654
                 self.formal_part()
-                self.state = 656
+                self.state = 655
                 self.match(vhdlParser.ARROW)
 
 
-            self.state = 660
+            self.state = 659
             self.actual_part()
         except RecognitionException as re:
             localctx.exception = re
@@ -3324,17 +3308,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 662
+            self.state = 661
             self.association_element()
-            self.state = 667
+            self.state = 666
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 663
+            while _la==139:
+                self.state = 662
                 self.match(vhdlParser.COMMA)
-                self.state = 664
+                self.state = 663
                 self.association_element()
-                self.state = 669
+                self.state = 668
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3394,13 +3378,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 44, self.RULE_attribute_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 670
+            self.state = 669
             self.match(vhdlParser.ATTRIBUTE)
-            self.state = 671
+            self.state = 670
             self.label_colon()
-            self.state = 672
+            self.state = 671
             self.name()
-            self.state = 673
+            self.state = 672
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -3465,42 +3449,42 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Attribute_designatorContext(self, self._ctx, self.state)
         self.enterRule(localctx, 46, self.RULE_attribute_designator)
         try:
-            self.state = 682
+            self.state = 681
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 675
+                self.state = 674
                 self.identifier()
                 pass
-            elif token in [vhdlParser.RANGE]:
+            elif token in [72]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 676
+                self.state = 675
                 self.match(vhdlParser.RANGE)
                 pass
-            elif token in [vhdlParser.REVERSE_RANGE]:
+            elif token in [73]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 677
+                self.state = 676
                 self.match(vhdlParser.REVERSE_RANGE)
                 pass
-            elif token in [vhdlParser.ACROSS]:
+            elif token in [3]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 678
+                self.state = 677
                 self.match(vhdlParser.ACROSS)
                 pass
-            elif token in [vhdlParser.THROUGH]:
+            elif token in [96]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 679
+                self.state = 678
                 self.match(vhdlParser.THROUGH)
                 pass
-            elif token in [vhdlParser.REFERENCE]:
+            elif token in [77]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 680
+                self.state = 679
                 self.match(vhdlParser.REFERENCE)
                 pass
-            elif token in [vhdlParser.TOLERANCE]:
+            elif token in [98]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 681
+                self.state = 680
                 self.match(vhdlParser.TOLERANCE)
                 pass
             else:
@@ -3572,19 +3556,19 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 48, self.RULE_attribute_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 684
+            self.state = 683
             self.match(vhdlParser.ATTRIBUTE)
-            self.state = 685
+            self.state = 684
             self.attribute_designator()
-            self.state = 686
+            self.state = 685
             self.match(vhdlParser.OF)
-            self.state = 687
+            self.state = 686
             self.entity_specification()
-            self.state = 688
+            self.state = 687
             self.match(vhdlParser.IS)
-            self.state = 689
+            self.state = 688
             self.expression()
-            self.state = 690
+            self.state = 689
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -3635,9 +3619,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 50, self.RULE_base_unit_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 692
+            self.state = 691
             self.identifier()
-            self.state = 693
+            self.state = 692
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -3697,29 +3681,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 697
+            self.state = 696
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.USE:
-                self.state = 695
+            if _la==104:
+                self.state = 694
                 self.match(vhdlParser.USE)
-                self.state = 696
+                self.state = 695
                 self.entity_aspect()
 
 
-            self.state = 700
+            self.state = 699
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GENERIC:
-                self.state = 699
+            if _la==33:
+                self.state = 698
                 self.generic_map_aspect()
 
 
-            self.state = 703
+            self.state = 702
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PORT:
-                self.state = 702
+            if _la==65:
+                self.state = 701
                 self.port_map_aspect()
 
 
@@ -3796,35 +3780,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 705
+            self.state = 704
             self.match(vhdlParser.FOR)
-            self.state = 706
+            self.state = 705
             self.block_specification()
-            self.state = 710
+            self.state = 709
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.USE:
-                self.state = 707
+            while _la==104:
+                self.state = 706
                 self.use_clause()
-                self.state = 712
+                self.state = 711
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 716
+            self.state = 715
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.FOR:
-                self.state = 713
+            while _la==30:
+                self.state = 712
                 self.configuration_item()
-                self.state = 718
+                self.state = 717
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 719
+            self.state = 718
             self.match(vhdlParser.END)
-            self.state = 720
+            self.state = 719
             self.match(vhdlParser.FOR)
-            self.state = 721
+            self.state = 720
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -3955,138 +3939,138 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Block_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 56, self.RULE_block_declarative_item)
         try:
-            self.state = 745
+            self.state = 744
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,32,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 723
+                self.state = 722
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 724
+                self.state = 723
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 725
+                self.state = 724
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 726
+                self.state = 725
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 727
+                self.state = 726
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 728
+                self.state = 727
                 self.signal_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 729
+                self.state = 728
                 self.variable_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 730
+                self.state = 729
                 self.file_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 731
+                self.state = 730
                 self.alias_declaration()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 732
+                self.state = 731
                 self.component_declaration()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 733
+                self.state = 732
                 self.attribute_declaration()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 734
+                self.state = 733
                 self.attribute_specification()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 735
+                self.state = 734
                 self.configuration_specification()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 736
+                self.state = 735
                 self.disconnection_specification()
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 737
+                self.state = 736
                 self.step_limit_specification()
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 738
+                self.state = 737
                 self.use_clause()
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 739
+                self.state = 738
                 self.group_template_declaration()
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 740
+                self.state = 739
                 self.group_declaration()
                 pass
 
             elif la_ == 19:
                 self.enterOuterAlt(localctx, 19)
-                self.state = 741
+                self.state = 740
                 self.nature_declaration()
                 pass
 
             elif la_ == 20:
                 self.enterOuterAlt(localctx, 20)
-                self.state = 742
+                self.state = 741
                 self.subnature_declaration()
                 pass
 
             elif la_ == 21:
                 self.enterOuterAlt(localctx, 21)
-                self.state = 743
+                self.state = 742
                 self.quantity_declaration()
                 pass
 
             elif la_ == 22:
                 self.enterOuterAlt(localctx, 22)
-                self.state = 744
+                self.state = 743
                 self.terminal_declaration()
                 pass
 
@@ -4141,13 +4125,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 750
+            self.state = 749
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.COMPONENT) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.DISCONNECT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FOR) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE) | (1 << vhdlParser.LIMIT) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.QUANTITY - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SIGNAL - 68)) | (1 << (vhdlParser.SUBNATURE - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TERMINAL - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 747
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 2269550383466528) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210571231245) != 0):
+                self.state = 746
                 self.block_declarative_item()
-                self.state = 752
+                self.state = 751
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -4216,37 +4200,37 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 759
+            self.state = 758
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GENERIC:
-                self.state = 753
+            if _la==33:
+                self.state = 752
                 self.generic_clause()
-                self.state = 757
+                self.state = 756
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.GENERIC:
-                    self.state = 754
+                if _la==33:
+                    self.state = 753
                     self.generic_map_aspect()
-                    self.state = 755
+                    self.state = 754
                     self.match(vhdlParser.SEMI)
 
 
 
 
-            self.state = 767
+            self.state = 766
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PORT:
-                self.state = 761
+            if _la==65:
+                self.state = 760
                 self.port_clause()
-                self.state = 765
+                self.state = 764
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.PORT:
-                    self.state = 762
+                if _la==65:
+                    self.state = 761
                     self.port_map_aspect()
-                    self.state = 763
+                    self.state = 762
                     self.match(vhdlParser.SEMI)
 
 
@@ -4312,22 +4296,22 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 62, self.RULE_block_specification)
         self._la = 0 # Token type
         try:
-            self.state = 777
+            self.state = 776
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,39,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 769
+                self.state = 768
                 self.identifier()
-                self.state = 774
+                self.state = 773
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.LPAREN:
-                    self.state = 770
+                if _la==141:
+                    self.state = 769
                     self.match(vhdlParser.LPAREN)
-                    self.state = 771
+                    self.state = 770
                     self.index_specification()
-                    self.state = 772
+                    self.state = 771
                     self.match(vhdlParser.RPAREN)
 
 
@@ -4335,7 +4319,7 @@ class vhdlParser ( Parser ):
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 776
+                self.state = 775
                 self.name()
                 pass
 
@@ -4431,51 +4415,51 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 779
+            self.state = 778
             self.label_colon()
-            self.state = 780
+            self.state = 779
             self.match(vhdlParser.BLOCK)
-            self.state = 785
+            self.state = 784
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LPAREN:
-                self.state = 781
+            if _la==141:
+                self.state = 780
                 self.match(vhdlParser.LPAREN)
-                self.state = 782
+                self.state = 781
                 self.expression()
-                self.state = 783
+                self.state = 782
                 self.match(vhdlParser.RPAREN)
 
 
-            self.state = 788
+            self.state = 787
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IS:
-                self.state = 787
+            if _la==41:
+                self.state = 786
                 self.match(vhdlParser.IS)
 
 
-            self.state = 790
+            self.state = 789
             self.block_header()
-            self.state = 791
+            self.state = 790
             self.block_declarative_part()
-            self.state = 792
+            self.state = 791
             self.match(vhdlParser.BEGIN)
-            self.state = 793
+            self.state = 792
             self.block_statement_part()
-            self.state = 794
+            self.state = 793
             self.match(vhdlParser.END)
-            self.state = 795
+            self.state = 794
             self.match(vhdlParser.BLOCK)
-            self.state = 797
+            self.state = 796
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 796
+            if _la==118 or _la==119:
+                self.state = 795
                 self.identifier()
 
 
-            self.state = 799
+            self.state = 798
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -4527,13 +4511,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 804
+            self.state = 803
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ABS) | (1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.IF) | (1 << vhdlParser.NEW) | (1 << vhdlParser.NOT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & ((1 << (vhdlParser.POSTPONED - 66)) | (1 << (vhdlParser.PROCESS - 66)) | (1 << (vhdlParser.PROCEDURAL - 66)) | (1 << (vhdlParser.WITH - 66)) | (1 << (vhdlParser.BASE_LITERAL - 66)) | (1 << (vhdlParser.BIT_STRING_LITERAL - 66)) | (1 << (vhdlParser.REAL_LITERAL - 66)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 66)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 66)) | (1 << (vhdlParser.CHARACTER_LITERAL - 66)) | (1 << (vhdlParser.STRING_LITERAL - 66)))) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & ((1 << (vhdlParser.LPAREN - 141)) | (1 << (vhdlParser.PLUS - 141)) | (1 << (vhdlParser.MINUS - 141)) | (1 << (vhdlParser.INTEGER - 141)))) != 0):
-                self.state = 801
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 220676450460926978) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 3474740417772126219) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & 131457) != 0):
+                self.state = 800
                 self.architecture_statement()
-                self.state = 806
+                self.state = 805
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -4597,27 +4581,27 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 68, self.RULE_branch_quantity_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 807
+            self.state = 806
             self.match(vhdlParser.QUANTITY)
-            self.state = 809
+            self.state = 808
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,44,self._ctx)
             if la_ == 1:
-                self.state = 808
+                self.state = 807
                 self.across_aspect()
 
 
-            self.state = 812
+            self.state = 811
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,45,self._ctx)
             if la_ == 1:
-                self.state = 811
+                self.state = 810
                 self.through_aspect()
 
 
-            self.state = 814
+            self.state = 813
             self.terminal_aspect()
-            self.state = 815
+            self.state = 814
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -4677,19 +4661,19 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 818
+            self.state = 817
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FOR:
-                self.state = 817
+            if _la==30:
+                self.state = 816
                 self.break_selector_clause()
 
 
-            self.state = 820
+            self.state = 819
             self.name()
-            self.state = 821
+            self.state = 820
             self.match(vhdlParser.ARROW)
-            self.state = 822
+            self.state = 821
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -4747,17 +4731,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 824
+            self.state = 823
             self.break_element()
-            self.state = 829
+            self.state = 828
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 825
+            while _la==139:
+                self.state = 824
                 self.match(vhdlParser.COMMA)
-                self.state = 826
+                self.state = 825
                 self.break_element()
-                self.state = 831
+                self.state = 830
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -4813,11 +4797,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 74, self.RULE_break_selector_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 832
+            self.state = 831
             self.match(vhdlParser.FOR)
-            self.state = 833
+            self.state = 832
             self.name()
-            self.state = 834
+            self.state = 833
             self.match(vhdlParser.USE)
         except RecognitionException as re:
             localctx.exception = re
@@ -4883,35 +4867,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 837
+            self.state = 836
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 836
+            if _la==118 or _la==119:
+                self.state = 835
                 self.label_colon()
 
 
-            self.state = 839
+            self.state = 838
             self.match(vhdlParser.BREAK)
-            self.state = 841
+            self.state = 840
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FOR or ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & ((1 << (vhdlParser.BASIC_IDENTIFIER - 118)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 118)) | (1 << (vhdlParser.STRING_LITERAL - 118)))) != 0):
-                self.state = 840
+            if _la==30 or ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & 515) != 0):
+                self.state = 839
                 self.break_list()
 
 
-            self.state = 845
+            self.state = 844
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.WHEN:
-                self.state = 843
+            if _la==108:
+                self.state = 842
                 self.match(vhdlParser.WHEN)
-                self.state = 844
+                self.state = 843
                 self.condition()
 
 
-            self.state = 847
+            self.state = 846
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -4990,45 +4974,45 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 850
+            self.state = 849
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 849
+            if _la==118 or _la==119:
+                self.state = 848
                 self.label_colon()
 
 
-            self.state = 852
+            self.state = 851
             self.match(vhdlParser.CASE)
-            self.state = 853
+            self.state = 852
             self.expression()
-            self.state = 854
+            self.state = 853
             self.match(vhdlParser.IS)
-            self.state = 856 
+            self.state = 855 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 855
+                self.state = 854
                 self.case_statement_alternative()
-                self.state = 858 
+                self.state = 857 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==vhdlParser.WHEN):
+                if not (_la==108):
                     break
 
-            self.state = 860
+            self.state = 859
             self.match(vhdlParser.END)
-            self.state = 861
+            self.state = 860
             self.match(vhdlParser.CASE)
-            self.state = 863
+            self.state = 862
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 862
+            if _la==118 or _la==119:
+                self.state = 861
                 self.identifier()
 
 
-            self.state = 865
+            self.state = 864
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -5086,13 +5070,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 80, self.RULE_case_statement_alternative)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 867
+            self.state = 866
             self.match(vhdlParser.WHEN)
-            self.state = 868
+            self.state = 867
             self.choices()
-            self.state = 869
+            self.state = 868
             self.match(vhdlParser.ARROW)
-            self.state = 870
+            self.state = 869
             self.sequence_of_statements()
         except RecognitionException as re:
             localctx.exception = re
@@ -5150,30 +5134,30 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.ChoiceContext(self, self._ctx, self.state)
         self.enterRule(localctx, 82, self.RULE_choice)
         try:
-            self.state = 876
+            self.state = 875
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,54,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 872
+                self.state = 871
                 self.identifier()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 873
+                self.state = 872
                 self.discrete_range()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 874
+                self.state = 873
                 self.simple_expression()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 875
+                self.state = 874
                 self.match(vhdlParser.OTHERS)
                 pass
 
@@ -5234,17 +5218,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 878
+            self.state = 877
             self.choice()
-            self.state = 883
+            self.state = 882
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.BAR:
-                self.state = 879
+            while _la==153:
+                self.state = 878
                 self.match(vhdlParser.BAR)
-                self.state = 880
+                self.state = 879
                 self.choice()
-                self.state = 885
+                self.state = 884
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -5318,33 +5302,33 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 886
+            self.state = 885
             self.match(vhdlParser.FOR)
-            self.state = 887
+            self.state = 886
             self.component_specification()
-            self.state = 891
+            self.state = 890
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GENERIC or _la==vhdlParser.PORT or _la==vhdlParser.USE or _la==vhdlParser.SEMI:
-                self.state = 888
+            if _la==33 or _la==65 or _la==104 or _la==138:
+                self.state = 887
                 self.binding_indication()
-                self.state = 889
+                self.state = 888
                 self.match(vhdlParser.SEMI)
 
 
-            self.state = 894
+            self.state = 893
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FOR:
-                self.state = 893
+            if _la==30:
+                self.state = 892
                 self.block_configuration()
 
 
-            self.state = 896
+            self.state = 895
             self.match(vhdlParser.END)
-            self.state = 897
+            self.state = 896
             self.match(vhdlParser.FOR)
-            self.state = 898
+            self.state = 897
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -5419,47 +5403,47 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 900
+            self.state = 899
             self.match(vhdlParser.COMPONENT)
-            self.state = 901
+            self.state = 900
             self.identifier()
-            self.state = 903
+            self.state = 902
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IS:
-                self.state = 902
+            if _la==41:
+                self.state = 901
                 self.match(vhdlParser.IS)
 
 
-            self.state = 906
+            self.state = 905
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GENERIC:
-                self.state = 905
+            if _la==33:
+                self.state = 904
                 self.generic_clause()
 
 
-            self.state = 909
+            self.state = 908
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PORT:
-                self.state = 908
+            if _la==65:
+                self.state = 907
                 self.port_clause()
 
 
-            self.state = 911
+            self.state = 910
             self.match(vhdlParser.END)
-            self.state = 912
+            self.state = 911
             self.match(vhdlParser.COMPONENT)
-            self.state = 914
+            self.state = 913
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 913
+            if _la==118 or _la==119:
+                self.state = 912
                 self.identifier()
 
 
-            self.state = 916
+            self.state = 915
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -5523,27 +5507,27 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 918
+            self.state = 917
             self.label_colon()
-            self.state = 919
+            self.state = 918
             self.instantiated_unit()
-            self.state = 921
+            self.state = 920
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GENERIC:
-                self.state = 920
+            if _la==33:
+                self.state = 919
                 self.generic_map_aspect()
 
 
-            self.state = 924
+            self.state = 923
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PORT:
-                self.state = 923
+            if _la==65:
+                self.state = 922
                 self.port_map_aspect()
 
 
-            self.state = 926
+            self.state = 925
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -5598,11 +5582,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 92, self.RULE_component_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 928
+            self.state = 927
             self.instantiation_list()
-            self.state = 929
+            self.state = 928
             self.match(vhdlParser.COLON)
-            self.state = 930
+            self.state = 929
             self.name()
         except RecognitionException as re:
             localctx.exception = re
@@ -5653,17 +5637,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Composite_nature_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 94, self.RULE_composite_nature_definition)
         try:
-            self.state = 934
+            self.state = 933
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ARRAY]:
+            if token in [9]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 932
+                self.state = 931
                 self.array_nature_definition()
                 pass
-            elif token in [vhdlParser.RECORD]:
+            elif token in [76]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 933
+                self.state = 932
                 self.record_nature_definition()
                 pass
             else:
@@ -5718,17 +5702,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Composite_type_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 96, self.RULE_composite_type_definition)
         try:
-            self.state = 938
+            self.state = 937
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ARRAY]:
+            if token in [9]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 936
+                self.state = 935
                 self.array_type_definition()
                 pass
-            elif token in [vhdlParser.RECORD]:
+            elif token in [76]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 937
+                self.state = 936
                 self.record_type_definition()
                 pass
             else:
@@ -5791,25 +5775,25 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 941
+            self.state = 940
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 940
+            if _la==118 or _la==119:
+                self.state = 939
                 self.label_colon()
 
 
-            self.state = 944
+            self.state = 943
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.POSTPONED:
-                self.state = 943
+            if _la==66:
+                self.state = 942
                 self.match(vhdlParser.POSTPONED)
 
 
-            self.state = 946
+            self.state = 945
             self.assertion()
-            self.state = 947
+            self.state = 946
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -5879,43 +5863,43 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 950
+            self.state = 949
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 949
+            if _la==118 or _la==119:
+                self.state = 948
                 self.label_colon()
 
 
-            self.state = 952
+            self.state = 951
             self.match(vhdlParser.BREAK)
-            self.state = 954
+            self.state = 953
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FOR or ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & ((1 << (vhdlParser.BASIC_IDENTIFIER - 118)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 118)) | (1 << (vhdlParser.STRING_LITERAL - 118)))) != 0):
-                self.state = 953
+            if _la==30 or ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & 515) != 0):
+                self.state = 952
                 self.break_list()
 
 
-            self.state = 957
+            self.state = 956
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.ON:
-                self.state = 956
+            if _la==59:
+                self.state = 955
                 self.sensitivity_clause()
 
 
-            self.state = 961
+            self.state = 960
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.WHEN:
-                self.state = 959
+            if _la==108:
+                self.state = 958
                 self.match(vhdlParser.WHEN)
-                self.state = 960
+                self.state = 959
                 self.condition()
 
 
-            self.state = 963
+            self.state = 962
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -5974,25 +5958,25 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 966
+            self.state = 965
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,72,self._ctx)
             if la_ == 1:
-                self.state = 965
+                self.state = 964
                 self.label_colon()
 
 
-            self.state = 969
+            self.state = 968
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.POSTPONED:
-                self.state = 968
+            if _la==66:
+                self.state = 967
                 self.match(vhdlParser.POSTPONED)
 
 
-            self.state = 971
+            self.state = 970
             self.procedure_call()
-            self.state = 972
+            self.state = 971
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -6052,31 +6036,31 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 975
+            self.state = 974
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,74,self._ctx)
             if la_ == 1:
-                self.state = 974
+                self.state = 973
                 self.label_colon()
 
 
-            self.state = 978
+            self.state = 977
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.POSTPONED:
-                self.state = 977
+            if _la==66:
+                self.state = 976
                 self.match(vhdlParser.POSTPONED)
 
 
-            self.state = 982
+            self.state = 981
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL, vhdlParser.LPAREN]:
-                self.state = 980
+            if token in [118, 119, 127, 141]:
+                self.state = 979
                 self.conditional_signal_assignment()
                 pass
-            elif token in [vhdlParser.WITH]:
-                self.state = 981
+            elif token in [107]:
+                self.state = 980
                 self.selected_signal_assignment()
                 pass
             else:
@@ -6128,7 +6112,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 106, self.RULE_condition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 984
+            self.state = 983
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -6179,9 +6163,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 108, self.RULE_condition_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 986
+            self.state = 985
             self.match(vhdlParser.UNTIL)
-            self.state = 987
+            self.state = 986
             self.condition()
         except RecognitionException as re:
             localctx.exception = re
@@ -6243,15 +6227,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 110, self.RULE_conditional_signal_assignment)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 989
+            self.state = 988
             self.target()
-            self.state = 990
+            self.state = 989
             self.match(vhdlParser.LE)
-            self.state = 991
+            self.state = 990
             self.opts()
-            self.state = 992
+            self.state = 991
             self.conditional_waveforms()
-            self.state = 993
+            self.state = 992
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -6314,23 +6298,23 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 995
+            self.state = 994
             self.waveform()
-            self.state = 1002
+            self.state = 1001
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.WHEN:
-                self.state = 996
+            if _la==108:
+                self.state = 995
                 self.match(vhdlParser.WHEN)
-                self.state = 997
+                self.state = 996
                 self.condition()
-                self.state = 1000
+                self.state = 999
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.ELSE:
-                    self.state = 998
+                if _la==26:
+                    self.state = 997
                     self.match(vhdlParser.ELSE)
-                    self.state = 999
+                    self.state = 998
                     self.conditional_waveforms()
 
 
@@ -6416,39 +6400,39 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1004
+            self.state = 1003
             self.match(vhdlParser.CONFIGURATION)
-            self.state = 1005
+            self.state = 1004
             self.identifier()
-            self.state = 1006
+            self.state = 1005
             self.match(vhdlParser.OF)
-            self.state = 1007
+            self.state = 1006
             self.name()
-            self.state = 1008
+            self.state = 1007
             self.match(vhdlParser.IS)
-            self.state = 1009
+            self.state = 1008
             self.configuration_declarative_part()
-            self.state = 1010
+            self.state = 1009
             self.block_configuration()
-            self.state = 1011
+            self.state = 1010
             self.match(vhdlParser.END)
-            self.state = 1013
+            self.state = 1012
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.CONFIGURATION:
-                self.state = 1012
+            if _la==20:
+                self.state = 1011
                 self.match(vhdlParser.CONFIGURATION)
 
 
-            self.state = 1016
+            self.state = 1015
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1015
+            if _la==118 or _la==119:
+                self.state = 1014
                 self.identifier()
 
 
-            self.state = 1018
+            self.state = 1017
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -6503,22 +6487,22 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Configuration_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 116, self.RULE_configuration_declarative_item)
         try:
-            self.state = 1023
+            self.state = 1022
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.USE]:
+            if token in [104]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1020
+                self.state = 1019
                 self.use_clause()
                 pass
-            elif token in [vhdlParser.ATTRIBUTE]:
+            elif token in [11]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1021
+                self.state = 1020
                 self.attribute_specification()
                 pass
-            elif token in [vhdlParser.GROUP]:
+            elif token in [34]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1022
+                self.state = 1021
                 self.group_declaration()
                 pass
             else:
@@ -6574,13 +6558,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1028
+            self.state = 1027
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.ATTRIBUTE or _la==vhdlParser.GROUP or _la==vhdlParser.USE:
-                self.state = 1025
+            while _la==11 or _la==34 or _la==104:
+                self.state = 1024
                 self.configuration_declarative_item()
-                self.state = 1030
+                self.state = 1029
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -6633,18 +6617,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Configuration_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 120, self.RULE_configuration_item)
         try:
-            self.state = 1033
+            self.state = 1032
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,83,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1031
+                self.state = 1030
                 self.block_configuration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1032
+                self.state = 1031
                 self.component_configuration()
                 pass
 
@@ -6705,13 +6689,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 122, self.RULE_configuration_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1035
+            self.state = 1034
             self.match(vhdlParser.FOR)
-            self.state = 1036
+            self.state = 1035
             self.component_specification()
-            self.state = 1037
+            self.state = 1036
             self.binding_indication()
-            self.state = 1038
+            self.state = 1037
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -6780,25 +6764,25 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1040
+            self.state = 1039
             self.match(vhdlParser.CONSTANT)
-            self.state = 1041
+            self.state = 1040
             self.identifier_list()
-            self.state = 1042
+            self.state = 1041
             self.match(vhdlParser.COLON)
-            self.state = 1043
+            self.state = 1042
             self.subtype_indication()
-            self.state = 1046
+            self.state = 1045
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1044
+            if _la==135:
+                self.state = 1043
                 self.match(vhdlParser.VARASGN)
-                self.state = 1045
+                self.state = 1044
                 self.expression()
 
 
-            self.state = 1048
+            self.state = 1047
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -6856,13 +6840,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 126, self.RULE_constrained_array_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1050
+            self.state = 1049
             self.match(vhdlParser.ARRAY)
-            self.state = 1051
+            self.state = 1050
             self.index_constraint()
-            self.state = 1052
+            self.state = 1051
             self.match(vhdlParser.OF)
-            self.state = 1053
+            self.state = 1052
             self.subtype_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -6920,13 +6904,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 128, self.RULE_constrained_nature_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1055
+            self.state = 1054
             self.match(vhdlParser.ARRAY)
-            self.state = 1056
+            self.state = 1055
             self.index_constraint()
-            self.state = 1057
+            self.state = 1056
             self.match(vhdlParser.OF)
-            self.state = 1058
+            self.state = 1057
             self.subnature_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -6977,17 +6961,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.ConstraintContext(self, self._ctx, self.state)
         self.enterRule(localctx, 130, self.RULE_constraint)
         try:
-            self.state = 1062
+            self.state = 1061
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.RANGE]:
+            if token in [72]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1060
+                self.state = 1059
                 self.range_constraint()
                 pass
-            elif token in [vhdlParser.LPAREN]:
+            elif token in [141]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1061
+                self.state = 1060
                 self.index_constraint()
                 pass
             else:
@@ -7043,13 +7027,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1067
+            self.state = 1066
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.LIBRARY or _la==vhdlParser.USE:
-                self.state = 1064
+            while _la==43 or _la==104:
+                self.state = 1063
                 self.context_item()
-                self.state = 1069
+                self.state = 1068
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -7102,17 +7086,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Context_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 134, self.RULE_context_item)
         try:
-            self.state = 1072
+            self.state = 1071
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.LIBRARY]:
+            if token in [43]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1070
+                self.state = 1069
                 self.library_clause()
                 pass
-            elif token in [vhdlParser.USE]:
+            elif token in [104]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1071
+                self.state = 1070
                 self.use_clause()
                 pass
             else:
@@ -7173,27 +7157,27 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 136, self.RULE_delay_mechanism)
         self._la = 0 # Token type
         try:
-            self.state = 1080
+            self.state = 1079
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.TRANSPORT]:
+            if token in [99]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1074
+                self.state = 1073
                 self.match(vhdlParser.TRANSPORT)
                 pass
-            elif token in [vhdlParser.INERTIAL, vhdlParser.REJECT]:
+            elif token in [39, 74]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1077
+                self.state = 1076
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.REJECT:
-                    self.state = 1075
+                if _la==74:
+                    self.state = 1074
                     self.match(vhdlParser.REJECT)
-                    self.state = 1076
+                    self.state = 1075
                     self.expression()
 
 
-                self.state = 1079
+                self.state = 1078
                 self.match(vhdlParser.INERTIAL)
                 pass
             else:
@@ -7252,17 +7236,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1085
+            self.state = 1084
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ARCHITECTURE) | (1 << vhdlParser.CONFIGURATION) | (1 << vhdlParser.ENTITY) | (1 << vhdlParser.LIBRARY))) != 0) or _la==vhdlParser.PACKAGE or _la==vhdlParser.USE:
-                self.state = 1082
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 8796127625472) != 0) or _la==64 or _la==104:
+                self.state = 1081
                 self.design_unit()
-                self.state = 1087
+                self.state = 1086
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1088
+            self.state = 1087
             self.match(vhdlParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -7314,9 +7298,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 140, self.RULE_design_unit)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1090
+            self.state = 1089
             self.context_clause()
-            self.state = 1091
+            self.state = 1090
             self.library_unit()
         except RecognitionException as re:
             localctx.exception = re
@@ -7366,17 +7350,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.DesignatorContext(self, self._ctx, self.state)
         self.enterRule(localctx, 142, self.RULE_designator)
         try:
-            self.state = 1095
+            self.state = 1094
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1093
+                self.state = 1092
                 self.identifier()
                 pass
-            elif token in [vhdlParser.STRING_LITERAL]:
+            elif token in [127]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1094
+                self.state = 1093
                 self.match(vhdlParser.STRING_LITERAL)
                 pass
             else:
@@ -7431,9 +7415,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1097
+            self.state = 1096
             _la = self._input.LA(1)
-            if not(_la==vhdlParser.DOWNTO or _la==vhdlParser.TO):
+            if not(_la==23 or _la==97):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -7497,15 +7481,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 146, self.RULE_disconnection_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1099
+            self.state = 1098
             self.match(vhdlParser.DISCONNECT)
-            self.state = 1100
+            self.state = 1099
             self.guarded_signal_specification()
-            self.state = 1101
+            self.state = 1100
             self.match(vhdlParser.AFTER)
-            self.state = 1102
+            self.state = 1101
             self.expression()
-            self.state = 1103
+            self.state = 1102
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -7556,18 +7540,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Discrete_rangeContext(self, self._ctx, self.state)
         self.enterRule(localctx, 148, self.RULE_discrete_range)
         try:
-            self.state = 1107
+            self.state = 1106
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,92,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1105
+                self.state = 1104
                 self.range_decl()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1106
+                self.state = 1105
                 self.subtype_indication()
                 pass
 
@@ -7625,17 +7609,17 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 150, self.RULE_element_association)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1112
+            self.state = 1111
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,93,self._ctx)
             if la_ == 1:
-                self.state = 1109
+                self.state = 1108
                 self.choices()
-                self.state = 1110
+                self.state = 1109
                 self.match(vhdlParser.ARROW)
 
 
-            self.state = 1114
+            self.state = 1113
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -7693,13 +7677,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 152, self.RULE_element_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1116
+            self.state = 1115
             self.identifier_list()
-            self.state = 1117
+            self.state = 1116
             self.match(vhdlParser.COLON)
-            self.state = 1118
+            self.state = 1117
             self.element_subtype_definition()
-            self.state = 1119
+            self.state = 1118
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -7747,7 +7731,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 154, self.RULE_element_subnature_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1121
+            self.state = 1120
             self.subnature_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -7795,7 +7779,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 156, self.RULE_element_subtype_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1123
+            self.state = 1122
             self.subtype_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -7820,16 +7804,6 @@ class vhdlParser ( Parser ):
             return self.getTypedRuleContext(vhdlParser.NameContext,0)
 
 
-        def LPAREN(self):
-            return self.getToken(vhdlParser.LPAREN, 0)
-
-        def identifier(self):
-            return self.getTypedRuleContext(vhdlParser.IdentifierContext,0)
-
-
-        def RPAREN(self):
-            return self.getToken(vhdlParser.RPAREN, 0)
-
         def CONFIGURATION(self):
             return self.getToken(vhdlParser.CONFIGURATION, 0)
 
@@ -7860,40 +7834,27 @@ class vhdlParser ( Parser ):
 
         localctx = vhdlParser.Entity_aspectContext(self, self._ctx, self.state)
         self.enterRule(localctx, 158, self.RULE_entity_aspect)
-        self._la = 0 # Token type
         try:
-            self.state = 1136
+            self.state = 1129
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ENTITY]:
+            if token in [25]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1125
+                self.state = 1124
                 self.match(vhdlParser.ENTITY)
-                self.state = 1126
+                self.state = 1125
                 self.name()
-                self.state = 1131
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if _la==vhdlParser.LPAREN:
-                    self.state = 1127
-                    self.match(vhdlParser.LPAREN)
-                    self.state = 1128
-                    self.identifier()
-                    self.state = 1129
-                    self.match(vhdlParser.RPAREN)
-
-
                 pass
-            elif token in [vhdlParser.CONFIGURATION]:
+            elif token in [20]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1133
+                self.state = 1126
                 self.match(vhdlParser.CONFIGURATION)
-                self.state = 1134
+                self.state = 1127
                 self.name()
                 pass
-            elif token in [vhdlParser.OPEN]:
+            elif token in [60]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1135
+                self.state = 1128
                 self.match(vhdlParser.OPEN)
                 pass
             else:
@@ -8005,9 +7966,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1138
+            self.state = 1131
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ARCHITECTURE) | (1 << vhdlParser.COMPONENT) | (1 << vhdlParser.CONFIGURATION) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.ENTITY) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.LABEL) | (1 << vhdlParser.LITERAL) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & ((1 << (vhdlParser.PACKAGE - 64)) | (1 << (vhdlParser.PROCEDURE - 64)) | (1 << (vhdlParser.QUANTITY - 64)) | (1 << (vhdlParser.SIGNAL - 64)) | (1 << (vhdlParser.SUBNATURE - 64)) | (1 << (vhdlParser.SUBTYPE - 64)) | (1 << (vhdlParser.TERMINAL - 64)) | (1 << (vhdlParser.TYPE - 64)) | (1 << (vhdlParser.UNITS - 64)) | (1 << (vhdlParser.VARIABLE - 64)))) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2326586505822464) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & 2544503881873) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -8062,13 +8023,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1140
+            self.state = 1133
             self.entity_class()
-            self.state = 1142
+            self.state = 1135
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BOX:
-                self.state = 1141
+            if _la==136:
+                self.state = 1134
                 self.match(vhdlParser.BOX)
 
 
@@ -8128,17 +8089,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1144
+            self.state = 1137
             self.entity_class_entry()
-            self.state = 1149
+            self.state = 1142
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 1145
+            while _la==139:
+                self.state = 1138
                 self.match(vhdlParser.COMMA)
-                self.state = 1146
+                self.state = 1139
                 self.entity_class_entry()
-                self.state = 1151
+                self.state = 1144
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -8222,45 +8183,45 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1152
+            self.state = 1145
             self.match(vhdlParser.ENTITY)
-            self.state = 1153
+            self.state = 1146
             self.identifier()
-            self.state = 1154
+            self.state = 1147
             self.match(vhdlParser.IS)
-            self.state = 1155
+            self.state = 1148
             self.entity_header()
-            self.state = 1156
+            self.state = 1149
             self.entity_declarative_part()
-            self.state = 1159
+            self.state = 1152
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BEGIN:
-                self.state = 1157
+            if _la==12:
+                self.state = 1150
                 self.match(vhdlParser.BEGIN)
-                self.state = 1158
+                self.state = 1151
                 self.entity_statement_part()
 
 
-            self.state = 1161
+            self.state = 1154
             self.match(vhdlParser.END)
-            self.state = 1163
+            self.state = 1156
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.ENTITY:
-                self.state = 1162
+            if _la==25:
+                self.state = 1155
                 self.match(vhdlParser.ENTITY)
 
 
-            self.state = 1166
+            self.state = 1159
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1165
+            if _la==118 or _la==119:
+                self.state = 1158
                 self.identifier()
 
 
-            self.state = 1168
+            self.state = 1161
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -8383,126 +8344,126 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Entity_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 168, self.RULE_entity_declarative_item)
         try:
-            self.state = 1190
+            self.state = 1183
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,101,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,100,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1170
+                self.state = 1163
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1171
+                self.state = 1164
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1172
+                self.state = 1165
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1173
+                self.state = 1166
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1174
+                self.state = 1167
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1175
+                self.state = 1168
                 self.signal_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1176
+                self.state = 1169
                 self.variable_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1177
+                self.state = 1170
                 self.file_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1178
+                self.state = 1171
                 self.alias_declaration()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1179
+                self.state = 1172
                 self.attribute_declaration()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1180
+                self.state = 1173
                 self.attribute_specification()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 1181
+                self.state = 1174
                 self.disconnection_specification()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 1182
+                self.state = 1175
                 self.step_limit_specification()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 1183
+                self.state = 1176
                 self.use_clause()
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 1184
+                self.state = 1177
                 self.group_template_declaration()
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 1185
+                self.state = 1178
                 self.group_declaration()
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 1186
+                self.state = 1179
                 self.nature_declaration()
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 1187
+                self.state = 1180
                 self.subnature_declaration()
                 pass
 
             elif la_ == 19:
                 self.enterOuterAlt(localctx, 19)
-                self.state = 1188
+                self.state = 1181
                 self.quantity_declaration()
                 pass
 
             elif la_ == 20:
                 self.enterOuterAlt(localctx, 20)
-                self.state = 1189
+                self.state = 1182
                 self.terminal_declaration()
                 pass
 
@@ -8557,13 +8518,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1195
+            self.state = 1188
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.DISCONNECT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE) | (1 << vhdlParser.LIMIT) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.QUANTITY - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SIGNAL - 68)) | (1 << (vhdlParser.SUBNATURE - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TERMINAL - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 1192
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 2269549309200416) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210571231245) != 0):
+                self.state = 1185
                 self.entity_declarative_item()
-                self.state = 1197
+                self.state = 1190
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -8618,13 +8579,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1198
+            self.state = 1191
             self.entity_tag()
-            self.state = 1200
+            self.state = 1193
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LBRACKET:
-                self.state = 1199
+            if _la==143:
+                self.state = 1192
                 self.signature()
 
 
@@ -8679,19 +8640,19 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1203
+            self.state = 1196
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GENERIC:
-                self.state = 1202
+            if _la==33:
+                self.state = 1195
                 self.generic_clause()
 
 
-            self.state = 1206
+            self.state = 1199
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PORT:
-                self.state = 1205
+            if _la==65:
+                self.state = 1198
                 self.port_clause()
 
 
@@ -8756,34 +8717,34 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 176, self.RULE_entity_name_list)
         self._la = 0 # Token type
         try:
-            self.state = 1218
+            self.state = 1211
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.CHARACTER_LITERAL, vhdlParser.STRING_LITERAL]:
+            if token in [118, 119, 126, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1208
+                self.state = 1201
                 self.entity_designator()
-                self.state = 1213
+                self.state = 1206
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==vhdlParser.COMMA:
-                    self.state = 1209
+                while _la==139:
+                    self.state = 1202
                     self.match(vhdlParser.COMMA)
-                    self.state = 1210
+                    self.state = 1203
                     self.entity_designator()
-                    self.state = 1215
+                    self.state = 1208
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
-            elif token in [vhdlParser.OTHERS]:
+            elif token in [62]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1216
+                self.state = 1209
                 self.match(vhdlParser.OTHERS)
                 pass
-            elif token in [vhdlParser.ALL]:
+            elif token in [6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1217
+                self.state = 1210
                 self.match(vhdlParser.ALL)
                 pass
             else:
@@ -8842,11 +8803,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 178, self.RULE_entity_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1220
+            self.state = 1213
             self.entity_name_list()
-            self.state = 1221
+            self.state = 1214
             self.match(vhdlParser.COLON)
-            self.state = 1222
+            self.state = 1215
             self.entity_class()
         except RecognitionException as re:
             localctx.exception = re
@@ -8901,24 +8862,24 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Entity_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 180, self.RULE_entity_statement)
         try:
-            self.state = 1227
+            self.state = 1220
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,108,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,107,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1224
+                self.state = 1217
                 self.concurrent_assertion_statement()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1225
+                self.state = 1218
                 self.process_statement()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1226
+                self.state = 1219
                 self.concurrent_procedure_call_statement()
                 pass
 
@@ -8973,13 +8934,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1232
+            self.state = 1225
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.ASSERT or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & ((1 << (vhdlParser.POSTPONED - 66)) | (1 << (vhdlParser.PROCESS - 66)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 66)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 66)))) != 0):
-                self.state = 1229
+            while _la==10 or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 13510798882111491) != 0):
+                self.state = 1222
                 self.entity_statement()
-                self.state = 1234
+                self.state = 1227
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -9034,22 +8995,22 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Entity_tagContext(self, self._ctx, self.state)
         self.enterRule(localctx, 184, self.RULE_entity_tag)
         try:
-            self.state = 1238
+            self.state = 1231
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1235
+                self.state = 1228
                 self.identifier()
                 pass
-            elif token in [vhdlParser.CHARACTER_LITERAL]:
+            elif token in [126]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1236
+                self.state = 1229
                 self.match(vhdlParser.CHARACTER_LITERAL)
                 pass
-            elif token in [vhdlParser.STRING_LITERAL]:
+            elif token in [127]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1237
+                self.state = 1230
                 self.match(vhdlParser.STRING_LITERAL)
                 pass
             else:
@@ -9103,17 +9064,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Enumeration_literalContext(self, self._ctx, self.state)
         self.enterRule(localctx, 186, self.RULE_enumeration_literal)
         try:
-            self.state = 1242
+            self.state = 1235
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1240
+                self.state = 1233
                 self.identifier()
                 pass
-            elif token in [vhdlParser.CHARACTER_LITERAL]:
+            elif token in [126]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1241
+                self.state = 1234
                 self.match(vhdlParser.CHARACTER_LITERAL)
                 pass
             else:
@@ -9181,23 +9142,23 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1244
+            self.state = 1237
             self.match(vhdlParser.LPAREN)
-            self.state = 1245
+            self.state = 1238
             self.enumeration_literal()
-            self.state = 1250
+            self.state = 1243
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 1246
+            while _la==139:
+                self.state = 1239
                 self.match(vhdlParser.COMMA)
-                self.state = 1247
+                self.state = 1240
                 self.enumeration_literal()
-                self.state = 1252
+                self.state = 1245
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1253
+            self.state = 1246
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -9263,35 +9224,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1256
+            self.state = 1249
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1255
+            if _la==118 or _la==119:
+                self.state = 1248
                 self.label_colon()
 
 
-            self.state = 1258
+            self.state = 1251
             self.match(vhdlParser.EXIT)
-            self.state = 1260
+            self.state = 1253
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1259
+            if _la==118 or _la==119:
+                self.state = 1252
                 self.identifier()
 
 
-            self.state = 1264
+            self.state = 1257
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.WHEN:
-                self.state = 1262
+            if _la==108:
+                self.state = 1255
                 self.match(vhdlParser.WHEN)
-                self.state = 1263
+                self.state = 1256
                 self.condition()
 
 
-            self.state = 1266
+            self.state = 1259
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -9349,20 +9310,20 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 192, self.RULE_expression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1268
+            self.state = 1261
             self.relation()
-            self.state = 1274
+            self.state = 1267
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,116,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,115,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1269
+                    self.state = 1262
                     self.logical_operator()
-                    self.state = 1270
+                    self.state = 1263
                     self.relation() 
-                self.state = 1276
+                self.state = 1269
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,116,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,115,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -9421,36 +9382,36 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.FactorContext(self, self._ctx, self.state)
         self.enterRule(localctx, 194, self.RULE_factor)
         try:
-            self.state = 1286
+            self.state = 1279
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.NEW, vhdlParser.NULL_, vhdlParser.BASE_LITERAL, vhdlParser.BIT_STRING_LITERAL, vhdlParser.REAL_LITERAL, vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.CHARACTER_LITERAL, vhdlParser.STRING_LITERAL, vhdlParser.LPAREN, vhdlParser.INTEGER]:
+            if token in [52, 57, 112, 113, 117, 118, 119, 126, 127, 141, 158]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1277
+                self.state = 1270
                 self.primary()
-                self.state = 1280
+                self.state = 1273
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,117,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,116,self._ctx)
                 if la_ == 1:
-                    self.state = 1278
+                    self.state = 1271
                     self.match(vhdlParser.DOUBLESTAR)
-                    self.state = 1279
+                    self.state = 1272
                     self.primary()
 
 
                 pass
-            elif token in [vhdlParser.ABS]:
+            elif token in [1]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1282
+                self.state = 1275
                 self.match(vhdlParser.ABS)
-                self.state = 1283
+                self.state = 1276
                 self.primary()
                 pass
-            elif token in [vhdlParser.NOT]:
+            elif token in [56]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1284
+                self.state = 1277
                 self.match(vhdlParser.NOT)
-                self.state = 1285
+                self.state = 1278
                 self.primary()
                 pass
             else:
@@ -9520,23 +9481,23 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1288
+            self.state = 1281
             self.match(vhdlParser.FILE)
-            self.state = 1289
+            self.state = 1282
             self.identifier_list()
-            self.state = 1290
+            self.state = 1283
             self.match(vhdlParser.COLON)
-            self.state = 1291
+            self.state = 1284
             self.subtype_indication()
-            self.state = 1293
+            self.state = 1286
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IS or _la==vhdlParser.OPEN:
-                self.state = 1292
+            if _la==41 or _la==60:
+                self.state = 1285
                 self.file_open_information()
 
 
-            self.state = 1295
+            self.state = 1288
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -9584,7 +9545,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 198, self.RULE_file_logical_name)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1297
+            self.state = 1290
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -9643,19 +9604,19 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1301
+            self.state = 1294
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.OPEN:
-                self.state = 1299
+            if _la==60:
+                self.state = 1292
                 self.match(vhdlParser.OPEN)
-                self.state = 1300
+                self.state = 1293
                 self.expression()
 
 
-            self.state = 1303
+            self.state = 1296
             self.match(vhdlParser.IS)
-            self.state = 1304
+            self.state = 1297
             self.file_logical_name()
         except RecognitionException as re:
             localctx.exception = re
@@ -9709,11 +9670,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 202, self.RULE_file_type_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1306
+            self.state = 1299
             self.match(vhdlParser.FILE)
-            self.state = 1307
+            self.state = 1300
             self.match(vhdlParser.OF)
-            self.state = 1308
+            self.state = 1301
             self.subtype_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -9761,7 +9722,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 204, self.RULE_formal_parameter_list)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1310
+            self.state = 1303
             self.interface_list()
         except RecognitionException as re:
             localctx.exception = re
@@ -9818,24 +9779,24 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Formal_partContext(self, self._ctx, self.state)
         self.enterRule(localctx, 206, self.RULE_formal_part)
         try:
-            self.state = 1318
+            self.state = 1311
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,121,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,120,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1312
+                self.state = 1305
                 self.identifier()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1313
+                self.state = 1306
                 self.identifier()
-                self.state = 1314
+                self.state = 1307
                 self.match(vhdlParser.LPAREN)
-                self.state = 1315
+                self.state = 1308
                 self.explicit_range()
-                self.state = 1316
+                self.state = 1309
                 self.match(vhdlParser.RPAREN)
                 pass
 
@@ -9907,25 +9868,25 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1320
+            self.state = 1313
             self.match(vhdlParser.QUANTITY)
-            self.state = 1321
+            self.state = 1314
             self.identifier_list()
-            self.state = 1322
+            self.state = 1315
             self.match(vhdlParser.COLON)
-            self.state = 1323
+            self.state = 1316
             self.subtype_indication()
-            self.state = 1326
+            self.state = 1319
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1324
+            if _la==135:
+                self.state = 1317
                 self.match(vhdlParser.VARASGN)
-                self.state = 1325
+                self.state = 1318
                 self.expression()
 
 
-            self.state = 1328
+            self.state = 1321
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -10011,53 +9972,53 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1330
+            self.state = 1323
             self.label_colon()
-            self.state = 1331
+            self.state = 1324
             self.generation_scheme()
-            self.state = 1332
+            self.state = 1325
             self.match(vhdlParser.GENERATE)
-            self.state = 1340
+            self.state = 1333
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.BEGIN) | (1 << vhdlParser.COMPONENT) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.DISCONNECT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FOR) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE) | (1 << vhdlParser.LIMIT) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.QUANTITY - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SIGNAL - 68)) | (1 << (vhdlParser.SUBNATURE - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TERMINAL - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 1336
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 2269550383470624) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210571231245) != 0):
+                self.state = 1329
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.COMPONENT) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.DISCONNECT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FOR) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE) | (1 << vhdlParser.LIMIT) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.QUANTITY - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SIGNAL - 68)) | (1 << (vhdlParser.SUBNATURE - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TERMINAL - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                    self.state = 1333
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 2269550383466528) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210571231245) != 0):
+                    self.state = 1326
                     self.block_declarative_item()
-                    self.state = 1338
+                    self.state = 1331
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 1339
+                self.state = 1332
                 self.match(vhdlParser.BEGIN)
 
 
-            self.state = 1345
+            self.state = 1338
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ABS) | (1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.IF) | (1 << vhdlParser.NEW) | (1 << vhdlParser.NOT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & ((1 << (vhdlParser.POSTPONED - 66)) | (1 << (vhdlParser.PROCESS - 66)) | (1 << (vhdlParser.PROCEDURAL - 66)) | (1 << (vhdlParser.WITH - 66)) | (1 << (vhdlParser.BASE_LITERAL - 66)) | (1 << (vhdlParser.BIT_STRING_LITERAL - 66)) | (1 << (vhdlParser.REAL_LITERAL - 66)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 66)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 66)) | (1 << (vhdlParser.CHARACTER_LITERAL - 66)) | (1 << (vhdlParser.STRING_LITERAL - 66)))) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & ((1 << (vhdlParser.LPAREN - 141)) | (1 << (vhdlParser.PLUS - 141)) | (1 << (vhdlParser.MINUS - 141)) | (1 << (vhdlParser.INTEGER - 141)))) != 0):
-                self.state = 1342
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 220676450460926978) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 3474740417772126219) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & 131457) != 0):
+                self.state = 1335
                 self.architecture_statement()
-                self.state = 1347
+                self.state = 1340
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1348
+            self.state = 1341
             self.match(vhdlParser.END)
-            self.state = 1349
+            self.state = 1342
             self.match(vhdlParser.GENERATE)
-            self.state = 1351
+            self.state = 1344
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1350
+            if _la==118 or _la==119:
+                self.state = 1343
                 self.identifier()
 
 
-            self.state = 1353
+            self.state = 1346
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -10114,21 +10075,21 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Generation_schemeContext(self, self._ctx, self.state)
         self.enterRule(localctx, 212, self.RULE_generation_scheme)
         try:
-            self.state = 1359
+            self.state = 1352
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.FOR]:
+            if token in [30]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1355
+                self.state = 1348
                 self.match(vhdlParser.FOR)
-                self.state = 1356
+                self.state = 1349
                 self.parameter_specification()
                 pass
-            elif token in [vhdlParser.IF]:
+            elif token in [36]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1357
+                self.state = 1350
                 self.match(vhdlParser.IF)
-                self.state = 1358
+                self.state = 1351
                 self.condition()
                 pass
             else:
@@ -10192,15 +10153,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 214, self.RULE_generic_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1361
+            self.state = 1354
             self.match(vhdlParser.GENERIC)
-            self.state = 1362
+            self.state = 1355
             self.match(vhdlParser.LPAREN)
-            self.state = 1363
+            self.state = 1356
             self.generic_list()
-            self.state = 1364
+            self.state = 1357
             self.match(vhdlParser.RPAREN)
-            self.state = 1365
+            self.state = 1358
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -10258,17 +10219,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1367
+            self.state = 1360
             self.interface_constant_declaration()
-            self.state = 1372
+            self.state = 1365
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.SEMI:
-                self.state = 1368
+            while _la==138:
+                self.state = 1361
                 self.match(vhdlParser.SEMI)
-                self.state = 1369
+                self.state = 1362
                 self.interface_constant_declaration()
-                self.state = 1374
+                self.state = 1367
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -10330,15 +10291,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 218, self.RULE_generic_map_aspect)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1375
+            self.state = 1368
             self.match(vhdlParser.GENERIC)
-            self.state = 1376
+            self.state = 1369
             self.match(vhdlParser.MAP)
-            self.state = 1377
+            self.state = 1370
             self.match(vhdlParser.LPAREN)
-            self.state = 1378
+            self.state = 1371
             self.association_list()
-            self.state = 1379
+            self.state = 1372
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -10388,17 +10349,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Group_constituentContext(self, self._ctx, self.state)
         self.enterRule(localctx, 220, self.RULE_group_constituent)
         try:
-            self.state = 1383
+            self.state = 1376
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL]:
+            if token in [118, 119, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1381
+                self.state = 1374
                 self.name()
                 pass
-            elif token in [vhdlParser.CHARACTER_LITERAL]:
+            elif token in [126]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1382
+                self.state = 1375
                 self.match(vhdlParser.CHARACTER_LITERAL)
                 pass
             else:
@@ -10460,17 +10421,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1385
+            self.state = 1378
             self.group_constituent()
-            self.state = 1390
+            self.state = 1383
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 1386
+            while _la==139:
+                self.state = 1379
                 self.match(vhdlParser.COMMA)
-                self.state = 1387
+                self.state = 1380
                 self.group_constituent()
-                self.state = 1392
+                self.state = 1385
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -10540,19 +10501,19 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 224, self.RULE_group_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1393
+            self.state = 1386
             self.match(vhdlParser.GROUP)
-            self.state = 1394
+            self.state = 1387
             self.label_colon()
-            self.state = 1395
+            self.state = 1388
             self.name()
-            self.state = 1396
+            self.state = 1389
             self.match(vhdlParser.LPAREN)
-            self.state = 1397
+            self.state = 1390
             self.group_constituent_list()
-            self.state = 1398
+            self.state = 1391
             self.match(vhdlParser.RPAREN)
-            self.state = 1399
+            self.state = 1392
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -10619,19 +10580,19 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 226, self.RULE_group_template_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1401
+            self.state = 1394
             self.match(vhdlParser.GROUP)
-            self.state = 1402
+            self.state = 1395
             self.identifier()
-            self.state = 1403
+            self.state = 1396
             self.match(vhdlParser.IS)
-            self.state = 1404
+            self.state = 1397
             self.match(vhdlParser.LPAREN)
-            self.state = 1405
+            self.state = 1398
             self.entity_class_entry_list()
-            self.state = 1406
+            self.state = 1399
             self.match(vhdlParser.RPAREN)
-            self.state = 1407
+            self.state = 1400
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -10686,11 +10647,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 228, self.RULE_guarded_signal_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1409
+            self.state = 1402
             self.signal_list()
-            self.state = 1410
+            self.state = 1403
             self.match(vhdlParser.COLON)
-            self.state = 1411
+            self.state = 1404
             self.name()
         except RecognitionException as re:
             localctx.exception = re
@@ -10741,9 +10702,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1413
+            self.state = 1406
             _la = self._input.LA(1)
-            if not(_la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER):
+            if not(_la==118 or _la==119):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -10804,17 +10765,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1415
+            self.state = 1408
             self.identifier()
-            self.state = 1420
+            self.state = 1413
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 1416
+            while _la==139:
+                self.state = 1409
                 self.match(vhdlParser.COMMA)
-                self.state = 1417
+                self.state = 1410
                 self.identifier()
-                self.state = 1422
+                self.state = 1415
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -10910,61 +10871,61 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1424
+            self.state = 1417
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1423
+            if _la==118 or _la==119:
+                self.state = 1416
                 self.label_colon()
 
 
-            self.state = 1426
+            self.state = 1419
             self.match(vhdlParser.IF)
-            self.state = 1427
+            self.state = 1420
             self.condition()
-            self.state = 1428
+            self.state = 1421
             self.match(vhdlParser.THEN)
-            self.state = 1429
+            self.state = 1422
             self.sequence_of_statements()
-            self.state = 1437
+            self.state = 1430
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.ELSIF:
-                self.state = 1430
+            while _la==27:
+                self.state = 1423
                 self.match(vhdlParser.ELSIF)
-                self.state = 1431
+                self.state = 1424
                 self.condition()
-                self.state = 1432
+                self.state = 1425
                 self.match(vhdlParser.THEN)
-                self.state = 1433
+                self.state = 1426
                 self.sequence_of_statements()
-                self.state = 1439
+                self.state = 1432
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1442
+            self.state = 1435
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.ELSE:
-                self.state = 1440
+            if _la==26:
+                self.state = 1433
                 self.match(vhdlParser.ELSE)
-                self.state = 1441
+                self.state = 1434
                 self.sequence_of_statements()
 
 
-            self.state = 1444
+            self.state = 1437
             self.match(vhdlParser.END)
-            self.state = 1445
+            self.state = 1438
             self.match(vhdlParser.IF)
-            self.state = 1447
+            self.state = 1440
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1446
+            if _la==118 or _la==119:
+                self.state = 1439
                 self.identifier()
 
 
-            self.state = 1449
+            self.state = 1442
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -11028,23 +10989,23 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1451
+            self.state = 1444
             self.match(vhdlParser.LPAREN)
-            self.state = 1452
+            self.state = 1445
             self.discrete_range()
-            self.state = 1457
+            self.state = 1450
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 1453
+            while _la==139:
+                self.state = 1446
                 self.match(vhdlParser.COMMA)
-                self.state = 1454
+                self.state = 1447
                 self.discrete_range()
-                self.state = 1459
+                self.state = 1452
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1460
+            self.state = 1453
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -11095,18 +11056,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Index_specificationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 238, self.RULE_index_specification)
         try:
-            self.state = 1464
+            self.state = 1457
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,137,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,136,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1462
+                self.state = 1455
                 self.discrete_range()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1463
+                self.state = 1456
                 self.expression()
                 pass
 
@@ -11163,11 +11124,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 240, self.RULE_index_subtype_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1466
+            self.state = 1459
             self.name()
-            self.state = 1467
+            self.state = 1460
             self.match(vhdlParser.RANGE)
-            self.state = 1468
+            self.state = 1461
             self.match(vhdlParser.BOX)
         except RecognitionException as re:
             localctx.exception = re
@@ -11195,16 +11156,6 @@ class vhdlParser ( Parser ):
         def ENTITY(self):
             return self.getToken(vhdlParser.ENTITY, 0)
 
-        def LPAREN(self):
-            return self.getToken(vhdlParser.LPAREN, 0)
-
-        def identifier(self):
-            return self.getTypedRuleContext(vhdlParser.IdentifierContext,0)
-
-
-        def RPAREN(self):
-            return self.getToken(vhdlParser.RPAREN, 0)
-
         def CONFIGURATION(self):
             return self.getToken(vhdlParser.CONFIGURATION, 0)
 
@@ -11234,46 +11185,34 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 242, self.RULE_instantiated_unit)
         self._la = 0 # Token type
         try:
-            self.state = 1484
+            self.state = 1471
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.COMPONENT, vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL]:
+            if token in [19, 118, 119, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1471
+                self.state = 1464
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.COMPONENT:
-                    self.state = 1470
+                if _la==19:
+                    self.state = 1463
                     self.match(vhdlParser.COMPONENT)
 
 
-                self.state = 1473
+                self.state = 1466
                 self.name()
                 pass
-            elif token in [vhdlParser.ENTITY]:
+            elif token in [25]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1474
+                self.state = 1467
                 self.match(vhdlParser.ENTITY)
-                self.state = 1475
+                self.state = 1468
                 self.name()
-                self.state = 1480
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if _la==vhdlParser.LPAREN:
-                    self.state = 1476
-                    self.match(vhdlParser.LPAREN)
-                    self.state = 1477
-                    self.identifier()
-                    self.state = 1478
-                    self.match(vhdlParser.RPAREN)
-
-
                 pass
-            elif token in [vhdlParser.CONFIGURATION]:
+            elif token in [20]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1482
+                self.state = 1469
                 self.match(vhdlParser.CONFIGURATION)
-                self.state = 1483
+                self.state = 1470
                 self.name()
                 pass
             else:
@@ -11340,34 +11279,34 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 244, self.RULE_instantiation_list)
         self._la = 0 # Token type
         try:
-            self.state = 1496
+            self.state = 1483
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1486
+                self.state = 1473
                 self.identifier()
-                self.state = 1491
+                self.state = 1478
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==vhdlParser.COMMA:
-                    self.state = 1487
+                while _la==139:
+                    self.state = 1474
                     self.match(vhdlParser.COMMA)
-                    self.state = 1488
+                    self.state = 1475
                     self.identifier()
-                    self.state = 1493
+                    self.state = 1480
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
-            elif token in [vhdlParser.OTHERS]:
+            elif token in [62]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1494
+                self.state = 1481
                 self.match(vhdlParser.OTHERS)
                 pass
-            elif token in [vhdlParser.ALL]:
+            elif token in [6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1495
+                self.state = 1482
                 self.match(vhdlParser.ALL)
                 pass
             else:
@@ -11440,35 +11379,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1499
+            self.state = 1486
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.CONSTANT:
-                self.state = 1498
+            if _la==21:
+                self.state = 1485
                 self.match(vhdlParser.CONSTANT)
 
 
-            self.state = 1501
+            self.state = 1488
             self.identifier_list()
-            self.state = 1502
+            self.state = 1489
             self.match(vhdlParser.COLON)
-            self.state = 1504
+            self.state = 1491
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IN:
-                self.state = 1503
+            if _la==38:
+                self.state = 1490
                 self.match(vhdlParser.IN)
 
 
-            self.state = 1506
+            self.state = 1493
             self.subtype_indication()
-            self.state = 1509
+            self.state = 1496
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1507
+            if _la==135:
+                self.state = 1494
                 self.match(vhdlParser.VARASGN)
-                self.state = 1508
+                self.state = 1495
                 self.expression()
 
 
@@ -11537,42 +11476,42 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Interface_declarationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 248, self.RULE_interface_declaration)
         try:
-            self.state = 1517
+            self.state = 1504
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,146,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,144,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1511
+                self.state = 1498
                 self.interface_constant_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1512
+                self.state = 1499
                 self.interface_signal_declaration()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1513
+                self.state = 1500
                 self.interface_variable_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1514
+                self.state = 1501
                 self.interface_file_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1515
+                self.state = 1502
                 self.interface_terminal_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1516
+                self.state = 1503
                 self.interface_quantity_declaration()
                 pass
 
@@ -11623,7 +11562,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 250, self.RULE_interface_element)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1519
+            self.state = 1506
             self.interface_declaration()
         except RecognitionException as re:
             localctx.exception = re
@@ -11681,13 +11620,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 252, self.RULE_interface_file_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1521
+            self.state = 1508
             self.match(vhdlParser.FILE)
-            self.state = 1522
+            self.state = 1509
             self.identifier_list()
-            self.state = 1523
+            self.state = 1510
             self.match(vhdlParser.COLON)
-            self.state = 1524
+            self.state = 1511
             self.subtype_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -11745,17 +11684,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1526
+            self.state = 1513
             self.interface_signal_declaration()
-            self.state = 1531
+            self.state = 1518
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.SEMI:
-                self.state = 1527
+            while _la==138:
+                self.state = 1514
                 self.match(vhdlParser.SEMI)
-                self.state = 1528
+                self.state = 1515
                 self.interface_signal_declaration()
-                self.state = 1533
+                self.state = 1520
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -11815,17 +11754,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1534
+            self.state = 1521
             self.interface_port_declaration()
-            self.state = 1539
+            self.state = 1526
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.SEMI:
-                self.state = 1535
+            while _la==138:
+                self.state = 1522
                 self.match(vhdlParser.SEMI)
-                self.state = 1536
+                self.state = 1523
                 self.interface_port_declaration()
-                self.state = 1541
+                self.state = 1528
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -11885,17 +11824,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1542
+            self.state = 1529
             self.interface_element()
-            self.state = 1547
+            self.state = 1534
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.SEMI:
-                self.state = 1543
+            while _la==138:
+                self.state = 1530
                 self.match(vhdlParser.SEMI)
-                self.state = 1544
+                self.state = 1531
                 self.interface_element()
-                self.state = 1549
+                self.state = 1536
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -11969,34 +11908,34 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1550
+            self.state = 1537
             self.match(vhdlParser.QUANTITY)
-            self.state = 1551
+            self.state = 1538
             self.identifier_list()
-            self.state = 1552
+            self.state = 1539
             self.match(vhdlParser.COLON)
-            self.state = 1554
+            self.state = 1541
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IN or _la==vhdlParser.OUT:
-                self.state = 1553
+            if _la==38 or _la==63:
+                self.state = 1540
                 _la = self._input.LA(1)
-                if not(_la==vhdlParser.IN or _la==vhdlParser.OUT):
+                if not(_la==38 or _la==63):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
 
 
-            self.state = 1556
+            self.state = 1543
             self.subtype_indication()
-            self.state = 1559
+            self.state = 1546
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1557
+            if _la==135:
+                self.state = 1544
                 self.match(vhdlParser.VARASGN)
-                self.state = 1558
+                self.state = 1545
                 self.expression()
 
 
@@ -12068,35 +12007,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1561
+            self.state = 1548
             self.identifier_list()
-            self.state = 1562
+            self.state = 1549
             self.match(vhdlParser.COLON)
-            self.state = 1564
+            self.state = 1551
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.BUFFER) | (1 << vhdlParser.IN) | (1 << vhdlParser.INOUT) | (1 << vhdlParser.LINKAGE) | (1 << vhdlParser.OUT))) != 0):
-                self.state = 1563
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -9223335478093086720) != 0):
+                self.state = 1550
                 self.signal_mode()
 
 
-            self.state = 1566
+            self.state = 1553
             self.subtype_indication()
-            self.state = 1568
+            self.state = 1555
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BUS:
-                self.state = 1567
+            if _la==17:
+                self.state = 1554
                 self.match(vhdlParser.BUS)
 
 
-            self.state = 1572
+            self.state = 1559
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1570
+            if _la==135:
+                self.state = 1557
                 self.match(vhdlParser.VARASGN)
-                self.state = 1571
+                self.state = 1558
                 self.expression()
 
 
@@ -12171,37 +12110,37 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1574
+            self.state = 1561
             self.match(vhdlParser.SIGNAL)
-            self.state = 1575
+            self.state = 1562
             self.identifier_list()
-            self.state = 1576
+            self.state = 1563
             self.match(vhdlParser.COLON)
-            self.state = 1578
+            self.state = 1565
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.BUFFER) | (1 << vhdlParser.IN) | (1 << vhdlParser.INOUT) | (1 << vhdlParser.LINKAGE) | (1 << vhdlParser.OUT))) != 0):
-                self.state = 1577
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -9223335478093086720) != 0):
+                self.state = 1564
                 self.signal_mode()
 
 
-            self.state = 1580
+            self.state = 1567
             self.subtype_indication()
-            self.state = 1582
+            self.state = 1569
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BUS:
-                self.state = 1581
+            if _la==17:
+                self.state = 1568
                 self.match(vhdlParser.BUS)
 
 
-            self.state = 1586
+            self.state = 1573
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1584
+            if _la==135:
+                self.state = 1571
                 self.match(vhdlParser.VARASGN)
-                self.state = 1585
+                self.state = 1572
                 self.expression()
 
 
@@ -12261,13 +12200,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 266, self.RULE_interface_terminal_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1588
+            self.state = 1575
             self.match(vhdlParser.TERMINAL)
-            self.state = 1589
+            self.state = 1576
             self.identifier_list()
-            self.state = 1590
+            self.state = 1577
             self.match(vhdlParser.COLON)
-            self.state = 1591
+            self.state = 1578
             self.subnature_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -12337,35 +12276,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1594
+            self.state = 1581
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARIABLE:
-                self.state = 1593
+            if _la==105:
+                self.state = 1580
                 self.match(vhdlParser.VARIABLE)
 
 
-            self.state = 1596
+            self.state = 1583
             self.identifier_list()
-            self.state = 1597
+            self.state = 1584
             self.match(vhdlParser.COLON)
-            self.state = 1599
+            self.state = 1586
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.BUFFER) | (1 << vhdlParser.IN) | (1 << vhdlParser.INOUT) | (1 << vhdlParser.LINKAGE) | (1 << vhdlParser.OUT))) != 0):
-                self.state = 1598
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -9223335478093086720) != 0):
+                self.state = 1585
                 self.signal_mode()
 
 
-            self.state = 1601
+            self.state = 1588
             self.subtype_indication()
-            self.state = 1604
+            self.state = 1591
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 1602
+            if _la==135:
+                self.state = 1589
                 self.match(vhdlParser.VARASGN)
-                self.state = 1603
+                self.state = 1590
                 self.expression()
 
 
@@ -12424,21 +12363,21 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Iteration_schemeContext(self, self._ctx, self.state)
         self.enterRule(localctx, 270, self.RULE_iteration_scheme)
         try:
-            self.state = 1610
+            self.state = 1597
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.WHILE]:
+            if token in [109]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1606
+                self.state = 1593
                 self.match(vhdlParser.WHILE)
-                self.state = 1607
+                self.state = 1594
                 self.condition()
                 pass
-            elif token in [vhdlParser.FOR]:
+            elif token in [30]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1608
+                self.state = 1595
                 self.match(vhdlParser.FOR)
-                self.state = 1609
+                self.state = 1596
                 self.parameter_specification()
                 pass
             else:
@@ -12493,9 +12432,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 272, self.RULE_label_colon)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1612
+            self.state = 1599
             self.identifier()
-            self.state = 1613
+            self.state = 1600
             self.match(vhdlParser.COLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -12549,11 +12488,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 274, self.RULE_library_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1615
+            self.state = 1602
             self.match(vhdlParser.LIBRARY)
-            self.state = 1616
+            self.state = 1603
             self.logical_name_list()
-            self.state = 1617
+            self.state = 1604
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -12604,18 +12543,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Library_unitContext(self, self._ctx, self.state)
         self.enterRule(localctx, 276, self.RULE_library_unit)
         try:
-            self.state = 1621
+            self.state = 1608
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,162,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,160,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1619
+                self.state = 1606
                 self.secondary_unit()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1620
+                self.state = 1607
                 self.primary_unit()
                 pass
 
@@ -12678,32 +12617,32 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.LiteralContext(self, self._ctx, self.state)
         self.enterRule(localctx, 278, self.RULE_literal)
         try:
-            self.state = 1628
+            self.state = 1615
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.NULL_]:
+            if token in [57]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1623
+                self.state = 1610
                 self.match(vhdlParser.NULL_)
                 pass
-            elif token in [vhdlParser.BIT_STRING_LITERAL]:
+            elif token in [113]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1624
+                self.state = 1611
                 self.match(vhdlParser.BIT_STRING_LITERAL)
                 pass
-            elif token in [vhdlParser.STRING_LITERAL]:
+            elif token in [127]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1625
+                self.state = 1612
                 self.match(vhdlParser.STRING_LITERAL)
                 pass
-            elif token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.CHARACTER_LITERAL]:
+            elif token in [118, 119, 126]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1626
+                self.state = 1613
                 self.enumeration_literal()
                 pass
-            elif token in [vhdlParser.BASE_LITERAL, vhdlParser.REAL_LITERAL, vhdlParser.INTEGER]:
+            elif token in [112, 117, 158]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1627
+                self.state = 1614
                 self.numeric_literal()
                 pass
             else:
@@ -12755,7 +12694,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 280, self.RULE_logical_name)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1630
+            self.state = 1617
             self.identifier()
         except RecognitionException as re:
             localctx.exception = re
@@ -12813,17 +12752,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1632
+            self.state = 1619
             self.logical_name()
-            self.state = 1637
+            self.state = 1624
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 1633
+            while _la==139:
+                self.state = 1620
                 self.match(vhdlParser.COMMA)
-                self.state = 1634
+                self.state = 1621
                 self.logical_name()
-                self.state = 1639
+                self.state = 1626
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -12888,9 +12827,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1640
+            self.state = 1627
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.AND) | (1 << vhdlParser.NAND) | (1 << vhdlParser.NOR) | (1 << vhdlParser.OR))) != 0) or _la==vhdlParser.XNOR or _la==vhdlParser.XOR):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2342997706139500672) != 0) or _la==110 or _la==111):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -12966,39 +12905,39 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1643
+            self.state = 1630
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1642
+            if _la==118 or _la==119:
+                self.state = 1629
                 self.label_colon()
 
 
-            self.state = 1646
+            self.state = 1633
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FOR or _la==vhdlParser.WHILE:
-                self.state = 1645
+            if _la==30 or _la==109:
+                self.state = 1632
                 self.iteration_scheme()
 
 
-            self.state = 1648
+            self.state = 1635
             self.match(vhdlParser.LOOP)
-            self.state = 1649
+            self.state = 1636
             self.sequence_of_statements()
-            self.state = 1650
+            self.state = 1637
             self.match(vhdlParser.END)
-            self.state = 1651
+            self.state = 1638
             self.match(vhdlParser.LOOP)
-            self.state = 1653
+            self.state = 1640
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1652
+            if _la==118 or _la==119:
+                self.state = 1639
                 self.identifier()
 
 
-            self.state = 1655
+            self.state = 1642
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -13058,9 +12997,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1657
+            self.state = 1644
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.BUFFER) | (1 << vhdlParser.IN) | (1 << vhdlParser.INOUT) | (1 << vhdlParser.LINKAGE) | (1 << vhdlParser.OUT))) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & -9223335478093086720) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -13120,9 +13059,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1659
+            self.state = 1646
             _la = self._input.LA(1)
-            if not(_la==vhdlParser.MOD or _la==vhdlParser.REM or _la==vhdlParser.MUL or _la==vhdlParser.DIV):
+            if not(_la==49 or _la==75 or _la==146 or _la==147):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -13183,30 +13122,30 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 292, self.RULE_name)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1663
+            self.state = 1650
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
-                self.state = 1661
+            if token in [118, 119]:
+                self.state = 1648
                 self.identifier()
                 pass
-            elif token in [vhdlParser.STRING_LITERAL]:
-                self.state = 1662
+            elif token in [127]:
+                self.state = 1649
                 self.match(vhdlParser.STRING_LITERAL)
                 pass
             else:
                 raise NoViableAltException(self)
 
-            self.state = 1668
+            self.state = 1655
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,169,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,167,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1665
+                    self.state = 1652
                     self.name_part() 
-                self.state = 1670
+                self.state = 1657
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,169,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,167,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -13232,10 +13171,6 @@ class vhdlParser ( Parser ):
             return self.getTypedRuleContext(vhdlParser.Function_call_or_indexed_name_partContext,0)
 
 
-        def slice_name_part(self):
-            return self.getTypedRuleContext(vhdlParser.Slice_name_partContext,0)
-
-
         def attribute_name_part(self):
             return self.getTypedRuleContext(vhdlParser.Attribute_name_partContext,0)
 
@@ -13265,33 +13200,26 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Name_partContext(self, self._ctx, self.state)
         self.enterRule(localctx, 294, self.RULE_name_part)
         try:
-            self.state = 1675
+            self.state = 1661
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,170,self._ctx)
-            if la_ == 1:
+            token = self._input.LA(1)
+            if token in [154]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1671
+                self.state = 1658
                 self.selected_name_part()
                 pass
-
-            elif la_ == 2:
+            elif token in [141]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1672
+                self.state = 1659
                 self.function_call_or_indexed_name_part()
                 pass
-
-            elif la_ == 3:
+            elif token in [143, 162]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1673
-                self.slice_name_part()
-                pass
-
-            elif la_ == 4:
-                self.enterOuterAlt(localctx, 4)
-                self.state = 1674
+                self.state = 1660
                 self.attribute_name_part()
                 pass
-
+            else:
+                raise NoViableAltException(self)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -13353,17 +13281,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1677
+            self.state = 1663
             self.identifier()
-            self.state = 1682
+            self.state = 1668
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.DOT:
-                self.state = 1678
+            while _la==154:
+                self.state = 1664
                 self.match(vhdlParser.DOT)
-                self.state = 1679
+                self.state = 1665
                 self.suffix()
-                self.state = 1684
+                self.state = 1670
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -13422,21 +13350,21 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 298, self.RULE_selected_name_part)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1687 
+            self.state = 1673 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 1685
+                    self.state = 1671
                     self.match(vhdlParser.DOT)
-                    self.state = 1686
+                    self.state = 1672
                     self.suffix()
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 1689 
+                self.state = 1675 
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,172,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,170,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -13490,11 +13418,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 300, self.RULE_function_call_or_indexed_name_part)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1691
+            self.state = 1677
             self.match(vhdlParser.LPAREN)
-            self.state = 1692
+            self.state = 1678
             self.actual_parameter_part()
-            self.state = 1693
+            self.state = 1679
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -13548,11 +13476,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 302, self.RULE_slice_name_part)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1695
+            self.state = 1681
             self.match(vhdlParser.LPAREN)
-            self.state = 1696
+            self.state = 1682
             self.discrete_range()
-            self.state = 1697
+            self.state = 1683
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -13618,27 +13546,27 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1700
+            self.state = 1686
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LBRACKET:
-                self.state = 1699
+            if _la==143:
+                self.state = 1685
                 self.signature()
 
 
-            self.state = 1702
+            self.state = 1688
             self.match(vhdlParser.APOSTROPHE)
-            self.state = 1703
+            self.state = 1689
             self.attribute_designator()
-            self.state = 1708
+            self.state = 1694
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,174,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,172,self._ctx)
             if la_ == 1:
-                self.state = 1704
+                self.state = 1690
                 self.match(vhdlParser.LPAREN)
-                self.state = 1705
+                self.state = 1691
                 self.expression()
-                self.state = 1706
+                self.state = 1692
                 self.match(vhdlParser.RPAREN)
 
 
@@ -13701,15 +13629,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 306, self.RULE_nature_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1710
+            self.state = 1696
             self.match(vhdlParser.NATURE)
-            self.state = 1711
+            self.state = 1697
             self.identifier()
-            self.state = 1712
+            self.state = 1698
             self.match(vhdlParser.IS)
-            self.state = 1713
+            self.state = 1699
             self.nature_definition()
-            self.state = 1714
+            self.state = 1700
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -13760,17 +13688,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Nature_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 308, self.RULE_nature_definition)
         try:
-            self.state = 1718
+            self.state = 1704
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL]:
+            if token in [118, 119, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1716
+                self.state = 1702
                 self.scalar_nature_definition()
                 pass
-            elif token in [vhdlParser.ARRAY, vhdlParser.RECORD]:
+            elif token in [9, 76]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1717
+                self.state = 1703
                 self.composite_nature_definition()
                 pass
             else:
@@ -13829,11 +13757,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 310, self.RULE_nature_element_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1720
+            self.state = 1706
             self.identifier_list()
-            self.state = 1721
+            self.state = 1707
             self.match(vhdlParser.COLON)
-            self.state = 1722
+            self.state = 1708
             self.element_subnature_definition()
         except RecognitionException as re:
             localctx.exception = re
@@ -13899,35 +13827,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1725
+            self.state = 1711
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1724
+            if _la==118 or _la==119:
+                self.state = 1710
                 self.label_colon()
 
 
-            self.state = 1727
+            self.state = 1713
             self.match(vhdlParser.NEXT)
-            self.state = 1729
+            self.state = 1715
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1728
+            if _la==118 or _la==119:
+                self.state = 1714
                 self.identifier()
 
 
-            self.state = 1733
+            self.state = 1719
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.WHEN:
-                self.state = 1731
+            if _la==108:
+                self.state = 1717
                 self.match(vhdlParser.WHEN)
-                self.state = 1732
+                self.state = 1718
                 self.condition()
 
 
-            self.state = 1735
+            self.state = 1721
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -13978,18 +13906,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Numeric_literalContext(self, self._ctx, self.state)
         self.enterRule(localctx, 314, self.RULE_numeric_literal)
         try:
-            self.state = 1739
+            self.state = 1725
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,179,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,177,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1737
+                self.state = 1723
                 self.abstract_literal()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1738
+                self.state = 1724
                 self.physical_literal()
                 pass
 
@@ -14059,37 +13987,37 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Object_declarationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 316, self.RULE_object_declaration)
         try:
-            self.state = 1747
+            self.state = 1733
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.CONSTANT]:
+            if token in [21]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1741
+                self.state = 1727
                 self.constant_declaration()
                 pass
-            elif token in [vhdlParser.SIGNAL]:
+            elif token in [86]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1742
+                self.state = 1728
                 self.signal_declaration()
                 pass
-            elif token in [vhdlParser.SHARED, vhdlParser.VARIABLE]:
+            elif token in [85, 105]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1743
+                self.state = 1729
                 self.variable_declaration()
                 pass
-            elif token in [vhdlParser.FILE]:
+            elif token in [29]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1744
+                self.state = 1730
                 self.file_declaration()
                 pass
-            elif token in [vhdlParser.TERMINAL]:
+            elif token in [94]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1745
+                self.state = 1731
                 self.terminal_declaration()
                 pass
-            elif token in [vhdlParser.QUANTITY]:
+            elif token in [71]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1746
+                self.state = 1732
                 self.quantity_declaration()
                 pass
             else:
@@ -14145,19 +14073,19 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1750
+            self.state = 1736
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.GUARDED:
-                self.state = 1749
+            if _la==35:
+                self.state = 1735
                 self.match(vhdlParser.GUARDED)
 
 
-            self.state = 1753
+            self.state = 1739
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if ((((_la - 39)) & ~0x3f) == 0 and ((1 << (_la - 39)) & ((1 << (vhdlParser.INERTIAL - 39)) | (1 << (vhdlParser.REJECT - 39)) | (1 << (vhdlParser.TRANSPORT - 39)))) != 0):
-                self.state = 1752
+            if ((((_la - 39)) & ~0x3f) == 0 and ((1 << (_la - 39)) & 1152921538966585345) != 0):
+                self.state = 1738
                 self.delay_mechanism()
 
 
@@ -14236,37 +14164,37 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1755
+            self.state = 1741
             self.match(vhdlParser.PACKAGE)
-            self.state = 1756
+            self.state = 1742
             self.match(vhdlParser.BODY)
-            self.state = 1757
+            self.state = 1743
             self.identifier()
-            self.state = 1758
+            self.state = 1744
             self.match(vhdlParser.IS)
-            self.state = 1759
+            self.state = 1745
             self.package_body_declarative_part()
-            self.state = 1760
+            self.state = 1746
             self.match(vhdlParser.END)
-            self.state = 1763
+            self.state = 1749
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PACKAGE:
-                self.state = 1761
+            if _la==64:
+                self.state = 1747
                 self.match(vhdlParser.PACKAGE)
-                self.state = 1762
+                self.state = 1748
                 self.match(vhdlParser.BODY)
 
 
-            self.state = 1766
+            self.state = 1752
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1765
+            if _la==118 or _la==119:
+                self.state = 1751
                 self.identifier()
 
 
-            self.state = 1768
+            self.state = 1754
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -14353,72 +14281,72 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Package_body_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 322, self.RULE_package_body_declarative_item)
         try:
-            self.state = 1781
+            self.state = 1767
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,185,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,183,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1770
+                self.state = 1756
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1771
+                self.state = 1757
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1772
+                self.state = 1758
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1773
+                self.state = 1759
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1774
+                self.state = 1760
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1775
+                self.state = 1761
                 self.variable_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1776
+                self.state = 1762
                 self.file_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1777
+                self.state = 1763
                 self.alias_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1778
+                self.state = 1764
                 self.use_clause()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1779
+                self.state = 1765
                 self.group_template_declaration()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1780
+                self.state = 1766
                 self.group_declaration()
                 pass
 
@@ -14473,13 +14401,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1786
+            self.state = 1772
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 1783
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 157305274400) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210487083013) != 0):
+                self.state = 1769
                 self.package_body_declarative_item()
-                self.state = 1788
+                self.state = 1774
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -14552,33 +14480,33 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1789
+            self.state = 1775
             self.match(vhdlParser.PACKAGE)
-            self.state = 1790
+            self.state = 1776
             self.identifier()
-            self.state = 1791
+            self.state = 1777
             self.match(vhdlParser.IS)
-            self.state = 1792
+            self.state = 1778
             self.package_declarative_part()
-            self.state = 1793
+            self.state = 1779
             self.match(vhdlParser.END)
-            self.state = 1795
+            self.state = 1781
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PACKAGE:
-                self.state = 1794
+            if _la==64:
+                self.state = 1780
                 self.match(vhdlParser.PACKAGE)
 
 
-            self.state = 1798
+            self.state = 1784
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1797
+            if _la==118 or _la==119:
+                self.state = 1783
                 self.identifier()
 
 
-            self.state = 1800
+            self.state = 1786
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -14697,120 +14625,120 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Package_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 328, self.RULE_package_declarative_item)
         try:
-            self.state = 1821
+            self.state = 1807
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,189,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,187,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1802
+                self.state = 1788
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1803
+                self.state = 1789
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1804
+                self.state = 1790
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1805
+                self.state = 1791
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1806
+                self.state = 1792
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1807
+                self.state = 1793
                 self.signal_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1808
+                self.state = 1794
                 self.variable_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1809
+                self.state = 1795
                 self.file_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1810
+                self.state = 1796
                 self.alias_declaration()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1811
+                self.state = 1797
                 self.component_declaration()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1812
+                self.state = 1798
                 self.attribute_declaration()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 1813
+                self.state = 1799
                 self.attribute_specification()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 1814
+                self.state = 1800
                 self.disconnection_specification()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 1815
+                self.state = 1801
                 self.use_clause()
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 1816
+                self.state = 1802
                 self.group_template_declaration()
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 1817
+                self.state = 1803
                 self.group_declaration()
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 1818
+                self.state = 1804
                 self.nature_declaration()
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 1819
+                self.state = 1805
                 self.subnature_declaration()
                 pass
 
             elif la_ == 19:
                 self.enterOuterAlt(localctx, 19)
-                self.state = 1820
+                self.state = 1806
                 self.terminal_declaration()
                 pass
 
@@ -14865,13 +14793,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1826
+            self.state = 1812
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.COMPONENT) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.DISCONNECT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE) | (1 << vhdlParser.NATURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SIGNAL - 68)) | (1 << (vhdlParser.SUBNATURE - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TERMINAL - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 1823
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 2251957123680288) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210571231237) != 0):
+                self.state = 1809
                 self.package_declarative_item()
-                self.state = 1828
+                self.state = 1814
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -14928,11 +14856,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 332, self.RULE_parameter_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1829
+            self.state = 1815
             self.identifier()
-            self.state = 1830
+            self.state = 1816
             self.match(vhdlParser.IN)
-            self.state = 1831
+            self.state = 1817
             self.discrete_range()
         except RecognitionException as re:
             localctx.exception = re
@@ -14984,10 +14912,10 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 334, self.RULE_physical_literal)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1833
+            self.state = 1819
             self.abstract_literal()
 
-            self.state = 1834
+            self.state = 1820
             self.identifier()
         except RecognitionException as re:
             localctx.exception = re
@@ -15060,31 +14988,31 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1836
+            self.state = 1822
             self.range_constraint()
-            self.state = 1837
+            self.state = 1823
             self.match(vhdlParser.UNITS)
-            self.state = 1838
+            self.state = 1824
             self.base_unit_declaration()
-            self.state = 1842
+            self.state = 1828
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1839
+            while _la==118 or _la==119:
+                self.state = 1825
                 self.secondary_unit_declaration()
-                self.state = 1844
+                self.state = 1830
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1845
+            self.state = 1831
             self.match(vhdlParser.END)
-            self.state = 1846
+            self.state = 1832
             self.match(vhdlParser.UNITS)
-            self.state = 1848
+            self.state = 1834
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1847
+            if _la==118 or _la==119:
+                self.state = 1833
                 self.identifier()
 
 
@@ -15146,15 +15074,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 338, self.RULE_port_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1850
+            self.state = 1836
             self.match(vhdlParser.PORT)
-            self.state = 1851
+            self.state = 1837
             self.match(vhdlParser.LPAREN)
-            self.state = 1852
+            self.state = 1838
             self.port_list()
-            self.state = 1853
+            self.state = 1839
             self.match(vhdlParser.RPAREN)
-            self.state = 1854
+            self.state = 1840
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -15202,7 +15130,7 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 340, self.RULE_port_list)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1856
+            self.state = 1842
             self.interface_port_list()
         except RecognitionException as re:
             localctx.exception = re
@@ -15262,15 +15190,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 342, self.RULE_port_map_aspect)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1858
+            self.state = 1844
             self.match(vhdlParser.PORT)
-            self.state = 1859
+            self.state = 1845
             self.match(vhdlParser.MAP)
-            self.state = 1860
+            self.state = 1846
             self.match(vhdlParser.LPAREN)
-            self.state = 1861
+            self.state = 1847
             self.association_list()
-            self.state = 1862
+            self.state = 1848
             self.match(vhdlParser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -15343,46 +15271,46 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.PrimaryContext(self, self._ctx, self.state)
         self.enterRule(localctx, 344, self.RULE_primary)
         try:
-            self.state = 1873
+            self.state = 1859
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,193,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,191,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1864
+                self.state = 1850
                 self.literal()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1865
+                self.state = 1851
                 self.qualified_expression()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1866
+                self.state = 1852
                 self.match(vhdlParser.LPAREN)
-                self.state = 1867
+                self.state = 1853
                 self.expression()
-                self.state = 1868
+                self.state = 1854
                 self.match(vhdlParser.RPAREN)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1870
+                self.state = 1856
                 self.allocator()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1871
+                self.state = 1857
                 self.aggregate()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1872
+                self.state = 1858
                 self.name()
                 pass
 
@@ -15440,22 +15368,22 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Primary_unitContext(self, self._ctx, self.state)
         self.enterRule(localctx, 346, self.RULE_primary_unit)
         try:
-            self.state = 1878
+            self.state = 1864
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ENTITY]:
+            if token in [25]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1875
+                self.state = 1861
                 self.entity_declaration()
                 pass
-            elif token in [vhdlParser.CONFIGURATION]:
+            elif token in [20]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1876
+                self.state = 1862
                 self.configuration_declaration()
                 pass
-            elif token in [vhdlParser.PACKAGE]:
+            elif token in [64]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1877
+                self.state = 1863
                 self.package_declaration()
                 pass
             else:
@@ -15550,78 +15478,78 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Procedural_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 348, self.RULE_procedural_declarative_item)
         try:
-            self.state = 1892
+            self.state = 1878
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,195,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,193,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1880
+                self.state = 1866
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1881
+                self.state = 1867
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1882
+                self.state = 1868
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1883
+                self.state = 1869
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1884
+                self.state = 1870
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1885
+                self.state = 1871
                 self.variable_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1886
+                self.state = 1872
                 self.alias_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1887
+                self.state = 1873
                 self.attribute_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1888
+                self.state = 1874
                 self.attribute_specification()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1889
+                self.state = 1875
                 self.use_clause()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1890
+                self.state = 1876
                 self.group_template_declaration()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 1891
+                self.state = 1877
                 self.group_declaration()
                 pass
 
@@ -15676,13 +15604,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1897
+            self.state = 1883
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 1894
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 156768405536) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210487083013) != 0):
+                self.state = 1880
                 self.procedural_declarative_item()
-                self.state = 1899
+                self.state = 1885
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -15736,13 +15664,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1903
+            self.state = 1889
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.EXIT) | (1 << vhdlParser.FOR) | (1 << vhdlParser.IF) | (1 << vhdlParser.LOOP) | (1 << vhdlParser.NEXT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & ((1 << (vhdlParser.REPORT - 79)) | (1 << (vhdlParser.RETURN - 79)) | (1 << (vhdlParser.WAIT - 79)) | (1 << (vhdlParser.WHILE - 79)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 79)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 79)) | (1 << (vhdlParser.STRING_LITERAL - 79)) | (1 << (vhdlParser.LPAREN - 79)))) != 0):
-                self.state = 1900
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 153263194880902144) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & 4611969143879499779) != 0):
+                self.state = 1886
                 self.sequential_statement()
-                self.state = 1905
+                self.state = 1891
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -15803,17 +15731,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1906
+            self.state = 1892
             self.selected_name()
-            self.state = 1911
+            self.state = 1897
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LPAREN:
-                self.state = 1907
+            if _la==141:
+                self.state = 1893
                 self.match(vhdlParser.LPAREN)
-                self.state = 1908
+                self.state = 1894
                 self.actual_parameter_part()
-                self.state = 1909
+                self.state = 1895
                 self.match(vhdlParser.RPAREN)
 
 
@@ -15870,17 +15798,17 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 356, self.RULE_procedure_call_statement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1914
+            self.state = 1900
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,199,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,197,self._ctx)
             if la_ == 1:
-                self.state = 1913
+                self.state = 1899
                 self.label_colon()
 
 
-            self.state = 1916
+            self.state = 1902
             self.procedure_call()
-            self.state = 1917
+            self.state = 1903
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -15975,84 +15903,84 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Process_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 358, self.RULE_process_declarative_item)
         try:
-            self.state = 1932
+            self.state = 1918
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,200,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,198,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1919
+                self.state = 1905
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1920
+                self.state = 1906
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1921
+                self.state = 1907
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1922
+                self.state = 1908
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1923
+                self.state = 1909
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1924
+                self.state = 1910
                 self.variable_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1925
+                self.state = 1911
                 self.file_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1926
+                self.state = 1912
                 self.alias_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1927
+                self.state = 1913
                 self.attribute_declaration()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1928
+                self.state = 1914
                 self.attribute_specification()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1929
+                self.state = 1915
                 self.use_clause()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 1930
+                self.state = 1916
                 self.group_template_declaration()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 1931
+                self.state = 1917
                 self.group_declaration()
                 pass
 
@@ -16107,13 +16035,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1937
+            self.state = 1923
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 1934
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 157305276448) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210487083013) != 0):
+                self.state = 1920
                 self.process_declarative_item()
-                self.state = 1939
+                self.state = 1925
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -16210,71 +16138,71 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1941
+            self.state = 1927
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1940
+            if _la==118 or _la==119:
+                self.state = 1926
                 self.label_colon()
 
 
-            self.state = 1944
+            self.state = 1930
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.POSTPONED:
-                self.state = 1943
+            if _la==66:
+                self.state = 1929
                 self.match(vhdlParser.POSTPONED)
 
 
-            self.state = 1946
+            self.state = 1932
             self.match(vhdlParser.PROCESS)
-            self.state = 1951
+            self.state = 1937
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LPAREN:
-                self.state = 1947
+            if _la==141:
+                self.state = 1933
                 self.match(vhdlParser.LPAREN)
-                self.state = 1948
+                self.state = 1934
                 self.sensitivity_list()
-                self.state = 1949
+                self.state = 1935
                 self.match(vhdlParser.RPAREN)
 
 
-            self.state = 1954
+            self.state = 1940
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IS:
-                self.state = 1953
+            if _la==41:
+                self.state = 1939
                 self.match(vhdlParser.IS)
 
 
-            self.state = 1956
+            self.state = 1942
             self.process_declarative_part()
-            self.state = 1957
+            self.state = 1943
             self.match(vhdlParser.BEGIN)
-            self.state = 1958
+            self.state = 1944
             self.process_statement_part()
-            self.state = 1959
+            self.state = 1945
             self.match(vhdlParser.END)
-            self.state = 1961
+            self.state = 1947
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.POSTPONED:
-                self.state = 1960
+            if _la==66:
+                self.state = 1946
                 self.match(vhdlParser.POSTPONED)
 
 
-            self.state = 1963
+            self.state = 1949
             self.match(vhdlParser.PROCESS)
-            self.state = 1965
+            self.state = 1951
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 1964
+            if _la==118 or _la==119:
+                self.state = 1950
                 self.identifier()
 
 
-            self.state = 1967
+            self.state = 1953
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -16326,13 +16254,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1972
+            self.state = 1958
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.EXIT) | (1 << vhdlParser.FOR) | (1 << vhdlParser.IF) | (1 << vhdlParser.LOOP) | (1 << vhdlParser.NEXT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & ((1 << (vhdlParser.REPORT - 79)) | (1 << (vhdlParser.RETURN - 79)) | (1 << (vhdlParser.WAIT - 79)) | (1 << (vhdlParser.WHILE - 79)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 79)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 79)) | (1 << (vhdlParser.STRING_LITERAL - 79)) | (1 << (vhdlParser.LPAREN - 79)))) != 0):
-                self.state = 1969
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 153263194880902144) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & 4611969143879499779) != 0):
+                self.state = 1955
                 self.sequential_statement()
-                self.state = 1974
+                self.state = 1960
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -16399,24 +16327,24 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 366, self.RULE_qualified_expression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1975
+            self.state = 1961
             self.subtype_indication()
-            self.state = 1976
+            self.state = 1962
             self.match(vhdlParser.APOSTROPHE)
-            self.state = 1982
+            self.state = 1968
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,209,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,207,self._ctx)
             if la_ == 1:
-                self.state = 1977
+                self.state = 1963
                 self.aggregate()
                 pass
 
             elif la_ == 2:
-                self.state = 1978
+                self.state = 1964
                 self.match(vhdlParser.LPAREN)
-                self.state = 1979
+                self.state = 1965
                 self.expression()
-                self.state = 1980
+                self.state = 1966
                 self.match(vhdlParser.RPAREN)
                 pass
 
@@ -16474,24 +16402,24 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Quantity_declarationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 368, self.RULE_quantity_declaration)
         try:
-            self.state = 1987
+            self.state = 1973
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,210,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,208,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1984
+                self.state = 1970
                 self.free_quantity_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1985
+                self.state = 1971
                 self.branch_quantity_declaration()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1986
+                self.state = 1972
                 self.source_quantity_declaration()
                 pass
 
@@ -16557,34 +16485,34 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 370, self.RULE_quantity_list)
         self._la = 0 # Token type
         try:
-            self.state = 1999
+            self.state = 1985
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL]:
+            if token in [118, 119, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1989
+                self.state = 1975
                 self.name()
-                self.state = 1994
+                self.state = 1980
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==vhdlParser.COMMA:
-                    self.state = 1990
+                while _la==139:
+                    self.state = 1976
                     self.match(vhdlParser.COMMA)
-                    self.state = 1991
+                    self.state = 1977
                     self.name()
-                    self.state = 1996
+                    self.state = 1982
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
-            elif token in [vhdlParser.OTHERS]:
+            elif token in [62]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1997
+                self.state = 1983
                 self.match(vhdlParser.OTHERS)
                 pass
-            elif token in [vhdlParser.ALL]:
+            elif token in [6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1998
+                self.state = 1984
                 self.match(vhdlParser.ALL)
                 pass
             else:
@@ -16643,11 +16571,11 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 372, self.RULE_quantity_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2001
+            self.state = 1987
             self.quantity_list()
-            self.state = 2002
+            self.state = 1988
             self.match(vhdlParser.COLON)
-            self.state = 2003
+            self.state = 1989
             self.name()
         except RecognitionException as re:
             localctx.exception = re
@@ -16698,18 +16626,18 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Range_declContext(self, self._ctx, self.state)
         self.enterRule(localctx, 374, self.RULE_range_decl)
         try:
-            self.state = 2007
+            self.state = 1993
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,213,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,211,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2005
+                self.state = 1991
                 self.explicit_range()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2006
+                self.state = 1992
                 self.name()
                 pass
 
@@ -16767,15 +16695,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 376, self.RULE_explicit_range)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2009
+            self.state = 1995
             self.simple_expression()
-            self.state = 2013
+            self.state = 1999
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,214,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,212,self._ctx)
             if la_ == 1:
-                self.state = 2010
+                self.state = 1996
                 self.direction()
-                self.state = 2011
+                self.state = 1997
                 self.simple_expression()
 
 
@@ -16828,9 +16756,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 378, self.RULE_range_constraint)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2015
+            self.state = 2001
             self.match(vhdlParser.RANGE)
-            self.state = 2016
+            self.state = 2002
             self.range_decl()
         except RecognitionException as re:
             localctx.exception = re
@@ -16895,29 +16823,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2018
+            self.state = 2004
             self.match(vhdlParser.RECORD)
-            self.state = 2020 
+            self.state = 2006 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 2019
+                self.state = 2005
                 self.nature_element_declaration()
-                self.state = 2022 
+                self.state = 2008 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER):
+                if not (_la==118 or _la==119):
                     break
 
-            self.state = 2024
+            self.state = 2010
             self.match(vhdlParser.END)
-            self.state = 2025
+            self.state = 2011
             self.match(vhdlParser.RECORD)
-            self.state = 2027
+            self.state = 2013
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2026
+            if _la==118 or _la==119:
+                self.state = 2012
                 self.identifier()
 
 
@@ -16984,29 +16912,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2029
+            self.state = 2015
             self.match(vhdlParser.RECORD)
-            self.state = 2031 
+            self.state = 2017 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 2030
+                self.state = 2016
                 self.element_declaration()
-                self.state = 2033 
+                self.state = 2019 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER):
+                if not (_la==118 or _la==119):
                     break
 
-            self.state = 2035
+            self.state = 2021
             self.match(vhdlParser.END)
-            self.state = 2036
+            self.state = 2022
             self.match(vhdlParser.RECORD)
-            self.state = 2038
+            self.state = 2024
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2037
+            if _la==118 or _la==119:
+                self.state = 2023
                 self.identifier()
 
 
@@ -17063,15 +16991,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 384, self.RULE_relation)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2040
+            self.state = 2026
             self.shift_expression()
-            self.state = 2044
+            self.state = 2030
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,219,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,217,self._ctx)
             if la_ == 1:
-                self.state = 2041
+                self.state = 2027
                 self.relational_operator()
-                self.state = 2042
+                self.state = 2028
                 self.shift_expression()
 
 
@@ -17136,9 +17064,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2046
+            self.state = 2032
             _la = self._input.LA(1)
-            if not(((((_la - 131)) & ~0x3f) == 0 and ((1 << (_la - 131)) & ((1 << (vhdlParser.LE - 131)) | (1 << (vhdlParser.GE - 131)) | (1 << (vhdlParser.NEQ - 131)) | (1 << (vhdlParser.LOWERTHAN - 131)) | (1 << (vhdlParser.GREATERTHAN - 131)) | (1 << (vhdlParser.EQ - 131)))) != 0)):
+            if not(((((_la - 131)) & ~0x3f) == 0 and ((1 << (_la - 131)) & 3670027) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -17206,29 +17134,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2049
+            self.state = 2035
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2048
+            if _la==118 or _la==119:
+                self.state = 2034
                 self.label_colon()
 
 
-            self.state = 2051
+            self.state = 2037
             self.match(vhdlParser.REPORT)
-            self.state = 2052
+            self.state = 2038
             self.expression()
-            self.state = 2055
+            self.state = 2041
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.SEVERITY:
-                self.state = 2053
+            if _la==84:
+                self.state = 2039
                 self.match(vhdlParser.SEVERITY)
-                self.state = 2054
+                self.state = 2040
                 self.expression()
 
 
-            self.state = 2057
+            self.state = 2043
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -17287,25 +17215,25 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2060
+            self.state = 2046
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2059
+            if _la==118 or _la==119:
+                self.state = 2045
                 self.label_colon()
 
 
-            self.state = 2062
+            self.state = 2048
             self.match(vhdlParser.RETURN)
-            self.state = 2064
+            self.state = 2050
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ABS) | (1 << vhdlParser.NEW) | (1 << vhdlParser.NOT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 112)) & ~0x3f) == 0 and ((1 << (_la - 112)) & ((1 << (vhdlParser.BASE_LITERAL - 112)) | (1 << (vhdlParser.BIT_STRING_LITERAL - 112)) | (1 << (vhdlParser.REAL_LITERAL - 112)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 112)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 112)) | (1 << (vhdlParser.CHARACTER_LITERAL - 112)) | (1 << (vhdlParser.STRING_LITERAL - 112)) | (1 << (vhdlParser.LPAREN - 112)) | (1 << (vhdlParser.PLUS - 112)) | (1 << (vhdlParser.MINUS - 112)) | (1 << (vhdlParser.INTEGER - 112)))) != 0):
-                self.state = 2063
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 220676381741154306) != 0) or ((((_la - 112)) & ~0x3f) == 0 and ((1 << (_la - 112)) & 70575439528163) != 0):
+                self.state = 2049
                 self.expression()
 
 
-            self.state = 2066
+            self.state = 2052
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -17365,17 +17293,17 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 392, self.RULE_scalar_nature_definition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2068
+            self.state = 2054
             self.name()
-            self.state = 2069
+            self.state = 2055
             self.match(vhdlParser.ACROSS)
-            self.state = 2070
+            self.state = 2056
             self.name()
-            self.state = 2071
+            self.state = 2057
             self.match(vhdlParser.THROUGH)
-            self.state = 2072
+            self.state = 2058
             self.name()
-            self.state = 2073
+            self.state = 2059
             self.match(vhdlParser.REFERENCE)
         except RecognitionException as re:
             localctx.exception = re
@@ -17430,24 +17358,24 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Scalar_type_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 394, self.RULE_scalar_type_definition)
         try:
-            self.state = 2078
+            self.state = 2064
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,224,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,222,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2075
+                self.state = 2061
                 self.physical_type_definition()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2076
+                self.state = 2062
                 self.enumeration_type_definition()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2077
+                self.state = 2063
                 self.range_constraint()
                 pass
 
@@ -17501,17 +17429,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Secondary_unitContext(self, self._ctx, self.state)
         self.enterRule(localctx, 396, self.RULE_secondary_unit)
         try:
-            self.state = 2082
+            self.state = 2068
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ARCHITECTURE]:
+            if token in [8]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2080
+                self.state = 2066
                 self.architecture_body()
                 pass
-            elif token in [vhdlParser.PACKAGE]:
+            elif token in [64]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2081
+                self.state = 2067
                 self.package_body()
                 pass
             else:
@@ -17573,13 +17501,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 398, self.RULE_secondary_unit_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2084
+            self.state = 2070
             self.identifier()
-            self.state = 2085
+            self.state = 2071
             self.match(vhdlParser.EQ)
-            self.state = 2086
+            self.state = 2072
             self.physical_literal()
-            self.state = 2087
+            self.state = 2073
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -17651,21 +17579,21 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 400, self.RULE_selected_signal_assignment)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2089
+            self.state = 2075
             self.match(vhdlParser.WITH)
-            self.state = 2090
+            self.state = 2076
             self.expression()
-            self.state = 2091
+            self.state = 2077
             self.match(vhdlParser.SELECT)
-            self.state = 2092
+            self.state = 2078
             self.target()
-            self.state = 2093
+            self.state = 2079
             self.match(vhdlParser.LE)
-            self.state = 2094
+            self.state = 2080
             self.opts()
-            self.state = 2095
+            self.state = 2081
             self.selected_waveforms()
-            self.state = 2096
+            self.state = 2082
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -17736,25 +17664,25 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2098
+            self.state = 2084
             self.waveform()
-            self.state = 2099
+            self.state = 2085
             self.match(vhdlParser.WHEN)
-            self.state = 2100
+            self.state = 2086
             self.choices()
-            self.state = 2108
+            self.state = 2094
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 2101
+            while _la==139:
+                self.state = 2087
                 self.match(vhdlParser.COMMA)
-                self.state = 2102
+                self.state = 2088
                 self.waveform()
-                self.state = 2103
+                self.state = 2089
                 self.match(vhdlParser.WHEN)
-                self.state = 2104
+                self.state = 2090
                 self.choices()
-                self.state = 2110
+                self.state = 2096
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -17807,9 +17735,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 404, self.RULE_sensitivity_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2111
+            self.state = 2097
             self.match(vhdlParser.ON)
-            self.state = 2112
+            self.state = 2098
             self.sensitivity_list()
         except RecognitionException as re:
             localctx.exception = re
@@ -17867,17 +17795,17 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2114
+            self.state = 2100
             self.name()
-            self.state = 2119
+            self.state = 2105
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 2115
+            while _la==139:
+                self.state = 2101
                 self.match(vhdlParser.COMMA)
-                self.state = 2116
+                self.state = 2102
                 self.name()
-                self.state = 2121
+                self.state = 2107
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -17931,13 +17859,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2125
+            self.state = 2111
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.EXIT) | (1 << vhdlParser.FOR) | (1 << vhdlParser.IF) | (1 << vhdlParser.LOOP) | (1 << vhdlParser.NEXT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & ((1 << (vhdlParser.REPORT - 79)) | (1 << (vhdlParser.RETURN - 79)) | (1 << (vhdlParser.WAIT - 79)) | (1 << (vhdlParser.WHILE - 79)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 79)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 79)) | (1 << (vhdlParser.STRING_LITERAL - 79)) | (1 << (vhdlParser.LPAREN - 79)))) != 0):
-                self.state = 2122
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 153263194880902144) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & 4611969143879499779) != 0):
+                self.state = 2108
                 self.sequential_statement()
-                self.state = 2127
+                self.state = 2113
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -18045,100 +17973,100 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 410, self.RULE_sequential_statement)
         self._la = 0 # Token type
         try:
-            self.state = 2146
+            self.state = 2132
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,230,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,228,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2128
+                self.state = 2114
                 self.wait_statement()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2129
+                self.state = 2115
                 self.assertion_statement()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2130
+                self.state = 2116
                 self.report_statement()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2131
+                self.state = 2117
                 self.signal_assignment_statement()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2132
+                self.state = 2118
                 self.variable_assignment_statement()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2133
+                self.state = 2119
                 self.if_statement()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 2134
+                self.state = 2120
                 self.case_statement()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 2135
+                self.state = 2121
                 self.loop_statement()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 2136
+                self.state = 2122
                 self.next_statement()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 2137
+                self.state = 2123
                 self.exit_statement()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 2138
+                self.state = 2124
                 self.return_statement()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 2140
+                self.state = 2126
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                    self.state = 2139
+                if _la==118 or _la==119:
+                    self.state = 2125
                     self.label_colon()
 
 
-                self.state = 2142
+                self.state = 2128
                 self.match(vhdlParser.NULL_)
-                self.state = 2143
+                self.state = 2129
                 self.match(vhdlParser.SEMI)
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 2144
+                self.state = 2130
                 self.break_statement()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 2145
+                self.state = 2131
                 self.procedure_call_statement()
                 pass
 
@@ -18196,15 +18124,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 412, self.RULE_shift_expression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2148
+            self.state = 2134
             self.simple_expression()
-            self.state = 2152
+            self.state = 2138
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,231,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,229,self._ctx)
             if la_ == 1:
-                self.state = 2149
+                self.state = 2135
                 self.shift_operator()
-                self.state = 2150
+                self.state = 2136
                 self.simple_expression()
 
 
@@ -18269,9 +18197,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2154
+            self.state = 2140
             _la = self._input.LA(1)
-            if not(((((_la - 81)) & ~0x3f) == 0 and ((1 << (_la - 81)) & ((1 << (vhdlParser.ROL - 81)) | (1 << (vhdlParser.ROR - 81)) | (1 << (vhdlParser.SLA - 81)) | (1 << (vhdlParser.SLL - 81)) | (1 << (vhdlParser.SRA - 81)) | (1 << (vhdlParser.SRL - 81)))) != 0)):
+            if not(((((_la - 81)) & ~0x3f) == 0 and ((1 << (_la - 81)) & 1731) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -18341,29 +18269,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2157
+            self.state = 2143
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,232,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,230,self._ctx)
             if la_ == 1:
-                self.state = 2156
+                self.state = 2142
                 self.label_colon()
 
 
-            self.state = 2159
+            self.state = 2145
             self.target()
-            self.state = 2160
+            self.state = 2146
             self.match(vhdlParser.LE)
-            self.state = 2162
+            self.state = 2148
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if ((((_la - 39)) & ~0x3f) == 0 and ((1 << (_la - 39)) & ((1 << (vhdlParser.INERTIAL - 39)) | (1 << (vhdlParser.REJECT - 39)) | (1 << (vhdlParser.TRANSPORT - 39)))) != 0):
-                self.state = 2161
+            if ((((_la - 39)) & ~0x3f) == 0 and ((1 << (_la - 39)) & 1152921538966585345) != 0):
+                self.state = 2147
                 self.delay_mechanism()
 
 
-            self.state = 2164
+            self.state = 2150
             self.waveform()
-            self.state = 2165
+            self.state = 2151
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -18436,33 +18364,33 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2167
+            self.state = 2153
             self.match(vhdlParser.SIGNAL)
-            self.state = 2168
+            self.state = 2154
             self.identifier_list()
-            self.state = 2169
+            self.state = 2155
             self.match(vhdlParser.COLON)
-            self.state = 2170
+            self.state = 2156
             self.subtype_indication()
-            self.state = 2172
+            self.state = 2158
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BUS or _la==vhdlParser.REGISTER:
-                self.state = 2171
+            if _la==17 or _la==78:
+                self.state = 2157
                 self.signal_kind()
 
 
-            self.state = 2176
+            self.state = 2162
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 2174
+            if _la==135:
+                self.state = 2160
                 self.match(vhdlParser.VARASGN)
-                self.state = 2175
+                self.state = 2161
                 self.expression()
 
 
-            self.state = 2178
+            self.state = 2164
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -18513,9 +18441,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2180
+            self.state = 2166
             _la = self._input.LA(1)
-            if not(_la==vhdlParser.BUS or _la==vhdlParser.REGISTER):
+            if not(_la==17 or _la==78):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -18581,34 +18509,34 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 422, self.RULE_signal_list)
         self._la = 0 # Token type
         try:
-            self.state = 2192
+            self.state = 2178
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL]:
+            if token in [118, 119, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2182
+                self.state = 2168
                 self.name()
-                self.state = 2187
+                self.state = 2173
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==vhdlParser.COMMA:
-                    self.state = 2183
+                while _la==139:
+                    self.state = 2169
                     self.match(vhdlParser.COMMA)
-                    self.state = 2184
+                    self.state = 2170
                     self.name()
-                    self.state = 2189
+                    self.state = 2175
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
-            elif token in [vhdlParser.OTHERS]:
+            elif token in [62]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2190
+                self.state = 2176
                 self.match(vhdlParser.OTHERS)
                 pass
-            elif token in [vhdlParser.ALL]:
+            elif token in [6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2191
+                self.state = 2177
                 self.match(vhdlParser.ALL)
                 pass
             else:
@@ -18679,39 +18607,39 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2194
+            self.state = 2180
             self.match(vhdlParser.LBRACKET)
-            self.state = 2203
+            self.state = 2189
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & ((1 << (vhdlParser.BASIC_IDENTIFIER - 118)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 118)) | (1 << (vhdlParser.STRING_LITERAL - 118)))) != 0):
-                self.state = 2195
+            if ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & 515) != 0):
+                self.state = 2181
                 self.name()
-                self.state = 2200
+                self.state = 2186
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==vhdlParser.COMMA:
-                    self.state = 2196
+                while _la==139:
+                    self.state = 2182
                     self.match(vhdlParser.COMMA)
-                    self.state = 2197
+                    self.state = 2183
                     self.name()
-                    self.state = 2202
+                    self.state = 2188
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2207
+            self.state = 2193
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.RETURN:
-                self.state = 2205
+            if _la==80:
+                self.state = 2191
                 self.match(vhdlParser.RETURN)
-                self.state = 2206
+                self.state = 2192
                 self.name()
 
 
-            self.state = 2209
+            self.state = 2195
             self.match(vhdlParser.RBRACKET)
         except RecognitionException as re:
             localctx.exception = re
@@ -18776,33 +18704,33 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2212
+            self.state = 2198
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.PLUS or _la==vhdlParser.MINUS:
-                self.state = 2211
+            if _la==148 or _la==149:
+                self.state = 2197
                 _la = self._input.LA(1)
-                if not(_la==vhdlParser.PLUS or _la==vhdlParser.MINUS):
+                if not(_la==148 or _la==149):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
 
 
-            self.state = 2214
+            self.state = 2200
             self.term()
-            self.state = 2220
+            self.state = 2206
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,242,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,240,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2215
+                    self.state = 2201
                     self.adding_operator()
-                    self.state = 2216
+                    self.state = 2202
                     self.term() 
-                self.state = 2222
+                self.state = 2208
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,242,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,240,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -18868,29 +18796,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2224
+            self.state = 2210
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,243,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,241,self._ctx)
             if la_ == 1:
-                self.state = 2223
+                self.state = 2209
                 self.label_colon()
 
 
-            self.state = 2226
+            self.state = 2212
             self.simple_expression()
-            self.state = 2227
+            self.state = 2213
             self.match(vhdlParser.ASSIGN)
-            self.state = 2228
+            self.state = 2214
             self.simple_expression()
-            self.state = 2230
+            self.state = 2216
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.TOLERANCE:
-                self.state = 2229
+            if _la==98:
+                self.state = 2215
                 self.tolerance_aspect()
 
 
-            self.state = 2232
+            self.state = 2218
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -18948,13 +18876,13 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 430, self.RULE_simultaneous_alternative)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2234
+            self.state = 2220
             self.match(vhdlParser.WHEN)
-            self.state = 2235
+            self.state = 2221
             self.choices()
-            self.state = 2236
+            self.state = 2222
             self.match(vhdlParser.ARROW)
-            self.state = 2237
+            self.state = 2223
             self.simultaneous_statement_part()
         except RecognitionException as re:
             localctx.exception = re
@@ -19033,45 +18961,45 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2240
+            self.state = 2226
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2239
+            if _la==118 or _la==119:
+                self.state = 2225
                 self.label_colon()
 
 
-            self.state = 2242
+            self.state = 2228
             self.match(vhdlParser.CASE)
-            self.state = 2243
+            self.state = 2229
             self.expression()
-            self.state = 2244
+            self.state = 2230
             self.match(vhdlParser.USE)
-            self.state = 2246 
+            self.state = 2232 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 2245
+                self.state = 2231
                 self.simultaneous_alternative()
-                self.state = 2248 
+                self.state = 2234 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==vhdlParser.WHEN):
+                if not (_la==108):
                     break
 
-            self.state = 2250
+            self.state = 2236
             self.match(vhdlParser.END)
-            self.state = 2251
+            self.state = 2237
             self.match(vhdlParser.CASE)
-            self.state = 2253
+            self.state = 2239
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2252
+            if _la==118 or _la==119:
+                self.state = 2238
                 self.identifier()
 
 
-            self.state = 2255
+            self.state = 2241
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -19162,61 +19090,61 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2258
+            self.state = 2244
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2257
+            if _la==118 or _la==119:
+                self.state = 2243
                 self.label_colon()
 
 
-            self.state = 2260
+            self.state = 2246
             self.match(vhdlParser.IF)
-            self.state = 2261
+            self.state = 2247
             self.condition()
-            self.state = 2262
+            self.state = 2248
             self.match(vhdlParser.USE)
-            self.state = 2263
+            self.state = 2249
             self.simultaneous_statement_part()
-            self.state = 2271
+            self.state = 2257
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.ELSIF:
-                self.state = 2264
+            while _la==27:
+                self.state = 2250
                 self.match(vhdlParser.ELSIF)
-                self.state = 2265
+                self.state = 2251
                 self.condition()
-                self.state = 2266
+                self.state = 2252
                 self.match(vhdlParser.USE)
-                self.state = 2267
+                self.state = 2253
                 self.simultaneous_statement_part()
-                self.state = 2273
+                self.state = 2259
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2276
+            self.state = 2262
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.ELSE:
-                self.state = 2274
+            if _la==26:
+                self.state = 2260
                 self.match(vhdlParser.ELSE)
-                self.state = 2275
+                self.state = 2261
                 self.simultaneous_statement_part()
 
 
-            self.state = 2278
+            self.state = 2264
             self.match(vhdlParser.END)
-            self.state = 2279
+            self.state = 2265
             self.match(vhdlParser.USE)
-            self.state = 2281
+            self.state = 2267
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2280
+            if _la==118 or _la==119:
+                self.state = 2266
                 self.identifier()
 
 
-            self.state = 2283
+            self.state = 2269
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -19295,43 +19223,43 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2286
+            self.state = 2272
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2285
+            if _la==118 or _la==119:
+                self.state = 2271
                 self.label_colon()
 
 
-            self.state = 2288
+            self.state = 2274
             self.match(vhdlParser.PROCEDURAL)
-            self.state = 2290
+            self.state = 2276
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IS:
-                self.state = 2289
+            if _la==41:
+                self.state = 2275
                 self.match(vhdlParser.IS)
 
 
-            self.state = 2292
+            self.state = 2278
             self.procedural_declarative_part()
-            self.state = 2293
+            self.state = 2279
             self.match(vhdlParser.BEGIN)
-            self.state = 2294
+            self.state = 2280
             self.procedural_statement_part()
-            self.state = 2295
+            self.state = 2281
             self.match(vhdlParser.END)
-            self.state = 2296
+            self.state = 2282
             self.match(vhdlParser.PROCEDURAL)
-            self.state = 2298
+            self.state = 2284
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2297
+            if _la==118 or _la==119:
+                self.state = 2283
                 self.identifier()
 
 
-            self.state = 2300
+            self.state = 2286
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -19401,46 +19329,46 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 438, self.RULE_simultaneous_statement)
         self._la = 0 # Token type
         try:
-            self.state = 2311
+            self.state = 2297
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,256,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,254,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2302
+                self.state = 2288
                 self.simple_simultaneous_statement()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2303
+                self.state = 2289
                 self.simultaneous_if_statement()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2304
+                self.state = 2290
                 self.simultaneous_case_statement()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2305
+                self.state = 2291
                 self.simultaneous_procedural_statement()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2307
+                self.state = 2293
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                    self.state = 2306
+                if _la==118 or _la==119:
+                    self.state = 2292
                     self.label_colon()
 
 
-                self.state = 2309
+                self.state = 2295
                 self.match(vhdlParser.NULL_)
-                self.state = 2310
+                self.state = 2296
                 self.match(vhdlParser.SEMI)
                 pass
 
@@ -19495,13 +19423,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2316
+            self.state = 2302
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ABS) | (1 << vhdlParser.CASE) | (1 << vhdlParser.IF) | (1 << vhdlParser.NEW) | (1 << vhdlParser.NOT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 69)) & ~0x3f) == 0 and ((1 << (_la - 69)) & ((1 << (vhdlParser.PROCEDURAL - 69)) | (1 << (vhdlParser.BASE_LITERAL - 69)) | (1 << (vhdlParser.BIT_STRING_LITERAL - 69)) | (1 << (vhdlParser.REAL_LITERAL - 69)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 69)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 69)) | (1 << (vhdlParser.CHARACTER_LITERAL - 69)) | (1 << (vhdlParser.STRING_LITERAL - 69)))) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & ((1 << (vhdlParser.LPAREN - 141)) | (1 << (vhdlParser.PLUS - 141)) | (1 << (vhdlParser.MINUS - 141)) | (1 << (vhdlParser.INTEGER - 141)))) != 0):
-                self.state = 2313
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 220676450460893186) != 0) or ((((_la - 69)) & ~0x3f) == 0 and ((1 << (_la - 69)) & 434342277343608833) != 0) or ((((_la - 141)) & ~0x3f) == 0 and ((1 << (_la - 141)) & 131457) != 0):
+                self.state = 2299
                 self.simultaneous_statement()
-                self.state = 2318
+                self.state = 2304
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -19562,25 +19490,25 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Source_aspectContext(self, self._ctx, self.state)
         self.enterRule(localctx, 442, self.RULE_source_aspect)
         try:
-            self.state = 2326
+            self.state = 2312
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.SPECTRUM]:
+            if token in [89]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2319
+                self.state = 2305
                 self.match(vhdlParser.SPECTRUM)
-                self.state = 2320
+                self.state = 2306
                 self.simple_expression()
-                self.state = 2321
+                self.state = 2307
                 self.match(vhdlParser.COMMA)
-                self.state = 2322
+                self.state = 2308
                 self.simple_expression()
                 pass
-            elif token in [vhdlParser.NOISE]:
+            elif token in [54]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2324
+                self.state = 2310
                 self.match(vhdlParser.NOISE)
-                self.state = 2325
+                self.state = 2311
                 self.simple_expression()
                 pass
             else:
@@ -19649,17 +19577,17 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 444, self.RULE_source_quantity_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2328
+            self.state = 2314
             self.match(vhdlParser.QUANTITY)
-            self.state = 2329
+            self.state = 2315
             self.identifier_list()
-            self.state = 2330
+            self.state = 2316
             self.match(vhdlParser.COLON)
-            self.state = 2331
+            self.state = 2317
             self.subtype_indication()
-            self.state = 2332
+            self.state = 2318
             self.source_aspect()
-            self.state = 2333
+            self.state = 2319
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -19720,15 +19648,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 446, self.RULE_step_limit_specification)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2335
+            self.state = 2321
             self.match(vhdlParser.LIMIT)
-            self.state = 2336
+            self.state = 2322
             self.quantity_specification()
-            self.state = 2337
+            self.state = 2323
             self.match(vhdlParser.WITH)
-            self.state = 2338
+            self.state = 2324
             self.expression()
-            self.state = 2339
+            self.state = 2325
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -19789,15 +19717,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 448, self.RULE_subnature_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2341
+            self.state = 2327
             self.match(vhdlParser.SUBNATURE)
-            self.state = 2342
+            self.state = 2328
             self.identifier()
-            self.state = 2343
+            self.state = 2329
             self.match(vhdlParser.IS)
-            self.state = 2344
+            self.state = 2330
             self.subnature_indication()
-            self.state = 2345
+            self.state = 2331
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -19866,29 +19794,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2347
+            self.state = 2333
             self.name()
-            self.state = 2349
+            self.state = 2335
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LPAREN:
-                self.state = 2348
+            if _la==141:
+                self.state = 2334
                 self.index_constraint()
 
 
-            self.state = 2357
+            self.state = 2343
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.TOLERANCE:
-                self.state = 2351
+            if _la==98:
+                self.state = 2337
                 self.match(vhdlParser.TOLERANCE)
-                self.state = 2352
+                self.state = 2338
                 self.expression()
-                self.state = 2353
+                self.state = 2339
                 self.match(vhdlParser.ACROSS)
-                self.state = 2354
+                self.state = 2340
                 self.expression()
-                self.state = 2355
+                self.state = 2341
                 self.match(vhdlParser.THROUGH)
 
 
@@ -19967,35 +19895,35 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2359
+            self.state = 2345
             self.subprogram_specification()
-            self.state = 2360
+            self.state = 2346
             self.match(vhdlParser.IS)
-            self.state = 2361
+            self.state = 2347
             self.subprogram_declarative_part()
-            self.state = 2362
+            self.state = 2348
             self.match(vhdlParser.BEGIN)
-            self.state = 2363
+            self.state = 2349
             self.subprogram_statement_part()
-            self.state = 2364
+            self.state = 2350
             self.match(vhdlParser.END)
-            self.state = 2366
+            self.state = 2352
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FUNCTION or _la==vhdlParser.PROCEDURE:
-                self.state = 2365
+            if _la==31 or _la==68:
+                self.state = 2351
                 self.subprogram_kind()
 
 
-            self.state = 2369
+            self.state = 2355
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & ((1 << (vhdlParser.BASIC_IDENTIFIER - 118)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 118)) | (1 << (vhdlParser.STRING_LITERAL - 118)))) != 0):
-                self.state = 2368
+            if ((((_la - 118)) & ~0x3f) == 0 and ((1 << (_la - 118)) & 515) != 0):
+                self.state = 2354
                 self.designator()
 
 
-            self.state = 2371
+            self.state = 2357
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -20046,9 +19974,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 454, self.RULE_subprogram_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2373
+            self.state = 2359
             self.subprogram_specification()
-            self.state = 2374
+            self.state = 2360
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -20143,84 +20071,84 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Subprogram_declarative_itemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 456, self.RULE_subprogram_declarative_item)
         try:
-            self.state = 2389
+            self.state = 2375
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,263,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,261,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2376
+                self.state = 2362
                 self.subprogram_declaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2377
+                self.state = 2363
                 self.subprogram_body()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2378
+                self.state = 2364
                 self.type_declaration()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2379
+                self.state = 2365
                 self.subtype_declaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2380
+                self.state = 2366
                 self.constant_declaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2381
+                self.state = 2367
                 self.variable_declaration()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 2382
+                self.state = 2368
                 self.file_declaration()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 2383
+                self.state = 2369
                 self.alias_declaration()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 2384
+                self.state = 2370
                 self.attribute_declaration()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 2385
+                self.state = 2371
                 self.attribute_specification()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 2386
+                self.state = 2372
                 self.use_clause()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 2387
+                self.state = 2373
                 self.group_template_declaration()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 2388
+                self.state = 2374
                 self.group_declaration()
                 pass
 
@@ -20275,13 +20203,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2394
+            self.state = 2380
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ALIAS) | (1 << vhdlParser.ATTRIBUTE) | (1 << vhdlParser.CONSTANT) | (1 << vhdlParser.FILE) | (1 << vhdlParser.FUNCTION) | (1 << vhdlParser.GROUP) | (1 << vhdlParser.IMPURE))) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & ((1 << (vhdlParser.PROCEDURE - 68)) | (1 << (vhdlParser.PURE - 68)) | (1 << (vhdlParser.SHARED - 68)) | (1 << (vhdlParser.SUBTYPE - 68)) | (1 << (vhdlParser.TYPE - 68)) | (1 << (vhdlParser.USE - 68)) | (1 << (vhdlParser.VARIABLE - 68)))) != 0):
-                self.state = 2391
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 157305276448) != 0) or ((((_la - 68)) & ~0x3f) == 0 and ((1 << (_la - 68)) & 210487083013) != 0):
+                self.state = 2377
                 self.subprogram_declarative_item()
-                self.state = 2396
+                self.state = 2382
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -20334,9 +20262,9 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2397
+            self.state = 2383
             _la = self._input.LA(1)
-            if not(_la==vhdlParser.FUNCTION or _la==vhdlParser.PROCEDURE):
+            if not(_la==31 or _la==68):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -20390,17 +20318,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Subprogram_specificationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 462, self.RULE_subprogram_specification)
         try:
-            self.state = 2401
+            self.state = 2387
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.PROCEDURE]:
+            if token in [68]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2399
+                self.state = 2385
                 self.procedure_specification()
                 pass
-            elif token in [vhdlParser.FUNCTION, vhdlParser.IMPURE, vhdlParser.PURE]:
+            elif token in [31, 37, 70]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2400
+                self.state = 2386
                 self.function_specification()
                 pass
             else:
@@ -20466,19 +20394,19 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2403
+            self.state = 2389
             self.match(vhdlParser.PROCEDURE)
-            self.state = 2404
+            self.state = 2390
             self.designator()
-            self.state = 2409
+            self.state = 2395
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LPAREN:
-                self.state = 2405
+            if _la==141:
+                self.state = 2391
                 self.match(vhdlParser.LPAREN)
-                self.state = 2406
+                self.state = 2392
                 self.formal_parameter_list()
-                self.state = 2407
+                self.state = 2393
                 self.match(vhdlParser.RPAREN)
 
 
@@ -20555,38 +20483,38 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2412
+            self.state = 2398
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IMPURE or _la==vhdlParser.PURE:
-                self.state = 2411
+            if _la==37 or _la==70:
+                self.state = 2397
                 _la = self._input.LA(1)
-                if not(_la==vhdlParser.IMPURE or _la==vhdlParser.PURE):
+                if not(_la==37 or _la==70):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
 
 
-            self.state = 2414
+            self.state = 2400
             self.match(vhdlParser.FUNCTION)
-            self.state = 2415
+            self.state = 2401
             self.designator()
-            self.state = 2420
+            self.state = 2406
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.LPAREN:
-                self.state = 2416
+            if _la==141:
+                self.state = 2402
                 self.match(vhdlParser.LPAREN)
-                self.state = 2417
+                self.state = 2403
                 self.formal_parameter_list()
-                self.state = 2418
+                self.state = 2404
                 self.match(vhdlParser.RPAREN)
 
 
-            self.state = 2422
+            self.state = 2408
             self.match(vhdlParser.RETURN)
-            self.state = 2423
+            self.state = 2409
             self.subtype_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -20638,13 +20566,13 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2428
+            self.state = 2414
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << vhdlParser.ASSERT) | (1 << vhdlParser.BREAK) | (1 << vhdlParser.CASE) | (1 << vhdlParser.EXIT) | (1 << vhdlParser.FOR) | (1 << vhdlParser.IF) | (1 << vhdlParser.LOOP) | (1 << vhdlParser.NEXT) | (1 << vhdlParser.NULL_))) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & ((1 << (vhdlParser.REPORT - 79)) | (1 << (vhdlParser.RETURN - 79)) | (1 << (vhdlParser.WAIT - 79)) | (1 << (vhdlParser.WHILE - 79)) | (1 << (vhdlParser.BASIC_IDENTIFIER - 79)) | (1 << (vhdlParser.EXTENDED_IDENTIFIER - 79)) | (1 << (vhdlParser.STRING_LITERAL - 79)) | (1 << (vhdlParser.LPAREN - 79)))) != 0):
-                self.state = 2425
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 153263194880902144) != 0) or ((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & 4611969143879499779) != 0):
+                self.state = 2411
                 self.sequential_statement()
-                self.state = 2430
+                self.state = 2416
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -20707,15 +20635,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 470, self.RULE_subtype_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2431
+            self.state = 2417
             self.match(vhdlParser.SUBTYPE)
-            self.state = 2432
+            self.state = 2418
             self.identifier()
-            self.state = 2433
+            self.state = 2419
             self.match(vhdlParser.IS)
-            self.state = 2434
+            self.state = 2420
             self.subtype_indication()
-            self.state = 2435
+            self.state = 2421
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -20775,29 +20703,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2437
+            self.state = 2423
             self.selected_name()
-            self.state = 2439
+            self.state = 2425
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2438
+            if _la==118 or _la==119:
+                self.state = 2424
                 self.selected_name()
 
 
-            self.state = 2442
+            self.state = 2428
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.RANGE or _la==vhdlParser.LPAREN:
-                self.state = 2441
+            if _la==72 or _la==141:
+                self.state = 2427
                 self.constraint()
 
 
-            self.state = 2445
+            self.state = 2431
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,272,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,270,self._ctx)
             if la_ == 1:
-                self.state = 2444
+                self.state = 2430
                 self.tolerance_aspect()
 
 
@@ -20855,27 +20783,27 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.SuffixContext(self, self._ctx, self.state)
         self.enterRule(localctx, 474, self.RULE_suffix)
         try:
-            self.state = 2451
+            self.state = 2437
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER]:
+            if token in [118, 119]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2447
+                self.state = 2433
                 self.identifier()
                 pass
-            elif token in [vhdlParser.CHARACTER_LITERAL]:
+            elif token in [126]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2448
+                self.state = 2434
                 self.match(vhdlParser.CHARACTER_LITERAL)
                 pass
-            elif token in [vhdlParser.STRING_LITERAL]:
+            elif token in [127]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2449
+                self.state = 2435
                 self.match(vhdlParser.STRING_LITERAL)
                 pass
-            elif token in [vhdlParser.ALL]:
+            elif token in [6]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2450
+                self.state = 2436
                 self.match(vhdlParser.ALL)
                 pass
             else:
@@ -20930,17 +20858,17 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.TargetContext(self, self._ctx, self.state)
         self.enterRule(localctx, 476, self.RULE_target)
         try:
-            self.state = 2455
+            self.state = 2441
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.STRING_LITERAL]:
+            if token in [118, 119, 127]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2453
+                self.state = 2439
                 self.name()
                 pass
-            elif token in [vhdlParser.LPAREN]:
+            elif token in [141]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2454
+                self.state = 2440
                 self.aggregate()
                 pass
             else:
@@ -21002,20 +20930,20 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 478, self.RULE_term)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2457
+            self.state = 2443
             self.factor()
-            self.state = 2463
+            self.state = 2449
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,275,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,273,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2458
+                    self.state = 2444
                     self.multiplying_operator()
-                    self.state = 2459
+                    self.state = 2445
                     self.factor() 
-                self.state = 2465
+                self.state = 2451
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,275,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,273,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -21070,15 +20998,15 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2466
+            self.state = 2452
             self.name()
-            self.state = 2469
+            self.state = 2455
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.TO:
-                self.state = 2467
+            if _la==97:
+                self.state = 2453
                 self.match(vhdlParser.TO)
-                self.state = 2468
+                self.state = 2454
                 self.name()
 
 
@@ -21141,15 +21069,15 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 482, self.RULE_terminal_declaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2471
+            self.state = 2457
             self.match(vhdlParser.TERMINAL)
-            self.state = 2472
+            self.state = 2458
             self.identifier_list()
-            self.state = 2473
+            self.state = 2459
             self.match(vhdlParser.COLON)
-            self.state = 2474
+            self.state = 2460
             self.subnature_indication()
-            self.state = 2475
+            self.state = 2461
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -21212,27 +21140,27 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2477
+            self.state = 2463
             self.identifier_list()
-            self.state = 2479
+            self.state = 2465
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.TOLERANCE:
-                self.state = 2478
+            if _la==98:
+                self.state = 2464
                 self.tolerance_aspect()
 
 
-            self.state = 2483
+            self.state = 2469
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 2481
+            if _la==135:
+                self.state = 2467
                 self.match(vhdlParser.VARASGN)
-                self.state = 2482
+                self.state = 2468
                 self.expression()
 
 
-            self.state = 2485
+            self.state = 2471
             self.match(vhdlParser.THROUGH)
         except RecognitionException as re:
             localctx.exception = re
@@ -21283,9 +21211,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 486, self.RULE_timeout_clause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2487
+            self.state = 2473
             self.match(vhdlParser.FOR)
-            self.state = 2488
+            self.state = 2474
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -21336,9 +21264,9 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 488, self.RULE_tolerance_aspect)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2490
+            self.state = 2476
             self.match(vhdlParser.TOLERANCE)
-            self.state = 2491
+            self.state = 2477
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -21400,21 +21328,21 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2493
+            self.state = 2479
             self.match(vhdlParser.TYPE)
-            self.state = 2494
+            self.state = 2480
             self.identifier()
-            self.state = 2497
+            self.state = 2483
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.IS:
-                self.state = 2495
+            if _la==41:
+                self.state = 2481
                 self.match(vhdlParser.IS)
-                self.state = 2496
+                self.state = 2482
                 self.type_definition()
 
 
-            self.state = 2499
+            self.state = 2485
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -21473,27 +21401,27 @@ class vhdlParser ( Parser ):
         localctx = vhdlParser.Type_definitionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 492, self.RULE_type_definition)
         try:
-            self.state = 2505
+            self.state = 2491
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.RANGE, vhdlParser.LPAREN]:
+            if token in [72, 141]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2501
+                self.state = 2487
                 self.scalar_type_definition()
                 pass
-            elif token in [vhdlParser.ARRAY, vhdlParser.RECORD]:
+            elif token in [9, 76]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2502
+                self.state = 2488
                 self.composite_type_definition()
                 pass
-            elif token in [vhdlParser.ACCESS]:
+            elif token in [2]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2503
+                self.state = 2489
                 self.access_type_definition()
                 pass
-            elif token in [vhdlParser.FILE]:
+            elif token in [29]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2504
+                self.state = 2490
                 self.file_type_definition()
                 pass
             else:
@@ -21571,29 +21499,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2507
+            self.state = 2493
             self.match(vhdlParser.ARRAY)
-            self.state = 2508
+            self.state = 2494
             self.match(vhdlParser.LPAREN)
-            self.state = 2509
+            self.state = 2495
             self.index_subtype_definition()
-            self.state = 2514
+            self.state = 2500
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 2510
+            while _la==139:
+                self.state = 2496
                 self.match(vhdlParser.COMMA)
-                self.state = 2511
+                self.state = 2497
                 self.index_subtype_definition()
-                self.state = 2516
+                self.state = 2502
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2517
+            self.state = 2503
             self.match(vhdlParser.RPAREN)
-            self.state = 2518
+            self.state = 2504
             self.match(vhdlParser.OF)
-            self.state = 2519
+            self.state = 2505
             self.subtype_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -21667,29 +21595,29 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2521
+            self.state = 2507
             self.match(vhdlParser.ARRAY)
-            self.state = 2522
+            self.state = 2508
             self.match(vhdlParser.LPAREN)
-            self.state = 2523
+            self.state = 2509
             self.index_subtype_definition()
-            self.state = 2528
+            self.state = 2514
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 2524
+            while _la==139:
+                self.state = 2510
                 self.match(vhdlParser.COMMA)
-                self.state = 2525
+                self.state = 2511
                 self.index_subtype_definition()
-                self.state = 2530
+                self.state = 2516
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2531
+            self.state = 2517
             self.match(vhdlParser.RPAREN)
-            self.state = 2532
+            self.state = 2518
             self.match(vhdlParser.OF)
-            self.state = 2533
+            self.state = 2519
             self.subnature_indication()
         except RecognitionException as re:
             localctx.exception = re
@@ -21753,23 +21681,23 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2535
+            self.state = 2521
             self.match(vhdlParser.USE)
-            self.state = 2536
+            self.state = 2522
             self.selected_name()
-            self.state = 2541
+            self.state = 2527
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==vhdlParser.COMMA:
-                self.state = 2537
+            while _la==139:
+                self.state = 2523
                 self.match(vhdlParser.COMMA)
-                self.state = 2538
+                self.state = 2524
                 self.selected_name()
-                self.state = 2543
+                self.state = 2529
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2544
+            self.state = 2530
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -21831,21 +21759,21 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 500, self.RULE_variable_assignment_statement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2547
+            self.state = 2533
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,284,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,282,self._ctx)
             if la_ == 1:
-                self.state = 2546
+                self.state = 2532
                 self.label_colon()
 
 
-            self.state = 2549
+            self.state = 2535
             self.target()
-            self.state = 2550
+            self.state = 2536
             self.match(vhdlParser.VARASGN)
-            self.state = 2551
+            self.state = 2537
             self.expression()
-            self.state = 2552
+            self.state = 2538
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -21917,33 +21845,33 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2555
+            self.state = 2541
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.SHARED:
-                self.state = 2554
+            if _la==85:
+                self.state = 2540
                 self.match(vhdlParser.SHARED)
 
 
-            self.state = 2557
+            self.state = 2543
             self.match(vhdlParser.VARIABLE)
-            self.state = 2558
+            self.state = 2544
             self.identifier_list()
-            self.state = 2559
+            self.state = 2545
             self.match(vhdlParser.COLON)
-            self.state = 2560
+            self.state = 2546
             self.subtype_indication()
-            self.state = 2563
+            self.state = 2549
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.VARASGN:
-                self.state = 2561
+            if _la==135:
+                self.state = 2547
                 self.match(vhdlParser.VARASGN)
-                self.state = 2562
+                self.state = 2548
                 self.expression()
 
 
-            self.state = 2565
+            self.state = 2551
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -22010,41 +21938,41 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2568
+            self.state = 2554
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.BASIC_IDENTIFIER or _la==vhdlParser.EXTENDED_IDENTIFIER:
-                self.state = 2567
+            if _la==118 or _la==119:
+                self.state = 2553
                 self.label_colon()
 
 
-            self.state = 2570
+            self.state = 2556
             self.match(vhdlParser.WAIT)
-            self.state = 2572
+            self.state = 2558
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.ON:
-                self.state = 2571
+            if _la==59:
+                self.state = 2557
                 self.sensitivity_clause()
 
 
-            self.state = 2575
+            self.state = 2561
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.UNTIL:
-                self.state = 2574
+            if _la==103:
+                self.state = 2560
                 self.condition_clause()
 
 
-            self.state = 2578
+            self.state = 2564
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.FOR:
-                self.state = 2577
+            if _la==30:
+                self.state = 2563
                 self.timeout_clause()
 
 
-            self.state = 2580
+            self.state = 2566
             self.match(vhdlParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -22104,29 +22032,29 @@ class vhdlParser ( Parser ):
         self.enterRule(localctx, 506, self.RULE_waveform)
         self._la = 0 # Token type
         try:
-            self.state = 2591
+            self.state = 2577
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [vhdlParser.ABS, vhdlParser.NEW, vhdlParser.NOT, vhdlParser.NULL_, vhdlParser.BASE_LITERAL, vhdlParser.BIT_STRING_LITERAL, vhdlParser.REAL_LITERAL, vhdlParser.BASIC_IDENTIFIER, vhdlParser.EXTENDED_IDENTIFIER, vhdlParser.CHARACTER_LITERAL, vhdlParser.STRING_LITERAL, vhdlParser.LPAREN, vhdlParser.PLUS, vhdlParser.MINUS, vhdlParser.INTEGER]:
+            if token in [1, 52, 56, 57, 112, 113, 117, 118, 119, 126, 127, 141, 148, 149, 158]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2582
+                self.state = 2568
                 self.waveform_element()
-                self.state = 2587
+                self.state = 2573
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==vhdlParser.COMMA:
-                    self.state = 2583
+                while _la==139:
+                    self.state = 2569
                     self.match(vhdlParser.COMMA)
-                    self.state = 2584
+                    self.state = 2570
                     self.waveform_element()
-                    self.state = 2589
+                    self.state = 2575
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
-            elif token in [vhdlParser.UNAFFECTED]:
+            elif token in [101]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2590
+                self.state = 2576
                 self.match(vhdlParser.UNAFFECTED)
                 pass
             else:
@@ -22185,15 +22113,15 @@ class vhdlParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2593
+            self.state = 2579
             self.expression()
-            self.state = 2596
+            self.state = 2582
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==vhdlParser.AFTER:
-                self.state = 2594
+            if _la==4:
+                self.state = 2580
                 self.match(vhdlParser.AFTER)
-                self.state = 2595
+                self.state = 2581
                 self.expression()
 
 
@@ -1,6 +1,6 @@
-# Generated from vhdl.g4 by ANTLR 4.10
+# Generated from vhdl.g4 by ANTLR 4.13.2
 from antlr4 import *
-if __name__ is not None and "." in __name__:
+if "." in __name__:
     from .vhdlParser import vhdlParser
 else:
     from vhdlParser import vhdlParser
@@ -0,0 +1,165 @@
+import os
+import glob
+import logging
+import traceback
+import multiprocessing.util
+
+from dataclasses import dataclass
+from typing import Callable, List
+
+from Debug import Debug
+from ParserManager import ParserManager
+from DecisionProfiler import DecisionProfiler
+from PhaseTimer import PhaseTimer
+
+import Constants as const
+
+@dataclass
+class BatchResult:
+    vhdl_path   : str
+    success     : bool
+    error       : str = None
+
+    parse_statistics : dict = None
+    rule_statistics  : dict = None
+    phase_statistics : dict = None
+    decision_statistics : dict = None
+
+class BatchTranslator():
+
+    @staticmethod
+    def collect_files(logger: logging.Logger, paths: List[str], quiet: bool = False) -> List[str]:
+        '''
+        Expand files, directories (searched recursively) and glob patterns into a sorted
+        list of unique VHDL files. quiet drops the warnings, for repeated scans.
+        '''
+
+        files : List[str] = []
+
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, filenames in os.walk(path):
+                    files.extend(
+                        os.path.join(root, filename)
+                        for filename in filenames
+                        if os.path.splitext(filename)[1].lower() in const.VHDL_EXTENSIONS
+                    )
+
+            elif os.path.isfile(path):
+                files.append(path)
+
+            else:
+                matches : List[str] = [match for match in glob.glob(path, recursive=True) if os.path.isfile(match)]
+
+                if not matches and not quiet:
+                    logger.warning(f"No files found for {path}")
+
+                files.extend(matches)
+
+        files = sorted(set(os.path.abspath(file) for file in files))
+
+        if not quiet:
+            BatchTranslator.__warn_about_name_collisions(logger, files)
+
+        return files
+
+    @staticmethod
+    def translate_files(logger: logging.Logger, vhdl_paths: List[str], jobs: int,
+                        translate_function: Callable[[logging.Logger, str], bool], use_dfa_cache: bool = True,
+                        configure_worker: Callable[[], None] = None) -> List[BatchResult]:
+        '''
+        Run translate_function for every file. With more than one job the files are spread
+        over a process pool, every worker builds its own visitor and result creators.
+        configure_worker is called once in every worker, e.g. to apply the debug options.
+        '''
+
+        if jobs <= 1 or len(vhdl_paths) <= 1:
+            return [BatchTranslator._translate_worker(vhdl_path, translate_function) for vhdl_path in vhdl_paths]
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # Forked workers inherit the DFA of the parent, so it is loaded once here instead of in every worker
+        ParserManager.load_pending_dfa_cache(logger)
+
+        results : List[BatchResult] = []
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=BatchTranslator._initialize_worker, initargs=(use_dfa_cache, configure_worker)) as executor:
+            futures = [
+                executor.submit(BatchTranslator._translate_worker, vhdl_path, translate_function)
+                for vhdl_path in vhdl_paths
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    result : BatchResult = future.result()
+                    ParserManager.add_statistics(result.parse_statistics)
+                    Debug.add_rule_statistics(result.rule_statistics)
+                    DecisionProfiler.add_statistics(result.decision_statistics)
+                    results.append(result)
+                except Exception:
+                    logger.error("Worker failed", exc_info=True)
+
+        # The workers have exited here and saved the DFA they built
+        if use_dfa_cache:
+            ParserManager.collect_worker_dfa_caches(logger, const.DFA_CACHE_PATH)
+
+        results.sort(key=lambda result: result.vhdl_path)
+        return results
+
+    @staticmethod
+    def write_summary(logger: logging.Logger, results: List[BatchResult]) -> None:
+        failed : List[BatchResult] = [result for result in results if not result.success]
+
+        for result in failed:
+            logger.error(f"Failed: {result.vhdl_path}" + (f"\n{result.error}" if result.error else ""))
+
+        logger.info(f"Batch summary: {len(results)} files, {len(results) - len(failed)} succeeded, {len(failed)} failed")
+
+    @staticmethod
+    def _initialize_worker(use_dfa_cache: bool, configure_worker: Callable[[], None] = None) -> None:
+        if configure_worker is not None:
+            configure_worker()
+
+        # Forked workers inherit the warm DFA of the parent, spawned workers load it before their first parse
+        if use_dfa_cache:
+            ParserManager.use_dfa_cache(const.DFA_CACHE_PATH)
+
+            # The parent does not parse, so every worker saves its DFA when the pool shuts it down
+            multiprocessing.util.Finalize(None, ParserManager.save_worker_dfa_cache, args=(Debug.get_logger("BatchTranslator"), const.DFA_CACHE_PATH), exitpriority=10)
+
+    @staticmethod
+    def _translate_worker(vhdl_path: str, translate_function: Callable[[logging.Logger, str], bool]) -> BatchResult:
+        output_log : logging.Logger = Debug.get_logger("BatchTranslator")
+        statistics_before       : dict = ParserManager.get_statistics()
+        rule_statistics_before  : dict = Debug.get_rule_statistics()
+        decision_statistics_before : dict = DecisionProfiler.get_statistics()
+
+        PhaseTimer.collect()    # drop phases measured outside of a translation
+
+        try:
+            with PhaseTimer.measure("total"):
+                result = BatchResult(vhdl_path, bool(translate_function(output_log, vhdl_path)))
+        except Exception:
+            result = BatchResult(vhdl_path, False, traceback.format_exc())
+
+        result.parse_statistics = {
+            key : value - statistics_before[key]
+            for key, value in ParserManager.get_statistics().items()
+        }
+        result.rule_statistics = Debug.get_rule_statistics_delta(rule_statistics_before)
+        result.phase_statistics = PhaseTimer.collect()
+        result.decision_statistics = DecisionProfiler.get_statistics_delta(decision_statistics_before)
+
+        return result
+
+    @staticmethod
+    def __warn_about_name_collisions(logger: logging.Logger, files: List[str]) -> None:
+        seen : dict = {}
+
+        for file in files:
+            name : str = os.path.splitext(os.path.basename(file))[0]
+
+            if name in seen:
+                logger.warning(f"{file} and {seen[name]} write to the same result files")
+            else:
+                seen[name] = file
@@ -0,0 +1,182 @@
+'''
+Memory benchmark of the statement and declaration nodes. Translates generated VHDL
+in this process and measures, for every node class, the bytes one node takes in its
+slotted layout and in the instance __dict__ layout the nodes had before. Only the
+node itself is counted, the strings and lists it refers to are the same in both.
+The expression renderings the nodes share are counted as well. Run from the VHDLTranslator folder:
+
+    python -m Benchmarks.MemoryBenchmark
+    python -m Benchmarks.MemoryBenchmark --entities 16 --processes 32
+
+Results are written to Benchmarks/results/memory-<date>-<revision>.json.
+'''
+
+import os, sys
+import copy
+import json
+import time
+import argparse
+import tracemalloc
+
+from dataclasses import asdict, fields, is_dataclass
+from typing import Callable, Dict, List
+
+from Benchmarks.ScalingBenchmark import RESULTS_DIR, get_revision
+from Benchmarks.VHDLGenerator import VHDLGenerator, GeneratorParameters
+
+from InMemoryTranslator import InMemoryTranslator
+from VHDL.VHDLData import VHDLData
+from VHDL.VHDLExpression import ExpressionText
+from VHDL.VHDLDeclaration import VHDLDeclaration
+from VHDL.VHDLStatements import VHDLStatement, ConditionalWaveform, SelectedWaveform
+
+NODE_CLASSES = (VHDLStatement, VHDLDeclaration, ConditionalWaveform, SelectedWaveform)
+
+def get_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="Measure the memory of one statement or declaration node per class")
+
+    argument_parser.add_argument("--entities", type=int, default=8, help="entity/architecture pairs of the generated file")
+    argument_parser.add_argument("--processes", type=int, default=16, help="processes per architecture")
+    argument_parser.add_argument("--output", help="result file (default: Benchmarks/results/memory-<date>-<revision>.json)")
+
+    return argument_parser.parse_args()
+
+def collect_nodes(vhdlData: VHDLData) -> List[object]:
+    # Every node reachable from the designs and the environment, including the statement infos the parents point to
+    pending : List[object] = [vhdlData.design_list, vhdlData.agents, vhdlData.declarations, list(vhdlData.agent_types.values())]
+    nodes   : Dict[int, object] = {}
+
+    while pending:
+        value = pending.pop()
+
+        if isinstance(value, (list, tuple)):
+            pending.extend(value)
+
+        elif is_dataclass(value) and id(value) not in nodes:
+            if isinstance(value, NODE_CLASSES):
+                nodes[id(value)] = value
+
+            pending.extend(getattr(value, field.name, None) for field in fields(value))
+
+    return list(nodes.values())
+
+def measure(nodes: List[object], create: Callable[[object], object]) -> float:
+    # Bytes per node still allocated after creating a copy of every node, without the list holding them
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    copies : List[object] = [create(node) for node in nodes]
+
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (current - start - sys.getsizeof(copies)) / len(copies)
+
+def get_dict_layout(node_class: type) -> Callable[[object], object]:
+    # A plain class per node class, so the instance dicts share their keys like the ones of the old dataclasses did
+    layout_class : type = type(node_class.__name__, (), {})
+    names : List[str] = [field.name for field in fields(node_class)]
+
+    def create(node: object) -> object:
+        layout = layout_class()
+
+        for name in names:
+            setattr(layout, name, getattr(node, name, None))
+
+        return layout
+
+    return create
+
+def run_case(nodes_by_class: Dict[type, List[object]]) -> List[dict]:
+    cases : List[dict] = []
+
+    for node_class, nodes in sorted(nodes_by_class.items(), key=lambda item: -len(item[1])):
+        cases.append({
+            "class"         : node_class.__name__,
+            "nodes"         : len(nodes),
+            "fields"        : len(fields(node_class)),
+            "dict_bytes"    : round(measure(nodes, get_dict_layout(node_class)), 1),
+            "slots_bytes"   : round(measure(nodes, copy.copy), 1)
+        })
+
+    return cases
+
+def count_renderings(nodes: List[object]) -> dict:
+    # Expression fields of the nodes, before the rendering pairs were shared every one was an object of its own
+    renderings : List[ExpressionText] = [
+        value for node in nodes for value in (getattr(node, field.name, None) for field in fields(node))
+        if isinstance(value, ExpressionText)
+    ]
+
+    return {
+        "references"    : len(renderings),
+        "objects"       : len({id(rendering) for rendering in renderings}),
+        "object_bytes"  : sys.getsizeof(renderings[0]) if renderings else 0
+    }
+
+def write_case(case: dict) -> None:
+    print(f"{case['class']:<32}{case['nodes']:>8} nodes{case['fields']:>4} fields"
+          f"{case['dict_bytes']:>9.0f} B dict{case['slots_bytes']:>9.0f} B slots"
+          f"{1 - case['slots_bytes'] / case['dict_bytes']:>9.1%} less")
+
+def main():
+    arguments : argparse.Namespace = get_arguments()
+
+    parameters : GeneratorParameters = GeneratorParameters(entities=arguments.entities, processes=arguments.processes)
+    generated = VHDLGenerator(parameters).generate()
+
+    start : float = time.perf_counter()
+    vhdlData : VHDLData = InMemoryTranslator.translate_string(generated.text).vhdl_data
+    translation_time : float = time.perf_counter() - start
+
+    nodes : List[object] = collect_nodes(vhdlData)
+    nodes_by_class : Dict[type, List[object]] = {}
+
+    for node in nodes:
+        nodes_by_class.setdefault(type(node), []).append(node)
+
+    print(f"{generated.lines} lines, {generated.statements} statements translated in {translation_time:.3f}s")
+
+    cases : List[dict] = run_case(nodes_by_class)
+
+    for case in cases:
+        write_case(case)
+
+    total : dict = {
+        "nodes"         : sum(case["nodes"] for case in cases),
+        "dict_bytes"    : round(sum(case["dict_bytes"] * case["nodes"] for case in cases)),
+        "slots_bytes"   : round(sum(case["slots_bytes"] * case["nodes"] for case in cases))
+    }
+
+    print(f"{'total':<32}{total['nodes']:>8} nodes{total['dict_bytes'] / 1024:>13.0f} KiB dict"
+          f"{total['slots_bytes'] / 1024:>9.0f} KiB slots{1 - total['slots_bytes'] / total['dict_bytes']:>9.1%} less")
+
+    renderings : dict = count_renderings(nodes)
+
+    print(f"{'renderings':<32}{renderings['references']:>8} fields{renderings['objects']:>12} objects"
+          f"{(renderings['references'] - renderings['objects']) * renderings['object_bytes'] / 1024:>9.0f} KiB saved")
+
+    revision : str = get_revision()
+    output_path : str = arguments.output or os.path.join(RESULTS_DIR, f"memory-{time.strftime('%Y%m%d-%H%M%S')}-{revision}.json")
+
+    output_dir : str = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    with open(output_path, 'w') as output_file:
+        json.dump({
+            "revision"      : revision,
+            "date"          : time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python"        : sys.version.split()[0],
+            "parameters"    : asdict(parameters),
+            "lines"         : generated.lines,
+            "statements"    : generated.statements,
+            "total"         : total,
+            "renderings"    : renderings,
+            "cases"         : cases
+        }, output_file, indent=4)
+
+    print(f"Results written to {output_path}")
+
+if __name__ == "__main__":
+    main()
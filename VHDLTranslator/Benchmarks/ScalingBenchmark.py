@@ -0,0 +1,171 @@
+'''
+Scaling benchmark of the full translation pipeline on generated VHDL. Every sweep
+varies one generator parameter and keeps the others at the baseline. Run from the
+VHDLTranslator folder:
+
+    python -m Benchmarks.ScalingBenchmark
+    python -m Benchmarks.ScalingBenchmark --sweep processes --sweep nesting_depth --repeat 5
+    python -m Benchmarks.ScalingBenchmark --compare Benchmarks/results/<earlier run>.json
+
+Every case runs VHDLTranslator.py in its own process with --phase-timing, so the
+pipeline time includes interpreter startup and the peak memory is that of one
+translation. Results are written to Benchmarks/results/<date>-<revision>.json.
+'''
+
+import os, sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+from dataclasses import asdict, replace
+from typing import Dict, List
+
+from Benchmarks.VHDLGenerator import VHDLGenerator, GeneratorParameters
+
+BENCHMARK_DIR   : str = os.path.dirname(os.path.abspath(__file__))
+TRANSLATOR_PATH : str = os.path.join(os.path.dirname(BENCHMARK_DIR), "VHDLTranslator.py")
+RESULTS_DIR     : str = os.path.join(BENCHMARK_DIR, "results")
+
+BASELINE : GeneratorParameters = GeneratorParameters()
+
+SWEEPS : Dict[str, List[int]] = {
+    "processes"         : [1, 4, 16, 64],
+    "nesting_depth"     : [0, 2, 4, 8, 16],
+    "signals"           : [4, 16, 64, 256],
+    "fsm_states"        : [2, 8, 32, 128],
+    "expression_length" : [1, 4, 16, 64],
+    "entities"          : [1, 4, 16]
+}
+
+def get_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="Translate generated VHDL of growing size and record throughput and peak memory")
+
+    argument_parser.add_argument("--sweep", action="append", choices=list(SWEEPS), help="parameter to scale, can be repeated (default: all)")
+    argument_parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest one is kept")
+    argument_parser.add_argument("--cold", action="store_true", help="translate without the DFA cache")
+    argument_parser.add_argument("--compare", help="earlier result file to compare the throughput with")
+    argument_parser.add_argument("--output", help="result file (default: Benchmarks/results/<date>-<revision>.json)")
+
+    return argument_parser.parse_args()
+
+def get_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def get_environment(work_dir: str) -> Dict[str, str]:
+    # The translator keeps its DFA cache in the cache directory of the user, point it to the work directory
+    return dict(os.environ, XDG_CACHE_HOME=work_dir, LOCALAPPDATA=work_dir)
+
+def translate(work_dir: str, vhdl_path: str, cold: bool) -> float:
+    command : List[str] = [sys.executable, TRANSLATOR_PATH, "--no-cache", "--phase-timing", vhdl_path]
+
+    if cold:
+        command.append("--no-dfa-cache")
+
+    start : float = time.perf_counter()
+    completed = subprocess.run(command, cwd=work_dir, env=get_environment(work_dir), capture_output=True, text=True)
+    pipeline_time : float = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        raise RuntimeError(f"Translation of {vhdl_path} failed:\n{completed.stderr}")
+
+    return pipeline_time
+
+def run_case(work_dir: str, name: str, parameters: GeneratorParameters, repeat: int, cold: bool) -> dict:
+    generated = VHDLGenerator(parameters).generate()
+    vhdl_path : str = os.path.join(work_dir, f"{name}.vhd")
+
+    with open(vhdl_path, 'w') as vhdl_file:
+        vhdl_file.write(generated.text)
+
+    best : dict = None
+
+    for _ in range(repeat):
+        pipeline_time : float = translate(work_dir, vhdl_path, cold)
+
+        with open(os.path.join(work_dir, "result", "phase_timing.json")) as report_file:
+            phases : Dict[str, dict] = json.load(report_file)["files"][vhdl_path]
+
+        if best is None or pipeline_time < best["pipeline_time"]:
+            best = {"pipeline_time": pipeline_time, "phases": phases}
+
+    phases = best["phases"]
+    translation_time : float = phases["total"]["wall_time"]
+
+    return {
+        "case"                  : name,
+        "parameters"            : asdict(parameters),
+        "lines"                 : generated.lines,
+        "statements"            : generated.statements,
+        "bytes"                 : len(generated.text),
+        "pipeline_time"         : round(best["pipeline_time"], 6),
+        "translation_time"      : translation_time,
+        "lines_per_second"      : round(generated.lines / translation_time, 1),
+        "statements_per_second" : round(generated.statements / translation_time, 1),
+        "process_peak_rss_kb"   : max((values["process_peak_rss_kb"] or 0 for values in phases.values()), default=0) or None,
+        "phases"                : {phase: values["wall_time"] for phase, values in phases.items()}
+    }
+
+def write_case(case: dict, baseline: dict = None) -> None:
+    line : str = (f"{case['case']:<24}{case['lines']:>8} lines{case['statements']:>8} stmts"
+                  f"{case['translation_time']:>10.3f}s{case['lines_per_second']:>12.0f} lines/s"
+                  f"{case['statements_per_second']:>12.0f} stmts/s{case['process_peak_rss_kb'] or 0:>10} KiB")
+
+    if baseline is not None:
+        line += f"   x{case['lines_per_second'] / baseline['lines_per_second']:.2f} vs {baseline['lines_per_second']:.0f} lines/s"
+
+    print(line)
+
+def main():
+    arguments : argparse.Namespace = get_arguments()
+
+    baseline_cases : Dict[str, dict] = {}
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline_cases = {case["case"] : case for case in json.load(baseline_file)["cases"]}
+
+    cases : List[dict] = []
+
+    with tempfile.TemporaryDirectory(prefix="vhdl_benchmark_") as work_dir:
+        os.makedirs(os.path.join(work_dir, "result"))
+
+        # Builds a DFA cache in the work directory, so warm runs measure a warm parser and
+        # neither read nor change the cache of the user
+        if not arguments.cold:
+            run_case(work_dir, "warmup", BASELINE, 1, False)
+
+        for sweep in arguments.sweep or list(SWEEPS):
+            for value in SWEEPS[sweep]:
+                name : str = f"{sweep}_{value}"
+
+                case : dict = run_case(work_dir, name, replace(BASELINE, **{sweep: value}), arguments.repeat, arguments.cold)
+                cases.append(case)
+
+                write_case(case, baseline_cases.get(name))
+
+    revision : str = get_revision()
+    output_path : str = arguments.output or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{revision}.json")
+
+    output_dir : str = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    with open(output_path, 'w') as output_file:
+        json.dump({
+            "revision"  : revision,
+            "date"      : time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python"    : sys.version.split()[0],
+            "cold"      : arguments.cold,
+            "repeat"    : arguments.repeat,
+            "cases"     : cases
+        }, output_file, indent=4)
+
+    print(f"Results written to {output_path}")
+
+if __name__ == "__main__":
+    main()
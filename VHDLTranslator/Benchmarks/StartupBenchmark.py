@@ -0,0 +1,134 @@
+'''
+Startup benchmark of the command line. Measures the wall time of --help, of a run
+that only hits the translation cache and of a translation that parses, and records
+whether the generated parser was imported. Run from the VHDLTranslator folder:
+
+    python -m Benchmarks.StartupBenchmark
+    python -m Benchmarks.StartupBenchmark --compare Benchmarks/results/startup-<earlier run>.json
+
+Results are written to Benchmarks/results/startup-<date>-<revision>.json.
+'''
+
+import os, sys
+import json
+import time
+import argparse
+import statistics
+import tempfile
+import subprocess
+
+from typing import Dict, List
+
+from Benchmarks.ScalingBenchmark import TRANSLATOR_PATH, RESULTS_DIR, get_environment, get_revision
+from Benchmarks.VHDLGenerator import VHDLGenerator, GeneratorParameters
+
+HEAVY_MODULES = ("ANTLR.vhdlParser", "ANTLR.vhdlLexer", "CustomVhdlVisitor", "ResultCreators.ActionCreator", "chardet")
+
+def get_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="Measure the startup time of VHDLTranslator.py")
+
+    argument_parser.add_argument("--repeat", type=int, default=10, help="runs per case")
+    argument_parser.add_argument("--compare", help="earlier result file to compare the times with")
+    argument_parser.add_argument("--output", help="result file (default: Benchmarks/results/startup-<date>-<revision>.json)")
+
+    return argument_parser.parse_args()
+
+def run_translator(work_dir: str, arguments: List[str], import_time: bool = False) -> subprocess.CompletedProcess:
+    command : List[str] = [sys.executable] + (["-X", "importtime"] if import_time else []) + [TRANSLATOR_PATH] + arguments
+
+    completed = subprocess.run(command, cwd=work_dir, env=get_environment(work_dir), capture_output=True, text=True)
+
+    if completed.returncode != 0:
+        raise RuntimeError(f"{' '.join(arguments)} failed:\n{completed.stderr}")
+
+    return completed
+
+def get_imported_modules(work_dir: str, arguments: List[str]) -> List[str]:
+    # -X importtime writes one "import time: self | cumulative | module" line per imported module
+    stderr : str = run_translator(work_dir, arguments, True).stderr
+
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
+def run_case(work_dir: str, name: str, arguments: List[str], repeat: int) -> dict:
+    times : List[float] = []
+
+    for _ in range(repeat):
+        start : float = time.perf_counter()
+        run_translator(work_dir, arguments)
+        times.append(time.perf_counter() - start)
+
+    modules : List[str] = get_imported_modules(work_dir, arguments)
+
+    return {
+        "case"          : name,
+        "arguments"     : arguments,
+        "min_time"      : round(min(times), 6),
+        "median_time"   : round(statistics.median(times), 6),
+        "modules"       : len(modules),
+        "heavy_modules" : [module for module in HEAVY_MODULES if module in modules]
+    }
+
+def write_case(case: dict, baseline: dict = None) -> None:
+    line : str = f"{case['case']:<16}{case['min_time']:>9.3f}s min{case['median_time']:>9.3f}s median{case['modules']:>6} modules   {', '.join(case['heavy_modules']) or '-'}"
+
+    if baseline is not None:
+        line += f"   x{baseline['median_time'] / case['median_time']:.2f} vs {baseline['median_time']:.3f}s"
+
+    print(line)
+
+def main():
+    arguments : argparse.Namespace = get_arguments()
+
+    baseline_cases : Dict[str, dict] = {}
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline_cases = {case["case"] : case for case in json.load(baseline_file)["cases"]}
+
+    cases : List[dict] = []
+
+    with tempfile.TemporaryDirectory(prefix="vhdl_startup_") as work_dir:
+        os.makedirs(os.path.join(work_dir, "result"))
+
+        vhdl_path : str = os.path.join(work_dir, "startup.vhd")
+
+        with open(vhdl_path, 'w') as vhdl_file:
+            vhdl_file.write(VHDLGenerator(GeneratorParameters()).generate().text)
+
+        # Fills the translation and DFA caches for the cache_hit case, both are kept in the work directory
+        run_translator(work_dir, [vhdl_path])
+
+        for name, case_arguments in (
+            ("help",        ["--help"]),
+            ("cache_hit",   [vhdl_path]),
+            ("translation", ["--no-cache", vhdl_path])
+        ):
+            case : dict = run_case(work_dir, name, case_arguments, arguments.repeat)
+            cases.append(case)
+
+            write_case(case, baseline_cases.get(name))
+
+    revision : str = get_revision()
+    output_path : str = arguments.output or os.path.join(RESULTS_DIR, f"startup-{time.strftime('%Y%m%d-%H%M%S')}-{revision}.json")
+
+    output_dir : str = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    with open(output_path, 'w') as output_file:
+        json.dump({
+            "revision"  : revision,
+            "date"      : time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python"    : sys.version.split()[0],
+            "repeat"    : arguments.repeat,
+            "cases"     : cases
+        }, output_file, indent=4)
+
+    print(f"Results written to {output_path}")
+
+if __name__ == "__main__":
+    main()
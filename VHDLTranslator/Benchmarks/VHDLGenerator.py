@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class GeneratorParameters():
+    entities            : int = 1      # entity/architecture pairs in one file
+    processes           : int = 4      # processes per architecture
+    nesting_depth       : int = 2      # if/case levels around every assignment
+    signals             : int = 8      # input ports and internal signals per entity
+    fsm_states          : int = 4      # states of the FSM driven by every process
+    expression_length   : int = 4      # operands of every condition and right-hand side
+
+@dataclass
+class GeneratedFile():
+    text        : str
+    lines       : int
+    statements  : int   # processes and sequential statements
+
+class VHDLGenerator():
+    '''
+    Synthetic VHDL in the style of the examples: clocked FSM processes with an
+    asynchronous reset, a case over the state and nested if/case statements around
+    signal assignments. Every size the translator depends on is one parameter, so a
+    benchmark can scale them one at a time.
+    '''
+
+    _operators = ("and", "or", "xor")
+
+    def __init__(self, parameters: GeneratorParameters):
+        self.parameters : GeneratorParameters = parameters
+
+        self.__lines        : List[str] = []
+        self.__statements   : int = 0
+
+    def generate(self) -> GeneratedFile:
+        self.__lines = []
+        self.__statements = 0
+
+        self.__write(0, "library ieee;")
+        self.__write(1, "use ieee.std_logic_1164.all;")
+        self.__write(0, "")
+
+        for entity in range(self.parameters.entities):
+            self.__write_entity(entity)
+            self.__write_architecture(entity)
+
+        return GeneratedFile("\n".join(self.__lines) + "\n", len(self.__lines), self.__statements)
+
+    def __write(self, indent: int, line: str) -> None:
+        self.__lines.append("\t" * indent + line)
+
+    def __write_entity(self, entity: int) -> None:
+        self.__write(0, f"entity bench_{entity} is")
+        self.__write(1, "port(")
+        self.__write(2, "i_clk\t\t: in std_logic;")
+        self.__write(2, "i_rst\t\t: in std_logic;")
+
+        for signal in range(self.parameters.signals):
+            self.__write(2, f"i_data_{signal}\t: in std_logic;")
+
+        self.__write(2, "o_rdy\t\t: out std_logic")
+        self.__write(1, ");")
+        self.__write(0, f"end bench_{entity};")
+        self.__write(0, "")
+
+    def __write_architecture(self, entity: int) -> None:
+        states : str = ", ".join(f"st_{state}" for state in range(self.parameters.fsm_states))
+
+        self.__write(0, f"architecture arch of bench_{entity} is")
+        self.__write(1, f"type fsm is ({states});")
+
+        for process in range(self.parameters.processes):
+            self.__write(1, f"signal state_{process} : fsm := st_0;")
+
+        for signal in range(self.parameters.signals):
+            self.__write(1, f"signal s_{signal} : std_logic := '0';")
+
+        self.__write(0, "begin")
+
+        for process in range(self.parameters.processes):
+            self.__write_process(process)
+
+        self.__write(0, "end arch;")
+        self.__write(0, "")
+
+    def __write_process(self, process: int) -> None:
+        self.__statements += 3  # process, reset if, case
+
+        self.__write(1, "process(i_clk, i_rst)")
+        self.__write(1, "begin")
+        self.__write(2, "if (i_rst = '1') then")
+        self.__write_assignment(3, f"state_{process}", "st_0")
+        self.__write_assignment(3, "o_rdy", "'0'")
+        self.__write(2, "elsif (i_clk'event and i_clk = '1') then")
+        self.__write(3, f"case state_{process} is")
+
+        for state in range(self.parameters.fsm_states):
+            seed : int = process * self.parameters.fsm_states + state
+            next_state : int = (state + 1) % self.parameters.fsm_states
+
+            self.__write(4, f"when st_{state} =>")
+            self.__write_nested(5, self.parameters.nesting_depth, seed)
+            self.__write_assignment(5, f"state_{process}", f"st_{next_state}")
+
+        self.__write(4, "when others =>")
+        self.__write_assignment(5, f"state_{process}", "st_0")
+        self.__write(3, "end case;")
+        self.__write(2, "end if;")
+        self.__write(1, "end process;")
+        self.__write(0, "")
+
+    def __write_nested(self, indent: int, depth: int, seed: int) -> None:
+        target : str = f"s_{seed % self.parameters.signals}"
+
+        if depth == 0:
+            self.__write_assignment(indent, target, self.__get_expression(seed))
+            return
+
+        self.__statements += 1
+
+        # Levels alternate between if and case, the else branch stays flat so the size grows linearly with the depth
+        if depth % 2 == 0:
+            self.__write(indent, f"if ({self.__get_expression(seed + depth)}) = '1' then")
+            self.__write_nested(indent + 1, depth - 1, seed + 1)
+            self.__write(indent, "else")
+            self.__write_assignment(indent + 1, target, "'0'")
+            self.__write(indent, "end if;")
+        else:
+            self.__write(indent, f"case i_data_{(seed + depth) % self.parameters.signals} is")
+            self.__write(indent + 1, "when '1' =>")
+            self.__write_nested(indent + 2, depth - 1, seed + 1)
+            self.__write(indent + 1, "when others =>")
+            self.__write_assignment(indent + 2, target, "'1'")
+            self.__write(indent, "end case;")
+
+    def __write_assignment(self, indent: int, target: str, expression: str) -> None:
+        self.__statements += 1
+        self.__write(indent, f"{target} <= {expression};")
+
+    def __get_expression(self, seed: int) -> str:
+        operands : List[str] = [
+            f"i_data_{(seed + operand) % self.parameters.signals}" if operand % 2 == 0 else f"s_{(seed + operand) % self.parameters.signals}"
+            for operand in range(self.parameters.expression_length)
+        ]
+
+        # VHDL only chains a logical operator with itself without parentheses
+        operator : str = VHDLGenerator._operators[seed % len(VHDLGenerator._operators)]
+        return f" {operator} ".join(operands)
@@ -1,4 +1,4 @@
-from VHDL.VHDLStatements import ProcessStatement, SignalAssignment, VariableAssignment
+import os
 
 
 vhdl_types = {
@@ -22,6 +22,65 @@ vhdl_types = {
 
 MODULE = "module"
 
-CONCURRENT_STATEMENTS = [ProcessStatement]
+# CONCURRENT_STATEMENTS and SIMPLE_ASSIGN_STATEMENTS hold statement classes. They are
+# built on first use, so reading the other constants does not import the VHDL models
+def __getattr__(name: str):
+    from VHDL.VHDLStatements import ProcessStatement, SignalAssignment, VariableAssignment
 
-SIMPLE_ASSIGN_STATEMENTS = (SignalAssignment, VariableAssignment)
\ No newline at end of file
+    statement_constants : dict = {
+        "CONCURRENT_STATEMENTS"     : [ProcessStatement],
+        "SIMPLE_ASSIGN_STATEMENTS"  : (SignalAssignment, VariableAssignment)
+    }
+
+    if name not in statement_constants:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals().update(statement_constants)
+    return statement_constants[name]
+
+VHDL_EXTENSIONS = (".vhd", ".vhdl")
+RESULT_EXTENSIONS = (".act", ".behp", ".env_descript")
+
+ENCODING_DETECTION_SAMPLE_SIZE = 64 * 1024
+
+# Files from this size on are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 16 * 1024 * 1024
+INPUT_CHUNK_SIZE = 1024 * 1024
+
+# Write a trace line for every visited node, slows translation down considerably
+TRACE_VISITS = False
+
+# Visit counts and times per grammar rule, written with --rule-statistics
+RULE_STATISTICS_PATH = os.path.join("result", "rule_statistics.json")
+
+# Wall time and CPU time per file and translation phase, with the process peak memory, written with --phase-timing
+PHASE_TIMING_PATH = os.path.join("result", "phase_timing.json")
+
+# Lookahead, conflicts and time per parser decision, written with --decision-profile
+DECISION_PROFILE_PATH = os.path.join("result", "decision_profile.json")
+
+# Parse every design unit on its own instead of the whole file at once
+SPLIT_DESIGN_UNITS = True
+
+# Write every design to the result files right after it is visited, needs SPLIT_DESIGN_UNITS
+STREAM_DESIGNS = False
+
+# ANTLR prediction DFA cache, kept in the cache directory of the user instead of the working directory
+USE_DFA_CACHE = True
+DFA_CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "VHDLTranslator")
+DFA_CACHE_PATH = os.path.join(DFA_CACHE_DIR, "dfa.cache")
+DFA_CACHE_VERSION = 3
+DFA_CACHE_RECURSION_LIMIT = 100000
+
+# Translation cache
+USE_TRANSLATION_CACHE = True
+TRANSLATION_CACHE_PATH = os.path.join("result", "cache")
+TRANSLATION_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Watch mode, seconds without further changes before a burst of saves is translated
+# and seconds between scans when inotify is not available
+WATCH_DEBOUNCE = 0.2
+WATCH_POLL_INTERVAL = 0.5
+
+# Files whose design units are kept in memory for incremental translation in watch and server mode
+INCREMENTAL_MAX_FILES = 64
@@ -1,8 +1,10 @@
 import logging
 
 import re
-from typing import Tuple
+import hashlib
+from typing import Callable, Dict, Iterable, List, Tuple
 from Debug import Debug
+from PhaseTimer import PhaseTimer
 
 from ANTLR.vhdlVisitor import vhdlVisitor
 from ANTLR.vhdlParser import vhdlParser
@@ -10,6 +12,7 @@ from ANTLR.vhdlParser import vhdlParser
 from VHDL.VHDLData import *
 from VHDL.VHDLStatements import *
 from VHDL.VHDLDeclaration import *
+from VHDL.VHDLExpression import *
 
 import Constants as const
 
@@ -18,10 +21,11 @@ class CustomVhdlVisitor(vhdlVisitor):
     class StatementManager():
         def __init__(self, visitor):
             self.__visitor : CustomVhdlVisitor = visitor
-            self.output_log = Debug.get_logger("Visitor")
+            self.output_log = visitor.output_log
 
             self.__statement_name_mapping = {
                 ProcessStatement    : "process",
+                BlockStatement      : "block",
                 
                 IfStatement         : "if",
                 CaseStatement       : "case",
@@ -32,6 +36,7 @@ class CustomVhdlVisitor(vhdlVisitor):
 
             self.__behaviour_name_mapping = {
                 ProcessStatement    : "process",
+                BlockStatement      : "block",
 
                 IfStatement         : "if",
                 CaseStatement       : "case",
@@ -54,6 +59,12 @@ class CustomVhdlVisitor(vhdlVisitor):
             self.__behaviour_index = {cls: 0 for cls in self.__behaviour_name_mapping}
             self.__agent_index = {cls: 0 for cls in self.__agent_name_mapping}
 
+        def get_state(self) -> tuple:
+            return dict(self.__statement_index), dict(self.__behaviour_index), dict(self.__agent_index)
+
+        def set_state(self, state: tuple) -> None:
+            self.__statement_index, self.__behaviour_index, self.__agent_index = (dict(index) for index in state)
+
         def __get_statement_name(self, cls, ctx):
             if hasattr(ctx, "label_colon"):
                 if ctx.label_colon(): return self.__visitor.visit(ctx.label_colon())
@@ -107,10 +118,10 @@ class CustomVhdlVisitor(vhdlVisitor):
             return f"{parent.behaviour_name}_{name}_{index}"
 
         def __get_agent_name(self, cls, parent: VHDLStatement):
+            # Every entity and architecture is an agent of its own, in every design unit of the file
             if (cls in (Entity, Architecture)):
-                if self.__agent_index[cls] == 0:
-                    self.__agent_index[cls] += 1
-                    return self.__agent_name_mapping[cls]
+                self.__agent_index[cls] += 1
+                return self.__agent_name_mapping[cls]
             
             if cls in (ProcessStatement, BlockStatement):
                 self.__agent_index[cls] += 1
@@ -151,10 +162,111 @@ class CustomVhdlVisitor(vhdlVisitor):
         def __get_declaration_value(self, cls, ctx):
             ...
 
-    def __init__(self):
+    class SymbolTable():
+        '''
+        Hash index over vhdlData.agent_types. Every scope (statement_name, agent_name,
+        design_unit) keeps a dict of its declarations by name, and every name keeps the
+        scopes that declare it, so a lookup does not scan all declarations. design_unit is
+        the entity the scope belongs to, architectures of different entities in one file
+        often share their name and agent.
+
+        Scopes are linked to their enclosing scope (process -> block -> architecture ->
+        entity), names are resolved along that chain first, so inner declarations shadow
+        outer ones. Names not visible in the chain (e.g. from packages) fall back to the
+        earliest created scope that declares them, like the scan in agent_types order.
+        '''
+
+        def __init__(self):
+            self.__scopes       : Dict[Tuple[str, str, str], Dict[str, VHDLDeclaration]] = {}
+            self.__scope_order  : Dict[Tuple[str, str, str], int] = {}
+            self.__symbols      : Dict[str, Dict[Tuple[str, str, str], int]] = {}
+
+            self.__parents      : Dict[Tuple[str, str, str], Tuple[str, str, str]] = {}
+            self.__scope_stack  : List[Tuple[str, str, str]] = []
+            self.__entities     : Dict[str, Tuple[str, str, str]] = {}
+
+        def get_state(self) -> tuple:
+            return (
+                {scope : dict(declarations) for scope, declarations in self.__scopes.items()},
+                dict(self.__scope_order),
+                {name : dict(scopes) for name, scopes in self.__symbols.items()},
+                dict(self.__parents),
+                list(self.__scope_stack),
+                dict(self.__entities)
+            )
+
+        def set_state(self, state: tuple) -> None:
+            scopes, scope_order, symbols, parents, scope_stack, entities = state
+
+            self.__scopes       = {scope : dict(declarations) for scope, declarations in scopes.items()}
+            self.__scope_order  = dict(scope_order)
+            self.__symbols      = {name : dict(scopes) for name, scopes in symbols.items()}
+            self.__parents      = dict(parents)
+            self.__scope_stack  = list(scope_stack)
+            self.__entities     = dict(entities)
+
+        def get_scope(self, statement: VHDLStatement, design_unit: str = None) -> Tuple[str, str, str]:
+            # design_unit defaults to the one of the scope the statement is nested in
+            if design_unit is None:
+                return (statement.statement_name, statement.agent_name, self.__scope_stack[-1][2] if self.__scope_stack else None)
+
+            return (statement.statement_name, statement.agent_name, design_unit.lower())
+
+        def add_entity(self, entity_name: str, scope: Tuple[str, str, str]) -> None:
+            self.__entities[entity_name.lower()] = scope
+
+        def get_entity(self, entity_name: str) -> Tuple[str, str, str]:
+            return self.__entities.get(entity_name.lower())
+
+        def enter_scope(self, scope: Tuple[str, str, str], parent_scope: Tuple[str, str, str] = None) -> None:
+            # parent_scope defaults to the scope the statement is nested in
+            if parent_scope is None and self.__scope_stack:
+                parent_scope = self.__scope_stack[-1]
+
+            self.__parents[scope] = parent_scope
+            self.__scope_stack.append(scope)
+
+        def exit_scope(self) -> None:
+            self.__scope_stack.pop()
+
+        def add_declarations(self, scope: Tuple[str, str, str], declaration_list: List[VHDLDeclaration]) -> None:
+            # Declarations are added one declarative item at a time, the first one of a name wins
+            order : int = self.__scope_order.setdefault(scope, len(self.__scope_order))
+            declarations : Dict[str, VHDLDeclaration] = self.__scopes.setdefault(scope, {})
+
+            for declaration in declaration_list:
+                name : str = getattr(declaration, "name", None)
+
+                if name is not None and name not in declarations:
+                    declarations[name] = declaration
+                    self.__symbols.setdefault(name, {})[scope] = order
+
+        def find_scope(self, name: str) -> Tuple[str, str, str]:
+            scopes : Dict[Tuple[str, str, str], int] = self.__symbols.get(name)
+
+            if not scopes:
+                return None
+
+            scope : Tuple[str, str, str] = self.__scope_stack[-1] if self.__scope_stack else None
+
+            while scope is not None:
+                if scope in scopes:
+                    return scope
+
+                scope = self.__parents.get(scope)
+
+            return min(scopes, key=scopes.get)
+
+        def find_declaration(self, name: str) -> VHDLDeclaration:
+            scope : Tuple[str, str, str] = self.find_scope(name)
+            return self.__scopes[scope][name] if scope is not None else None
+
+    def __init__(self, output_log: logging.Logger = None):
+        self.output_log         = output_log or Debug.get_logger("Visitor")
         self.vhdlData           = self._initialize_vhdl_data()
+        self.symbol_table       = self.SymbolTable()
+        self.expression_pool    = ExpressionPool()
         self.statement_manager  = self.StatementManager(self)
-        self.output_log         = Debug.get_logger("Visitor")
 
     def visitDesign_file(self, ctx:vhdlParser.Design_fileContext):
         '''
@@ -173,6 +285,30 @@ class CustomVhdlVisitor(vhdlVisitor):
         self.vhdlData.design_list = design_list
 
         self.output_log.debug(f"{len(design_list)} designs found")
+        self.expression_pool.write_statistics_to_log(self.output_log)
+
+    def visit_design_units(self, design_units: Iterable[vhdlParser.Design_unitContext], design_callback: Callable[[VHDLDesign], None] = None):
+        '''
+        Same as visitDesign_file for design units that were parsed one by one.
+        With design_callback every design is handed over as soon as it is visited
+        and is not kept in vhdlData.design_list, nor are its pooled expressions.
+        '''
+
+        design_count : int = 0
+
+        for design_unit in design_units:
+            with PhaseTimer.measure("visiting"):
+                design : VHDLDesign = self.visit(design_unit)
+            design_count += 1
+
+            if design_callback is None:
+                self.vhdlData.design_list.append(design)
+            else:
+                design_callback(design)
+                self.expression_pool.release()
+
+        self.output_log.debug(f"{design_count} designs found")
+        self.expression_pool.write_statistics_to_log(self.output_log)
     
     def visitDesign_unit(self, ctx:vhdlParser.Design_unitContext) -> VHDLDesign:
         '''
@@ -254,16 +390,20 @@ class CustomVhdlVisitor(vhdlVisitor):
         Debug.write_visit_to_log(self.output_log, "Entity_declaration")
         
         statement_info : VHDLStatement = VHDLStatement.from_tuple(Entity, None, self.statement_manager.get_statement_general_info(Entity, ctx, None))
-        self.output_log.debug(f"entity - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"entity - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
 
         generic, port = self.visitEntity_header(ctx.entity_header(), statement_info.agent_name)
 
         entity = Entity(statement_info, generic, port)
+        scope  : Tuple[str, str, str] = self.symbol_table.get_scope(statement_info, ctx.identifier(0).getText())
         
-        self.append_declarations(generic, entity)
-        self.append_declarations(port, entity)
+        self.append_declarations(generic, entity, scope)
+        self.append_declarations(port, entity, scope)
         self.append_agent(statement_info)
 
+        self.symbol_table.add_entity(ctx.identifier(0).getText(), scope)
+
         return entity
 
     def visitEntity_header(self, ctx:vhdlParser.Entity_headerContext, agent_name: str) -> Tuple[List[Generic], List[Port]]:
@@ -302,7 +442,8 @@ class CustomVhdlVisitor(vhdlVisitor):
         for declaration in ctx.interface_constant_declaration():
             generic_list.extend(self.visitInterface_constant_declaration(declaration, agent_name))
         
-        self.output_log.debug(f"{len(generic_list)} generic elements was found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(generic_list)} generic elements was found")
         return generic_list
 
     def visitInterface_constant_declaration(self, ctx:vhdlParser.Interface_constant_declarationContext, agent_name: str = None) -> List[Generic]:
@@ -321,7 +462,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         expression_with_agents  : str = None
 
         subtype_indication, subtype_indication_js = self.visit(ctx.subtype_indication())
-        expression, expression_with_agents = self.visit(ctx.expression()) if ctx.expression() else (None, None)
+        expression, expression_with_agents = self.visit(ctx.expression()).get_renderings() if ctx.expression() else (None, None)
 
         generic_list : List[Generic] = [
             Generic(identifier, const.MODULE, subtype_indication, subtype_indication_js, expression, expression_with_agents)
@@ -365,7 +506,8 @@ class CustomVhdlVisitor(vhdlVisitor):
         for declaration in ctx.interface_port_declaration():
             port_list.extend(self.visitInterface_port_declaration(declaration, agent_name))
         
-        self.output_log.debug(f"{len(port_list)} port elements was found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(port_list)} port elements was found")
         return port_list
 
     def visitInterface_port_declaration(self, ctx:vhdlParser.Interface_port_declarationContext, agent_name: str = None) -> List[Port]:
@@ -388,7 +530,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         subtype_indication, subtype_indication_js = self.visit(ctx.subtype_indication())
 
         if ctx.expression():
-            expression, expression_with_agents = self.visit(ctx.expression())
+            expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
 
         for identifier in identifier_list :
             port : Port = Port(identifier, "module", signal_mode, subtype_indication, subtype_indication_js, expression, expression_with_agents)
@@ -417,15 +559,21 @@ class CustomVhdlVisitor(vhdlVisitor):
         Debug.write_visit_to_log(self.output_log, "Architecture_body")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(Architecture, None, self.statement_manager.get_statement_general_info(Architecture, ctx, None))
-        self.output_log.debug(f"architecture - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"architecture - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         self.append_agent(statement_info)
 
+        # Ports and generics of the entity are visible in its architectures
+        self.symbol_table.enter_scope(self.symbol_table.get_scope(statement_info, ctx.identifier(1).getText()), self.symbol_table.get_entity(ctx.identifier(1).getText()))
+
         architecture_declarative_part : List[VHDLDeclaration] = []
         architecture_statement_part   : List[VHDLStatement] = []
 
         architecture_declarative_part = self.visitArchitecture_declarative_part(ctx.architecture_declarative_part(), statement_info)
         architecture_statement_part = self.visitArchitecture_statement_part(ctx.architecture_statement_part(), statement_info)
 
+        self.symbol_table.exit_scope()
+
         architecture : Architecture = Architecture(statement_info, architecture_declarative_part, architecture_statement_part)
 
         return architecture
@@ -569,7 +717,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         subtype_indication, subtype_indication_js = self.visit(ctx.subtype_indication())
 
         if ctx.expression():
-            expression, expression_with_agents = self.visit(ctx.expression())
+            expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
 
         for identifier in identifier_list:
             constant : ConstantDeclaration = ConstantDeclaration(identifier, agent_name, subtype_indication, subtype_indication_js, expression, expression_with_agents)
@@ -604,7 +752,7 @@ class CustomVhdlVisitor(vhdlVisitor):
             signal_kind = ctx.signal_kind().getText()
 
         if ctx.expression():
-            expression, expression_with_agents = self.visit(ctx.expression())
+            expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
 
         if len(identifier_list) > 1:
             for identifier in identifier_list:
@@ -634,7 +782,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         subtype_indication, subtype_indication_js = self.visit(ctx.subtype_indication())
 
         if ctx.expression():
-            expression, expression_with_agents = self.visit(ctx.expression())
+            expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
 
         for identifier in identifier_list:
             variable : VariableDeclaration = VariableDeclaration(identifier, agent_name, subtype_indication, subtype_indication_js, expression, expression_with_agents)
@@ -1042,18 +1190,25 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         Debug.write_visit_to_log(self.output_log, "Block_statement")
 
-        statement_info : VHDLStatement = VHDLStatement.from_tuple(BlockStatement, parent, self.statement_manager.get_statement_general_info(BlockStatement, ctx))
+        statement_info : VHDLStatement = VHDLStatement.from_tuple(BlockStatement, parent, self.statement_manager.get_statement_general_info(BlockStatement, ctx, parent))
+
+        self.symbol_table.enter_scope(self.symbol_table.get_scope(statement_info))
 
         expression              : str = None
         expression_with_agents  : str = None
         block_header            : None = self.visit(ctx.block_header())
-        declarations            : List[VHDLDeclaration] = self.visitBlock_declarative_part(ctx.block_declarative_part(), parent)
-        statements              : List[VHDLStatement] = self.visitBlock_statement_part(ctx.block_statement_part(), parent)
+        declarations            : List[VHDLDeclaration] = self.visitBlock_declarative_part(ctx.block_declarative_part(), statement_info)
+        statements              : List[VHDLStatement] = self.visitBlock_statement_part(ctx.block_statement_part(), statement_info)
 
         if ctx.expression():
-            expression, expression_with_agents = self.visit(ctx.expression())
+            expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
+
+        self.symbol_table.exit_scope()
+
+        if Debug.trace:
+            self.output_log.debug(f"block - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
 
-        self.output_log.debug(f"block - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        self.append_agent(statement_info)
         
         return BlockStatement(statement_info, expression, expression_with_agents, block_header, declarations, statements)
 
@@ -1069,9 +1224,15 @@ class CustomVhdlVisitor(vhdlVisitor):
         declaration_list : List[VHDLDeclaration] = []
 
         for declaration in ctx.block_declarative_item():
-            declaration_list.append(self.visitBlock_declarative_item(declaration, parent))
+            declarative_item = self.visitBlock_declarative_item(declaration, parent)
+
+            if isinstance(declarative_item, List):
+                declaration_list.extend(declarative_item)
+            else:
+                declaration_list.append(declarative_item)
 
-        self.output_log.debug(f"{len(ctx.block_declarative_item())} declarations found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(ctx.block_declarative_item())} declarations found")
 
         return declaration_list
     
@@ -1185,9 +1346,10 @@ class CustomVhdlVisitor(vhdlVisitor):
         '''
         Debug.write_visit_to_log(self.output_log, "Block_statement_part")
 
-        self.output_log.debug(f"{len(ctx.architecture_statement())} statements found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(ctx.architecture_statement())} statements found")
 
-        return self.visitChildren(ctx)
+        return [self.visitArchitecture_statement(statement, parent) for statement in ctx.architecture_statement()]
 
     #endregion
 
@@ -1206,16 +1368,21 @@ class CustomVhdlVisitor(vhdlVisitor):
         Debug.write_visit_to_log(self.output_log, "Process_statement")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(ProcessStatement, parent, self.statement_manager.get_statement_general_info(ProcessStatement, ctx, parent))
-        self.output_log.debug(f"process - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"process - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
 
         sensitivity_list                : List[str] = None
         sensitivity_list_with_agents    : List[str] = None
 
+        self.symbol_table.enter_scope(self.symbol_table.get_scope(statement_info))
+
         declarations    : List[VHDLDeclaration] = self.visitProcess_declarative_part(ctx.process_declarative_part(), statement_info)
         statements      : List[VHDLStatement] = self.visitProcess_statement_part(ctx.process_statement_part(), statement_info)
         
         if ctx.sensitivity_list():
             sensitivity_list, sensitivity_list_with_agents = self.visit(ctx.sensitivity_list())
+
+        self.symbol_table.exit_scope()
         
         process : ProcessStatement = ProcessStatement(statement_info, sensitivity_list, sensitivity_list_with_agents, declarations, statements)
 
@@ -1242,10 +1409,11 @@ class CustomVhdlVisitor(vhdlVisitor):
             temp = ctx.name(index).getText()
             agent = self.find_agent(temp)
 
-            sensitive_list.append(temp)
-            sensitive_list_with_agents.append(f"{agent}.{temp}" if agent is not None else f"{temp}")
+            sensitive_list.append(self.expression_pool.intern_text(temp))
+            sensitive_list_with_agents.append(self.expression_pool.intern_text(f"{agent}.{temp}" if agent is not None else f"{temp}"))
 
-        self.output_log.debug(f"{len(ctx.name())} sensitivities found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(ctx.name())} sensitivities found")
 
         return sensitive_list, sensitive_list_with_agents
 
@@ -1257,7 +1425,7 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
 
-        self.output_log.info("Process_declarative_part")
+        Debug.write_visit_to_log(self.output_log, "Process_declarative_part")
 
         declarations : List[VHDLDeclaration] = []
 
@@ -1271,7 +1439,8 @@ class CustomVhdlVisitor(vhdlVisitor):
             #else:
             #    declarations.append(declarative_item)
         
-        self.output_log.debug(f"{len(ctx.process_declarative_item())} declarations found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(ctx.process_declarative_item())} declarations found")
 
         self.append_declarations(declarations, parent)
 
@@ -1351,7 +1520,8 @@ class CustomVhdlVisitor(vhdlVisitor):
         for statement in ctx.sequential_statement():
             sequential_statements.append(self.visitSequential_statement(statement, process))
 
-        self.output_log.debug(f"{len(ctx.sequential_statement())} statements found")
+        if Debug.trace:
+            self.output_log.debug(f"{len(ctx.sequential_statement())} statements found")
 
         return sequential_statements
     
@@ -1427,17 +1597,18 @@ class CustomVhdlVisitor(vhdlVisitor):
         Debug.write_visit_to_log(self.output_log, "Signal_assignment_statement")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(SignalAssignment, parent, self.statement_manager.get_statement_general_info(SignalAssignment, ctx, parent))
-        self.output_log.debug(f"signal_assignment - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"signal_assignment - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
 
-        target : str = ctx.target().getText()
-        target_with_agent : str = f"{self.find_agent(target)}.{target}" if self.find_agent(target) is not None else target
+        target : str = self.expression_pool.intern_text(ctx.target().getText())
+        target_with_agent : str = self.expression_pool.intern_text(f"{self.find_agent(target)}.{target}" if self.find_agent(target) is not None else target)
 
         delay_mechanism : str = None
 
         waveform : str = None
         waveform_with_agents : str = None
 
-        waveform, waveform_with_agents = self.visitWaveform(ctx.waveform(), target)
+        waveform, waveform_with_agents = self.visitWaveform(ctx.waveform(), target).get_renderings()
 
         if ctx.delay_mechanism():
             delay_mechanism = ctx.target().getText()
@@ -1452,10 +1623,11 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
 
-        self.output_log.info("Variable_assignment_statement")
+        Debug.write_visit_to_log(self.output_log, "Variable_assignment_statement")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(VariableAssignment, parent, self.statement_manager.get_statement_general_info(VariableAssignment, ctx, parent))
-        self.output_log.debug(f"variable_assignment - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"variable_assignment - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         
         target                  : str = None
         target_with_agents      : str = None
@@ -1465,7 +1637,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         expression              : str = None
         expression_with_agents  : str = None
 
-        expression, expression_with_agents = self.visit(ctx.expression())
+        expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
 
         return VariableAssignment(statement_info, target, target_with_agents, expression, expression_with_agents)
     
@@ -1493,7 +1665,8 @@ class CustomVhdlVisitor(vhdlVisitor):
         Debug.write_visit_to_log(self.output_log, "Conditional_signal_assignment")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(ConditionalWaveform, parent, self.statement_manager.get_statement_general_info(ConditionalSignalAssignment, ctx, parent))
-        self.output_log.debug(f"conditional_assignment - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"conditional_assignment - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         
         target : str = None
         target_with_agent : str = None
@@ -1517,7 +1690,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         waveform                : str = None
         waveform_with_agents    : str = None
 
-        waveform, waveform_with_agents = self.visit(ctx.waveform())
+        waveform, waveform_with_agents = self.visit(ctx.waveform()).get_renderings()
 
         condition               : str = None
         condition_with_agents   : str = None
@@ -1525,7 +1698,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         conditional_waveforms   : ConditionalWaveform = None
 
         if ctx.WHEN():
-            condition, condition_with_agents = self.visit(ctx.condition())
+            condition, condition_with_agents = self.visit(ctx.condition()).get_renderings()
             
         if ctx.ELSE():
             conditional_waveforms = self.visit(ctx.conditional_waveforms())
@@ -1554,14 +1727,15 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         selected_waveforms : SelectedWaveform = None
         
-        expression, expression_with_agents = self.visit(ctx.expression())
+        expression, expression_with_agents = self.visit(ctx.expression()).get_renderings()
         
         target, target_with_agent = self.visit(ctx.target())
         opts = ctx.opts().getText()
         
         selected_waveforms = self.visit(ctx.selected_waveforms())
     
-        self.output_log.debug(f"selected_assignment - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"selected_assignment - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         
         return SelectedSignalAssignment(statement_info, target, target_with_agent, opts, expression, expression_with_agents, selected_waveforms)
 
@@ -1581,8 +1755,8 @@ class CustomVhdlVisitor(vhdlVisitor):
         selected_waveforms : List[SelectedWaveform] = []
 
         for index in range(len(ctx.waveform())):
-            waveform, waveform_with_agents = self.visit(ctx.waveform(index))
-            choice, choice_with_agent = self.visit(ctx.choices(index))
+            waveform, waveform_with_agents = self.visit(ctx.waveform(index)).get_renderings()
+            choice, choice_with_agent = self.visit(ctx.choices(index)).get_renderings()
 
             selected_waveforms.append(SelectedWaveform(waveform, waveform_with_agents, choice, choice_with_agent))
 
@@ -1599,10 +1773,11 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
 
-        self.output_log.info("visit 'If_statement'")
+        Debug.write_visit_to_log(self.output_log, "If_statement")
         
         statement_info : VHDLStatement = VHDLStatement.from_tuple(IfStatement, parent, self.statement_manager.get_statement_general_info(IfStatement, ctx, parent))
-        self.output_log.debug(f"if - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"if - parent: {parent.statement_class}, statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         
         condition                   : str = None
         condition_with_agents       : str = None
@@ -1618,7 +1793,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         elsif_statements            : List[VHDLStatement] = []
         else_statements             : List[VHDLStatement] = []
         
-        temp, temp_with_agents = self.visit(ctx.condition(0))
+        temp, temp_with_agents = self.visit(ctx.condition(0)).get_renderings()
 
         condition = temp
         condition_with_agents = temp_with_agents
@@ -1627,7 +1802,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         
         i : int = 1
         for _ in range(len(ctx.ELSIF())):
-            temp, temp_with_agents = self.visit(ctx.condition(i))
+            temp, temp_with_agents = self.visit(ctx.condition(i)).get_renderings()
 
             elsif_condition = temp
             elsif_condition_with_agents = temp_with_agents
@@ -1652,21 +1827,24 @@ class CustomVhdlVisitor(vhdlVisitor):
         Debug.write_visit_to_log(self.output_log, "Case_statement")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(CaseStatement, parent, self.statement_manager.get_statement_general_info(CaseStatement, ctx, parent))
-        self.output_log.debug(f"case - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"case - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+
+        case_expression : Expression = self.visit(ctx.expression())
 
         expression : str = None
         expression_with_agents : str = None
 
-        expression, expression_with_agents = self.visit(ctx.expression())
+        expression, expression_with_agents = case_expression.get_renderings()
 
         case_alternatives : List[CaseAlternative] = []
 
         for case in ctx.case_statement_alternative():
-            case_alternatives.append(self.visitCase_statement_alternative(case, statement_info, expression_with_agents))
+            case_alternatives.append(self.visitCase_statement_alternative(case, statement_info, case_expression))
 
         return CaseStatement(statement_info, expression, expression_with_agents, case_alternatives)
     
-    def visitCase_statement_alternative(self, ctx:vhdlParser.Case_statement_alternativeContext, parent: VHDLStatement = None, case_expression: str = None) -> CaseAlternative:
+    def visitCase_statement_alternative(self, ctx:vhdlParser.Case_statement_alternativeContext, parent: VHDLStatement = None, case_expression: Expression = None) -> CaseAlternative:
         '''
         case_statement_alternative
             : WHEN choices ARROW sequence_of_statements
@@ -1679,13 +1857,15 @@ class CustomVhdlVisitor(vhdlVisitor):
         choices : str = None
         choices_with_agents : str = None
 
-        choices, choices_with_agents = self.visit(ctx.choices())
+        choices_expression : Expression = self.visit(ctx.choices())
 
-        choices_with_agents = f"{case_expression} == {choices_with_agents}"
+        choices, _ = choices_expression.get_renderings()
+        _, choices_with_agents = self.expression_pool.intern(Operation([case_expression, choices_expression], ["=="], ["=="])).get_renderings()
 
         statements : List[VHDLStatement] = self.visitSequence_of_statements(ctx.sequence_of_statements(), statement_info)
 
-        self.output_log.debug(f"case_alternative - choices:{len(choices)}, sequence_of_statements:{len(statements)}")
+        if Debug.trace:
+            self.output_log.debug(f"case_alternative - choices:{len(ctx.choices().choice())}, sequence_of_statements:{len(statements)}")
         
         return CaseAlternative(statement_info, choices, choices_with_agents, statements)
     #endregion
@@ -1742,7 +1922,7 @@ class CustomVhdlVisitor(vhdlVisitor):
             : (label_colon)? WAIT (sensitivity_clause)? (condition_clause)? (timeout_clause)? SEMI
             ;
         '''
-        self.output_log.info("visit 'Wait_statement'")
+        Debug.write_visit_to_log(self.output_log, "Wait_statement")
         
         statement_info : VHDLStatement = VHDLStatement.from_tuple(parent, self.statement_manager.get_statement_general_info(WaitStatement, ctx, parent))
 
@@ -1757,7 +1937,8 @@ class CustomVhdlVisitor(vhdlVisitor):
         if ctx.timeout_clause():
             timeout_clause = self.visit(ctx.timeout_clause())
 
-        self.output_log.info(f"wait - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"wait - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         return WaitStatement(statement_info, sensitivity_clause, condition_clause, timeout_clause)
         
         
@@ -1769,7 +1950,7 @@ class CustomVhdlVisitor(vhdlVisitor):
             : (label_colon)? REPORT expression (SEVERITY expression)? SEMI
             ;
         '''
-        self.output_log.info("visit 'Report_statement'")
+        Debug.write_visit_to_log(self.output_log, "Report_statement")
         
         statement_info : VHDLStatement = VHDLStatement.from_tuple(parent, self.statement_manager.get_statement_general_info(ReportStatement, ctx, parent))
 
@@ -1778,12 +1959,13 @@ class CustomVhdlVisitor(vhdlVisitor):
         severity_expression             : str = None
         severity_expression_with_agents : str = None
 
-        report_expression, report_expression_with_agents = self.visit(ctx.expression(0))
+        report_expression, report_expression_with_agents = self.visit(ctx.expression(0)).get_renderings()
 
         if ctx.expression(1):
-            severity_expression, severity_expression_with_agents = self.visit(ctx.expression(1))
+            severity_expression, severity_expression_with_agents = self.visit(ctx.expression(1)).get_renderings()
 
-        self.output_log.info(f"report - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"report - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         return ReportStatement(statement_info, report_expression, report_expression_with_agents, severity_expression, severity_expression_with_agents)
 
     def visitComponent_instantiation_statement(self, ctx:vhdlParser.Component_instantiation_statementContext):
@@ -1845,7 +2027,7 @@ class CustomVhdlVisitor(vhdlVisitor):
             condition : str = None
             condition_with_agents : str = None
 
-            condition, condition_with_agents = self.visit(ctx.condition())
+            condition, condition_with_agents = self.visit(ctx.condition()).get_renderings()
 
             return WhileScheme(condition, condition_with_agents)
 
@@ -1949,13 +2131,14 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
 
-        self.output_log.info("Assertion_statement")
+        Debug.write_visit_to_log(self.output_log, "Assertion_statement")
         
         statement_info : VHDLStatement = VHDLStatement.from_tuple(parent, self.statement_manager.get_statement_general_info(AssertionStatement, ctx, parent))
 
         assertion : None = self.visit(ctx.assertion())
 
-        self.output_log.info(f"assertion - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"assertion - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         
         return AssertionStatement(statement_info, assertion)
     
@@ -1968,11 +2151,12 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
         
-        self.output_log.info("visit 'Concurrent_assertion_statement'")
+        Debug.write_visit_to_log(self.output_log, "Concurrent_assertion_statement")
 
         statement_info : VHDLStatement = VHDLStatement.from_tuple(parent, self.statement_manager.get_statement_general_info(ConcurrentAssertionStatement, ctx, parent))
 
-        self.output_log.info(f"concurrent_assertion - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"concurrent_assertion - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
         return self.visitChildren(ctx)
     #endregion
 
@@ -1991,7 +2175,8 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         statement_name, behaviour_name, full_behaviour_name, agent_name = self.statement_manager.get_statement_general_info(ProcedureCallStatement, ctx)
 
-        self.output_log.debug(f"procedure_call_statement - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"procedure_call_statement - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
     
     def visitConcurrent_procedure_call_statement(self, ctx:vhdlParser.Concurrent_procedure_call_statementContext, parent: VHDLStatement = None):
         return self.visitChildren(ctx) # SKIP VISIT
@@ -2006,7 +2191,8 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         statement_name, behaviour_name, full_behaviour_name, agent_name = self.statement_manager.get_statement_general_info(ConcurrentProcedureCallStatement, ctx)
 
-        self.output_log.debug(f"concurrent_procedure_call - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
+        if Debug.trace:
+            self.output_log.debug(f"concurrent_procedure_call - statement_name:{statement_info.statement_name}, behaviour_name:{statement_info.behaviour_name}, full_behaviour_name:{statement_info.full_behaviour_name}, agent_name:{statement_info.agent_name}")
     
     def visitProcedure_call(self, ctx:vhdlParser.Procedure_callContext, parent: VHDLStatement = None):
         return self.visitChildren(ctx) # SKIP VISIT
@@ -2055,18 +2241,21 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         if ctx.selected_name(1):
             selected_name_2 = ctx.selected_name(1).getText()
-            print(f"selected_name_2: {selected_name_2}")
+            if Debug.trace:
+                self.output_log.debug(f"selected_name_2: {selected_name_2}")
 
         if ctx.constraint():
             constraint, length = self.visit(ctx.constraint())
-            print(f"constraint: {constraint}")
+            if Debug.trace:
+                self.output_log.debug(f"constraint: {constraint}")
 
         selected_name : str = ctx.selected_name(0).getText()
         selected_name_js : str = self.convert_subtype_to_js(selected_name, length)
 
         if ctx.tolerance_aspect():
             tolerance_aspect = ctx.tolerance_aspect().getText()
-            print(f"tolerance_aspect: {tolerance_aspect}")
+            if Debug.trace:
+                self.output_log.debug(f"tolerance_aspect: {tolerance_aspect}")
 
 
         return selected_name, selected_name_js
@@ -2104,77 +2293,61 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         return self.visit(ctx.range_decl())
 
-    def visitWaveform(self, ctx:vhdlParser.WaveformContext, target: str = None) -> Tuple[str, str]:
+    def visitWaveform(self, ctx:vhdlParser.WaveformContext, target: str = None) -> Expression:
         '''
         waveform
             : waveform_element (COMMA waveform_element)*
             | UNAFFECTED
             ;
         '''
-        
-        waveform                : str = None
-        waveform_with_agents    : str = None
-
-        temp                    : str = None
-        temp_with_agents        : str = None
 
         if ctx.waveform_element():
+            elements : List[Expression] = [
+                self.visitWaveform_element(element, target)
+                for element in ctx.waveform_element()
+            ]
 
-            temp, temp_with_agents = self.visitWaveform_element(ctx.waveform_element(0), target)
+            if len(elements) == 1:
+                return elements[0]
 
-            waveform = temp
-            waveform_with_agents = temp_with_agents
-
-            for index in range(len(ctx.COMMA())):
-                temp = self.visitWaveform_element(ctx.waveform_element(index+1), target)
-
-                waveform += f"{ctx.COMMA(index).getText()} {temp}"
-                waveform_with_agents = f"{ctx.COMMA(index).getText()} {self.find_agent(temp)}.{temp}"
-                
-            return waveform, waveform_with_agents
+            return self.expression_pool.intern(Aggregate(elements))
         
         if ctx.UNAFFECTED():
-            return ctx.UNAFFECTED().getText(), ctx.UNAFFECTED().getText()
+            return self.expression_pool.intern(Text(ctx.UNAFFECTED().getText(), ctx.UNAFFECTED().getText()))
 
-    def visitWaveform_element(self, ctx:vhdlParser.Waveform_elementContext, target: str = None) -> Tuple[str, str]:
+    def visitWaveform_element(self, ctx:vhdlParser.Waveform_elementContext, target: str = None) -> Expression:
         '''
         waveform_element
             : expression (AFTER expression)?
             ;
         '''
 
-        waveform_element : str = ""
-        waveform_element_with_agents : str = ""
-
-        temp : str = ""
-        temp_with_agents : str = ""
-        temp, temp_with_agents = self.visit(ctx.expression(0))
-
-        waveform_element += temp
-        waveform_element_with_agents += temp_with_agents
+        waveform_element : Expression = self.visit(ctx.expression(0))
         
         if ctx.AFTER():
-            temp, temp_with_agents = self.visit(ctx.exception(1))
-            waveform_element += f" {ctx.AFTER().getText()} {temp}"
-            waveform_element_with_agents += f" {ctx.AFTER().getText()} {temp_with_agents}"
+            after : str = ctx.AFTER().getText()
+            waveform_element = self.expression_pool.intern(Operation([waveform_element, self.visit(ctx.expression(1))], [after], [after]))
             
         # For VHDL build-in functions
         for function in VHDLFunctions:
-            if function.value in waveform_element and function not in self.vhdlData.build_in_functions:
-                self.vhdlData.build_in_functions.append(function)
+            if function in self.vhdlData.build_in_functions:
+                continue
+
+            if not any(function.value in leaf.get_text() for leaf in waveform_element.get_leaves()):
+                continue
 
-                if function is VHDLFunctions.conv_std_logic_vector:
-                    waveform_element_with_agents = self.vhdl_buildin_function_str_modifier(waveform_element_with_agents, VHDLFunctions.conv_std_logic_vector)
+            self.vhdlData.build_in_functions.append(function)
 
-        if "others ==" in waveform_element_with_agents:
-            #length = self.find_vector_length(target)
-            temp = waveform_element_with_agents.replace("others == ", "")
-            waveform_element_with_agents = f"{temp}"*8
-            waveform_element_with_agents = f"'{waveform_element_with_agents}'"
+            if function is VHDLFunctions.conv_std_logic_vector:
+                # Agents of the arguments are resolved now, in the scope of the assignment
+                waveform_element = self.expression_pool.intern(Text(
+                    waveform_element.get_text(),
+                    self.vhdl_buildin_function_str_modifier(waveform_element.get_text_with_agents(), VHDLFunctions.conv_std_logic_vector)
+                ))
 
-        return waveform_element, waveform_element_with_agents
+        return self.expression_pool.intern(WaveformElement(waveform_element))
 
-    def visitCondition(self, ctx:vhdlParser.ConditionContext) -> Tuple[str, str]:
+    def visitCondition(self, ctx:vhdlParser.ConditionContext) -> Expression:
         '''
         condition
             : expression
@@ -2183,7 +2356,7 @@ class CustomVhdlVisitor(vhdlVisitor):
         
         return self.visit(ctx.expression())
     
-    def visitExpression(self, ctx:vhdlParser.ExpressionContext) -> Tuple[str, str]:
+    def visitExpression(self, ctx:vhdlParser.ExpressionContext) -> Expression:
         '''
         // NOTE that NAND/NOR are in (...)* now (used to be in (...)?).
         // (21.1.2004, e.f.)
@@ -2192,148 +2365,109 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
 
-        expression              : str = ""
-        expression_with_agents  : str = ""
+        relation : Expression = self.visit(ctx.relation(0))
 
-        logical_operator    : str = ""
-        logical_operator_js : str = ""
+        if not ctx.logical_operator():
+            return relation
 
-        temp                : str = ""
-        temp_with_agents    : str = ""
-
-        temp, temp_with_agents = self.visit(ctx.relation(0))
-
-        expression += temp
-        expression_with_agents += temp_with_agents
+        operands                : List[Expression] = [relation]
+        operators               : List[str] = []
+        operators_with_agents   : List[str] = []
         
         for index in range(len(ctx.logical_operator())):
-            temp, temp_with_agents = self.visit(ctx.relation(index+1))
             logical_operator, logical_operator_js = self.visit(ctx.logical_operator(index))
 
-            expression += f" {logical_operator} {temp}"
-            expression_with_agents += f" {logical_operator_js} {temp_with_agents}"
+            operands.append(self.visit(ctx.relation(index+1)))
+            operators.append(logical_operator)
+            operators_with_agents.append(logical_operator_js)
             
-        return expression, expression_with_agents
+        return self.expression_pool.intern(Operation(operands, operators, operators_with_agents))
 
-    def visitRelation(self, ctx:vhdlParser.RelationContext) -> Tuple[str, str]:
+    def visitRelation(self, ctx:vhdlParser.RelationContext) -> Expression:
         '''
         relation
             : shift_expression (: relational_operator shift_expression)?
             ;
         '''
         
-        relation                : str = ""
-        relation_with_agents    : str = ""
-
-        relational_operator     : str = ""
-        relational_operator_js  : str = ""
+        shift_expression : Expression = self.visit(ctx.shift_expression(0))
 
-        temp                : str = ""
-        temp_with_agents    : str = ""
+        if not ctx.relational_operator():
+            return shift_expression
 
-        temp, temp_with_agents = self.visit(ctx.shift_expression(0))
-        
-        relation = temp
-        relation_with_agents = temp_with_agents
-
-        if ctx.relational_operator():
-            temp, temp_with_agents = self.visit(ctx.shift_expression(1))
-            relational_operator, relational_operator_js = self.visit(ctx.relational_operator())
+        relational_operator, relational_operator_js = self.visit(ctx.relational_operator())
 
-            relation += f" {relational_operator} {temp}"
-            relation_with_agents += f" {relational_operator_js} {temp_with_agents}"
-        
-        return relation, relation_with_agents
+        return self.expression_pool.intern(Operation([shift_expression, self.visit(ctx.shift_expression(1))], [relational_operator], [relational_operator_js]))
     
-    def visitShift_expression(self, ctx:vhdlParser.Shift_expressionContext) -> Tuple[str, str]:
+    def visitShift_expression(self, ctx:vhdlParser.Shift_expressionContext) -> Expression:
         '''
         shift_expression
             : simple_expression (: shift_operator simple_expression)?
             ;
         '''
 
-        shift_expression : str = ""
-        shift_expression_with_agents : str = ""
-        
-        temp : str = ""
-        temp_with_agents : str = ""
-
-        temp, temp_with_agents = self.visit(ctx.simple_expression(0))
+        simple_expression : Expression = self.visit(ctx.simple_expression(0))
 
-        shift_expression += temp
-        shift_expression_with_agents += temp_with_agents
+        if not ctx.shift_operator():
+            return simple_expression
 
-        if ctx.shift_operator():
-            temp, temp_with_agents = self.visit(ctx.simple_expression(1))
+        shift_operator : str = ctx.shift_operator().getText()
 
-            shift_expression += f" {ctx.shift_operator().getText()} {temp}"
-            shift_expression_with_agents += f" {ctx.shift_operator().getText()} {temp_with_agents}"
-        
-        return shift_expression, shift_expression_with_agents
+        return self.expression_pool.intern(Operation([simple_expression, self.visit(ctx.simple_expression(1))], [shift_operator], [shift_operator]))
         
-    def visitSimple_expression(self, ctx:vhdlParser.Simple_expressionContext) -> Tuple[str, str]:
+    def visitSimple_expression(self, ctx:vhdlParser.Simple_expressionContext) -> Expression:
         '''
         simple_expression
             : (PLUS | MINUS)? term (: adding_operator term)*
             ;
         '''
         
-        simple_expression               : str = ""
-        simple_expression_with_agents   : str = ""
-
-        adding_operator : str = ""
-        adding_operator_js : str = ""
+        term : Expression = self.visit(ctx.term(0))
+        
+        if ctx.PLUS():
+            term = self.expression_pool.intern(Sign("+", term))
 
-        temp                : str = ""
-        temp_with_agents    : str = ""
+        if ctx.MINUS():
+            term = self.expression_pool.intern(Sign("-", term))
 
-        temp, temp_with_agents = self.visit(ctx.term(0))
-        
-        simple_expression += " + " if ctx.PLUS() else ""
-        simple_expression_with_agents += " + " if ctx.PLUS() else ""
+        if not ctx.adding_operator():
+            return term
 
-        simple_expression += " - " if ctx.MINUS() else ""
-        simple_expression_with_agents += " - " if ctx.MINUS() else ""
-        
-        simple_expression += temp
-        simple_expression_with_agents += temp_with_agents
+        operands                : List[Expression] = [term]
+        operators               : List[str] = []
+        operators_with_agents   : List[str] = []
         
         for index in range(len(ctx.adding_operator())):
-            temp, temp_with_agents = self.visit(ctx.term(index+1))
             adding_operator, adding_operator_js = self.visit(ctx.adding_operator(index))
 
-            simple_expression += f" {adding_operator} {temp}"
-            simple_expression_with_agents += f" {adding_operator_js} {temp_with_agents}"
+            operands.append(self.visit(ctx.term(index+1)))
+            operators.append(adding_operator)
+            operators_with_agents.append(adding_operator_js)
         
-        return simple_expression, simple_expression_with_agents
+        return self.expression_pool.intern(Operation(operands, operators, operators_with_agents))
 
-    def visitTerm(self, ctx:vhdlParser.TermContext):
+    def visitTerm(self, ctx:vhdlParser.TermContext) -> Expression:
         '''
         term
             : factor (: multiplying_operator factor)*
             ;
         '''
         
-        term : str = ""
-        term_with_agents : str = ""
+        factor : Expression = self.visit(ctx.factor(0))
 
-        temp        : str = ""
-        temp_with_agents : str = ""
+        if not ctx.multiplying_operator():
+            return factor
 
-        temp, temp_with_agents = self.visit(ctx.factor(0))
-        
-        term += temp
-        term_with_agents += temp_with_agents
+        operands    : List[Expression] = [factor]
+        operators   : List[str] = []
         
         for index in range(len(ctx.multiplying_operator())):
-            temp, temp_with_agents = self.visit(ctx.factor(index+1))
-
-            term += f" {ctx.multiplying_operator(index).getText()} {temp}"
-            term_with_agents += f" * {temp_with_agents}"
+            operands.append(self.visit(ctx.factor(index+1)))
+            operators.append(ctx.multiplying_operator(index).getText())
         
-        return term, term_with_agents
+        return self.expression_pool.intern(Operation(operands, operators, ["*"] * len(operators)))
 
-    def visitFactor(self, ctx:vhdlParser.FactorContext) -> Tuple[str, str]:
+    def visitFactor(self, ctx:vhdlParser.FactorContext) -> Expression:
         '''
         factor
             : primary (: DOUBLESTAR primary)?
@@ -2342,39 +2476,21 @@ class CustomVhdlVisitor(vhdlVisitor):
             ;
         '''
         
-        factor : str = ""
-        factor_with_agents : str = ""
-
-        temp : str = ""
-        temp_with_agents : str = ""
-
-        if ctx.primary(0):
-            temp, temp_with_agents = self.visit(ctx.primary(0))
+        primary : Expression = self.visit(ctx.primary(0))
 
-            factor += temp
-            factor_with_agents += temp_with_agents
-
-            if ctx.DOUBLESTAR():
-                temp, temp_with_agents = self.visit(ctx.primary(1))
-
-                factor += f" {ctx.DOUBLESTAR().getText()} {temp}"
-                factor_with_agents += f" ^= {temp_with_agents}"
+        if ctx.DOUBLESTAR():
+            return self.expression_pool.intern(Operation([primary, self.visit(ctx.primary(1))], [ctx.DOUBLESTAR().getText()], ["^="]))
         
+        # ABS and NOT are written after the primary, e.g. "x not x"
         if ctx.ABS():
-            temp, temp_with_agents = self.visit(ctx.primary(0))
-
-            factor += f" {ctx.ABS().getText()} {temp}"
-            factor_with_agents += f" {ctx.ABS().getText()} {temp_with_agents}"
+            return self.expression_pool.intern(Operation([primary, primary], [ctx.ABS().getText()], [ctx.ABS().getText()]))
         
         if ctx.NOT():
-            temp, temp_with_agents = self.visit(ctx.primary(0))
-
-            factor += f" {ctx.NOT().getText()} {temp}"
-            factor_with_agents += f" {ctx.NOT().getText()} {temp_with_agents}"
+            return self.expression_pool.intern(Operation([primary, primary], [ctx.NOT().getText()], [ctx.NOT().getText()]))
 
-        return factor, factor_with_agents
+        return primary
     
-    def visitPrimary(self, ctx:vhdlParser.PrimaryContext):
+    def visitPrimary(self, ctx:vhdlParser.PrimaryContext) -> Expression:
         '''
         primary
             : literal
@@ -2389,39 +2505,32 @@ class CustomVhdlVisitor(vhdlVisitor):
         if ctx.literal():
             literal : str = ctx.literal().getText().replace("'", "")
 
-            agent : str = self.find_agent(literal)
-
-            literal_with_agent : str = f"{agent}.{literal}" if agent is not None else literal
-            literal_with_agent = literal_with_agent.replace("'", "")
-
-            return literal, literal_with_agent
+            return self.expression_pool.intern(Literal(literal, self.find_agent(literal)))
 
         #???????
         if ctx.qualified_expression():
-            print("Primary qualified expression")
-            return ctx.qualified_expression().getText()
+            if Debug.trace:
+                self.output_log.debug("Primary qualified expression")
+            return self.expression_pool.intern(Text(ctx.qualified_expression().getText(), ctx.qualified_expression().getText()))
         
         if ctx.expression():
-            expression : str = ""
-            expression_with_agents : str = ""
-            expression, expression_with_agents = self.visit(ctx.expression())
-
-            return f"({expression})", f"({expression_with_agents})" 
+            return self.expression_pool.intern(Parenthesized(self.visit(ctx.expression())))
         
         #???????
         if ctx.allocator():
-            print("Primary allocator")
-            return ctx.allocator().getText()
+            if Debug.trace:
+                self.output_log.debug("Primary allocator")
+            return self.expression_pool.intern(Text(ctx.allocator().getText(), ctx.allocator().getText()))
         
         #???????
         if ctx.aggregate():
-            print("Primary aggregate")
+            if Debug.trace:
+                self.output_log.debug("Primary aggregate")
             return self.visit(ctx.aggregate())
         
         if ctx.name():
-            name    : str = ctx.name().getText()
-            agent   : str = self.find_agent(name)
-            return name, f"{agent}.{name}" if agent is not None else name
+            name : str = ctx.name().getText()
+            return self.expression_pool.intern(Name(name, self.find_agent(name)))
         
     def visitTarget(self, ctx:vhdlParser.TargetContext) -> Tuple[str, str]:
         '''
@@ -2432,9 +2541,9 @@ class CustomVhdlVisitor(vhdlVisitor):
         '''
         
         if ctx.name():
-            name    : str = ctx.name().getText()
+            name    : str = self.expression_pool.intern_text(ctx.name().getText())
             agent   : str = self.find_agent(name)
-            return name, f"{agent}.{name}" if agent is not None else name
+            return name, self.expression_pool.intern_text(f"{agent}.{name}" if agent is not None else name)
         
         if ctx.aggregate().getText():
             return ctx.aggregate().getText()
@@ -2482,86 +2591,47 @@ class CustomVhdlVisitor(vhdlVisitor):
 
         return self.visitChildren(ctx)
 
-    def visitAggregate(self, ctx:vhdlParser.AggregateContext) -> Tuple[str, str]:
+    def visitAggregate(self, ctx:vhdlParser.AggregateContext) -> Expression:
         '''
         aggregate
             : LPAREN element_association (COMMA element_association)* RPAREN
             ;
         '''
 
-        aggregate               : str = ""
-        aggregate_with_agents   : str = ""
-
-        temp                    : str = ""
-        temp_with_agents        : str = ""
-        
-        for index in range(len(ctx.element_association())):
-            temp, temp_with_agents = self.visit(ctx.element_association(index))
-            if index < len(ctx.element_association())-1:
-                temp += ", "
-                temp_with_agents += ", "
-
-            aggregate += temp
-            aggregate_with_agents += temp_with_agents
-            
-        return aggregate, aggregate_with_agents
+        return self.expression_pool.intern(Aggregate([
+            self.visit(element_association)
+            for element_association in ctx.element_association()
+        ]))
 
-    def visitElement_association(self, ctx:vhdlParser.Element_associationContext) -> Tuple[str, str]:
+    def visitElement_association(self, ctx:vhdlParser.Element_associationContext) -> Expression:
         '''
         element_association
             : (choices ARROW)? expression
             ;
         '''
 
-        element_association             : str = ""
-        element_association_with_agents : str = ""
-
-        choices                         : str = None
-        choices_with_agents             : str = None
-
-        expression                      : str = None
-        expression_with_agents          : str = None
-
-        if ctx.choices():
-            choices, choices_with_agents = self.visit(ctx.choices())
+        expression : Expression = self.visit(ctx.expression())
 
-        expression, expression_with_agents = self.visit(ctx.expression())
+        if not ctx.choices():
+            return expression
 
-        if choices is not None:
-            element_association             = f"{choices} => "
-            element_association_with_agents = f"{choices_with_agents} == "
+        return self.expression_pool.intern(Operation([self.visit(ctx.choices()), expression], ["=>"], ["=="]))
 
-        element_association             += expression
-        element_association_with_agents += expression_with_agents
-
-        return element_association, element_association_with_agents
-
-    def visitChoices(self, ctx:vhdlParser.ChoicesContext) -> Tuple[str, str]:
+    def visitChoices(self, ctx:vhdlParser.ChoicesContext) -> Expression:
         '''
         choices
             : choice (BAR choice)*
             ;
         '''
 
-        choices             : str = None
-        choices_with_agents : str = None
-
-        temp                : str = None
-        temp_with_agents    : str = None
+        choices : List[Expression] = [self.visit(choice) for choice in ctx.choice()]
 
-        for index in range(len(ctx.choice())):
-            if index == 0:
-                choices, choices_with_agents = self.visit(ctx.choice(0))
-                continue
-
-            temp, temp_with_agents = self.visit(ctx.choice(index))
+        if len(choices) == 1:
+            return choices[0]
 
-            choices += f" | {temp}"
-            choices_with_agents += f" | {temp_with_agents}"
-
-        return choices, choices_with_agents
+        return self.expression_pool.intern(Operation(choices, ["|"] * (len(choices)-1), ["|"] * (len(choices)-1)))
     
-    def visitChoice(self, ctx:vhdlParser.ChoiceContext) -> Tuple[str, str]:
+    def visitChoice(self, ctx:vhdlParser.ChoiceContext) -> Expression:
         '''
         choice
             : identifier
@@ -2572,17 +2642,18 @@ class CustomVhdlVisitor(vhdlVisitor):
         '''
 
         if ctx.identifier():
-            temp : str = ctx.identifier().getText()
-            return temp, f"{self.find_agent(temp)}.{temp}" if self.find_agent(temp) is not None else temp 
+            identifier : str = ctx.identifier().getText()
+            return self.expression_pool.intern(Name(identifier, self.find_agent(identifier)))
 
         if ctx.discrete_range():
-            return self.visit(ctx.discrete_range())
+            discrete_range, discrete_range_js = self.visit(ctx.discrete_range())
+            return self.expression_pool.intern(Text(str(discrete_range), str(discrete_range_js)))
 
         if ctx.simple_expression():
             return self.visit(ctx.simple_expression())
 
         if ctx.OTHERS():
-            return ctx.OTHERS().getText(), ctx.OTHERS().getText()
+            return self.expression_pool.intern(Text(ctx.OTHERS().getText(), ctx.OTHERS().getText()))
 
     def visitExplicit_range(self, ctx:vhdlParser.Explicit_rangeContext) -> Tuple[str, int]:
         '''
@@ -2594,15 +2665,13 @@ class CustomVhdlVisitor(vhdlVisitor):
         #simple_expression               : str = None
         #simple_expression_with_agents   : str = None
         
-        simple_expression_1     : str = "" 
         simple_expression_js_1  : str = ""
-        simple_expression_2     : str = "" 
         simple_expression_js_2  : str = ""
 
-        simple_expression_1, simple_expression_js_1 = self.visitSimple_expression(ctx.simple_expression(0))
+        simple_expression_js_1 = self.visitSimple_expression(ctx.simple_expression(0)).get_text_with_agents()
 
         if ctx.direction():
-            simple_expression_2, simple_expression_js_2 = self.visitSimple_expression(ctx.simple_expression(1))
+            simple_expression_js_2 = self.visitSimple_expression(ctx.simple_expression(1)).get_text_with_agents()
             try:
                 return f"{simple_expression_js_1} {ctx.direction().getText()} {simple_expression_js_2}", abs(int(simple_expression_js_1) - int(simple_expression_js_2))+1
             except (TypeError, ValueError):
@@ -2775,15 +2844,144 @@ class CustomVhdlVisitor(vhdlVisitor):
     def get_vhdl_data(self) -> VHDLData :
         return self.vhdlData
 
+    def get_state(self) -> tuple:
+        '''
+        Copy of what a design unit leaves behind for the units after it: the name
+        counters, the symbol table and the agents, declarations and functions collected
+        so far. IncrementalTranslator continues a file from it after a cached unit.
+        '''
+
+        return (
+            self.statement_manager.get_state(),
+            self.symbol_table.get_state(),
+            (
+                {key : list(declarations) for key, declarations in self.vhdlData.agent_types.items()},
+                list(self.vhdlData.agents),
+                list(self.vhdlData.declarations),
+                list(self.vhdlData.build_in_functions)
+            )
+        )
+
+    def set_state(self, state: tuple) -> None:
+        statement_state, symbol_state, (agent_types, agents, declarations, build_in_functions) = state
+
+        self.statement_manager.set_state(statement_state)
+        self.symbol_table.set_state(symbol_state)
+
+        self.vhdlData.agent_types           = {key : list(declarations) for key, declarations in agent_types.items()}
+        self.vhdlData.agents                = list(agents)
+        self.vhdlData.declarations          = list(declarations)
+        self.vhdlData.build_in_functions    = list(build_in_functions)
+
+    @staticmethod
+    def get_state_delta(before: tuple, after: tuple) -> tuple:
+        '''
+        What a design unit changed in the state, in the shape of a state: the dict entries
+        it added or replaced and the items it appended to lists. The name counters and the
+        scope stack are small and are kept as they are after the unit. Nothing is ever
+        removed from the state, so apply_state_delta on the state before gives the one after.
+        '''
+
+        _, symbol_before, data_before = before
+        statement_state, symbol_after, data_after = after
+
+        scopes_before, scope_order_before, symbols_before, parents_before, _, entities_before = symbol_before
+        scopes, scope_order, symbols, parents, scope_stack, entities = symbol_after
+
+        agent_types_before, agents_before, declarations_before, build_in_functions_before = data_before
+        agent_types, agents, declarations, build_in_functions = data_after
+
+        get_dict_delta  = CustomVhdlVisitor.__get_dict_delta
+
+        return (
+            statement_state,
+            (
+                CustomVhdlVisitor.__get_nested_delta(scopes_before, scopes, get_dict_delta),
+                get_dict_delta(scope_order_before, scope_order),
+                CustomVhdlVisitor.__get_nested_delta(symbols_before, symbols, get_dict_delta),
+                get_dict_delta(parents_before, parents),
+                list(scope_stack),
+                get_dict_delta(entities_before, entities)
+            ),
+            (
+                CustomVhdlVisitor.__get_nested_delta(agent_types_before, agent_types, CustomVhdlVisitor.__get_list_delta),
+                CustomVhdlVisitor.__get_list_delta(agents_before, agents),
+                CustomVhdlVisitor.__get_list_delta(declarations_before, declarations),
+                CustomVhdlVisitor.__get_list_delta(build_in_functions_before, build_in_functions)
+            )
+        )
+
+    @staticmethod
+    def apply_state_delta(state: tuple, delta: tuple) -> tuple:
+        # Updates the containers of state in place, the counters and the scope stack are replaced
+        _, (scopes, scope_order, symbols, parents, _, entities), (agent_types, agents, declarations, build_in_functions) = state
+        statement_delta, (scopes_delta, scope_order_delta, symbols_delta, parents_delta, scope_stack, entities_delta), data_delta = delta
+        agent_types_delta, agents_delta, declarations_delta, build_in_functions_delta = data_delta
+
+        for name, declarations_of_scope in scopes_delta.items():
+            scopes.setdefault(name, {}).update(declarations_of_scope)
+
+        for name, scopes_of_name in symbols_delta.items():
+            symbols.setdefault(name, {}).update(scopes_of_name)
+
+        for key, declarations_of_agent in agent_types_delta.items():
+            agent_types.setdefault(key, []).extend(declarations_of_agent)
 
-    def append_declarations(self, declaration_list: List[VHDLDeclaration], parent: VHDLStatement) -> None:
+        scope_order.update(scope_order_delta)
+        parents.update(parents_delta)
+        entities.update(entities_delta)
+
+        agents.extend(agents_delta)
+        declarations.extend(declarations_delta)
+        build_in_functions.extend(build_in_functions_delta)
+
+        return (
+            tuple(dict(index) for index in statement_delta),
+            (scopes, scope_order, symbols, parents, list(scope_stack), entities),
+            (agent_types, agents, declarations, build_in_functions)
+        )
+
+    @staticmethod
+    def __get_dict_delta(before: dict, after: dict) -> dict:
+        # The state copies share their values, so an entry that was not replaced is the same object
+        return {key : value for key, value in after.items() if key not in before or before[key] is not value}
+
+    @staticmethod
+    def __get_list_delta(before: list, after: list) -> list:
+        return after[len(before):]
+
+    @staticmethod
+    def __get_nested_delta(before: dict, after: dict, get_delta: Callable) -> dict:
+        # New keys are kept even when empty, e.g. the agent_types entry of a process without declarations
+        deltas : dict = {key : get_delta(before.get(key, type(value)()), value) for key, value in after.items()}
+        return {key : delta for key, delta in deltas.items() if delta or key not in before}
+
+    @staticmethod
+    def get_state_fingerprint(state: tuple) -> str:
+        # Also takes a delta, which has the shape of a state. Declarations are dataclasses with text fields,
+        # their repr covers their content. Agents are statements holding their whole body, only their names
+        # matter to the units after them
+        statement_state, symbol_state, (agent_types, agents, declarations, build_in_functions) = state
+
+        agent_names : list = [(agent.statement_class.__name__, agent.statement_name, agent.agent_name) for agent in agents]
+
+        return hashlib.sha256(repr((statement_state, symbol_state, agent_types, agent_names, declarations, build_in_functions)).encode("utf-8")).hexdigest()
+
+
+    def append_declarations(self, declaration_list: List[VHDLDeclaration], parent: VHDLStatement, scope: Tuple[str, str, str] = None) -> None:
         #if not declaration_list:
         #    return
 
-        if parent.statement_name in self.vhdlData.agent_types:
-            self.vhdlData.agent_types[(parent.statement_name, parent.agent_name)].extend(declaration_list)
+        # Declarations of a statement are added in its own scope, entities are not entered as one
+        if scope is None:
+            scope = self.symbol_table.get_scope(parent)
+
+        if scope in self.vhdlData.agent_types:
+            self.vhdlData.agent_types[scope].extend(declaration_list)
         else:
-            self.vhdlData.agent_types[(parent.statement_name, parent.agent_name)] = declaration_list
+            self.vhdlData.agent_types[scope] = list(declaration_list)
+
+        self.symbol_table.add_declarations(scope, declaration_list)
 
         self.vhdlData.declarations.extend(declaration_list)
 
@@ -2791,20 +2989,17 @@ class CustomVhdlVisitor(vhdlVisitor):
         self.vhdlData.agents.append(statement)
 
     def find_agent(self, target: str) -> str:
+        # Nothing is declared before the first generics and ports, e.g. for the literals in their defaults
         if not self.vhdlData.agent_types:
-            print("Can't find agent name. Declaration list is empty...")
             return None
 
-        for (statement_name, agent_name) in self.vhdlData.agent_types:
-            if not self.vhdlData.agent_types[(statement_name, agent_name)]:
-                continue
+        scope : Tuple[str, str, str] = self.symbol_table.find_scope(target)
 
-            declarations_names: List[str] = [declaration.name for declaration in self.vhdlData.agent_types[(statement_name, agent_name)]]
-            
-            if target in declarations_names:
-                return agent_name
+        if scope is None:
+            return None
 
-        return None
+        statement_name, agent_name, design_unit = scope
+        return agent_name
 
     def convert_subtype_to_js(self, subtype: str, vector_length: int = None) -> str:
         key : str = subtype.lower()
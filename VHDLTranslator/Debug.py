@@ -1,10 +1,23 @@
-import chardet
+import os
+import json
+import time
 import logging
+import functools
+
+from typing import Dict, List
 
 class Debug():
     _loggers = {}
     _file_handler = None
 
+    # Per-node trace of the visitor. write_visit_to_log returns before calling a
+    # handler when it is off, messages with formatted fields check it first
+    trace : bool = False
+
+    # Visit count, cumulative and self time per grammar rule, see profile_visitor
+    _rule_statistics    : Dict[str, List] = {}
+    _rule_timer_stack   : List[float] = []
+
     @staticmethod
     def get_logger(logger_name: str) -> logging.Logger:
         if Debug._file_handler is None:
@@ -24,7 +37,7 @@ class Debug():
         return Debug._loggers[logger_name]
     
     def _get_file_handler():
-        file_handler = logging.FileHandler(f"result\output.log", mode = "w")
+        file_handler = logging.FileHandler(f"result\output.log", mode = "w", delay = True)    # opened by the first record
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(logging.Formatter("%(name)s | %(levelname)s | %(message)s"))
         return file_handler
@@ -35,15 +48,118 @@ class Debug():
         stream_handler.setFormatter(logging.Formatter("%(name)s | %(levelname)s | %(message)s"))
         return stream_handler
 
+    @staticmethod
+    def set_trace(enabled: bool) -> None:
+        Debug.trace = enabled
+
     @staticmethod
     def write_visit_to_log(logger, ctx_name : str):
+        if not Debug.trace:
+            return
+
         logger.info(f"{ctx_name} - visited")
 
+    # Rule statistics
+    #region Rule statistics
+    '''
+    profile_visitor wraps every visitXxx method of a visitor class with a counter and
+    a timer keyed by the rule name (Xxx). Nothing is wrapped unless it is called, so
+    a normal run pays nothing. Self time excludes nested visits, cumulative time of
+    recursive rules (expression, relation, ...) includes them.
+    '''
+
+    @staticmethod
+    def profile_visitor(visitor_class: type) -> None:
+        for attribute_name, method in list(vars(visitor_class).items()):
+            if not attribute_name.startswith("visit") or not attribute_name[5:6].isupper():
+                continue
+
+            if not callable(method) or hasattr(method, "_rule_name"):
+                continue
+
+            setattr(visitor_class, attribute_name, Debug._get_timed_method(method, attribute_name[5:]))
+
+    @staticmethod
+    def _get_timed_method(method, rule_name: str):
+        statistics  : Dict[str, List] = Debug._rule_statistics
+        timer_stack : List[float] = Debug._rule_timer_stack
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            timer_stack.append(0.0)
+            start : float = time.perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed     : float = time.perf_counter() - start
+                nested_time : float = timer_stack.pop()
+
+                entry : List = statistics.get(rule_name)
+                if entry is None:
+                    entry = statistics[rule_name] = [0, 0.0, 0.0]
+
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] += elapsed - nested_time
+
+                if timer_stack:
+                    timer_stack[-1] += elapsed
+
+        timed_method._rule_name = rule_name
+        return timed_method
+
+    @staticmethod
+    def get_rule_statistics() -> Dict[str, List]:
+        return {rule_name: list(entry) for rule_name, entry in Debug._rule_statistics.items()}
+
+    @staticmethod
+    def get_rule_statistics_delta(before: Dict[str, List]) -> Dict[str, List]:
+        delta : Dict[str, List] = {}
+
+        for rule_name, entry in Debug._rule_statistics.items():
+            previous : List = before.get(rule_name, [0, 0.0, 0.0])
+
+            if entry[0] != previous[0]:
+                delta[rule_name] = [value - previous_value for value, previous_value in zip(entry, previous)]
+
+        return delta
+
     @staticmethod
-    def detect_encoding(logger: logging.Logger, file_path: str) -> None:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
+    def add_rule_statistics(statistics: Dict[str, List]) -> None:
+        # Merge statistics collected by batch worker processes
+        if not statistics:
+            return
+
+        for rule_name, entry in statistics.items():
+            total : List = Debug._rule_statistics.setdefault(rule_name, [0, 0.0, 0.0])
+
+            for index, value in enumerate(entry):
+                total[index] += value
+
+    @staticmethod
+    def write_rule_statistics(logger: logging.Logger, path: str) -> None:
+        rules : dict = {
+            rule_name : {
+                "count"             : count,
+                "cumulative_time"   : round(cumulative_time, 6),
+                "self_time"         : round(self_time, 6)
+            }
+            for rule_name, (count, cumulative_time, self_time) in sorted(Debug._rule_statistics.items(), key=lambda item: -item[1][2])
+        }
+
+        try:
+            directory : str = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            with open(path, 'w') as statistics_file:
+                json.dump({"rules": rules}, statistics_file, indent=4)
+
+        except OSError:
+            logger.warning(f"Could not write rule statistics to {path}", exc_info=True)
+            return
+
+        logger.info(f"Rule statistics of {len(rules)} rules written to {path}")
 
-            logger.info(f"File encoding: {result['encoding']}")
-            return result['encoding']
\ No newline at end of file
+    #endregion
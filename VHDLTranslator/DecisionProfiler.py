@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import logging
+
+from typing import Dict
+
+from antlr4 import *
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    '''
+    Python port of the parts of ANTLR's Java ProfilingATNSimulator that grammar tuning
+    needs: invocations, time, SLL and LL lookahead depth, DFA misses, SLL conflicts,
+    LL fallbacks, ambiguities and context sensitivities of every decision.
+    '''
+
+    def __init__(self, parser: Parser, atn, decisionToDFA, sharedContextCache):
+        super().__init__(parser, atn, decisionToDFA, sharedContextCache)
+
+        self._entry             : dict = None
+        self._sll_stop_index    : int = -1
+        self._ll_stop_index     : int = -1
+        self._conflict          : bool = False
+
+    def adaptivePredict(self, input: TokenStream, decision: int, outerContext: ParserRuleContext):
+        entry : dict = DecisionProfiler.get_entry(decision)
+
+        self._entry = entry
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+        self._conflict = False
+
+        start : float = time.perf_counter()
+
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+
+        finally:
+            entry["invocations"] += 1
+            entry["time"] += time.perf_counter() - start
+
+            if self._sll_stop_index >= 0:
+                look : int = self._sll_stop_index - self._startIndex + 1
+                entry["sll_total_look"] += look
+                entry["sll_max_look"] = max(entry["sll_max_look"], look)
+
+            if self._ll_stop_index >= 0:
+                look : int = self._ll_stop_index - self._startIndex + 1
+                entry["ll_total_look"] += look
+                entry["ll_max_look"] = max(entry["ll_max_look"], look)
+
+            if self._conflict:
+                entry["sll_conflicts"] += 1
+
+    def getExistingTargetState(self, previousD, t: int):
+        self._sll_stop_index = self._input.index
+
+        existing = super().getExistingTargetState(previousD, t)
+
+        if existing is not None:
+            self._entry["sll_dfa_transitions"] += 1
+            self.__check_target(existing)
+
+        return existing
+
+    def computeTargetState(self, dfa, previousD, t: int):
+        self._entry["sll_atn_transitions"] += 1
+
+        target = super().computeTargetState(dfa, previousD, t)
+        self.__check_target(target)
+
+        return target
+
+    def computeReachSet(self, closure, t: int, fullCtx: bool):
+        if fullCtx:
+            self._ll_stop_index = self._input.index
+            self._entry["ll_atn_transitions"] += 1
+
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex: int, stopIndex: int):
+        self._entry["ll_fallbacks"] += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction: int, configs, startIndex: int, stopIndex: int):
+        self._entry["context_sensitivities"] += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex: int, stopIndex: int, exact: bool, ambigAlts, configs):
+        self._entry["ambiguities"] += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+    def __check_target(self, target) -> None:
+        if target is self.ERROR:
+            self._entry["errors"] += 1
+
+        # A state SLL cannot decide on, full LL prediction would be needed here
+        elif target.requiresFullContext:
+            self._conflict = True
+
+class DecisionProfiler():
+    '''
+    Decision statistics of vhdlParser, collected while ProfilingATNSimulator is used
+    by ParserManager. The report maps every decision to the grammar rule it is in.
+    '''
+
+    enabled : bool = False
+
+    _decisions : Dict[int, dict] = {}
+
+    _counters = (
+        "invocations", "time",
+        "sll_total_look", "sll_max_look", "sll_atn_transitions", "sll_dfa_transitions", "sll_conflicts",
+        "ll_fallbacks", "ll_total_look", "ll_max_look", "ll_atn_transitions",
+        "ambiguities", "context_sensitivities", "errors"
+    )
+    _maximums = ("sll_max_look", "ll_max_look")
+
+    @staticmethod
+    def set_enabled(enabled: bool) -> None:
+        DecisionProfiler.enabled = enabled
+
+    @staticmethod
+    def create_simulator(parser: vhdlParser) -> ProfilingATNSimulator:
+        return ProfilingATNSimulator(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+
+    @staticmethod
+    def get_entry(decision: int) -> dict:
+        entry : dict = DecisionProfiler._decisions.get(decision)
+
+        if entry is None:
+            entry = DecisionProfiler._decisions[decision] = dict.fromkeys(DecisionProfiler._counters, 0)
+
+        return entry
+
+    @staticmethod
+    def get_statistics() -> Dict[int, dict]:
+        return {decision: dict(entry) for decision, entry in DecisionProfiler._decisions.items()}
+
+    @staticmethod
+    def get_statistics_delta(before: Dict[int, dict]) -> Dict[int, dict]:
+        # Maximums are kept as they are, the maximum of the worker is still a lower bound of the total
+        delta : Dict[int, dict] = {}
+
+        for decision, entry in DecisionProfiler._decisions.items():
+            previous : dict = before.get(decision)
+
+            if previous is None:
+                delta[decision] = dict(entry)
+
+            elif entry["invocations"] != previous["invocations"]:
+                delta[decision] = {
+                    counter : value if counter in DecisionProfiler._maximums else value - previous[counter]
+                    for counter, value in entry.items()
+                }
+
+        return delta
+
+    @staticmethod
+    def add_statistics(statistics: Dict[int, dict]) -> None:
+        # Merge statistics collected by batch worker processes
+        if not statistics:
+            return
+
+        for decision, entry in statistics.items():
+            total : dict = DecisionProfiler.get_entry(decision)
+
+            for counter, value in entry.items():
+                if counter in DecisionProfiler._maximums:
+                    total[counter] = max(total[counter], value)
+                else:
+                    total[counter] += value
+
+    @staticmethod
+    def get_rule_name(decision: int) -> str:
+        from ANTLR.vhdlParser import vhdlParser
+
+        return vhdlParser.ruleNames[vhdlParser.atn.decisionToState[decision].ruleIndex]
+
+    @staticmethod
+    def write_report(logger: logging.Logger, path: str) -> None:
+        decisions : list = [
+            {"decision": decision, "rule": DecisionProfiler.get_rule_name(decision), **entry, "time": round(entry["time"], 6)}
+            for decision, entry in sorted(DecisionProfiler._decisions.items(), key=lambda item: -item[1]["time"])
+        ]
+
+        rules : Dict[str, dict] = {}
+
+        for decision in decisions:
+            total : dict = rules.setdefault(decision["rule"], dict.fromkeys(DecisionProfiler._counters, 0))
+
+            for counter in DecisionProfiler._counters:
+                if counter in DecisionProfiler._maximums:
+                    total[counter] = max(total[counter], decision[counter])
+                else:
+                    total[counter] += decision[counter]
+
+        rules = dict(sorted(((rule, {**total, "time": round(total["time"], 6)}) for rule, total in rules.items()), key=lambda item: -item[1]["time"]))
+
+        try:
+            directory : str = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            with open(path, 'w') as profile_file:
+                json.dump({"decisions": decisions, "rules": rules}, profile_file, indent=4)
+
+        except OSError:
+            logger.warning(f"Could not write decision profile to {path}", exc_info=True)
+            return
+
+        for decision in decisions[:10]:
+            logger.info(f"Decision {decision['decision']} ({decision['rule']}): {decision['invocations']} predictions, {decision['time']:.3f}s, "
+                        f"SLL max look {decision['sll_max_look']}, {decision['sll_conflicts']} SLL conflicts, {decision['ll_fallbacks']} LL fallbacks, "
+                        f"{decision['ambiguities']} ambiguities")
+
+        logger.info(f"Decision profile of {len(decisions)} decisions written to {path}")
@@ -0,0 +1,93 @@
+from typing import List
+
+from antlr4 import *
+
+from ANTLR.vhdlLexer import vhdlLexer
+
+class DesignUnitSplitter():
+    '''
+    Token level pre-scan that finds where every design unit of a file starts, so that
+    each unit can be parsed as its own design_unit. A unit starts at its context clause
+    (LIBRARY/USE items) in front of a library unit header:
+
+        ENTITY identifier IS
+        ARCHITECTURE identifier OF identifier IS
+        PACKAGE identifier IS
+        PACKAGE BODY identifier IS
+        CONFIGURATION identifier OF
+
+    Headers are only recognised right after a SEMI, which rules out END ENTITY,
+    entity instantiations and attribute specifications.
+    '''
+
+    _identifiers = (vhdlLexer.BASIC_IDENTIFIER, vhdlLexer.EXTENDED_IDENTIFIER)
+    _context_items = (vhdlLexer.LIBRARY, vhdlLexer.USE)
+
+    @staticmethod
+    def split(token_stream: CommonTokenStream) -> List[List[Token]]:
+        token_stream.fill()
+
+        tokens : List[Token] = [token for token in token_stream.tokens if token.type != Token.EOF]
+
+        if not tokens:
+            return []
+
+        starts : List[int] = [
+            DesignUnitSplitter.__get_context_start(tokens, index)
+            for index in range(len(tokens))
+            if DesignUnitSplitter.__is_unit_header(tokens, index)
+        ]
+
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+
+        return [
+            tokens[start:end]
+            for start, end in zip(starts, starts[1:] + [len(tokens)])
+        ]
+
+    @staticmethod
+    def __is_unit_header(tokens: List[Token], index: int) -> bool:
+        if index > 0 and tokens[index-1].type != vhdlLexer.SEMI:
+            return False
+
+        pattern : List[tuple] = None
+        token_type : int = tokens[index].type
+
+        if token_type == vhdlLexer.ENTITY:
+            pattern = [DesignUnitSplitter._identifiers, (vhdlLexer.IS,)]
+
+        elif token_type == vhdlLexer.ARCHITECTURE:
+            pattern = [DesignUnitSplitter._identifiers, (vhdlLexer.OF,), DesignUnitSplitter._identifiers, (vhdlLexer.IS,)]
+
+        elif token_type == vhdlLexer.CONFIGURATION:
+            pattern = [DesignUnitSplitter._identifiers, (vhdlLexer.OF,)]
+
+        elif token_type == vhdlLexer.PACKAGE:
+            if index+1 < len(tokens) and tokens[index+1].type == vhdlLexer.BODY:
+                pattern = [(vhdlLexer.BODY,), DesignUnitSplitter._identifiers, (vhdlLexer.IS,)]
+            else:
+                pattern = [DesignUnitSplitter._identifiers, (vhdlLexer.IS,)]
+
+        if pattern is None or index + len(pattern) >= len(tokens):
+            return False
+
+        return all(tokens[index+1+offset].type in expected for offset, expected in enumerate(pattern))
+
+    @staticmethod
+    def __get_context_start(tokens: List[Token], header: int) -> int:
+        # Walk back over the LIBRARY/USE items that directly precede the header
+        start : int = header
+
+        while start > 0:
+            clause_start : int = start - 1
+
+            while clause_start > 0 and tokens[clause_start-1].type != vhdlLexer.SEMI:
+                clause_start -= 1
+
+            if tokens[clause_start].type not in DesignUnitSplitter._context_items:
+                break
+
+            start = clause_start
+
+        return start
@@ -0,0 +1,279 @@
+import os, sys
+import time
+import errno
+import ctypes, ctypes.util
+import select
+import struct
+import hashlib
+import logging
+import functools
+
+from typing import Callable, Dict, List, Set
+
+from BatchTranslator import BatchTranslator, BatchResult
+from InputLoader import InputLoader, Source
+
+import Constants as const
+
+class _PollingBackend():
+    '''
+    Compares modification time and size of the watched files on every scan.
+    '''
+
+    def __init__(self, logger: logging.Logger, paths: List[str], poll_interval: float):
+        self.logger         = logger
+        self.paths          = paths
+        self.poll_interval  = poll_interval
+
+        self.__snapshot : Dict[str, tuple] = self.__scan()
+
+    def wait(self, timeout: float = None) -> Set[str]:
+        '''
+        Paths changed, created or removed since the last call, an empty set when
+        nothing changed within timeout seconds.
+        '''
+
+        deadline : float = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            time.sleep(self.poll_interval if deadline is None else max(min(self.poll_interval, deadline - time.monotonic()), 0))
+
+            snapshot : Dict[str, tuple] = self.__scan()
+            changed : Set[str] = {
+                path for path in snapshot.keys() | self.__snapshot.keys()
+                if snapshot.get(path) != self.__snapshot.get(path)
+            }
+            self.__snapshot = snapshot
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+    def __scan(self) -> Dict[str, tuple]:
+        snapshot : Dict[str, tuple] = {}
+
+        for path in BatchTranslator.collect_files(self.logger, self.paths, quiet=True):
+            try:
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass    # removed between listing and stat
+
+        return snapshot
+
+class _InotifyBackend():
+    '''
+    Linux inotify through ctypes. inotify does not watch subdirectories on its own,
+    so every directory gets a watch and new directories are added as they appear.
+    '''
+
+    IN_CLOSE_WRITE  = 0x00000008
+    IN_MOVED_FROM   = 0x00000040
+    IN_MOVED_TO     = 0x00000080
+    IN_CREATE       = 0x00000100
+    IN_DELETE       = 0x00000200
+    IN_Q_OVERFLOW   = 0x00004000
+    IN_ISDIR        = 0x40000000
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    _event_header = struct.Struct("iIII")   # wd, mask, cookie, len, followed by the name
+
+    def __init__(self, logger: logging.Logger, paths: List[str]):
+        self.logger = logger
+        self.paths  = paths
+
+        self.__libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.__fd   : int = self.__libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.__directories  : Dict[int, str] = {}   # watch descriptor -> directory
+        self.__recursive    : Set[str] = set()
+
+        for directory, recursive in self.__get_roots():
+            self.__add_watch(directory, recursive)
+
+    def wait(self, timeout: float = None) -> Set[str]:
+        '''
+        Paths changed, created or removed since the last call, an empty set when
+        nothing changed within timeout seconds.
+        '''
+
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+
+        if not readable:
+            return set()
+
+        changed : Set[str] = set()
+
+        while True:
+            try:
+                buffer : bytes = os.read(self.__fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset : int = 0
+
+            while offset < len(buffer):
+                watch, mask, _, length = self._event_header.unpack_from(buffer, offset)
+                name : str = buffer[offset + self._event_header.size : offset + self._event_header.size + length].rstrip(b"\0").decode(sys.getfilesystemencoding(), "replace")
+                offset += self._event_header.size + length
+
+                # The kernel dropped events, let the watcher look at every file again
+                if mask & self.IN_Q_OVERFLOW:
+                    changed.update(BatchTranslator.collect_files(self.logger, self.paths, quiet=True))
+                    continue
+
+                directory : str = self.__directories.get(watch)
+                if directory is None:
+                    continue
+
+                path : str = os.path.join(directory, name)
+
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO) and directory in self.__recursive:
+                        self.__add_watch(path, True)
+                        changed.update(self.__get_vhdl_files(path))     # files moved in together with the directory
+
+                elif os.path.splitext(name)[1].lower() in const.VHDL_EXTENSIONS:
+                    changed.add(path)
+
+    def close(self) -> None:
+        os.close(self.__fd)
+
+    def __get_roots(self) -> List[tuple]:
+        roots : List[tuple] = []
+
+        for path in self.paths:
+            if os.path.isdir(path):
+                roots.append((path, True))
+
+            elif os.path.isfile(path):
+                roots.append((os.path.dirname(os.path.abspath(path)), False))
+
+            else:
+                # The folder before the first wildcard of a glob pattern
+                prefix : str = path[:min((path.find(char) for char in "*?[" if char in path), default=len(path))]
+                roots.append((os.path.dirname(prefix) or os.curdir, True))
+
+        return roots
+
+    def __add_watch(self, directory: str, recursive: bool) -> None:
+        for root, _, _ in os.walk(directory) if recursive else [(directory, None, None)]:
+            root = os.path.abspath(root)
+            watch : int = self.__libc.inotify_add_watch(self.__fd, os.fsencode(root), self.MASK)
+
+            if watch < 0:
+                error : int = ctypes.get_errno()
+                if error == errno.ENOSPC:
+                    raise OSError(error, "inotify watch limit reached, see fs.inotify.max_user_watches")
+
+                self.logger.warning(f"Could not watch {root}: {os.strerror(error)}")
+                continue
+
+            self.__directories[watch] = root
+            if recursive:
+                self.__recursive.add(root)
+
+    def __get_vhdl_files(self, directory: str) -> List[str]:
+        return [
+            os.path.join(root, filename)
+            for root, _, filenames in os.walk(directory)
+            for filename in filenames
+            if os.path.splitext(filename)[1].lower() in const.VHDL_EXTENSIONS
+        ]
+
+class FileWatcher():
+    '''
+    Translates the given files, directories and glob patterns and then keeps
+    re-translating the files whose content changes, until interrupted. Translation
+    runs in this process, so the parser, the visitor and the prediction DFA stay warm
+    between rounds.
+    '''
+
+    def __init__(self, logger: logging.Logger, paths: List[str], translate_function: Callable[..., bool],
+                 debounce: float = const.WATCH_DEBOUNCE, poll_interval: float = const.WATCH_POLL_INTERVAL):
+        self.logger             = logger
+        self.paths              = paths
+        self.translate_function = translate_function
+        self.debounce           = debounce
+        self.poll_interval      = poll_interval
+
+        self.results : Dict[str, BatchResult] = {}     # latest result of every translated file
+
+        self.__hashes : Dict[str, str] = {}
+
+    def watch(self) -> None:
+        backend = self.__create_backend()
+
+        try:
+            self.__translate_changes(set(BatchTranslator.collect_files(self.logger, self.paths)))
+
+            self.logger.info(f"Watching {', '.join(self.paths)} for changes, Ctrl+C to stop")
+
+            while True:
+                changed : Set[str] = backend.wait()
+
+                # Editors save in several steps and tools touch many files at once, wait until it is quiet
+                while True:
+                    more : Set[str] = backend.wait(self.debounce)
+                    if not more:
+                        break
+
+                    changed |= more
+
+                self.__translate_changes(changed)
+
+        except KeyboardInterrupt:
+            self.logger.info("Watch stopped")
+
+        finally:
+            backend.close()
+
+    def __create_backend(self):
+        if sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend(self.logger, self.paths)
+            except (OSError, AttributeError):
+                self.logger.warning("inotify is not available, polling for changes", exc_info=True)
+
+        return _PollingBackend(self.logger, self.paths, self.poll_interval)
+
+    def __translate_changes(self, changed: Set[str]) -> None:
+        watched : Set[str] = set(BatchTranslator.collect_files(self.logger, self.paths, quiet=True))
+
+        # Also catches files that left with a moved or deleted directory
+        for path in sorted(self.__hashes.keys() - watched):
+            del self.__hashes[path]
+            self.results.pop(path, None)
+            self.logger.info(f"Removed: {path}")
+
+        for path in sorted(changed & watched):
+            try:
+                source : Source = InputLoader.read_source(path)
+            except OSError:
+                continue    # removed again before it could be read
+
+            content_hash : str = hashlib.sha256(source).hexdigest()
+
+            # Saved without changes, or touched by a checkout that restored the same content
+            if self.__hashes.get(path) == content_hash:
+                InputLoader.close_source(source)
+                continue
+
+            start : float = time.perf_counter()
+            result : BatchResult = BatchTranslator._translate_worker(path, functools.partial(self.translate_function, source=source))
+            elapsed : float = time.perf_counter() - start
+
+            # A failed translation is retried on the next save even if the content is the same
+            self.__hashes[path] = content_hash if result.success else None
+            self.results[path] = result
+
+            if result.success:
+                self.logger.info(f"Translated {path} in {elapsed * 1000:.0f} ms")
+            else:
+                self.logger.error(f"Failed: {path}" + (f"\n{result.error}" if result.error else ""))
@@ -0,0 +1,130 @@
+import logging
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from antlr4 import *
+from antlr4.error.ErrorListener import ErrorListener
+
+from ANTLR.vhdlLexer import vhdlLexer
+from CustomVhdlVisitor import CustomVhdlVisitor
+from InputLoader import InputLoader
+from ParserManager import ParserManager
+
+from ResultCreators.ActionCreator import ActionCreator
+from ResultCreators.BehaviourCreator import BehaviourCreator
+from ResultCreators.EnvironmentCreator import EnvironmentCreator
+from VHDL.VHDLData import VHDLData
+
+import Constants as const
+
+@dataclass
+class TranslationResult:
+    '''
+    A source with syntax errors is not visited, vhdl_data is None and the three
+    result texts are empty then.
+    '''
+
+    vhdl_data   : VHDLData
+    action      : str       # .act
+    behaviour   : str       # .behp
+    environment : str       # .env_descript
+
+    syntax_errors : List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.syntax_errors
+
+    @property
+    def outputs(self) -> Dict[str, str]:
+        return dict(zip(const.RESULT_EXTENSIONS, (self.action, self.behaviour, self.environment)))
+
+class _SyntaxErrorCollector(ErrorListener):
+    def __init__(self):
+        self.errors : List[str] = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append(f"line {line}:{column} {msg}")
+
+class InMemoryTranslator():
+    '''
+    Library interface of the translator: VHDL source in, VHDLData and the three result
+    texts out. Nothing is read from or written to disk, nothing is logged or printed
+    (syntax errors are returned with the result) and the working directory does not
+    matter. The only file access is the DFA cache, if one was set with
+    ParserManager.use_dfa_cache.
+
+        result = InMemoryTranslator.translate_string(vhdl_text)
+        result.outputs[".act"]
+    '''
+
+    _logger : logging.Logger = None
+
+    @staticmethod
+    def translate_string(text: str) -> TranslationResult:
+        return InMemoryTranslator.__translate(InputStream(text))
+
+    @staticmethod
+    def translate_bytes(source: bytes, encoding: str = None) -> TranslationResult:
+        '''
+        encoding is detected like for files (BOM, ascii, utf-8, chardet) if not given.
+        '''
+
+        logger : logging.Logger = InMemoryTranslator.__get_logger()
+
+        return InMemoryTranslator.__translate(InputStream(InputLoader.decode_source(logger, source, encoding)))
+
+    @staticmethod
+    def __translate(input_stream: InputStream) -> TranslationResult:
+        logger : logging.Logger = InMemoryTranslator.__get_logger()
+        syntax_errors : _SyntaxErrorCollector = _SyntaxErrorCollector()
+
+        # The lexer takes the decision DFA of vhdlLexer when it is created, so the cache must be loaded first
+        ParserManager.load_pending_dfa_cache(logger)
+
+        lexer = vhdlLexer(input_stream)
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(syntax_errors)
+
+        stream = CommonTokenStream(lexer)
+        stream.fill()
+
+        if const.SPLIT_DESIGN_UNITS:
+            trees : list = list(ParserManager.parse_design_units(logger, stream, syntax_errors))
+        else:
+            trees : list = [ParserManager.parse_design_file(logger, stream, syntax_errors)]
+
+        # The visitor expects a valid tree, an erroneous one is never visited
+        if syntax_errors.errors:
+            return TranslationResult(None, "", "", "", syntax_errors.errors)
+
+        visitor : CustomVhdlVisitor = CustomVhdlVisitor(logger)
+
+        if const.SPLIT_DESIGN_UNITS:
+            visitor.visit_design_units(trees)
+        else:
+            visitor.visit(trees[0])
+
+        vhdlData : VHDLData = visitor.get_vhdl_data()
+
+        return TranslationResult(
+            vhdlData,
+            ActionCreator().render_result(vhdlData),
+            BehaviourCreator().render_result(vhdlData),
+            EnvironmentCreator(logger).render_result(vhdlData),
+            syntax_errors.errors
+        )
+
+    @staticmethod
+    def __get_logger() -> logging.Logger:
+        # A logger of its own that drops every record, the Debug loggers write to result\output.log
+        if InMemoryTranslator._logger is None:
+            logger = logging.getLogger("InMemoryTranslator")
+            logger.setLevel(logging.CRITICAL + 1)
+            logger.addHandler(logging.NullHandler())
+            logger.propagate = False
+
+            InMemoryTranslator._logger = logger
+
+        return InMemoryTranslator._logger
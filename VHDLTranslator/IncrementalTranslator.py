@@ -0,0 +1,177 @@
+import os
+import hashlib
+import logging
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+from antlr4 import *
+
+from ANTLR.vhdlLexer import vhdlLexer
+from CustomVhdlVisitor import CustomVhdlVisitor
+from DesignUnitSplitter import DesignUnitSplitter
+from InputLoader import InputLoader, Source
+from ParserManager import ParserManager
+from PhaseTimer import PhaseTimer
+
+from ResultCreators.ResultFile import ResultFile
+from VHDL.VHDLData import VHDLData, VHDLDesign
+
+import Constants as const
+
+@dataclass
+class UnitRecord:
+    unit_hash   : str                   # token types and texts of the unit
+    designs     : List[VHDLDesign]
+    texts       : Dict[str, str]        # result creator -> text written for the designs of the unit
+    state_delta : tuple                 # what the unit changed in the visitor state
+    fingerprint : str                   # of the visitor state after the unit
+
+class IncrementalTranslator():
+    '''
+    Keeps the design units of the files translated by this process in memory and on
+    the next translation of a file re-parses and re-visits only the units that changed.
+
+    A unit is reused while its tokens and the visitor state it starts from are the same
+    as last time. The state carries the name counters, the symbol table and the agents
+    and declarations of the units before it, so a changed unit also re-visits the units
+    after it until the state after a unit matches again, e.g. after an edit that adds
+    no statements and no declarations. Comments and whitespace are not tokens and never
+    cause a re-visit.
+
+    A unit keeps only what it changed in the state, the state before a unit is rebuilt
+    from the changes of the units before it when the visit continues after cached units.
+    The fingerprint of the state after a unit chains the one before it with the changes.
+    '''
+
+    _files : Dict[str, List[UnitRecord]] = {}
+
+    @staticmethod
+    def translate(logger: logging.Logger, vhdl_path: str, source: Source, result_path: str, creators: List[ResultFile]) -> bool:
+        key : str = os.path.abspath(vhdl_path)
+        previous_records : List[UnitRecord] = IncrementalTranslator._files.pop(key, [])
+
+        try:
+            records : List[UnitRecord] = IncrementalTranslator.__translate_units(logger, source, previous_records, creators)
+            vhdlData : VHDLData = IncrementalTranslator.__get_vhdl_data(records)
+
+            for creator in creators:
+                with PhaseTimer.measure(type(creator).__name__):
+                    creator.open_result(result_path)
+                    creator.write_text("".join(record.texts[type(creator).__name__] for record in records))
+                    creator.close_result(vhdlData)
+
+        except Exception:
+            logger.error("Details:", exc_info=True)
+
+            for creator in creators:
+                creator.abort_result()
+
+            return False
+
+        # Most recently translated files last, the oldest ones are dropped first
+        IncrementalTranslator._files[key] = records
+
+        while len(IncrementalTranslator._files) > const.INCREMENTAL_MAX_FILES:
+            del IncrementalTranslator._files[next(iter(IncrementalTranslator._files))]
+
+        return True
+
+    @staticmethod
+    def clear() -> None:
+        IncrementalTranslator._files.clear()
+
+    @staticmethod
+    def __translate_units(logger: logging.Logger, source: Source, previous_records: List[UnitRecord], creators: List[ResultFile]) -> List[UnitRecord]:
+        input_stream : InputStream = InputLoader.get_input_stream(logger, source)
+
+        # The lexer takes the decision DFA of vhdlLexer when it is created, so the cache must be loaded first
+        ParserManager.load_pending_dfa_cache(logger)
+
+        stream : CommonTokenStream = CommonTokenStream(vhdlLexer(input_stream))
+
+        with PhaseTimer.measure("lexing"):
+            stream.fill()
+
+        records : List[UnitRecord] = []
+
+        visitor         : CustomVhdlVisitor = None
+        visitor_units   : int = 0       # units whose state the visitor holds
+        visitor_state   : tuple = None  # copy of that state, to find what the next unit changes
+        same_state      : bool = True   # the state before the next unit is the one it had last time
+
+        for index, unit_tokens in enumerate(DesignUnitSplitter.split(stream)):
+            unit_hash : str = IncrementalTranslator.__get_unit_hash(unit_tokens)
+            previous : UnitRecord = previous_records[index] if index < len(previous_records) else None
+
+            if same_state and previous is not None and previous.unit_hash == unit_hash:
+                records.append(previous)
+                continue
+
+            # Continue from the state after the last unit, which may be a cached one
+            if visitor is None or visitor_units != len(records):
+                visitor = CustomVhdlVisitor()
+                visitor_state = IncrementalTranslator.__get_state(visitor, records)
+                visitor.set_state(visitor_state)
+
+            designs : List[VHDLDesign] = []
+
+            for design_unit in ParserManager.parse_unit_tokens(logger, unit_tokens):
+                with PhaseTimer.measure("visiting"):
+                    designs.append(visitor.visit(design_unit))
+
+            texts : Dict[str, str] = {}
+
+            for creator in creators:
+                with PhaseTimer.measure(type(creator).__name__):
+                    texts[type(creator).__name__] = "".join(creator.get_design_text(design) for design in designs)
+
+            state       : tuple = visitor.get_state()
+            state_delta : tuple = CustomVhdlVisitor.get_state_delta(visitor_state, state)
+            fingerprint : str = IncrementalTranslator.__get_fingerprint(records[-1].fingerprint if records else "", state_delta)
+
+            records.append(UnitRecord(unit_hash, designs, texts, state_delta, fingerprint))
+            visitor_units = len(records)
+            visitor_state = state
+
+            same_state = previous is not None and previous.fingerprint == fingerprint
+
+        previous_ids : set = {id(previous) for previous in previous_records}
+        reused : int = sum(1 for record in records if id(record) in previous_ids)
+        logger.info(f"Incremental translation: {len(records) - reused} of {len(records)} design units translated, {reused} reused")
+
+        return records
+
+    @staticmethod
+    def __get_unit_hash(unit_tokens: List[Token]) -> str:
+        unit_hash = hashlib.sha256()
+
+        for token in unit_tokens:
+            unit_hash.update(f"{token.type}:{token.text}\n".encode("utf-8"))
+
+        return unit_hash.hexdigest()
+
+    @staticmethod
+    def __get_fingerprint(previous_fingerprint: str, state_delta: tuple) -> str:
+        # Equal states before the unit and equal changes give equal states after it
+        return hashlib.sha256(f"{previous_fingerprint}:{CustomVhdlVisitor.get_state_fingerprint(state_delta)}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def __get_state(visitor: CustomVhdlVisitor, records: List[UnitRecord]) -> tuple:
+        # State after the records, from the one of a new visitor
+        state : tuple = visitor.get_state()
+
+        for record in records:
+            state = CustomVhdlVisitor.apply_state_delta(state, record.state_delta)
+
+        return state
+
+    @staticmethod
+    def __get_vhdl_data(records: List[UnitRecord]) -> VHDLData:
+        # The environment is built from everything the units collected, which the state after the last unit holds
+        _, _, (agent_types, agents, declarations, build_in_functions) = IncrementalTranslator.__get_state(CustomVhdlVisitor(), records)
+
+        return VHDLData(
+            [design for record in records for design in record.designs],
+            agent_types, agents, declarations, build_in_functions
+        )
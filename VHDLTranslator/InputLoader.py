@@ -0,0 +1,148 @@
+import os
+import mmap
+import codecs
+import logging
+
+from typing import Union
+
+from antlr4 import InputStream
+
+from PhaseTimer import PhaseTimer
+
+import Constants as const
+
+Source = Union[bytes, mmap.mmap]
+
+class MMapInputStream(InputStream):
+    '''
+    InputStream that serves characters straight from a memory-mapped file instead of a
+    list of code points. Only used for ASCII compatible encodings: the lexer sees bytes,
+    so token boundaries are byte offsets and multi-byte UTF-8 characters (which VHDL only
+    allows in comments and string literals) are decoded again when token text is read.
+    '''
+
+    def __init__(self, data: mmap.mmap, encoding: str):
+        self.name       = "<mmap>"
+        self.strdata    = None
+        self.encoding   = encoding
+
+        self._index     = 0
+        self.data       = data      # mmap indexing returns ints, just like the code point list
+        self._size      = len(data)
+
+    def getText(self, start: int, stop: int):
+        if stop >= self._size:
+            stop = self._size-1
+        if start >= self._size:
+            return ""
+
+        return self.data[start:stop+1].decode(self.encoding, errors='replace')
+
+    def __str__(self):
+        return self.getText(0, self._size-1)
+
+class InputLoader():
+    '''
+    Reads a .vhd file once and decodes it without running chardet over the whole file:
+    a BOM or pure ASCII/valid UTF-8 content is recognised directly, chardet only looks
+    at a bounded sample when neither matches. Files above Constants.MMAP_THRESHOLD are
+    memory-mapped instead of read.
+    '''
+
+    _boms = [
+        (codecs.BOM_UTF32_LE,   'utf-32'),
+        (codecs.BOM_UTF32_BE,   'utf-32'),
+        (codecs.BOM_UTF8,       'utf-8-sig'),
+        (codecs.BOM_UTF16_LE,   'utf-16'),
+        (codecs.BOM_UTF16_BE,   'utf-16')
+    ]
+
+    _mmap_encodings = ('ascii', 'utf-8')
+
+    @staticmethod
+    def read_source(file_path: str) -> Source:
+        with open(file_path, 'rb') as source_file:
+            size : int = os.fstat(source_file.fileno()).st_size
+
+            if size >= const.MMAP_THRESHOLD:
+                return mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            return source_file.read()
+
+    @staticmethod
+    def close_source(source: Source) -> None:
+        if isinstance(source, mmap.mmap):
+            source.close()
+
+    @staticmethod
+    def detect_encoding(logger: logging.Logger, source: Source) -> str:
+        for bom, encoding in InputLoader._boms:
+            if source[:len(bom)] == bom:
+                logger.info(f"File encoding: {encoding} (BOM)")
+                return encoding
+
+        if InputLoader.__is_ascii(source):
+            logger.info("File encoding: ascii")
+            return 'ascii'
+
+        if InputLoader.__is_utf8(source):
+            logger.info("File encoding: utf-8")
+            return 'utf-8'
+
+        import chardet
+
+        result = chardet.detect(source[:const.ENCODING_DETECTION_SAMPLE_SIZE])
+        encoding : str = result['encoding'] or 'latin-1'
+
+        logger.info(f"File encoding: {encoding} (detected by chardet)")
+        return encoding
+
+    @staticmethod
+    def decode_source(logger: logging.Logger, source: Source, encoding: str = None) -> str:
+        if encoding is None:
+            encoding = InputLoader.detect_encoding(logger, source)
+
+        if isinstance(source, mmap.mmap):
+            source = source[:]
+
+        try:
+            return source.decode(encoding)
+        except UnicodeDecodeError:
+            # chardet only saw a sample, do not fail on characters outside of it
+            logger.warning(f"File is not valid {encoding}, undecodable characters are replaced")
+            return source.decode(encoding, errors='replace')
+        except LookupError:
+            logger.warning(f"Unknown encoding {encoding}, file is decoded as latin-1")
+            return source.decode('latin-1')
+
+    @staticmethod
+    def get_input_stream(logger: logging.Logger, source: Source) -> InputStream:
+        with PhaseTimer.measure("encoding_detection"):
+            encoding : str = InputLoader.detect_encoding(logger, source)
+
+        with PhaseTimer.measure("decoding"):
+            if isinstance(source, mmap.mmap) and encoding in InputLoader._mmap_encodings:
+                return MMapInputStream(source, encoding)
+
+            return InputStream(InputLoader.decode_source(logger, source, encoding))
+
+    # Both checks walk the source in chunks, so a mapped file is never copied as a whole
+    @staticmethod
+    def __is_ascii(source: Source) -> bool:
+        return all(
+            source[index:index+const.INPUT_CHUNK_SIZE].isascii()
+            for index in range(0, len(source), const.INPUT_CHUNK_SIZE)
+        )
+
+    @staticmethod
+    def __is_utf8(source: Source) -> bool:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+
+        try:
+            for index in range(0, len(source), const.INPUT_CHUNK_SIZE):
+                decoder.decode(source[index:index+const.INPUT_CHUNK_SIZE])
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+
+        return True
@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import os, sys
+import glob
+import logging
+import io
+import pickle
+import hashlib
+import importlib.metadata
+
+from typing import Callable, Iterator, List
+
+from antlr4 import *
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.PredictionContext import PredictionContext
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.Errors import ParseCancellationException
+
+from DecisionProfiler import DecisionProfiler
+from PhaseTimer import PhaseTimer
+
+import Constants as const
+
+# Runtime singletons the ANTLR simulators compare by identity, the DFA cache pickles them by name
+_dfa_cache_singletons = {
+    "PredictionContext.EMPTY"   : PredictionContext.EMPTY,
+    "SemanticContext.NONE"      : SemanticContext.NONE,
+    "ATNSimulator.ERROR"        : ATNSimulator.ERROR,
+    "LexerATNSimulator.ERROR"   : LexerATNSimulator.ERROR
+}
+
+class _DFACachePickler(pickle.Pickler):
+    _names = {id(singleton) : name for name, singleton in _dfa_cache_singletons.items()}
+
+    def persistent_id(self, obj):
+        return self._names.get(id(obj))
+
+class _DFACacheUnpickler(pickle.Unpickler):
+    # The DFA and ATN only consist of ANTLR runtime objects and builtin containers
+    _modules = ("antlr4.", "ANTLR.")
+
+    def persistent_load(self, persistent_id):
+        return _dfa_cache_singletons[persistent_id]
+
+    def find_class(self, module: str, name: str):
+        if (module == "builtins" or module.startswith(self._modules)) and "." not in name:
+            found = super().find_class(module, name)
+
+            if isinstance(found, type) and (found.__module__ == "builtins" or found.__module__.startswith(self._modules)):
+                return found
+
+        raise pickle.UnpicklingError(f"DFA cache refers to {module}.{name}")
+
+class ParserManager():
+    '''
+    The generated parser and lexer are imported by the functions that need them,
+    so a run that only hits the translation cache never loads them. For the same
+    reason the DFA cache set with use_dfa_cache is only loaded by load_pending_dfa_cache,
+    which the translators call right before they create the first lexer.
+    '''
+
+    _sll_parses = 0
+    _ll_fallbacks = 0
+
+    _loaded_dfa_states = 0
+    _pending_dfa_cache : str = None
+
+    @staticmethod
+    def parse_design_file(logger: logging.Logger, token_stream: CommonTokenStream, error_listener: ErrorListener = None) -> vhdlParser.Design_fileContext:
+        from ANTLR.vhdlParser import vhdlParser
+
+        ParserManager.load_pending_dfa_cache(logger)
+
+        with PhaseTimer.measure("parsing"):
+            return ParserManager._parse(logger, token_stream, vhdlParser.design_file, error_listener)
+
+    @staticmethod
+    def parse_design_units(logger: logging.Logger, token_stream: CommonTokenStream, error_listener: ErrorListener = None) -> Iterator[vhdlParser.Design_unitContext]:
+        '''
+        Parse every design unit found by DesignUnitSplitter on its own token stream.
+        Units are yielded one at a time, so the caller can visit and drop each parse
+        tree before the next one is built, and a unit that needs full LL prediction
+        does not force a re-parse of the whole file.
+        '''
+
+        from DesignUnitSplitter import DesignUnitSplitter
+
+        for unit_tokens in DesignUnitSplitter.split(token_stream):
+            yield from ParserManager.parse_unit_tokens(logger, unit_tokens, error_listener)
+
+    @staticmethod
+    def parse_unit_tokens(logger: logging.Logger, unit_tokens: List[Token], error_listener: ErrorListener = None) -> Iterator[vhdlParser.Design_unitContext]:
+        '''
+        Parse the tokens of one unit found by DesignUnitSplitter.
+        '''
+
+        from ANTLR.vhdlParser import vhdlParser
+
+        ParserManager.load_pending_dfa_cache(logger)
+
+        with PhaseTimer.measure("token_buffering"):
+            unit_stream : CommonTokenStream = CommonTokenStream(ListTokenSource(unit_tokens))
+
+        # A unit normally holds exactly one design_unit, keep parsing if the split missed a boundary
+        while unit_stream.LA(1) != Token.EOF:
+            with PhaseTimer.measure("parsing"):
+                tree : vhdlParser.Design_unitContext = ParserManager._parse(logger, unit_stream, vhdlParser.design_unit, error_listener)
+
+            yield tree
+
+    @staticmethod
+    def _parse(logger: logging.Logger, token_stream: CommonTokenStream, start_rule: Callable, error_listener: ErrorListener = None):
+        '''
+        Two-stage parse: try fast SLL prediction with a bail-out error strategy first,
+        re-parse with full LL prediction and normal error reporting only if SLL fails.
+        Syntax errors go to error_listener if given, to stderr otherwise.
+        '''
+
+        start_index : int = token_stream.index
+        parser : vhdlParser = ParserManager._create_parser(token_stream)
+
+        parser.removeErrorListeners()
+        parser._errHandler = BailErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.SLL
+
+        try:
+            tree = start_rule(parser)
+            ParserManager._sll_parses += 1
+            return tree
+
+        except ParseCancellationException:
+            logger.debug("SLL parse failed, falling back to full LL prediction")
+
+        ParserManager._ll_fallbacks += 1
+
+        token_stream.seek(start_index)
+        parser = ParserManager._create_parser(token_stream)
+        parser._interp.predictionMode = PredictionMode.LL
+
+        if error_listener is not None:
+            parser.removeErrorListeners()
+            parser.addErrorListener(error_listener)
+
+        return start_rule(parser)
+
+    @staticmethod
+    def _create_parser(token_stream: CommonTokenStream) -> vhdlParser:
+        from ANTLR.vhdlParser import vhdlParser
+
+        parser : vhdlParser = vhdlParser(token_stream)
+
+        if DecisionProfiler.enabled:
+            parser._interp = DecisionProfiler.create_simulator(parser)
+
+        return parser
+
+    @staticmethod
+    def get_statistics() -> dict:
+        return {
+            "sll_parses"    : ParserManager._sll_parses,
+            "ll_fallbacks"  : ParserManager._ll_fallbacks
+        }
+
+    @staticmethod
+    def add_statistics(statistics: dict) -> None:
+        # Merge counters collected by batch worker processes
+        if not statistics:
+            return
+
+        ParserManager._sll_parses += statistics.get("sll_parses", 0)
+        ParserManager._ll_fallbacks += statistics.get("ll_fallbacks", 0)
+
+    @staticmethod
+    def write_statistics_to_log(logger: logging.Logger) -> None:
+        total : int = ParserManager._sll_parses + ParserManager._ll_fallbacks
+        logger.info(f"Parse statistics: {total} parsed, {ParserManager._ll_fallbacks} LL fallbacks")
+
+    # DFA cache
+    #region DFA cache
+    '''
+    The prediction DFA of vhdlParser and vhdlLexer is stored at class level, so every
+    parser and lexer created in one process already shares it. The functions below
+    persist that warm state between runs. The ATN is pickled together with the DFA,
+    because DFA states keep references to ATN states and prediction contexts.
+
+    The cache file starts with two lines, the cache key and the SHA-256 of the pickled
+    payload after them. The key holds the cache format version, the ANTLR runtime and
+    Python versions and a hash of the serialized ATNs. The payload is only unpickled
+    when both match, and only ANTLR runtime classes are accepted while unpickling.
+    '''
+
+    @staticmethod
+    def use_dfa_cache(cache_path: str) -> None:
+        # A process that already holds a warm DFA, e.g. a forked batch worker, keeps it
+        if ParserManager._loaded_dfa_states == 0:
+            ParserManager._pending_dfa_cache = cache_path
+
+    @staticmethod
+    def load_pending_dfa_cache(logger: logging.Logger) -> None:
+        if ParserManager._pending_dfa_cache is not None:
+            cache_path : str = ParserManager._pending_dfa_cache
+            ParserManager._pending_dfa_cache = None
+
+            ParserManager.load_dfa_cache(logger, cache_path)
+
+    @staticmethod
+    def load_dfa_cache(logger: logging.Logger, cache_path: str) -> bool:
+        from ANTLR.vhdlParser import vhdlParser
+        from ANTLR.vhdlLexer import vhdlLexer
+
+        if not os.path.exists(cache_path):
+            logger.debug(f"DFA cache {cache_path} not found, starting cold")
+            return False
+
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                key     : bytes = cache_file.readline().rstrip(b"\n")
+                digest  : bytes = cache_file.readline().rstrip(b"\n")
+                payload : bytes = cache_file.read()
+
+            if key.decode(errors="replace") != ParserManager._get_dfa_cache_key():
+                logger.info(f"DFA cache {cache_path} was built for another grammar or runtime, ignoring it")
+                return False
+
+            if hashlib.sha256(payload).hexdigest().encode() != digest:
+                logger.warning(f"DFA cache {cache_path} is damaged, starting cold")
+                return False
+
+            recursion_limit : int = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(recursion_limit, const.DFA_CACHE_RECURSION_LIMIT))
+
+            try:
+                cache : dict = _DFACacheUnpickler(io.BytesIO(payload)).load()
+            finally:
+                sys.setrecursionlimit(recursion_limit)
+
+            vhdlParser.atn, vhdlParser.decisionsToDFA, vhdlParser.sharedContextCache = cache["parser"]
+            vhdlLexer.atn, vhdlLexer.decisionsToDFA = cache["lexer"]
+
+            ParserManager._rehash_lexer_dfa(vhdlLexer.decisionsToDFA)
+
+        except Exception:
+            logger.warning(f"Could not load DFA cache {cache_path}, starting cold", exc_info=True)
+            return False
+
+        ParserManager._loaded_dfa_states = ParserManager.get_dfa_state_count()
+        logger.info(f"DFA cache loaded: {ParserManager._loaded_dfa_states} states")
+        return True
+
+    @staticmethod
+    def save_dfa_cache(logger: logging.Logger, cache_path: str) -> bool:
+        if ParserManager._pending_dfa_cache is not None:
+            logger.debug("Nothing was parsed, DFA cache not saved")
+            return False
+
+        from ANTLR.vhdlParser import vhdlParser
+        from ANTLR.vhdlLexer import vhdlLexer
+
+        state_count : int = ParserManager.get_dfa_state_count()
+
+        if state_count <= ParserManager._loaded_dfa_states:
+            logger.debug("DFA did not grow since it was loaded, cache not saved")
+            return False
+
+        cache : dict = {
+            "parser"    : (vhdlParser.atn, vhdlParser.decisionsToDFA, vhdlParser.sharedContextCache),
+            "lexer"     : (vhdlLexer.atn, vhdlLexer.decisionsToDFA)
+        }
+
+        temp_path : str = f"{cache_path}.{os.getpid()}.tmp"
+
+        try:
+            cache_dir : str = os.path.dirname(cache_path)
+            if cache_dir and not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+
+            recursion_limit : int = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(recursion_limit, const.DFA_CACHE_RECURSION_LIMIT))
+
+            try:
+                payload = io.BytesIO()
+                _DFACachePickler(payload, protocol=pickle.HIGHEST_PROTOCOL).dump(cache)
+            finally:
+                sys.setrecursionlimit(recursion_limit)
+
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(f"{ParserManager._get_dfa_cache_key()}\n{hashlib.sha256(payload.getbuffer()).hexdigest()}\n".encode())
+                cache_file.write(payload.getbuffer())
+
+            os.replace(temp_path, cache_path)   # replace atomically, so concurrent readers never see a partial file
+
+        except Exception:
+            logger.warning(f"Could not save DFA cache {cache_path}", exc_info=True)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        ParserManager._loaded_dfa_states = state_count
+        logger.info(f"DFA cache saved: {state_count} states")
+        return True
+
+    @staticmethod
+    def save_worker_dfa_cache(logger: logging.Logger, cache_path: str) -> bool:
+        # Run when a pool worker exits, the state count in the name lets the parent pick the largest
+        return ParserManager.save_dfa_cache(logger, f"{cache_path}.{ParserManager.get_dfa_state_count()}.{os.getpid()}.worker")
+
+    @staticmethod
+    def collect_worker_dfa_caches(logger: logging.Logger, cache_path: str) -> bool:
+        '''
+        Pool workers parse on copies of the DFA, the parent never sees what they add.
+        DFAs of different processes cannot be merged, so the largest one a worker saved
+        becomes the cache and the others are deleted. The next run starts every worker
+        from it, so the cache keeps growing over runs.
+        '''
+
+        worker_caches : List[str] = glob.glob(f"{glob.escape(cache_path)}.*.worker")
+
+        if not worker_caches:
+            return False
+
+        worker_caches.sort(key=lambda worker_cache: int(worker_cache.rsplit(".", 3)[-3]))
+
+        try:
+            os.replace(worker_caches.pop(), cache_path)
+        except OSError:
+            logger.warning(f"Could not save DFA cache {cache_path}", exc_info=True)
+            return False
+        finally:
+            for worker_cache in worker_caches:
+                os.remove(worker_cache)
+
+        logger.info(f"DFA cache saved from a worker: {cache_path}")
+        return True
+
+    @staticmethod
+    def _rehash_lexer_dfa(decisions_to_dfa: List[DFA]) -> None:
+        '''
+        LexerActionExecutor caches the hash of a string, and string hashes differ between
+        processes. An unpickled executor never equals the one the lexer builds for the same
+        actions, so every run added another copy of the states with lexer actions. The
+        hashes are computed again and the state maps rebuilt with them.
+        '''
+
+        def rehash(executor: LexerActionExecutor) -> None:
+            if executor is not None:
+                executor.hashCode = hash("".join(str(action) for action in executor.lexerActions))
+
+        for dfa in decisions_to_dfa:
+            for state in dfa._states:
+                rehash(state.lexerActionExecutor)
+
+                for config in state.configs:
+                    rehash(config.lexerActionExecutor)
+
+                state.configs.cachedHashCode = -1
+
+            dfa._states = {state : state for state in dfa._states}
+
+    @staticmethod
+    def get_dfa_state_count() -> int:
+        from ANTLR.vhdlParser import vhdlParser
+        from ANTLR.vhdlLexer import vhdlLexer
+
+        return sum(len(dfa._states) for dfa in vhdlParser.decisionsToDFA) + sum(len(dfa._states) for dfa in vhdlLexer.decisionsToDFA)
+
+    @staticmethod
+    def _get_dfa_cache_key() -> str:
+        import ANTLR.vhdlParser
+        import ANTLR.vhdlLexer
+
+        try:
+            runtime_version : str = importlib.metadata.version("antlr4-python3-runtime")
+        except importlib.metadata.PackageNotFoundError:
+            runtime_version : str = "unknown"
+
+        atn_hash = hashlib.sha1()
+        atn_hash.update(repr(ANTLR.vhdlParser.serializedATN()).encode())
+        atn_hash.update(repr(ANTLR.vhdlLexer.serializedATN()).encode())
+        return f"{const.DFA_CACHE_VERSION}:{runtime_version}:{sys.version_info[0]}.{sys.version_info[1]}:{atn_hash.hexdigest()}"
+
+    #endregion
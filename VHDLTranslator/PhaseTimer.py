@@ -0,0 +1,112 @@
+import os, sys
+import json
+import time
+import logging
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+try:
+    import resource
+except ImportError:     # not available on Windows, peak memory is reported as null there
+    resource = None
+
+class PhaseTimer():
+    '''
+    Wall time and CPU time per translation phase (encoding detection, lexing, token
+    buffering, parsing, visiting and every result creator). Phases are collected per
+    file by BatchTranslator and written as JSON together with the totals of the batch.
+    process_peak_rss_kb is the peak resident set size of the whole process since it
+    started (ru_maxrss), read at the end of the phase. It is not the memory the phase
+    used: it only grows, and a phase can be credited with the peak of an earlier one.
+    '''
+
+    enabled : bool = False
+
+    _phases : Dict[str, List] = {}     # phase -> [calls, wall_time, cpu_time, process_peak_rss_kb]
+
+    @staticmethod
+    def set_enabled(enabled: bool) -> None:
+        PhaseTimer.enabled = enabled
+
+    @staticmethod
+    @contextmanager
+    def measure(phase: str) -> Iterator[None]:
+        if not PhaseTimer.enabled:
+            yield
+            return
+
+        wall_start  : float = time.perf_counter()
+        cpu_start   : float = time.process_time()
+
+        try:
+            yield
+        finally:
+            entry : List = PhaseTimer._phases.setdefault(phase, [0, 0.0, 0.0, None])
+
+            entry[0] += 1
+            entry[1] += time.perf_counter() - wall_start
+            entry[2] += time.process_time() - cpu_start
+            entry[3] = PhaseTimer.get_process_peak_rss()
+
+    @staticmethod
+    def get_process_peak_rss() -> int:
+        if resource is None:
+            return None
+
+        peak_rss : int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_rss // 1024 if sys.platform == "darwin" else peak_rss    # bytes on macOS, KiB elsewhere
+
+    @staticmethod
+    def collect() -> Dict[str, dict]:
+        # Phases measured since the last call, for the file that was just translated
+        phases : Dict[str, dict] = {
+            phase : {
+                "calls"                 : calls,
+                "wall_time"             : round(wall_time, 6),
+                "cpu_time"              : round(cpu_time, 6),
+                "process_peak_rss_kb"   : peak_rss
+            }
+            for phase, (calls, wall_time, cpu_time, peak_rss) in PhaseTimer._phases.items()
+        }
+
+        PhaseTimer._phases = {}
+        return phases
+
+    @staticmethod
+    def get_total(files: Dict[str, Dict[str, dict]]) -> Dict[str, dict]:
+        total : Dict[str, dict] = {}
+
+        for phases in files.values():
+            for phase, values in phases.items():
+                phase_total : dict = total.setdefault(phase, {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "process_peak_rss_kb": None})
+
+                phase_total["calls"]        += values["calls"]
+                phase_total["wall_time"]    = round(phase_total["wall_time"] + values["wall_time"], 6)
+                phase_total["cpu_time"]     = round(phase_total["cpu_time"] + values["cpu_time"], 6)
+
+                if values["process_peak_rss_kb"] is not None:
+                    phase_total["process_peak_rss_kb"] = max(phase_total["process_peak_rss_kb"] or 0, values["process_peak_rss_kb"])
+
+        return total
+
+    @staticmethod
+    def write_report(logger: logging.Logger, path: str, files: Dict[str, Dict[str, dict]]) -> None:
+        total : Dict[str, dict] = PhaseTimer.get_total(files)
+
+        try:
+            directory : str = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            with open(path, 'w') as report_file:
+                json.dump({"files": files, "total": total}, report_file, indent=4)
+
+        except OSError:
+            logger.warning(f"Could not write phase timing to {path}", exc_info=True)
+            return
+
+        for phase, values in total.items():
+            logger.info(f"Phase {phase}: {values['wall_time']:.3f}s wall, {values['cpu_time']:.3f}s CPU, {values['calls']} calls")
+
+        logger.info(f"Phase timing of {len(files)} files written to {path}")
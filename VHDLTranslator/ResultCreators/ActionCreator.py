@@ -8,29 +8,42 @@ class ActionCreator(ResultFile):
 
     def create_result(self, result_path : str, vhdlData : VHDLData):
         try:
-            result_file = self._create_file(f"{result_path}.act")
+            self.open_result(result_path)
 
-            self.__iterate_trough_designs(vhdlData, result_file)
+            for design in vhdlData.design_list:
+                self.write_design(design)
 
-            result_file.close()
+            self.close_result(vhdlData)
 
         except Exception:
             print("Action result status ... Fail")
             print(traceback.format_exc())
+            return False
         else:
             print("Action result status ... Success")
+            return True
 
-    def __iterate_trough_designs(self, vhdlData: VHDLData, result_file) -> None:
-        for design in vhdlData.design_list:
-            if design.architecture is None: continue
+    # Streaming interface, designs are written one by one as soon as they are visited
+    def open_result(self, result_path : str) -> None:
+        self.result_file = self._create_file(f"{result_path}.act")
 
-            self.__write_actions_from_design(design, result_file)
+    def write_design(self, design: VHDLDesign) -> None:
+        if design.architecture is None: return
+
+        self.__write_actions_from_design(design, self.result_file)
+
+    def close_result(self, vhdlData : VHDLData) -> None:
+        self.result_file.close()
 
     def __write_actions_from_design(self, vhdl_design: VHDLDesign, result_file):
         for statement in vhdl_design.architecture.statements:
             self.__visit_statement(statement, result_file)
 
     def __visit_statement(self, statement : VHDLStatement, result_file):
+        if isinstance(statement, BlockStatement):
+            for block_statement in statement.statements:
+                self.__visit_statement(block_statement, result_file)
+
         if isinstance(statement, ProcessStatement):
             for process_statement in statement.statements:
                 self.__visit_statement(process_statement, result_file)
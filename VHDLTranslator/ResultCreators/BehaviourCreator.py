@@ -12,24 +12,33 @@ class BehaviourCreator(ResultFile):
 
     def create_result(self, result_path : str, vhdlData : VHDLData):
         try:
-            result_file = self._create_file(f"{result_path}.behp")
+            self.open_result(result_path)
 
-            self.__iterate_trough_designs(vhdlData, result_file)
+            for design in vhdlData.design_list:
+                self.write_design(design)
 
-            result_file.close()
+            self.close_result(vhdlData)
 
         except Exception:
             print("Behaviour result status ... Fail")
             print(traceback.format_exc())
+            return False
         else:
             print("Behaviour result status ... Success")
+            return True
         
-    def __iterate_trough_designs(self, vhdlData: VHDLData, result_file) -> None:
-        for design in vhdlData.design_list:
-            if design.architecture is None: continue
+    # Streaming interface, designs are written one by one as soon as they are visited
+    def open_result(self, result_path : str) -> None:
+        self.result_file = self._create_file(f"{result_path}.behp")
 
-            self.__write_concurrent_behaviour(design, result_file)
-            self.__write_sequential_behaviour(design, result_file)
+    def write_design(self, design: VHDLDesign) -> None:
+        if design.architecture is None: return
+
+        self.__write_concurrent_behaviour(design, self.result_file)
+        self.__write_sequential_behaviour(design, self.result_file)
+
+    def close_result(self, vhdlData : VHDLData) -> None:
+        self.result_file.close()
 
     def __write_concurrent_behaviour(self, vhdlDesign: VHDLDesign, result_file) -> None:
         concurrent_behaviour : str = "beh0 = "
@@ -40,7 +49,8 @@ class BehaviourCreator(ResultFile):
 
     def __get_concurrent_statement(self, statement: any) -> str:
         if isinstance(statement, BlockStatement):
-            pass
+            # A block only groups concurrent statements, they run in parallel with the ones around it
+            return " || ".join(self.__get_concurrent_statement(block_statement) for block_statement in statement.statements)
 
         if isinstance(statement, ConcurrentProcedureCallStatement):
             pass
@@ -72,6 +82,9 @@ class BehaviourCreator(ResultFile):
             self.__visit_statement(statement, result_file)
 
     def __visit_statement(self, statement : VHDLStatement, result_file):
+        if isinstance(statement, BlockStatement):
+            self.__visit_childs(statement.statements, result_file)
+
         if isinstance(statement, ProcessStatement):
             result_file.write(f"{statement.statement_name} = (")
             result_file.write("; ".join(self.__get_behaviours(statement.statements)))
@@ -1,39 +1,53 @@
+import logging
 import traceback
 
 from typing import List
 
 from Debug import Debug
 from ResultCreators.ResultFile import ResultFile
-from VHDL.VHDLData import VHDLData, VHDLFunctions
+from VHDL.VHDLData import VHDLData, VHDLDesign, VHDLFunctions
 from VHDL.VHDLDeclaration import *
 
 class EnvironmentCreator(ResultFile): 
 
-    def __init__(self):
-        self.output_log = Debug.get_logger("EnvironmentCreator")
+    def __init__(self, output_log: logging.Logger = None):
+        self.output_log = output_log or Debug.get_logger("EnvironmentCreator")
 
     def create_result(self, result_path: str, vhdlData: VHDLData):
         try:
-            result_file = self._create_file(f"{result_path}.env_descript")
-
-            result_file.write("environment(\n")
-            result_file.write(f"\ttypes:obj({self.__get_types(vhdlData)});\n")
-                
-            result_file.write(f"\tattributes:obj({self.__get_attributes(vhdlData)});\n")
-            result_file.write(f"\tagent_types:obj({self.__get_agent_types(vhdlData)});\n")  
-            result_file.write(f"\tagents:obj({self.__get_agents(vhdlData)});\n")            
-
-            result_file.write(f"\tinstances:obj({self.__get_instances(vhdlData)});\n")
-            result_file.write(f"\taxioms:obj({self.__get_axioms(vhdlData)});\n")
-            result_file.write(f"\tlogic_formula:obj({self.__get_logic_formula(vhdlData)})\n")
-            result_file.write(");")
-
-            result_file.close()
+            self.open_result(result_path)
+            self.close_result(vhdlData)
         
         except Exception:
             self.output_log.error("Environment result status ... Fail", exc_info=True)
+            return False
         else:
             self.output_log.info("Environment result status ... Success")
+            return True
+
+    # Streaming interface, the environment needs every declaration and agent, so it is written on close
+    def open_result(self, result_path: str) -> None:
+        self.result_file = self._create_file(f"{result_path}.env_descript")
+
+    def write_design(self, design: VHDLDesign) -> None:
+        pass
+
+    def close_result(self, vhdlData: VHDLData) -> None:
+        result_file = self.result_file
+
+        result_file.write("environment(\n")
+        result_file.write(f"\ttypes:obj({self.__get_types(vhdlData)});\n")
+            
+        result_file.write(f"\tattributes:obj({self.__get_attributes(vhdlData)});\n")
+        result_file.write(f"\tagent_types:obj({self.__get_agent_types(vhdlData)});\n")  
+        result_file.write(f"\tagents:obj({self.__get_agents(vhdlData)});\n")            
+
+        result_file.write(f"\tinstances:obj({self.__get_instances(vhdlData)});\n")
+        result_file.write(f"\taxioms:obj({self.__get_axioms(vhdlData)});\n")
+        result_file.write(f"\tlogic_formula:obj({self.__get_logic_formula(vhdlData)})\n")
+        result_file.write(");")
+
+        result_file.close()
     
     def __get_types(self, vhdlData: VHDLData) -> str:
         if not vhdlData.has_type_declaration():
@@ -84,7 +98,7 @@ class EnvironmentCreator(ResultFile):
 
         result += "\n"
 
-        for (statement_name, agent_name), declarations in vhdlData.agent_types.items():
+        for (statement_name, agent_name, design_unit), declarations in vhdlData.agent_types.items():
             if len(declarations) == 0:
                 result += f"\t\t{statement_name}:obj(Nil)"
             else:
@@ -1,26 +1,70 @@
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 import os
 import shutil
 import traceback
 
+class _ResultBuffer(StringIO):
+    # close_result closes the result file, the text is kept for render_result
+    text : str = ""
+
+    def close(self) -> None:
+        if not self.closed:
+            self.text = self.getvalue()
+
+        super().close()
+
+def create_result_file(result_path: str) -> TextIOWrapper:
+    try:
+        if os.path.exists(result_path):
+            # Construct the new name for the existing file
+            base, ext = os.path.splitext(result_path)
+            new_name = base + '_old' + ext
+            
+            # Rename the existing file
+            shutil.move(result_path, new_name)
+
+        # Create a new file
+        return open(result_path, 'w')
+        
+
+    except Exception:
+        print(traceback.format_exc())
+        #print(traceback.exc_info()[2])
+
 class ResultFile:
     def _create_file(self, result_path: str) -> TextIOWrapper:
+        return create_result_file(result_path)
+
+    def get_design_text(self, design) -> str:
+        # Text write_design produces for one design, incremental translation splices these
+        result_file = getattr(self, "result_file", None)
+        self.result_file = StringIO()
+
         try:
-            if os.path.exists(result_path):
-                # Construct the new name for the existing file
-                base, ext = os.path.splitext(result_path)
-                new_name = base + '_old' + ext
-                
-                # Rename the existing file
-                shutil.move(result_path, new_name)
-
-            # Create a new file
-            return open(result_path, 'w')
-            
+            self.write_design(design)
+            return self.result_file.getvalue()
+        finally:
+            self.result_file = result_file
+
+    def write_text(self, text: str) -> None:
+        self.result_file.write(text)
+
+    def render_result(self, vhdlData) -> str:
+        # Whole result as text without touching the disk, for InMemoryTranslator
+        self.result_file = _ResultBuffer()
+
+        for design in vhdlData.design_list:
+            self.write_design(design)
+
+        self.close_result(vhdlData)
+        return self.result_file.text
+
+    def abort_result(self) -> None:
+        # Close a result file left open by a failed streaming translation
+        result_file = getattr(self, "result_file", None)
 
-        except Exception:
-            print(traceback.format_exc())
-            #print(traceback.exc_info()[2])
+        if result_file is not None and not result_file.closed:
+            result_file.close()
 
     def _is_nil(self, result: str) -> str:
         if result == "":
@@ -0,0 +1,25 @@
+import os, sys
+import logging
+
+import pytest
+
+TESTS_PATH      : str = os.path.dirname(os.path.abspath(__file__))
+TRANSLATOR_PATH : str = os.path.dirname(TESTS_PATH)
+EXAMPLES_PATH   : str = os.path.join(os.path.dirname(TRANSLATOR_PATH), "Examples")
+
+# The translator modules import each other from the VHDLTranslator folder
+sys.path.insert(0, TRANSLATOR_PATH)
+
+@pytest.fixture(autouse=True)
+def work_dir(tmp_path, monkeypatch):
+    # Logs, result files and the translation cache are written relative to the working directory
+    from IncrementalTranslator import IncrementalTranslator
+
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+
+    IncrementalTranslator.clear()
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    return logging.getLogger("Tests")
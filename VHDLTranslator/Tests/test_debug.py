@@ -0,0 +1,122 @@
+'''
+Tests of the visitor logging and profiling: lookups that happen for every node must not
+warn, and the rule statistics count the visits without changing the result.
+'''
+
+import os, sys
+import json
+import logging
+import subprocess
+
+from typing import List
+
+import pytest
+
+from conftest import EXAMPLES_PATH, TRANSLATOR_PATH
+from Debug import Debug
+from ParserManager import ParserManager
+from VHDL.VHDLData import VHDLData
+
+GENERICS = """
+entity top is
+	generic(
+		WIDTH : integer := 8;
+		DEPTH : integer := 2 * 4
+	);
+	port(
+		clk : in bit;
+		o   : out integer
+	);
+end top;
+
+architecture rtl of top is
+begin
+	o <= WIDTH + DEPTH;
+end rtl;
+"""
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records : List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+@pytest.fixture
+def visitor_records():
+    logger : logging.Logger = Debug.get_logger("Visitor")
+    records : _Records = _Records()
+
+    logger.addHandler(records)
+    yield records.records
+    logger.removeHandler(records)
+
+def visit(text: str) -> VHDLData:
+    from antlr4 import CommonTokenStream, InputStream
+    from ANTLR.vhdlLexer import vhdlLexer
+    from CustomVhdlVisitor import CustomVhdlVisitor
+
+    stream : CommonTokenStream = CommonTokenStream(vhdlLexer(InputStream(text)))
+    stream.fill()
+
+    visitor : CustomVhdlVisitor = CustomVhdlVisitor()
+    visitor.visit_design_units(ParserManager.parse_design_units(logging.getLogger("Tests"), stream))
+
+    return visitor.get_vhdl_data()
+
+def test_lookups_before_the_first_declaration_are_silent(visitor_records):
+    visit(GENERICS)
+
+    assert not [record for record in visitor_records if record.funcName == "find_agent"]
+
+def profile_visitor(monkeypatch) -> None:
+    # profile_visitor wraps the methods of the class, monkeypatch puts the plain ones back afterwards
+    from CustomVhdlVisitor import CustomVhdlVisitor
+
+    for attribute_name, method in list(vars(CustomVhdlVisitor).items()):
+        if attribute_name.startswith("visit"):
+            monkeypatch.setattr(CustomVhdlVisitor, attribute_name, method)
+
+    monkeypatch.setattr(Debug, "_rule_statistics", {})
+    monkeypatch.setattr(Debug, "_rule_timer_stack", [])
+
+    Debug.profile_visitor(CustomVhdlVisitor)
+
+def test_rule_statistics(logger, work_dir, monkeypatch):
+    profile_visitor(monkeypatch)
+    visit(GENERICS)
+
+    statistics : dict = Debug.get_rule_statistics()
+
+    assert statistics["Design_unit"][0] == 2
+    assert statistics["Entity_declaration"][0] == 1
+    assert statistics["Architecture_body"][0] == 1
+    assert all(cumulative_time >= self_time >= 0 for _, cumulative_time, self_time in statistics.values())
+
+    Debug.write_rule_statistics(logger, str(work_dir / "rule_statistics.json"))
+
+    with open(work_dir / "rule_statistics.json", 'r') as statistics_file:
+        rules : dict = json.load(statistics_file)["rules"]
+
+    assert rules["Design_unit"]["count"] == 2
+    assert set(rules) == set(statistics)
+
+def test_profiled_visitor_gives_the_same_result(monkeypatch):
+    from InMemoryTranslator import InMemoryTranslator
+
+    plain : dict = InMemoryTranslator.translate_string(GENERICS).outputs
+
+    profile_visitor(monkeypatch)
+
+    assert InMemoryTranslator.translate_string(GENERICS).outputs == plain
+
+def test_rule_statistics_option(work_dir):
+    subprocess.run([sys.executable, os.path.join(TRANSLATOR_PATH, "VHDLTranslator.py"), "--no-cache", "--no-dfa-cache", "--rule-statistics", os.path.join(EXAMPLES_PATH, "CaseIfExample.vhd")],
+                   cwd=work_dir, check=True, capture_output=True)
+
+    with open(work_dir / "result" / "rule_statistics.json", 'r') as statistics_file:
+        rules : dict = json.load(statistics_file)["rules"]
+
+    assert rules["Design_unit"]["count"] > 0
+    assert list(rules) == sorted(rules, key=lambda rule_name: -rules[rule_name]["self_time"])
@@ -0,0 +1,94 @@
+'''
+Tests of the decision profile of the parser: the counters of the profiling simulator,
+the merge of worker statistics and the report --decision-profile writes.
+'''
+
+import os, sys
+import json
+import logging
+import subprocess
+
+from typing import Dict
+
+import pytest
+
+from antlr4 import CommonTokenStream, InputStream
+
+from conftest import EXAMPLES_PATH, TRANSLATOR_PATH
+from DecisionProfiler import DecisionProfiler
+from ParserManager import ParserManager
+
+ARCHITECTURE = """
+entity top is
+	port(
+		a : in bit;
+		x : out integer
+	);
+end top;
+
+architecture rtl of top is
+begin
+	x <= {expression};
+end rtl;
+"""
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(DecisionProfiler, "enabled", True)
+    monkeypatch.setattr(DecisionProfiler, "_decisions", {})
+
+def profile(expression: str) -> Dict[str, int]:
+    # Counters of all decisions, summed
+    from ANTLR.vhdlLexer import vhdlLexer
+
+    stream : CommonTokenStream = CommonTokenStream(vhdlLexer(InputStream(ARCHITECTURE.format(expression=expression))))
+    stream.fill()
+
+    ParserManager.parse_design_file(logging.getLogger("Tests"), stream)
+
+    statistics : Dict[int, dict] = DecisionProfiler.get_statistics()
+    return {counter : sum(entry[counter] for entry in statistics.values()) for counter in DecisionProfiler._counters}
+
+def test_sll_parse(profiler):
+    totals : Dict[str, int] = profile("a")
+
+    assert totals["invocations"] > 0
+    assert totals["ll_fallbacks"] == totals["ll_atn_transitions"] == totals["errors"] == 0
+
+def test_ll_fallback(profiler):
+    # SLL prediction cannot tell the qualified expression apart from an attribute name, see test_parser_manager
+    totals : Dict[str, int] = profile("t'(a)")
+
+    assert totals["sll_conflicts"] > 0
+    assert totals["ll_fallbacks"] > 0 and totals["ll_max_look"] > 0
+    assert totals["errors"] == 0
+
+def test_worker_statistics_are_merged(profiler):
+    DecisionProfiler.get_entry(1).update(invocations=2, time=0.5, sll_max_look=3)
+    before : Dict[int, dict] = DecisionProfiler.get_statistics()
+
+    DecisionProfiler.get_entry(1).update(invocations=5, time=1.5, sll_max_look=2)
+    DecisionProfiler.get_entry(2).update(invocations=1)
+    delta : Dict[int, dict] = DecisionProfiler.get_statistics_delta(before)
+
+    assert delta[1]["invocations"] == 3 and delta[1]["time"] == 1.0
+    assert delta[2]["invocations"] == 1
+
+    # Maximums are merged by their maximum, the other counters are added
+    DecisionProfiler.add_statistics({1: dict(delta[1], sll_max_look=7)})
+
+    assert DecisionProfiler.get_entry(1)["invocations"] == 8
+    assert DecisionProfiler.get_entry(1)["sll_max_look"] == 7
+
+def test_decision_profile_option(work_dir):
+    subprocess.run([sys.executable, os.path.join(TRANSLATOR_PATH, "VHDLTranslator.py"), "--no-cache", "--no-dfa-cache", "--decision-profile", os.path.join(EXAMPLES_PATH, "CaseIfExample.vhd")],
+                   cwd=work_dir, check=True, capture_output=True)
+
+    with open(work_dir / "result" / "decision_profile.json", 'r') as profile_file:
+        report : dict = json.load(profile_file)
+
+    decisions : list = report["decisions"]
+
+    assert decisions and decisions == sorted(decisions, key=lambda decision: -decision["time"])
+    assert set(report["rules"]) == {decision["rule"] for decision in decisions}
+    assert sum(rule["invocations"] for rule in report["rules"].values()) == sum(decision["invocations"] for decision in decisions)
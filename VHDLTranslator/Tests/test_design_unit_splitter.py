@@ -0,0 +1,72 @@
+'''
+Tests of the token level pre-scan that splits a file into its design units.
+'''
+
+from typing import List
+
+from antlr4 import CommonTokenStream, InputStream
+
+from ANTLR.vhdlLexer import vhdlLexer
+from DesignUnitSplitter import DesignUnitSplitter
+
+SOURCE : str = """
+library ieee;
+use ieee.std_logic_1164.all;
+
+entity top is
+	port(
+		clk : in std_logic;
+		o   : out std_logic
+	);
+end entity top;
+
+library ieee;
+use ieee.numeric_std.all;
+
+architecture rtl of top is
+	attribute keep : boolean;
+	attribute keep of o : signal is true;
+begin
+	u_inner: entity work.inner port map(clk => clk);
+end architecture rtl;
+
+package pkg is
+	constant WIDTH : integer := 8;
+end package pkg;
+
+package body pkg is
+end package body pkg;
+
+configuration cfg of top is
+	for rtl
+	end for;
+end configuration cfg;
+"""
+
+def split(text: str) -> List[str]:
+    units = DesignUnitSplitter.split(CommonTokenStream(vhdlLexer(InputStream(text))))
+    return [" ".join(token.text for token in unit[:4]).lower() for unit in units]
+
+def test_units_start_at_their_context_clause():
+    assert split(SOURCE) == [
+        "library ieee ; use",
+        "library ieee ; use",
+        "package pkg is constant",
+        "package body pkg is",
+        "configuration cfg of top"
+    ]
+
+def test_units_end_with_their_end():
+    # END ENTITY, the entity instantiation and the attribute specification do not start a unit
+    units = DesignUnitSplitter.split(CommonTokenStream(vhdlLexer(InputStream(SOURCE))))
+
+    assert [" ".join(token.text for token in unit[-3:]).lower() for unit in units] == [
+        "entity top ;",
+        "architecture rtl ;",
+        "package pkg ;",
+        "body pkg ;",
+        "configuration cfg ;"
+    ]
+
+def test_empty_file():
+    assert split("-- only a comment\n") == []
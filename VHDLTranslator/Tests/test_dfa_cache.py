@@ -0,0 +1,107 @@
+'''
+Tests of the persistent DFA cache of the generated parser and lexer.
+'''
+
+import os, sys
+import logging
+import subprocess
+
+from typing import List
+
+import pytest
+
+from antlr4.dfa.DFA import DFA
+
+from conftest import EXAMPLES_PATH, TRANSLATOR_PATH
+from ParserManager import ParserManager
+
+EXAMPLE : str = os.path.join(EXAMPLES_PATH, "hcms2905_driver_fsm.vhd")
+
+def cold_dfa(atn) -> List[DFA]:
+    return [DFA(decision_state, index) for index, decision_state in enumerate(atn.decisionToState)]
+
+@pytest.fixture
+def cold_start(monkeypatch):
+    # Start from an empty DFA, the fixture puts the warm one of the test process back afterwards
+    from antlr4.PredictionContext import PredictionContextCache
+    from ANTLR.vhdlParser import vhdlParser
+    from ANTLR.vhdlLexer import vhdlLexer
+
+    monkeypatch.setattr(vhdlParser, "atn", vhdlParser.atn)
+    monkeypatch.setattr(vhdlParser, "decisionsToDFA", cold_dfa(vhdlParser.atn))
+    monkeypatch.setattr(vhdlParser, "sharedContextCache", PredictionContextCache())
+    monkeypatch.setattr(vhdlLexer, "atn", vhdlLexer.atn)
+    monkeypatch.setattr(vhdlLexer, "decisionsToDFA", cold_dfa(vhdlLexer.atn))
+
+    monkeypatch.setattr(ParserManager, "_loaded_dfa_states", 0)
+    monkeypatch.setattr(ParserManager, "_pending_dfa_cache", None)
+
+def translate(logger, mode: str, result_path: str) -> None:
+    from VHDLTranslator import translate_to_result
+    from InMemoryTranslator import InMemoryTranslator
+
+    if mode == "in_memory":
+        with open(EXAMPLE, 'rb') as vhdl_file:
+            assert InMemoryTranslator.translate_bytes(vhdl_file.read()).success
+        return
+
+    assert translate_to_result(logger, EXAMPLE, use_cache=False, stream=(mode == "stream"), incremental=(mode == "incremental"), result_path=result_path)
+
+@pytest.mark.parametrize("mode", ["default", "stream", "incremental", "in_memory"])
+def test_first_lexer_uses_the_loaded_dfa(mode, logger, work_dir, cold_start, monkeypatch):
+    from ANTLR.vhdlLexer import vhdlLexer
+
+    cache_path : str = str(work_dir / "dfa.cache")
+
+    translate(logger, mode, str(work_dir / "first"))
+    assert ParserManager.save_dfa_cache(logger, cache_path)
+
+    # A new run: cold DFA, the cache is only pending until the first file is translated
+    monkeypatch.setattr(vhdlLexer, "decisionsToDFA", cold_dfa(vhdlLexer.atn))
+    monkeypatch.setattr(ParserManager, "_loaded_dfa_states", 0)
+    ParserManager.use_dfa_cache(cache_path)
+
+    lexers : List[vhdlLexer] = []
+    create_lexer = vhdlLexer.__init__
+
+    def spy(self, *arguments, **options) -> None:
+        create_lexer(self, *arguments, **options)
+        lexers.append(self)
+
+    monkeypatch.setattr(vhdlLexer, "__init__", spy)
+
+    translate(logger, mode, str(work_dir / "second"))
+
+    assert lexers and all(lexer._interp.decisionToDFA is vhdlLexer.decisionsToDFA for lexer in lexers)
+    assert ParserManager.get_dfa_state_count() == ParserManager._loaded_dfa_states
+
+def test_repeated_run_does_not_grow_the_cache(work_dir):
+    environment : dict = dict(os.environ, XDG_CACHE_HOME=str(work_dir / "cache"))
+    environment.pop("LOCALAPPDATA", None)
+
+    cache_path : str = str(work_dir / "cache" / "VHDLTranslator" / "dfa.cache")
+    cache_contents : List[bytes] = []
+
+    # String hashes differ between the two processes, like between two runs of the translator
+    for hash_seed in ("1", "2"):
+        environment["PYTHONHASHSEED"] = hash_seed
+        subprocess.run([sys.executable, os.path.join(TRANSLATOR_PATH, "VHDLTranslator.py"), "--no-cache", EXAMPLE],
+                       cwd=work_dir, env=environment, check=True, capture_output=True)
+
+        with open(cache_path, 'rb') as cache_file:
+            cache_contents.append(cache_file.read())
+
+    assert cache_contents[0] == cache_contents[1]
+
+def test_batch_workers_save_the_cache(work_dir, cold_start):
+    environment : dict = dict(os.environ, XDG_CACHE_HOME=str(work_dir / "cache"))
+    environment.pop("LOCALAPPDATA", None)
+
+    subprocess.run([sys.executable, os.path.join(TRANSLATOR_PATH, "VHDLTranslator.py"), "--no-cache", "-j", "2", EXAMPLES_PATH],
+                   cwd=work_dir, env=environment, check=True, capture_output=True)
+
+    # The largest DFA of the two workers became the cache, the other one was deleted
+    assert os.listdir(work_dir / "cache" / "VHDLTranslator") == ["dfa.cache"]
+
+    cache_path : str = str(work_dir / "cache" / "VHDLTranslator" / "dfa.cache")
+    assert ParserManager.load_dfa_cache(logging.getLogger("Tests"), cache_path)
@@ -0,0 +1,82 @@
+'''
+Golden output tests: every file of Examples/ is translated in each mode and the
+result files are compared with the ones checked in next to it.
+'''
+
+import os
+import glob
+
+from typing import Dict
+
+import pytest
+
+from conftest import EXAMPLES_PATH
+
+import Constants as const
+
+EXAMPLES = sorted(os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(EXAMPLES_PATH, "*.vhd")))
+
+def read_outputs(result_path: str) -> Dict[str, str]:
+    outputs : Dict[str, str] = {}
+
+    for extension in const.RESULT_EXTENSIONS:
+        with open(f"{result_path}{extension}", 'r') as result_file:
+            outputs[extension] = result_file.read()
+
+    return outputs
+
+def translate(logger, example: str, result_path: str, **options) -> Dict[str, str]:
+    from VHDLTranslator import translate_to_result
+
+    assert translate_to_result(logger, os.path.join(EXAMPLES_PATH, f"{example}.vhd"), result_path=result_path, **options)
+    return read_outputs(result_path)
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_default(example, logger, work_dir):
+    golden : Dict[str, str] = read_outputs(os.path.join(EXAMPLES_PATH, example))
+
+    assert translate(logger, example, str(work_dir / example), use_cache=False, stream=False) == golden
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_mmap(example, logger, work_dir, monkeypatch):
+    golden : Dict[str, str] = read_outputs(os.path.join(EXAMPLES_PATH, example))
+
+    # Every file is memory-mapped and lexed from its bytes
+    monkeypatch.setattr(const, "MMAP_THRESHOLD", 0)
+
+    assert translate(logger, example, str(work_dir / example), use_cache=False, stream=False) == golden
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_translation_cache(example, logger, work_dir):
+    golden : Dict[str, str] = read_outputs(os.path.join(EXAMPLES_PATH, example))
+
+    # The second translation is a cache hit, its files are copies of the first ones
+    for run in ("first", "second"):
+        os.makedirs(work_dir / run)
+        assert translate(logger, example, str(work_dir / run / example), use_cache=True) == golden
+
+    assert len(os.listdir(work_dir / "result" / "cache")) == 1
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_stream(example, logger, work_dir):
+    golden : Dict[str, str] = read_outputs(os.path.join(EXAMPLES_PATH, example))
+
+    assert translate(logger, example, str(work_dir / example), use_cache=False, stream=True) == golden
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_incremental(example, logger, work_dir):
+    golden : Dict[str, str] = read_outputs(os.path.join(EXAMPLES_PATH, example))
+
+    # The second translation reuses every design unit of the first one
+    assert translate(logger, example, str(work_dir / example), use_cache=False, incremental=True) == golden
+    assert translate(logger, example, str(work_dir / example), use_cache=False, incremental=True) == golden
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_in_memory(example):
+    from InMemoryTranslator import InMemoryTranslator, TranslationResult
+
+    with open(os.path.join(EXAMPLES_PATH, f"{example}.vhd"), 'rb') as vhdl_file:
+        result : TranslationResult = InMemoryTranslator.translate_bytes(vhdl_file.read())
+
+    assert result.syntax_errors == []
+    assert result.outputs == read_outputs(os.path.join(EXAMPLES_PATH, example))
@@ -0,0 +1,66 @@
+'''
+Tests of the expression pool: in stream mode the pool must not keep the expressions
+of designs that were already handed over.
+'''
+
+import gc
+import logging
+import weakref
+
+from typing import List
+
+from antlr4 import CommonTokenStream, InputStream
+
+from ANTLR.vhdlLexer import vhdlLexer
+from CustomVhdlVisitor import CustomVhdlVisitor
+from ParserManager import ParserManager
+from VHDL.VHDLExpression import Expression, Operation
+
+UNITS = "".join(f"""
+entity unit_{index} is
+	port(
+		a, b : in bit;
+		o    : out bit
+	);
+end unit_{index};
+
+architecture rtl of unit_{index} is
+begin
+	o <= a and b;
+end rtl;
+""" for index in range(2))
+
+def visit_with_callback(visitor: CustomVhdlVisitor) -> None:
+    stream : CommonTokenStream = CommonTokenStream(vhdlLexer(InputStream(UNITS)))
+    stream.fill()
+
+    visitor.visit_design_units(ParserManager.parse_design_units(logging.getLogger("Tests"), stream), lambda design: None)
+
+def test_stream_mode_releases_the_expressions_of_written_designs(monkeypatch):
+    visitor : CustomVhdlVisitor = CustomVhdlVisitor()
+    operations : List[weakref.ref] = []
+    intern = visitor.expression_pool.intern
+
+    def spy(expression: Expression) -> Expression:
+        expression = intern(expression)
+        if isinstance(expression, Operation):
+            operations.append(weakref.ref(expression))
+        return expression
+
+    monkeypatch.setattr(visitor.expression_pool, "intern", spy)
+
+    visit_with_callback(visitor)
+    gc.collect()
+
+    assert operations and all(operation() is None for operation in operations)
+
+def test_statistics_count_released_expressions():
+    visitor : CustomVhdlVisitor = CustomVhdlVisitor()
+
+    visit_with_callback(visitor)
+    statistics : dict = visitor.expression_pool.get_statistics()
+
+    # Every design was released after its callback, the log still reports the unique nodes of all of them
+    assert statistics["unique_nodes"] > 0
+    assert statistics["unique_nodes"] <= statistics["requested_nodes"]
+    assert visitor.expression_pool.released_nodes == statistics["unique_nodes"]
@@ -0,0 +1,81 @@
+'''
+Tests of the watch mode with the polling backend: changes that come in during the
+debounce time are translated once, and files saved without changes are skipped.
+'''
+
+import os
+
+from typing import Callable, List, Tuple
+
+import pytest
+
+import FileWatcher as file_watcher
+
+from FileWatcher import FileWatcher
+
+Step = Callable[[], None]
+
+def write(path, content: str, modified: int) -> Step:
+    def step() -> None:
+        path.write_text(content)
+        os.utime(path, (modified, modified))
+    return step
+
+def touch(path, modified: int) -> Step:
+    return lambda: os.utime(path, (modified, modified))
+
+def nothing() -> None:
+    pass
+
+@pytest.fixture
+def watch(logger, work_dir, monkeypatch):
+    def _no_inotify(*arguments):
+        raise OSError("inotify disabled by the test")
+
+    def watch(steps: List[Step]) -> List[Tuple[str, str]]:
+        # Runs one step before every wait of the watcher, the watch stops when they are used up
+        translations : List[Tuple[str, str]] = []
+
+        class _ScriptedBackend(file_watcher._PollingBackend):
+            def wait(self, timeout: float = None):
+                if not steps:
+                    raise KeyboardInterrupt()
+
+                steps.pop(0)()
+                return super().wait(timeout)
+
+        def translate(logger, vhdl_path: str, source: bytes = None) -> bool:
+            translations.append((os.path.basename(vhdl_path), bytes(source).decode()))
+            return True
+
+        monkeypatch.setattr(file_watcher, "_InotifyBackend", _no_inotify)
+        monkeypatch.setattr(file_watcher, "_PollingBackend", _ScriptedBackend)
+
+        FileWatcher(logger, [str(work_dir / "src")], translate, debounce=0.05, poll_interval=0.01).watch()
+        return translations
+
+    os.makedirs(work_dir / "src")
+    return watch
+
+def test_changes_within_the_debounce_time_are_translated_once(watch, work_dir):
+    a = work_dir / "src" / "a.vhd"
+    write(a, "first", 1_000_000)()
+
+    assert watch([
+        write(a, "second", 1_000_001),      # wait for a change
+        write(a, "third save", 1_000_002),  # debounce, another save comes in
+        nothing                             # debounce, quiet
+    ]) == [("a.vhd", "first"), ("a.vhd", "third save")]
+
+def test_files_saved_without_changes_are_skipped(watch, work_dir):
+    a = work_dir / "src" / "a.vhd"
+    b = work_dir / "src" / "b.vhd"
+    write(a, "a", 1_000_000)()
+    write(b, "b", 1_000_000)()
+
+    assert watch([
+        touch(a, 1_000_001),                # same content, new modification time
+        nothing,
+        write(b, "b changed", 1_000_001),
+        nothing
+    ]) == [("a.vhd", "a"), ("b.vhd", "b"), ("b.vhd", "b changed")]
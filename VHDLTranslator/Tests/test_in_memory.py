@@ -0,0 +1,42 @@
+'''
+Tests of the library interface on sources with syntax errors: the errors are
+returned with the result and the erroneous tree is never visited.
+'''
+
+import pytest
+
+from InMemoryTranslator import InMemoryTranslator, TranslationResult
+
+import Constants as const
+
+MISSING_SEMICOLON = """
+entity top is
+	port(
+		clk : in bit
+	)
+end top;
+
+architecture rtl of top is
+begin
+end rtl;
+"""
+
+@pytest.mark.parametrize("split_design_units", [True, False])
+def test_syntax_errors_are_returned(split_design_units, monkeypatch):
+    monkeypatch.setattr(const, "SPLIT_DESIGN_UNITS", split_design_units)
+
+    result : TranslationResult = InMemoryTranslator.translate_string(MISSING_SEMICOLON)
+
+    assert not result.success
+    assert result.syntax_errors and all(error.startswith("line 6:") for error in result.syntax_errors)
+
+    assert result.vhdl_data is None
+    assert result.outputs == dict.fromkeys(const.RESULT_EXTENSIONS, "")
+
+def test_valid_source_succeeds():
+    result : TranslationResult = InMemoryTranslator.translate_string(MISSING_SEMICOLON.replace("\t)\n", "\t);\n"))
+
+    assert result.success
+    assert result.syntax_errors == []
+    assert result.vhdl_data is not None
+    assert "clk:(bool)" in result.environment
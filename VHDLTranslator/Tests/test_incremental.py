@@ -0,0 +1,89 @@
+'''
+Tests of the incremental translation: after an edit the cached design units are spliced
+with the re-visited ones, and the result is the same as a translation from scratch.
+'''
+
+import re
+import logging
+
+from typing import Dict, List
+
+import pytest
+
+from IncrementalTranslator import IncrementalTranslator, UnitRecord
+
+import Constants as const
+
+def unit(index: int, port: str = "o", statement: str = "o <= a and b;") -> str:
+    return f"""
+entity unit_{index} is
+	port(
+		a, b : in bit;
+		{port} : out bit
+	);
+end unit_{index};
+
+architecture rtl of unit_{index} is
+	signal s_{index} : bit := '0';
+begin
+	{statement}
+end rtl;
+"""
+
+UNITS : List[str] = [unit(index) for index in range(3)]
+
+def translate(logger, text: str, result_path: str, incremental: bool) -> Dict[str, str]:
+    from VHDLTranslator import translate_to_result
+
+    assert translate_to_result(logger, "units.vhd", use_cache=False, source=text.encode("utf-8"), result_path=result_path, incremental=incremental)
+
+    outputs : Dict[str, str] = {}
+
+    for extension in const.RESULT_EXTENSIONS:
+        with open(f"{result_path}{extension}", 'r') as result_file:
+            outputs[extension] = result_file.read()
+
+    return outputs
+
+def get_translated_units(caplog) -> int:
+    messages : List[str] = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Incremental translation")]
+    return int(re.match(r"Incremental translation: (\d+) of", messages[-1]).group(1))
+
+@pytest.fixture
+def edit(logger, work_dir, caplog):
+    caplog.set_level(logging.INFO)
+
+    def edit(text: str) -> int:
+        # Translates the first version of the file and then text, which must give the result of a full translation
+        translate(logger, "".join(UNITS), str(work_dir / "units"), incremental=True)
+        caplog.clear()
+
+        assert translate(logger, text, str(work_dir / "units"), incremental=True) == translate(logger, text, str(work_dir / "full"), incremental=False)
+        return get_translated_units(caplog)
+
+    return edit
+
+def test_units_after_an_edited_statement_are_spliced(edit):
+    # Only the architecture of the first unit changed, the units after it are reused
+    assert edit("".join([unit(0, statement="o <= a or b;")] + UNITS[1:])) == 1
+
+def test_edited_entity_changes_the_units_after_it(edit):
+    # The renamed port is declared by the entity, every unit after it starts from another state
+    assert edit("".join([unit(0, port="q", statement="q <= a and b;")] + UNITS[1:])) == 6
+
+def test_added_unit(edit):
+    # The entity and architecture before the new unit are reused
+    assert edit("".join(UNITS[:1] + [unit(3)] + UNITS[1:])) == 6
+
+def test_removed_unit(edit):
+    assert edit("".join(UNITS[:1] + UNITS[2:])) == 2
+
+def test_units_keep_only_what_they_changed(logger, work_dir):
+    translate(logger, "".join(UNITS), str(work_dir / "units"), incremental=True)
+    records : List[UnitRecord] = next(iter(IncrementalTranslator._files.values()))
+
+    # Every declaration is held by the delta of the unit that declared it, not again by the units after it
+    declarations : List[int] = [len(record.state_delta[2][2]) for record in records]
+
+    assert all(declarations)
+    assert sum(declarations) == len({id(declaration) for record in records for declaration in record.state_delta[2][2]})
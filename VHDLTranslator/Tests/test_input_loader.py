@@ -0,0 +1,105 @@
+'''
+Tests of the input loading: the encoding detection and the input streams it chooses.
+'''
+
+import codecs
+
+import pytest
+
+from InputLoader import InputLoader
+
+import Constants as const
+
+ENTITY : str = """
+-- Größe des Zählers
+entity top is
+	port(
+		o : out bit
+	);
+end top;
+"""
+
+@pytest.mark.parametrize("bom, body_encoding, encoding", [
+    (codecs.BOM_UTF8,       'utf-8',        'utf-8-sig'),
+    (codecs.BOM_UTF16_LE,   'utf-16-le',    'utf-16'),
+    (codecs.BOM_UTF16_BE,   'utf-16-be',    'utf-16'),
+    (codecs.BOM_UTF32_LE,   'utf-32-le',    'utf-32'),
+    (codecs.BOM_UTF32_BE,   'utf-32-be',    'utf-32')
+])
+def test_bom(bom, body_encoding, encoding, logger):
+    # The UTF-32 LE BOM starts with the UTF-16 LE one, it must win
+    source : bytes = bom + ENTITY.encode(body_encoding)
+
+    assert InputLoader.detect_encoding(logger, source) == encoding
+    assert InputLoader.decode_source(logger, source) == ENTITY
+
+def test_ascii(logger):
+    assert InputLoader.detect_encoding(logger, ENTITY.replace("Größe des Zählers", "Counter width").encode('ascii')) == 'ascii'
+
+def test_utf8_without_chardet(logger, monkeypatch):
+    import chardet
+
+    monkeypatch.setattr(chardet, "detect", lambda sample: pytest.fail("chardet must not run for valid UTF-8"))
+
+    # Split multi-byte characters at the chunk boundaries must not be taken for invalid UTF-8
+    monkeypatch.setattr(const, "INPUT_CHUNK_SIZE", 3)
+
+    assert InputLoader.detect_encoding(logger, ENTITY.encode('utf-8')) == 'utf-8'
+
+def test_chardet_sees_only_a_sample(logger, monkeypatch):
+    import chardet
+
+    samples : list = []
+    detect = chardet.detect
+
+    def spy(sample: bytes) -> dict:
+        samples.append(sample)
+        return detect(sample)
+
+    monkeypatch.setattr(chardet, "detect", spy)
+    monkeypatch.setattr(const, "ENCODING_DETECTION_SAMPLE_SIZE", 64)
+
+    source : bytes = ENTITY.encode('latin-1') * 10
+
+    assert InputLoader.detect_encoding(logger, source) not in ('ascii', 'utf-8')
+    assert [len(sample) for sample in samples] == [64]
+
+def test_undecodable_characters_are_replaced(logger):
+    # chardet only saw a sample, bytes after it may not fit the detected encoding
+    assert InputLoader.decode_source(logger, b"entity \xff top", 'ascii') == "entity � top"
+
+MULTIBYTE : str = """
+-- Größe des Zählers, 0–255
+entity top is
+	port(
+		o : out integer
+	);
+end top;
+
+architecture rtl of top is
+	signal name : string(1 to 8) := "Zähler µ";
+	signal s : integer := 0;
+begin
+	o <= s;
+end rtl;
+"""
+
+@pytest.mark.parametrize("mapped", [True, False])
+def test_mmap_token_text(mapped, logger, work_dir, monkeypatch):
+    from VHDLTranslator import translate_to_result
+    from InputLoader import MMapInputStream
+
+    monkeypatch.setattr(const, "MMAP_THRESHOLD", 0 if mapped else len(MULTIBYTE.encode('utf-8')) + 1)
+
+    (work_dir / "top.vhd").write_bytes(MULTIBYTE.encode('utf-8'))
+    source = InputLoader.read_source(str(work_dir / "top.vhd"))
+
+    try:
+        assert isinstance(InputLoader.get_input_stream(logger, source), MMapInputStream) == mapped
+    finally:
+        InputLoader.close_source(source)
+
+    assert translate_to_result(logger, str(work_dir / "top.vhd"), use_cache=False, result_path=str(work_dir / "top"))
+
+    with open(work_dir / "top.env_descript", 'r', encoding='utf-8') as result_file:
+        assert '"Zähler µ"' in result_file.read()
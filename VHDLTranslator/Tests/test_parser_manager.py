@@ -0,0 +1,89 @@
+'''
+Tests of the two-stage parse: SLL prediction first, full LL prediction only for
+the inputs SLL cannot parse.
+'''
+
+import logging
+
+from typing import List
+
+import pytest
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from ParserManager import ParserManager
+
+ARCHITECTURE = """
+entity top is
+	port(
+		a : in bit;
+		x : out integer
+	);
+end top;
+
+architecture rtl of top is
+begin
+	x <= {expression};
+end rtl;
+"""
+
+class _Errors(ErrorListener):
+    def __init__(self):
+        self.errors : List[str] = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append(msg)
+
+@pytest.fixture(autouse=True)
+def statistics(monkeypatch):
+    monkeypatch.setattr(ParserManager, "_sll_parses", 0)
+    monkeypatch.setattr(ParserManager, "_ll_fallbacks", 0)
+
+def parse(text: str, split_design_units: bool) -> List[str]:
+    from ANTLR.vhdlLexer import vhdlLexer
+
+    logger : logging.Logger = logging.getLogger("Tests")
+    errors : _Errors = _Errors()
+
+    stream : CommonTokenStream = CommonTokenStream(vhdlLexer(InputStream(text)))
+    stream.fill()
+
+    if split_design_units:
+        trees : list = list(ParserManager.parse_design_units(logger, stream, errors))
+    else:
+        trees : list = [ParserManager.parse_design_file(logger, stream, errors)]
+
+    # Every token of the input ends up in the trees
+    assert "".join(tree.getText() for tree in trees).replace("<EOF>", "") == "".join(text.split())
+    return errors.errors
+
+@pytest.mark.parametrize("split_design_units", [True, False])
+def test_sll_parse(split_design_units):
+    assert parse(ARCHITECTURE.format(expression="a"), split_design_units) == []
+
+    assert ParserManager.get_statistics() == {"sll_parses": 2 if split_design_units else 1, "ll_fallbacks": 0}
+
+@pytest.mark.parametrize("split_design_units", [True, False])
+def test_sll_parse_of_nested_calls(split_design_units):
+    # The conversion function alternative of actual_part made SLL prediction bail out here
+    assert parse(ARCHITECTURE.format(expression="to_integer(unsigned(a(7 downto 0)))"), split_design_units) == []
+
+    assert ParserManager.get_statistics() == {"sll_parses": 2 if split_design_units else 1, "ll_fallbacks": 0}
+
+@pytest.mark.parametrize("split_design_units", [True, False])
+def test_ll_fallback_of_valid_input(split_design_units):
+    # SLL prediction cannot tell the qualified expression apart from an attribute name and bails out
+    assert parse(ARCHITECTURE.format(expression="t'(a)"), split_design_units) == []
+
+    if split_design_units:
+        assert ParserManager.get_statistics() == {"sll_parses": 1, "ll_fallbacks": 1}
+    else:
+        assert ParserManager.get_statistics() == {"sll_parses": 0, "ll_fallbacks": 1}
+
+def test_ll_fallback_reports_syntax_errors():
+    # The bail-out of the SLL stage is silent, the errors come from the LL stage
+    errors : List[str] = parse(ARCHITECTURE.format(expression="a") + "\n".join(["", "end;", ""]), False)
+
+    assert len(errors) == 1
+    assert ParserManager.get_statistics() == {"sll_parses": 0, "ll_fallbacks": 1}
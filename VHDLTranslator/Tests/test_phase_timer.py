@@ -0,0 +1,75 @@
+'''
+Tests of the phase timing: nothing is measured unless it is enabled, phases are
+collected per file and --phase-timing writes them with the totals of the batch.
+'''
+
+import os, sys
+import json
+import subprocess
+
+from typing import Dict
+
+import pytest
+
+from conftest import EXAMPLES_PATH, TRANSLATOR_PATH
+from PhaseTimer import PhaseTimer
+
+@pytest.fixture
+def phase_timer(monkeypatch):
+    monkeypatch.setattr(PhaseTimer, "enabled", True)
+    monkeypatch.setattr(PhaseTimer, "_phases", {})
+
+def test_disabled(monkeypatch):
+    monkeypatch.setattr(PhaseTimer, "enabled", False)
+    monkeypatch.setattr(PhaseTimer, "_phases", {})
+
+    with PhaseTimer.measure("lexing"):
+        pass
+
+    assert PhaseTimer.collect() == {}
+
+def test_collect(phase_timer):
+    for _ in range(3):
+        with PhaseTimer.measure("lexing"):
+            sum(range(1000))
+
+    # A phase that raises is measured too
+    with pytest.raises(ValueError):
+        with PhaseTimer.measure("parsing"):
+            raise ValueError()
+
+    phases : Dict[str, dict] = PhaseTimer.collect()
+
+    assert {phase : values["calls"] for phase, values in phases.items()} == {"lexing": 3, "parsing": 1}
+    assert phases["lexing"]["wall_time"] > 0
+    assert PhaseTimer.collect() == {}
+
+def test_total():
+    files : Dict[str, Dict[str, dict]] = {
+        "a.vhd" : {"lexing": {"calls": 1, "wall_time": 0.5, "cpu_time": 0.25, "process_peak_rss_kb": 100}},
+        "b.vhd" : {"lexing": {"calls": 2, "wall_time": 1.0, "cpu_time": 0.5, "process_peak_rss_kb": None},
+                   "parsing": {"calls": 1, "wall_time": 2.0, "cpu_time": 2.0, "process_peak_rss_kb": 300}}
+    }
+
+    assert PhaseTimer.get_total(files) == {
+        "lexing"    : {"calls": 3, "wall_time": 1.5, "cpu_time": 0.75, "process_peak_rss_kb": 100},
+        "parsing"   : {"calls": 1, "wall_time": 2.0, "cpu_time": 2.0, "process_peak_rss_kb": 300}
+    }
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_phase_timing_option(jobs, work_dir):
+    examples : list = [os.path.join(EXAMPLES_PATH, f"{example}.vhd") for example in ("CaseIfExample", "ConcurrentAssignmentExample")]
+
+    subprocess.run([sys.executable, os.path.join(TRANSLATOR_PATH, "VHDLTranslator.py"), "--no-cache", "--no-dfa-cache", "--phase-timing", "-j", jobs, *examples],
+                   cwd=work_dir, check=True, capture_output=True)
+
+    with open(work_dir / "result" / "phase_timing.json", 'r') as report_file:
+        report : dict = json.load(report_file)
+
+    # Phases are reported per file, also when the files were translated by worker processes
+    assert sorted(report["files"]) == sorted(os.path.abspath(example) for example in examples)
+
+    for phases in report["files"].values():
+        assert {"reading", "lexing", "parsing", "visiting", "total"} <= set(phases)
+
+    assert report["total"]["total"]["calls"] == 2
@@ -0,0 +1,132 @@
+'''
+Regression tests of the name resolution: every name is prefixed with the agent of
+the scope that declares it, looked up along the enclosing scopes.
+'''
+
+from InMemoryTranslator import InMemoryTranslator, TranslationResult
+
+SIGNALS_AND_SHADOWING = """
+library ieee;
+use ieee.std_logic_1164.all;
+
+entity top is
+	port(
+		clk : in std_logic;
+		o   : out std_logic
+	);
+end top;
+
+architecture rtl of top is
+	signal x : std_logic := '0';
+	signal y : std_logic := '0';
+begin
+	p_first: process(clk)
+		variable x : std_logic;
+	begin
+		x := clk;
+	end process;
+
+	p_second: process(clk)
+	begin
+		y <= x;
+		o <= y;
+	end process;
+end rtl;
+"""
+
+# Architectures of different entities with the same name, like the benchmark generator writes them
+TWO_ENTITIES = "".join(f"""
+library ieee;
+use ieee.std_logic_1164.all;
+
+entity unit_{index} is
+	port(
+		clk : in std_logic;
+		o   : out std_logic
+	);
+end unit_{index};
+
+architecture rtl of unit_{index} is
+	signal s_{index} : std_logic := '0';
+	signal t_{index} : std_logic := '0';
+begin
+	process(clk)
+	begin
+		s_{index} <= clk;
+		o <= t_{index};
+	end process;
+end rtl;
+""" for index in range(2))
+
+BLOCK = """
+library ieee;
+use ieee.std_logic_1164.all;
+
+entity blk is
+	port(
+		clk : in std_logic;
+		o   : out std_logic
+	);
+end blk;
+
+architecture rtl of blk is
+	signal a : std_logic := '0';
+begin
+	inner: block
+		signal b : std_logic := '0';
+	begin
+		process(clk)
+		begin
+			b <= a;
+			o <= b;
+		end process;
+	end block;
+end rtl;
+"""
+
+def test_signals_of_one_architecture():
+    from CustomVhdlVisitor import CustomVhdlVisitor
+    from VHDL.VHDLDeclaration import SignalDeclaration
+
+    symbol_table = CustomVhdlVisitor.SymbolTable()
+
+    # One call per signal declaration, like visitBlock_declarative_item does
+    for name in ("x", "y", "z"):
+        symbol_table.add_declarations(("rtl", "arc", "top"), [SignalDeclaration(name, "arc", "std_logic", "bool", None, None, None)])
+
+    assert [symbol_table.find_scope(name) for name in ("x", "y", "z")] == [("rtl", "arc", "top")] * 3
+
+def test_architecture_signal_is_not_shadowed_by_other_process():
+    result : TranslationResult = InMemoryTranslator.translate_string(SIGNALS_AND_SHADOWING)
+
+    assert result.syntax_errors == []
+    assert "(p_1.x = module.clk)" in result.action
+    assert "(arc.y = arc.x)" in result.action
+    assert "(module.o = arc.y)" in result.action
+
+def test_every_design_unit_has_its_agent():
+    result : TranslationResult = InMemoryTranslator.translate_string(TWO_ENTITIES)
+
+    assert result.syntax_errors == []
+    assert [(agent.statement_name, agent.agent_name) for agent in result.vhdl_data.agents] == [
+        ("unit_0", "module"), ("rtl", "arc"), ("process_1", "p_1"),
+        ("unit_1", "module"), ("rtl", "arc"), ("process_2", "p_2")
+    ]
+
+    for index in range(2):
+        assert f"(arc.s_{index} = module.clk)" in result.action
+        assert f"(module.o = arc.t_{index})" in result.action
+
+    # Both architectures keep their own signals
+    assert [[declaration.name for declaration in declarations] for (statement_name, agent_name, design_unit), declarations in result.vhdl_data.agent_types.items() if statement_name == "rtl"] == [
+        ["s_0", "t_0"], ["s_1", "t_1"]
+    ]
+
+def test_block_statement():
+    result : TranslationResult = InMemoryTranslator.translate_string(BLOCK)
+
+    assert result.syntax_errors == []
+    assert "(b_1.b = arc.a)" in result.action
+    assert "(module.o = b_1.b)" in result.action
+    assert "beh0 = Sensitive(process_1, sensitive(snvclk))" in result.behaviour
+    assert "inner:obj(b_1)" in result.environment
@@ -0,0 +1,59 @@
+'''
+Tests of the translation server over stdin/stdout with several worker processes.
+'''
+
+import io, os, sys
+import json
+import functools
+
+from typing import Dict, List
+
+from conftest import EXAMPLES_PATH
+
+import Constants as const
+
+def serve(logger, requests: List[dict], jobs: int = 4) -> Dict[object, dict]:
+    from TranslationServer import TranslationServer
+    from VHDLTranslator import translate_to_result, get_result_path
+
+    translate_function = functools.partial(translate_to_result, use_cache=False, stream=False, incremental=True)
+    server : TranslationServer = TranslationServer(logger, jobs, translate_function, get_result_path, use_dfa_cache=False)
+
+    output_stream : io.StringIO = io.StringIO()
+    server.serve_stdio(io.StringIO("".join(json.dumps(request) + "\n" for request in requests)), output_stream)
+
+    replies : List[dict] = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+    return {reply["id"]: reply for reply in replies}
+
+def test_requests_for_the_same_result_files(logger, work_dir, monkeypatch):
+    # serve_stdio sends stray prints to stderr
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+
+    example : str = os.path.join(EXAMPLES_PATH, "hcms2905_driver_fsm")
+    replies : Dict[object, dict] = serve(logger, [{"id": index, "path": f"{example}.vhd"} for index in range(16)])
+
+    assert len(replies) == 16
+    assert all(reply["success"] for reply in replies.values())
+
+    for extension in const.RESULT_EXTENSIONS:
+        with open(f"{example}{extension}", 'r') as golden_file:
+            golden : str = golden_file.read()
+
+        for result_path in (work_dir / "result" / f"hcms2905_driver_fsm{extension}", work_dir / "result" / f"hcms2905_driver_fsm_old{extension}"):
+            with open(result_path, 'r') as result_file:
+                assert result_file.read() == golden
+
+def test_reply_with_syntax_errors(logger, work_dir, monkeypatch):
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+
+    replies : Dict[object, dict] = serve(logger, [
+        {"id": "invalid", "source": "entity top is port(clk : in bit) end top;"},
+        {"id": "valid", "source": "entity top is port(clk : in bit); end top;"}
+    ], jobs=1)
+
+    assert replies["invalid"]["success"] is False
+    assert replies["invalid"]["syntax_errors"] == ["line 1:33 missing ';' at 'end'"]
+    assert "outputs" not in replies["invalid"]
+
+    assert replies["valid"]["success"] is True
+    assert "clk:(bool)" in replies["valid"]["outputs"][".env_descript"]
@@ -0,0 +1,72 @@
+'''
+Tests of the on-disk translation cache: least recently used entries are evicted
+once the cache grows over its size limit, and --no-cache does not touch it.
+'''
+
+import os, sys
+import subprocess
+
+from typing import List
+
+import pytest
+
+from conftest import EXAMPLES_PATH, TRANSLATOR_PATH
+from TranslationCache import TranslationCache
+
+import Constants as const
+
+ENTRY_SIZE : int = 100 * len(const.RESULT_EXTENSIONS)
+
+@pytest.fixture
+def cache(work_dir) -> TranslationCache:
+    # Room for two entries of the ones store_entries writes
+    return TranslationCache(str(work_dir / "cache"), max_size=2 * ENTRY_SIZE)
+
+def store_entries(logger, cache: TranslationCache, work_dir, keys: List[str]) -> None:
+    for extension in const.RESULT_EXTENSIONS:
+        (work_dir / f"result{extension}").write_text("x" * 100)
+
+    # One second apart, from the oldest to the most recently used
+    for age, key in enumerate(reversed(keys)):
+        cache.store(logger, key, str(work_dir / "result"))
+        modified : float = 1_000_000 - age
+        os.utime(os.path.join(cache.cache_path, key), (modified, modified))
+
+def test_evict_least_recently_used(logger, work_dir, cache):
+    store_entries(logger, cache, work_dir, ["a", "b", "c", "d"])
+    os.makedirs(os.path.join(cache.cache_path, "e.1234.tmp"))
+
+    cache.evict(logger)
+
+    # The entry of another process that is still being stored is left alone
+    assert sorted(os.listdir(cache.cache_path)) == ["c", "d", "e.1234.tmp"]
+
+def test_evict_keeps_entries_under_the_limit(logger, work_dir, cache):
+    store_entries(logger, cache, work_dir, ["a", "b"])
+
+    cache.evict(logger)
+
+    assert sorted(os.listdir(cache.cache_path)) == ["a", "b"]
+
+def test_hit_marks_the_entry_as_used(logger, work_dir, cache):
+    store_entries(logger, cache, work_dir, ["a", "b", "c"])
+
+    assert cache.load(logger, "a", str(work_dir / "loaded"))
+    cache.evict(logger)
+
+    assert sorted(os.listdir(cache.cache_path)) == ["a", "c"]
+
+@pytest.mark.parametrize("no_cache", [True, False])
+def test_no_cache(no_cache, work_dir):
+    environment : dict = dict(os.environ, XDG_CACHE_HOME=str(work_dir / "dfa"))
+    environment.pop("LOCALAPPDATA", None)
+
+    options : List[str] = ["--no-dfa-cache"] + (["--no-cache"] if no_cache else [])
+
+    subprocess.run([sys.executable, os.path.join(TRANSLATOR_PATH, "VHDLTranslator.py"), *options, os.path.join(EXAMPLES_PATH, "CaseIfExample.vhd")],
+                   cwd=work_dir, env=environment, check=True, capture_output=True)
+
+    cache_path : str = str(work_dir / const.TRANSLATION_CACHE_PATH)
+    entries : List[str] = os.listdir(cache_path) if os.path.isdir(cache_path) else []
+
+    assert len(entries) == (0 if no_cache else 1)
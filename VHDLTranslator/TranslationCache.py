@@ -0,0 +1,127 @@
+import os
+import glob
+import shutil
+import hashlib
+import logging
+
+from typing import List, Tuple
+
+from ResultCreators.ResultFile import create_result_file
+
+import Constants as const
+
+class TranslationCache():
+    '''
+    On-disk cache of result files, addressed by the hash of the .vhd source bytes and
+    the translator version. Every entry is a directory with the .act, .behp and
+    .env_descript files. Entries are touched on every hit and the least recently used
+    ones are evicted once the cache grows over its size limit.
+    '''
+
+    _version : str = None
+
+    def __init__(self, cache_path: str = const.TRANSLATION_CACHE_PATH, max_size: int = const.TRANSLATION_CACHE_MAX_SIZE):
+        self.cache_path = cache_path
+        self.max_size   = max_size
+
+    def get_key(self, source: bytes) -> str:
+        source_hash = hashlib.sha256(source)
+        source_hash.update(TranslationCache.get_version().encode())
+        return source_hash.hexdigest()
+
+    def load(self, logger: logging.Logger, key: str, result_path: str) -> bool:
+        entry_path : str = os.path.join(self.cache_path, key)
+
+        if not os.path.isdir(entry_path):
+            return False
+
+        try:
+            for extension in const.RESULT_EXTENSIONS:
+                with open(os.path.join(entry_path, extension), 'r') as cached_file:
+                    content : str = cached_file.read()
+
+                result_file = create_result_file(f"{result_path}{extension}")
+                result_file.write(content)
+                result_file.close()
+
+            os.utime(entry_path)    # mark entry as recently used
+
+        except OSError:
+            logger.warning(f"Translation cache entry {key} is broken, translating again", exc_info=True)
+            return False
+
+        logger.info(f"Translation cache hit: {key}")
+        return True
+
+    def store(self, logger: logging.Logger, key: str, result_path: str) -> None:
+        entry_path  : str = os.path.join(self.cache_path, key)
+        temp_path   : str = f"{entry_path}.{os.getpid()}.tmp"
+
+        if os.path.isdir(entry_path):
+            return
+
+        try:
+            os.makedirs(temp_path, exist_ok=True)
+
+            for extension in const.RESULT_EXTENSIONS:
+                shutil.copyfile(f"{result_path}{extension}", os.path.join(temp_path, extension))
+
+            os.rename(temp_path, entry_path)    # publish atomically, another worker may store the same entry
+
+        except OSError:
+            logger.debug(f"Translation cache entry {key} not stored", exc_info=True)
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+    def evict(self, logger: logging.Logger) -> None:
+        entries : List[Tuple[float, int, str]] = []
+
+        for entry_path in glob.glob(os.path.join(self.cache_path, "*")):
+            if not os.path.isdir(entry_path) or entry_path.endswith(".tmp"):
+                continue
+
+            try:
+                size : int = sum(os.path.getsize(os.path.join(entry_path, extension)) for extension in const.RESULT_EXTENSIONS)
+                entries.append((os.path.getmtime(entry_path), size, entry_path))
+            except OSError:
+                continue
+
+        total_size : int = sum(size for _, size, _ in entries)
+
+        if total_size <= self.max_size:
+            return
+
+        evicted : int = 0
+
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= size
+            evicted += 1
+
+        logger.info(f"Translation cache: {evicted} entries evicted, {total_size} bytes left")
+
+    @staticmethod
+    def get_version() -> str:
+        '''
+        Hash of the path, size and modification time of the translator sources and the
+        grammar, so that any change to the visitor, result creators or generated parser
+        invalidates old entries without reading the sources on every start.
+        '''
+
+        if TranslationCache._version is not None:
+            return TranslationCache._version
+
+        translator_path : str = os.path.dirname(os.path.abspath(__file__))
+        version_hash = hashlib.sha256()
+
+        sources : List[str] = glob.glob(os.path.join(translator_path, "**", "*.py"), recursive=True)
+        sources.append(os.path.join(translator_path, "ANTLR", "vhdl.g4"))
+
+        for source in sorted(sources):
+            source_stat : os.stat_result = os.stat(source)
+            version_hash.update(f"{os.path.relpath(source, translator_path)}:{source_stat.st_size}:{source_stat.st_mtime_ns}\n".encode())
+
+        TranslationCache._version = version_hash.hexdigest()
+        return TranslationCache._version
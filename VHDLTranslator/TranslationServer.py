@@ -0,0 +1,307 @@
+import os, sys
+import json
+import signal
+import logging
+import threading
+import traceback
+import socketserver
+
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, TextIO
+
+from Debug import Debug
+from ParserManager import ParserManager
+from BatchTranslator import BatchTranslator
+
+import Constants as const
+
+class TranslationServer():
+    '''
+    Long-running translator that keeps a pool of warm worker processes and serves
+    translate requests, one JSON object per line, over stdin/stdout or a Unix socket.
+    A request names a file or carries the source itself. The result files are written
+    to disk or sent back in the reply:
+
+        {"id": 1, "path": "design.vhd"}
+        {"id": 1, "success": true, "files": [".../result/design.act", ...]}
+
+        {"id": 2, "source": "entity ...", "name": "design", "output": "reply"}
+        {"id": 2, "success": true, "outputs": {".act": "...", ".behp": "...", ".env_descript": "..."}}
+
+    "output" is "disk" for paths and "reply" for inline sources unless given, "result_path"
+    sets where a disk result is written (without extension). Disk requests that write
+    the same result files are translated one after the other. Reply output is translated
+    in memory by InMemoryTranslator, without the translation cache. A source with syntax
+    errors fails and lists them under "syntax_errors". Replies can arrive out of order,
+    they carry the id of their request.
+    '''
+
+    def __init__(self, logger: logging.Logger, jobs: int,
+                 translate_function: Callable[..., bool], result_path_function: Callable[[logging.Logger, str], str],
+                 use_dfa_cache: bool = True, configure_worker: Callable[[], None] = None):
+        self.logger                 = logger
+        self.jobs                   = max(jobs, 1)
+        self.translate_function     = translate_function
+        self.result_path_function   = result_path_function
+        self.use_dfa_cache          = use_dfa_cache
+        self.configure_worker       = configure_worker
+
+        self.__executor : ProcessPoolExecutor = None
+
+        # Reply of the last request submitted for every result path that is still translated
+        self.__result_path_lock : threading.Lock = threading.Lock()
+        self.__result_path_replies : Dict[str, Future] = {}
+
+    def serve_stdio(self, input_stream: TextIO, output_stream: TextIO) -> None:
+        # Keep stray prints, e.g. the status lines of the result creators, out of the replies
+        sys.stdout = sys.stderr
+
+        lock : threading.Lock = threading.Lock()
+
+        def write_reply(reply: Future) -> None:
+            with lock:
+                output_stream.write(json.dumps(reply.result()) + "\n")
+                output_stream.flush()
+
+        with self.__start_pool():
+            self.logger.info(f"Serving JSON lines on stdin/stdout with {self.jobs} workers")
+
+            for line in input_stream:
+                if line.strip():
+                    self.submit(line).add_done_callback(write_reply)
+
+            self.__wait_for_result_paths()
+
+    def serve_socket(self, socket_path: str) -> None:
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise OSError("Unix sockets are not available on this platform, use --serve with stdin/stdout")
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)      # left behind by a server that did not shut down
+
+        with self.__start_pool(), _UnixServer(socket_path, _RequestHandler) as server:
+            server.translation_server = self
+
+            self.logger.info(f"Serving JSON lines on {socket_path} with {self.jobs} workers")
+
+            signal.signal(signal.SIGTERM, TranslationServer.__stop)
+
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                self.logger.info("Server stopped")
+            finally:
+                self.__wait_for_result_paths()
+                os.remove(socket_path)
+
+    @staticmethod
+    def __stop(signal_number: int, frame) -> None:
+        raise KeyboardInterrupt
+
+    def submit(self, line: str) -> Future:
+        '''
+        Start translating one request line. The returned future always resolves to a
+        reply, also for invalid requests and failed workers.
+        '''
+
+        reply : Future = Future()
+
+        try:
+            request : dict = json.loads(line)
+
+            if not isinstance(request, dict):
+                raise ValueError("request is not a JSON object")
+
+        except ValueError as error:
+            reply.set_result({"id": None, "success": False, "error": f"Invalid request: {error}"})
+            return reply
+
+        def set_reply(translation: Future) -> None:
+            try:
+                reply.set_result(translation.result())
+            except Exception:
+                reply.set_result({"id": request.get("id"), "success": False, "error": traceback.format_exc()})
+
+        def translate(previous_reply: Future = None) -> None:
+            try:
+                self.__executor.submit(TranslationServer._handle_request, request, self.translate_function, self.result_path_function).add_done_callback(set_reply)
+            except Exception:
+                reply.set_result({"id": request.get("id"), "success": False, "error": traceback.format_exc()})
+
+        result_path : str = self.__get_result_path(request)
+
+        if result_path is None:
+            translate()
+            return reply
+
+        # The creators move existing result files to _old before writing new ones, two workers
+        # doing that for the same files at once would mix or lose them. Wait for the previous request
+        request["result_path"] = result_path
+
+        with self.__result_path_lock:
+            previous_reply : Future = self.__result_path_replies.get(result_path)
+            self.__result_path_replies[result_path] = reply
+
+        def release_result_path(reply: Future) -> None:
+            with self.__result_path_lock:
+                if self.__result_path_replies.get(result_path) is reply:
+                    del self.__result_path_replies[result_path]
+
+        reply.add_done_callback(release_result_path)
+
+        if previous_reply is None:
+            translate()
+        else:
+            previous_reply.add_done_callback(translate)
+
+        return reply
+
+    def __wait_for_result_paths(self) -> None:
+        # Requests waiting for a result path are submitted later, the pool must not be shut down before
+        while True:
+            with self.__result_path_lock:
+                replies : List[Future] = list(self.__result_path_replies.values())
+
+            if not replies:
+                return
+
+            wait(replies)
+
+    def __get_result_path(self, request: dict) -> str:
+        # Result path of a valid disk request, None otherwise
+        if (request.get("path") is None) == (request.get("source") is None):
+            return None
+
+        if TranslationServer._get_output(request) != "disk":
+            return None
+
+        result_path : str = request.get("result_path") or self.result_path_function(self.logger, TranslationServer._get_vhdl_path(request))
+        return os.path.abspath(result_path) if result_path else None
+
+    def __start_pool(self) -> ProcessPoolExecutor:
+        # Forked workers inherit the DFA of the server, so it is loaded once here
+        ParserManager.load_pending_dfa_cache(self.logger)
+
+        self.__executor = ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=TranslationServer._initialize_worker,
+            initargs=(self.use_dfa_cache, self.configure_worker)
+        )
+
+        return self.__executor
+
+    @staticmethod
+    def _initialize_worker(use_dfa_cache: bool, configure_worker: Callable[[], None] = None) -> None:
+        sys.stdout = sys.stderr
+
+        # The server stops the workers, Ctrl+C in the terminal reaches them as well
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        BatchTranslator._initialize_worker(use_dfa_cache, configure_worker)
+
+        # Import the parser, visitor and creators now, so the first request is served warm
+        import CustomVhdlVisitor
+        import InMemoryTranslator
+        import ResultCreators.ActionCreator
+        import ResultCreators.BehaviourCreator
+        import ResultCreators.EnvironmentCreator
+
+        ParserManager.load_pending_dfa_cache(Debug.get_logger("TranslationServer"))
+
+    @staticmethod
+    def _handle_request(request: dict, translate_function: Callable[..., bool], result_path_function: Callable[[logging.Logger, str], str]) -> dict:
+        output_log : logging.Logger = Debug.get_logger("TranslationServer")
+        reply : dict = {"id": request.get("id")}
+
+        path : str = request.get("path")
+        text : str = request.get("source")
+
+        if (path is None) == (text is None):
+            reply.update(success=False, error="A request needs either path or source")
+            return reply
+
+        output : str = TranslationServer._get_output(request)
+
+        if output not in ("disk", "reply"):
+            reply.update(success=False, error=f"Unknown output {output}, use disk or reply")
+            return reply
+
+        if output == "disk":
+            vhdl_path   : str = TranslationServer._get_vhdl_path(request)
+            source      : bytes = text.encode("utf-8") if text is not None else None
+
+            result_path : str = request.get("result_path") or result_path_function(output_log, vhdl_path)
+            success : bool = bool(translate_function(output_log, vhdl_path, source=source, result_path=result_path))
+
+            reply.update(success=success)
+            if success:
+                reply["files"] = [f"{result_path}{extension}" for extension in const.RESULT_EXTENSIONS]
+
+            return reply
+
+        # Reply output, translated in memory without result files
+        from InMemoryTranslator import InMemoryTranslator, TranslationResult
+
+        if text is not None:
+            result : TranslationResult = InMemoryTranslator.translate_string(text)
+        else:
+            with open(path, 'rb') as vhdl_file:
+                result : TranslationResult = InMemoryTranslator.translate_bytes(vhdl_file.read())
+
+        reply.update(success=result.success)
+        if result.success:
+            reply["outputs"] = result.outputs
+        else:
+            reply["syntax_errors"] = result.syntax_errors
+
+        return reply
+
+    @staticmethod
+    def _get_output(request: dict) -> str:
+        return request.get("output", "disk" if request.get("path") is not None else "reply")
+
+    @staticmethod
+    def _get_vhdl_path(request: dict) -> str:
+        path : str = request.get("path")
+        return path if path is not None else f"{request.get('name', 'inline')}.vhd"
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        translation_server : TranslationServer = None
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    '''
+    One client connection. Requests of a connection are translated concurrently and
+    every reply is written as soon as it is ready.
+    '''
+
+    def handle(self) -> None:
+        lock    : threading.Lock = threading.Lock()
+        written : List[Future] = []
+
+        for line in self.rfile:
+            if line.strip():
+                reply : Future = self.server.translation_server.submit(line.decode("utf-8"))
+                written.append(self.__write_reply(reply, lock))
+
+        # The connection is closed when this returns, so wait until every reply is written, not only translated
+        wait(written)
+
+    def __write_reply(self, reply: Future, lock: threading.Lock) -> Future:
+        written : Future = Future()
+
+        def write_reply(reply: Future) -> None:
+            try:
+                with lock:
+                    self.wfile.write((json.dumps(reply.result()) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+            except (OSError, ValueError):
+                pass    # the client closed the connection
+            finally:
+                written.set_result(None)
+
+        reply.add_done_callback(write_reply)
+        return written
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from enum import Enum
 
 from VHDL.VHDLStatements import *
@@ -47,7 +47,7 @@ class VHDLDesign:
 class VHDLData:
     design_list : List[VHDLDesign]
 
-    agent_types     : Dict[(str, str), List[VHDLDeclaration]]
+    agent_types     : Dict[Tuple[str, str, str], List[VHDLDeclaration]]     # (statement_name, agent_name, design_unit)
     agents          : List[VHDLStatement]
     declarations    : List[VHDLDeclaration]
     build_in_functions : List[VHDLFunctions]
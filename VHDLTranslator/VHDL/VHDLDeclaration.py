@@ -5,6 +5,8 @@ from typing import List, Tuple
 
 @dataclass
 class VHDLDeclaration():
+    __slots__ = ('name', 'agent_name')
+
     name            : str
     agent_name      : str
 
@@ -14,6 +16,8 @@ class VHDLDeclaration():
 
 @dataclass
 class Port(VHDLDeclaration):
+    __slots__ = ('signal_mode', 'subtype_indication', 'subtype_indication_js', 'expression', 'expression_with_agents')
+
     signal_mode             : str
     subtype_indication      : str
     subtype_indication_js   : str
@@ -22,6 +26,8 @@ class Port(VHDLDeclaration):
 
 @dataclass
 class Generic(VHDLDeclaration):
+    __slots__ = ('subtype_indication', 'subtype_indication_js', 'expression', 'expression_with_agents')
+
     subtype_indication      : str
     subtype_indication_js   : str
     expression              : str
@@ -29,6 +35,8 @@ class Generic(VHDLDeclaration):
 
 @dataclass
 class SubprogramBody(VHDLDeclaration):
+    __slots__ = ('specification', 'declarations', 'subprogram_kind')
+
     specification       : None
     declarations        : List[VHDLDeclaration]
     #statements          : List[VHDLStatement]
@@ -36,21 +44,23 @@ class SubprogramBody(VHDLDeclaration):
 
 @dataclass
 class TypeDeclaration(VHDLDeclaration):
-    ...
+    __slots__ = ()
 
 # Scalar type definition
 #region ScalarType
 @dataclass
 class PhysicalType(TypeDeclaration):
-    ...
+    __slots__ = ()
 
 @dataclass
 class EnumerationType(TypeDeclaration):
+    __slots__ = ('enumeration_literals',)
+
     enumeration_literals : List[str]
 
 @dataclass
 class RangeConstraint(TypeDeclaration):
-    ...
+    __slots__ = ()
 #endregion
 
 # Composite type definition
@@ -59,40 +69,44 @@ class RangeConstraint(TypeDeclaration):
  # Array type definition
 @dataclass
 class UnconstrainedArray(TypeDeclaration):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ConstrainedArray(TypeDeclaration):
-    ...
+    __slots__ = ()
 
 # Record type
 @dataclass
 class RecordType(TypeDeclaration):
-    ...
+    __slots__ = ()
 #endregion
 
 # Access type definition
 #region AccessType
 @dataclass
 class AccessType(TypeDeclaration):
-    ...
+    __slots__ = ()
 #endregion
 
 # File type definition
 #region FileType
 @dataclass
 class FileType(TypeDeclaration):
-    ...
+    __slots__ = ()
 #endregion
 
 @dataclass
 class SubtypeDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier', 'subtype_indication', 'subtype_indication_js')
+
     identifier              : str
     subtype_indication      : str
     subtype_indication_js   : str
 
 @dataclass
 class ConstantDeclaration(VHDLDeclaration):
+    __slots__ = ('subtype_indication', 'subtype_indication_js', 'expression', 'expression_with_agents')
+
     subtype_indication      : str
     subtype_indication_js   : str
     expression              : str
@@ -100,6 +114,8 @@ class ConstantDeclaration(VHDLDeclaration):
 
 @dataclass
 class SignalDeclaration(VHDLDeclaration):
+    __slots__ = ('subtype_indication', 'subtype_indication_js', 'signal_kind', 'expression', 'expression_with_agents')
+
     subtype_indication      : str
     subtype_indication_js   : str
     signal_kind             : str
@@ -108,6 +124,8 @@ class SignalDeclaration(VHDLDeclaration):
 
 @dataclass
 class VariableDeclaration(VHDLDeclaration):
+    __slots__ = ('subtype_indication', 'subtype_indication_js', 'expression', 'expression_with_agents')
+
     subtype_indication      : str
     subtype_indication_js   : str
     expression              : str
@@ -115,6 +133,8 @@ class VariableDeclaration(VHDLDeclaration):
 
 @dataclass
 class FileDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier_list', 'subtype_indication', 'subtype_indication_js', 'file_open_information')
+
     identifier_list         : List[str]
     subtype_indication      : str
     subtype_indication_js   : str
@@ -122,6 +142,8 @@ class FileDeclaration(VHDLDeclaration):
 
 @dataclass
 class AliasDeclaration(VHDLDeclaration):
+    __slots__ = ('designator', 'indication', 'signature')
+
     designator  : None
     indication  : None
     name        : None
@@ -129,17 +151,23 @@ class AliasDeclaration(VHDLDeclaration):
 
 @dataclass
 class ComponentDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier', 'generic_clause', 'port_clause')
+
     identifier      : str
     generic_clause  : List[Generic]
     port_clause     : List[Port]
 
 @dataclass
 class AttributeDeclaration(VHDLDeclaration):
+    __slots__ = ('label_colon',)
+
     label_colon : str
     name        : str
 
 @dataclass
 class AttributeSpecification(VHDLDeclaration):
+    __slots__ = ('designator', 'specification', 'expression', 'expression_with_agents')
+
     designator              : None
     specification           : None
     expression              : str
@@ -147,58 +175,80 @@ class AttributeSpecification(VHDLDeclaration):
 
 @dataclass
 class ConfigurationSpecification(VHDLDeclaration):
+    __slots__ = ('component_specification', 'binding_indication')
+
     component_specification : None
     binding_indication      : None
 
 @dataclass
 class DisconnectionSpecification(VHDLDeclaration):
+    __slots__ = ('guarded_signal_specification', 'expression', 'expression_with_agents')
+
     guarded_signal_specification    : None
     expression                      : str
     expression_with_agents          : str
 
 @dataclass
 class StepLimitSpecification(VHDLDeclaration):
+    __slots__ = ('quantity_specification', 'expression', 'expression_with_agents')
+
     quantity_specification : None
     expression                      : str
     expression_with_agents          : str
 
 @dataclass
 class UseClause(VHDLDeclaration):
+    __slots__ = ('selected_name',)
+
     selected_name : List[str]
 
 @dataclass
 class GroupTemplateDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier', 'entity_class_entry_list')
+
     identifier              : str
     entity_class_entry_list : None
 
 @dataclass
 class GroupDeclaration(VHDLDeclaration):
+    __slots__ = ('group_constituent_list',)
+
     name                    : str
     group_constituent_list  : None
 
 @dataclass
 class NatureDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier', 'nature_definition')
+
     identifier          : str
     nature_definition   : None
 
 @dataclass
 class SubnatureDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier', 'subnature_indication')
+
     identifier              : str
     subnature_indication    : None
 
 @dataclass
 class QuantityDeclaration(VHDLDeclaration):
+    __slots__ = ('free_quantity_declaration', 'branch_quantity_declaration', 'source_quantity_declaration')
+
     free_quantity_declaration   : None
     branch_quantity_declaration : None
     source_quantity_declaration : None
 
 @dataclass
 class TerminalDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier_list', 'subnature_indication')
+
     identifier_list         : List[str]
     subnature_indication    : None
 
 @dataclass
 class ElementDeclaration(VHDLDeclaration):
+    __slots__ = ('identifier_list', 'subtype', 'subtype_js')
+
     identifier_list : List[str]
     subtype         : str
     subtype_js      : str
\ No newline at end of file
@@ -0,0 +1,266 @@
+from __future__ import annotations
+from dataclasses import dataclass, fields
+from typing import ClassVar, Dict, Iterator, List, Tuple
+
+import logging
+
+
+@dataclass
+class Expression():
+    '''
+    Node of the expression tree built by the expression visitors. A node is rendered
+    as VHDL text or as text with agent-qualified names only when it is asked for,
+    and each rendering is kept on the node, so shared subtrees are rendered once.
+    '''
+
+    _text               : ClassVar[str] = None
+    _text_with_agents   : ClassVar[str] = None
+    _renderings         : ClassVar[Tuple[ExpressionText, ExpressionText]] = None
+
+    def get_text(self) -> str:
+        if self._text is None:
+            self._text = self._render(False)
+        return self._text
+
+    def get_text_with_agents(self) -> str:
+        if self._text_with_agents is None:
+            self._text_with_agents = self._render(True)
+        return self._text_with_agents
+
+    def get_renderings(self) -> Tuple[ExpressionText, ExpressionText]:
+        # The (text, text_with_agents) pair stored in statements and declarations, shared by all that use the node
+        if self._renderings is None:
+            self._renderings = (ExpressionText(self, False), ExpressionText(self, True))
+        return self._renderings
+
+    def get_leaves(self) -> Iterator[Expression]:
+        yield self
+
+    def get_key(self) -> tuple:
+        # Children are interned before their parent, so they are compared by identity
+        return (type(self),) + tuple(Expression.__get_key_part(getattr(self, field.name)) for field in fields(self))
+
+    def _render(self, with_agents: bool) -> str:
+        raise NotImplementedError
+
+    @staticmethod
+    def __get_key_part(value):
+        if isinstance(value, Expression):
+            return id(value)
+
+        if isinstance(value, list):
+            return tuple(Expression.__get_key_part(item) for item in value)
+
+        return value
+
+class ExpressionText():
+    '''
+    One rendering of an expression, formatted like a string by the result creators
+    '''
+
+    __slots__ = ('expression', 'with_agents')
+
+    def __init__(self, expression: Expression, with_agents: bool):
+        self.expression  = expression
+        self.with_agents = with_agents
+
+    def __str__(self) -> str:
+        return self.expression.get_text_with_agents() if self.with_agents else self.expression.get_text()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __contains__(self, item: str) -> bool:
+        return item in str(self)
+
+    def __len__(self) -> int:
+        return len(str(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ExpressionText):
+            other = str(other)
+        return str(self) == other
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+# Leaves
+#region Leaves
+
+@dataclass
+class Text(Expression):
+    # Leaf with fixed renderings, e.g. OTHERS, UNAFFECTED or a rewritten built-in call
+    text                : str
+    text_with_agents    : str
+
+    def _render(self, with_agents: bool) -> str:
+        return self.text_with_agents if with_agents else self.text
+
+@dataclass
+class Name(Expression):
+    # Also covers function calls, the grammar parses them as names
+    name    : str
+    agent   : str
+
+    def _render(self, with_agents: bool) -> str:
+        if with_agents and self.agent is not None:
+            return f"{self.agent}.{self.name}"
+        return self.name
+
+@dataclass
+class Literal(Name):
+    ...
+
+#endregion
+
+# Operations
+#region Operations
+
+@dataclass
+class Operation(Expression):
+    '''
+    operand (operator operand)*, the operator is written in VHDL or in its agent form
+    '''
+
+    operands                : List[Expression]
+    operators               : List[str]
+    operators_with_agents   : List[str]
+
+    def get_leaves(self) -> Iterator[Expression]:
+        for operand in self.operands:
+            yield from operand.get_leaves()
+
+    def _render(self, with_agents: bool) -> str:
+        operators : List[str] = self.operators_with_agents if with_agents else self.operators
+        texts : List[str] = [
+            operand.get_text_with_agents() if with_agents else operand.get_text()
+            for operand in self.operands
+        ]
+
+        parts : List[str] = [texts[0]]
+
+        for operator, text in zip(operators, texts[1:]):
+            parts.append(f" {operator} {text}")
+
+        return "".join(parts)
+
+@dataclass
+class Sign(Expression):
+    sign    : str
+    operand : Expression
+
+    def get_leaves(self) -> Iterator[Expression]:
+        yield from self.operand.get_leaves()
+
+    def _render(self, with_agents: bool) -> str:
+        text : str = self.operand.get_text_with_agents() if with_agents else self.operand.get_text()
+        return f" {self.sign} {text}"
+
+@dataclass
+class Parenthesized(Expression):
+    expression : Expression
+
+    def get_leaves(self) -> Iterator[Expression]:
+        yield from self.expression.get_leaves()
+
+    def _render(self, with_agents: bool) -> str:
+        text : str = self.expression.get_text_with_agents() if with_agents else self.expression.get_text()
+        return f"({text})"
+
+@dataclass
+class Aggregate(Expression):
+    elements : List[Expression]
+
+    def get_leaves(self) -> Iterator[Expression]:
+        for element in self.elements:
+            yield from element.get_leaves()
+
+    def _render(self, with_agents: bool) -> str:
+        return ", ".join(
+            element.get_text_with_agents() if with_agents else element.get_text()
+            for element in self.elements
+        )
+
+@dataclass
+class WaveformElement(Expression):
+    '''
+    A (others => x) aggregate is written as an 8 bit vector of x
+    '''
+
+    expression : Expression
+
+    def get_leaves(self) -> Iterator[Expression]:
+        yield from self.expression.get_leaves()
+
+    def _render(self, with_agents: bool) -> str:
+        if not with_agents:
+            return self.expression.get_text()
+
+        text : str = self.expression.get_text_with_agents()
+
+        if "others ==" in text:
+            #length = self.find_vector_length(target)
+            text = text.replace("others == ", "")
+            text = f"'{text * 8}'"
+
+        return text
+
+#endregion
+
+class ExpressionPool():
+    '''
+    Hash-consing table of one translation. Identical expression nodes and agent-qualified
+    strings are replaced by the instance seen first, so repeated conditions and right-hand
+    sides (e.g. state = Init_st in an FSM) share one node and are rendered once.
+    '''
+
+    def __init__(self):
+        self.__nodes    : Dict[tuple, Expression] = {}
+        self.__texts    : Dict[str, str] = {}
+
+        self.requested_nodes : int = 0
+        self.requested_texts : int = 0
+
+        self.released_nodes : int = 0
+        self.released_texts : int = 0
+
+    def intern(self, expression: Expression) -> Expression:
+        self.requested_nodes += 1
+        return self.__nodes.setdefault(expression.get_key(), expression)
+
+    def intern_text(self, text: str) -> str:
+        self.requested_texts += 1
+        return self.__texts.setdefault(text, text)
+
+    def release(self) -> None:
+        '''
+        Drop the interned nodes and strings, e.g. after a design was handed over, so the pool
+        does not keep them alive. Nodes interned later are not shared with the released ones.
+        '''
+
+        self.released_nodes += len(self.__nodes)
+        self.released_texts += len(self.__texts)
+
+        self.__nodes.clear()
+        self.__texts.clear()
+
+    def get_statistics(self) -> dict:
+        return {
+            "requested_nodes"   : self.requested_nodes,
+            "unique_nodes"      : self.released_nodes + len(self.__nodes),
+            "requested_texts"   : self.requested_texts,
+            "unique_texts"      : self.released_texts + len(self.__texts)
+        }
+
+    def write_statistics_to_log(self, logger: logging.Logger) -> None:
+        statistics : dict = self.get_statistics()
+
+        for kind in ("nodes", "texts"):
+            requested   : int = statistics[f"requested_{kind}"]
+            unique      : int = statistics[f"unique_{kind}"]
+            ratio : float = 1 - unique / requested if requested else 0
+
+            logger.info(f"Expression pool: {requested} {kind}, {unique} unique, {ratio:.1%} shared")
@@ -6,6 +6,8 @@ from VHDL.VHDLDeclaration import VHDLDeclaration
 
 @dataclass
 class VHDLStatement:
+    __slots__ = ('statement_class', 'parent', 'statement_name', 'behaviour_name', 'full_behaviour_name', 'agent_name')
+
     statement_class     : VHDLStatement # Variable for class reference
     parent              : VHDLStatement
 
@@ -33,6 +35,10 @@ class VHDLStatement:
     def from_tuple(statement_class: VHDLStatement, parent: VHDLStatement, info: Tuple[str, str, str, str]):
         return VHDLStatement(statement_class, parent, *info)
 
+    def get_info(self) -> Tuple[VHDLStatement, VHDLStatement, str, str, str, str]:
+        # The fields of this class, which the subclasses take over from their statement info (slotted nodes have no vars())
+        return (self.statement_class, self.parent, self.statement_name, self.behaviour_name, self.full_behaviour_name, self.agent_name)
+
     def get_root_statement(self) -> VHDLStatement:
         if self.parent.statement_class in (ProcessStatement, BlockStatement):
             return self.parent
@@ -42,11 +48,13 @@ class VHDLStatement:
 
 @dataclass
 class Entity(VHDLStatement):
+    __slots__ = ('generic', 'port')
+
     generic : List[VHDLDeclaration.Generic]
     port    : List[VHDLDeclaration.Port]
 
     def __init__(self, statement_info: VHDLStatement, generic: List[VHDLDeclaration.Generic], port: List[VHDLDeclaration.Port]):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.generic = generic
         self.port    = port
@@ -54,17 +62,21 @@ class Entity(VHDLStatement):
 
 @dataclass    
 class Architecture(VHDLStatement):
+    __slots__ = ('declarations', 'statements')
+
     declarations : List[VHDLDeclaration]
     statements   : List[VHDLStatement]
 
     def __init__(self, statement_info: VHDLStatement, declarations: List[VHDLDeclaration], statements: List[VHDLStatement]):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.declarations = declarations
         self.statements   = statements
 
 @dataclass
 class BlockStatement(VHDLStatement):
+    __slots__ = ('expression', 'expression_with_agents', 'block_header', 'declarations', 'statements')
+
     expression              : str
     expression_with_agents  : str
     block_header            : None
@@ -74,7 +86,7 @@ class BlockStatement(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, expression: str, expression_with_agents: str,
                 block_header: None, declarations: List[VHDLDeclaration], statements: List[VHDLStatement]):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.expression               = expression
         self.expression_with_agents   = expression_with_agents
@@ -85,6 +97,8 @@ class BlockStatement(VHDLStatement):
 
 @dataclass
 class ProcessStatement(VHDLStatement):
+    __slots__ = ('sensitivity_list', 'sensitivity_list_with_agents', 'declarations', 'statements')
+
     sensitivity_list                : List[str]
     sensitivity_list_with_agents    : List[str]
     declarations                    : List[VHDLDeclaration]
@@ -94,7 +108,7 @@ class ProcessStatement(VHDLStatement):
                 sensitivity_list_with_agents: List[str], 
                 declarations: List[VHDLDeclaration], statements: List[VHDLStatement]):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.sensitivity_list                = sensitivity_list
         self.sensitivity_list_with_agents    = sensitivity_list_with_agents
@@ -103,42 +117,38 @@ class ProcessStatement(VHDLStatement):
    
 @dataclass
 class ConcurrentProcedureCallStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ConcurrentAssertionStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ComponentInstantiationStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class GenerateStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ConcurrentBreakStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class SimultaneousStatement(VHDLStatement):
-    pass
+    __slots__ = ()
 
 @dataclass
 class SimpleSimultaneousStatement(SimultaneousStatement):
+    __slots__ = ('expression', 'expression_with_agents', 'tolerance_aspect')
+
     expression              : str
     expression_with_agents  : str
     tolerance_aspect        : None
 
     def __init__(self, statement_info: VHDLStatement, expression: str, expression_with_agents: str, tolerance_aspect: None):
-        super().__init__(
-            parent=statement_info.parent,
-            statement_name=statement_info.statement_name,
-            behaviour_name=statement_info.behaviour_name,
-            full_behaviour_name=statement_info.full_behaviour_name,
-            agent_name=statement_info.agent_name,
-        )
+        super().__init__(*statement_info.get_info())
 
         self.expression              = expression
         self.expression_with_agents  = expression_with_agents
@@ -147,6 +157,8 @@ class SimpleSimultaneousStatement(SimultaneousStatement):
 
 @dataclass
 class SimultaneousIfStatement(SimultaneousStatement):
+    __slots__ = ('condition', 'condition_with_agents', 'statements', 'elsif_condition', 'elsif_condition_with_agents', 'elsif_statements', 'else_statements')
+
     condition                       : str
     condition_with_agents           : str
     statements                      : List[SimultaneousStatement]
@@ -158,7 +170,7 @@ class SimultaneousIfStatement(SimultaneousStatement):
     def __init__(self, statement_info: VHDLStatement, condition: str, condition_with_agents: str, statements: List[SimultaneousStatement], elsif_condition: str, 
     elsif_condition_with_agents: str, elsif_statements: List[SimultaneousStatement], else_statements: List[SimultaneousStatement]):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.condition                       = condition
         self.condition_with_agents           = condition_with_agents
@@ -170,21 +182,25 @@ class SimultaneousIfStatement(SimultaneousStatement):
 
 @dataclass
 class SimultaneousCaseStatement(SimultaneousStatement):
+    __slots__ = ('expression', 'expression_with_agents')
+
     expression              : str
     expression_with_agents  : str
 
     def __init__(self, statement_info: VHDLStatement, expression: str, expression_with_agents: str):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.expression              = expression              
         self.expression_with_agents  = expression_with_agents  
 
 @dataclass
 class SimultaneousAlternative():
-    ...
+    __slots__ = ()
 
 @dataclass
 class WaitStatement(VHDLStatement):
+    __slots__ = ('sensitivity_list', 'sensitivity_list_with_agents', 'condition', 'condition_with_agents', 'timeout')
+
     sensitivity_list                : str
     sensitivity_list_with_agents    : str
     condition                       : str
@@ -196,7 +212,7 @@ class WaitStatement(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, sensitivity_list: str, sensitivity_list_with_agents: str, 
                  condition: str, condition_with_agents: str, timeout: None):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.sensitivity_list               = sensitivity_list
         self.sensitivity_list_with_agents   = sensitivity_list_with_agents
@@ -206,15 +222,19 @@ class WaitStatement(VHDLStatement):
 
 @dataclass
 class AssertionStatement(VHDLStatement):
+    __slots__ = ('assertion',)
+
     assertion : None
 
     def __init__(self, statement_info: VHDLStatement, assertion: None):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.assertion = assertion
 
 @dataclass
 class ReportStatement(VHDLStatement):
+    __slots__ = ('report_expression', 'report_expression_with_agents', 'severity_expression', 'severity_expression_with_agents')
+
     report_expression               : str
     report_expression_with_agents   : str
     severity_expression             : str
@@ -223,7 +243,7 @@ class ReportStatement(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, report_expression: str, report_expression_with_agents: str, 
                  severity_expression: str, severity_expression_with_agents: str):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.report_expression               = report_expression
         self.report_expression_with_agents   = report_expression_with_agents
@@ -233,6 +253,8 @@ class ReportStatement(VHDLStatement):
 
 @dataclass
 class SignalAssignment(VHDLStatement):
+    __slots__ = ('target', 'target_with_agent', 'delay_mechanism', 'waveform', 'waveform_with_agents')
+
     target                  : str
     target_with_agent       : str
     delay_mechanism         : str
@@ -242,7 +264,7 @@ class SignalAssignment(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, target: str, target_with_agent: str, 
                  delay_mechanism: str, waveform: str, waveform_with_agents: str):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.target                  = target
         self.target_with_agent       = target_with_agent
@@ -252,6 +274,8 @@ class SignalAssignment(VHDLStatement):
 
 @dataclass
 class ConditionalSignalAssignment(VHDLStatement):
+    __slots__ = ('target', 'target_with_agent', 'opts', 'conditional_waveforms')
+
     target                  : str
     target_with_agent       : str
     opts                    : str
@@ -260,7 +284,7 @@ class ConditionalSignalAssignment(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, target: str, target_with_agent: str, 
                  opts: str, conditional_waveforms: ConditionalWaveform):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.target                  = target
         self.target_with_agent       = target_with_agent
@@ -269,6 +293,8 @@ class ConditionalSignalAssignment(VHDLStatement):
 
 @dataclass
 class SelectedSignalAssignment(VHDLStatement):
+    __slots__ = ('target', 'target_with_agent', 'delay_mechanism', 'expression', 'expression_with_agents', 'selected_waveforms')
+
     target                  : str
     target_with_agent       : str
     delay_mechanism         : str
@@ -279,7 +305,7 @@ class SelectedSignalAssignment(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, target: str, target_with_agent: str, delay_mechanism: str,
                 expression : str, expression_with_agents: str, selected_waveforms: List[SelectedWaveform]):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.target                  = target
         self.target_with_agent       = target_with_agent
@@ -290,6 +316,8 @@ class SelectedSignalAssignment(VHDLStatement):
 
 @dataclass
 class SelectedWaveform:
+    __slots__ = ('waveform', 'waveform_with_agetns', 'choice', 'choice_with_agent')
+
     waveform                : str 
     waveform_with_agetns    : str
     choice                  : str
@@ -298,6 +326,8 @@ class SelectedWaveform:
 
 @dataclass
 class ConditionalWaveform:
+    __slots__ = ('waveform', 'waveform_with_agents', 'condition', 'condition_with_agents', 'conditional_waveforms')
+
     waveform                : str
     waveform_with_agents    : str
     condition               : str
@@ -306,6 +336,8 @@ class ConditionalWaveform:
 
 @dataclass
 class VariableAssignment(VHDLStatement):
+    __slots__ = ('target', 'target_with_agent', 'expression', 'expression_with_agents')
+
     target                  : str
     target_with_agent      : str
     expression              : str
@@ -314,7 +346,7 @@ class VariableAssignment(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, target: str, target_with_agent: str,
                 expression  : str, expression_with_agents: str):
 
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.target                  = target
         self.target_with_agent      = target_with_agent
@@ -323,6 +355,8 @@ class VariableAssignment(VHDLStatement):
 
 @dataclass
 class IfStatement(VHDLStatement):
+    __slots__ = ('condition', 'condition_with_agents', 'statements', 'elsif_condition', 'elsif_condition_with_agents', 'elsif_statements', 'else_statements')
+
     condition                       : str
     condition_with_agents           : str
     statements                      : List[VHDLStatement]
@@ -334,7 +368,7 @@ class IfStatement(VHDLStatement):
     def __init__(self, statement_info: VHDLStatement, condition: str, condition_with_agents: str, statements: List[VHDLStatement],
                 elsif_condition: str, elsif_condition_with_agents: str, elsif_statements: List[VHDLStatement], else_statements: List[VHDLStatement]):
         
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.condition                       = condition
         self.condition_with_agents           = condition_with_agents
@@ -346,12 +380,14 @@ class IfStatement(VHDLStatement):
 
 @dataclass
 class CaseStatement(VHDLStatement):
+    __slots__ = ('expression', 'expression_with_agents', 'case_alternatives')
+
     expression              : str
     expression_with_agents  : str
     case_alternatives       : List[CaseAlternative]
 
     def __init__(self, statement_info: VHDLStatement, expression: str, expression_with_agents: str, case_alternatives: List[CaseAlternative]):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.expression              = expression
         self.expression_with_agents  = expression_with_agents
@@ -359,12 +395,14 @@ class CaseStatement(VHDLStatement):
 
 @dataclass
 class CaseAlternative(VHDLStatement):
+    __slots__ = ('choices', 'choices_with_agents', 'statements')
+
     choices             : str
     choices_with_agents : str
     statements          : List[VHDLStatement]
 
     def __init__(self, statement_info: VHDLStatement, choices: str, choices_with_agents: str, statements: List[VHDLStatement]):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
         self.choices             = choices
         self.choices_with_agents = choices_with_agents
@@ -372,50 +410,52 @@ class CaseAlternative(VHDLStatement):
 
 @dataclass
 class LoopStatement(VHDLStatement):
+    __slots__ = ('iteration_scheme', 'statements')
+
     iteration_scheme    : IterationScheme
     statements          : List[VHDLStatement]
 
     def __init__(self, statement_info: VHDLStatement, iteration_scheme: IterationScheme, statements: List[VHDLStatement]):
-        super().__init__(**vars(statement_info))
+        super().__init__(*statement_info.get_info())
 
-        iteration_scheme    = iteration_scheme
-        statements          = statements
+        self.iteration_scheme    = iteration_scheme
+        self.statements          = statements
 
 @dataclass
 class IterationScheme():
-    pass
+    __slots__ = ()
 
 @dataclass
 class WhileScheme(IterationScheme):
+    __slots__ = ('condition', 'condition_with_agents')
+
     condition               : str
     condition_with_agents   : str
 
-    def __init__(self, statement_info: VHDLStatement, condition: str, condition_with_agents: str):
-        super().__init__(**vars(statement_info))
-
-        condition               = condition               
-        condition_with_agents   = condition_with_agents   
+    def __init__(self, condition: str, condition_with_agents: str):
+        self.condition               = condition
+        self.condition_with_agents   = condition_with_agents
 
 @dataclass
 class ForScheme(IterationScheme):
-    ...
+    __slots__ = ()
 
 @dataclass
 class NextStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ExitStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ReturnStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class BreakStatement(VHDLStatement):
-    ...
+    __slots__ = ()
 
 @dataclass
 class ProcedureCallStatement(VHDLStatement):
-    ...
+    __slots__ = ()
@@ -1,76 +1,110 @@
+from __future__ import annotations
+
 import os, sys
 import logging
+import argparse
+import functools
+
+from typing import List
 
 from Debug import Debug
+from ParserManager import ParserManager
+from PhaseTimer import PhaseTimer
+from DecisionProfiler import DecisionProfiler
+from BatchTranslator import BatchTranslator, BatchResult
+from TranslationCache import TranslationCache
+from InputLoader import InputLoader, Source
+
+from ResultCreators.ResultFile import ResultFile
+
+import Constants as const
+
+# The generated parser and lexer, the visitor and the result creators are imported
+# by the functions that translate, so --help and cache hits start without them
+
 
-from CustomVhdlVisitor import CustomVhdlVisitor
-from VHDL.VHDLStatements import *
-from VHDL.VHDLDeclaration import *
+#Get command line arguments
+def get_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="Translate VHDL code into .act, .behp and .env_descript files")
 
-from antlr4 import *
+    argument_parser.add_argument("paths", nargs="*", help=".vhd files, directories or glob patterns to translate")
+    argument_parser.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes for batch translation")
+    argument_parser.add_argument("--no-dfa-cache", action="store_true", help="do not load or save the ANTLR prediction DFA cache")
+    argument_parser.add_argument("--no-cache", action="store_true", help="always translate, do not use the translation cache")
+    argument_parser.add_argument("--trace", action="store_true", help="log every visited grammar rule (slow, for debugging)")
+    argument_parser.add_argument("--rule-statistics", action="store_true", help=f"write visit count and time per grammar rule to {const.RULE_STATISTICS_PATH} (use with --no-cache)")
+    argument_parser.add_argument("--phase-timing", action="store_true", help=f"write wall time and CPU time per translation phase and the peak memory of the process to {const.PHASE_TIMING_PATH}")
+    argument_parser.add_argument("--decision-profile", action="store_true", help=f"profile the parser decisions and write them to {const.DECISION_PROFILE_PATH} (slow, use with --no-cache)")
+    argument_parser.add_argument("--stream", action="store_true", help="write every design to the result files as soon as it is translated")
+    argument_parser.add_argument("--watch", action="store_true", help="keep running and translate the files again whenever their content changes")
+    argument_parser.add_argument("--serve", action="store_true", help="keep running and translate JSON line requests from stdin, replies go to stdout")
+    argument_parser.add_argument("--socket", metavar="PATH", help="like --serve, but accept requests on a Unix socket at PATH")
 
-from VHDL.VHDLData import VHDLData
-from ANTLR.vhdlLexer import vhdlLexer
-from ANTLR.vhdlParser import vhdlParser
+    arguments : argparse.Namespace = argument_parser.parse_args()
 
-from ResultCreators.ActionCreator import ActionCreator
-from ResultCreators.BehaviourCreator import BehaviourCreator
-from ResultCreators.EnvironmentCreator import EnvironmentCreator
+    if not arguments.paths and not (arguments.serve or arguments.socket):
+        argument_parser.error("the following arguments are required: paths")
 
+    return arguments
 
-class ASCIIFileStream(FileStream):
-    def __init__(self, file_name):
-        super().__init__(file_name, encoding='ascii')
+#Apply debug options, in the main process and in every batch worker
+def configure_debug(trace: bool, rule_statistics: bool, phase_timing: bool, decision_profile: bool) -> None:
+    Debug.set_trace(trace)
+    PhaseTimer.set_enabled(phase_timing)
+    DecisionProfiler.set_enabled(decision_profile)
 
-class UTF8FileStream(FileStream):
-    def __init__(self, file_name):
-        super().__init__(file_name, encoding='utf-8')
+    if rule_statistics:
+        from CustomVhdlVisitor import CustomVhdlVisitor
+        Debug.profile_visitor(CustomVhdlVisitor)
 
-#Get path of .vhd file from command line
-def get_filepath(output_log: logging.Logger) -> str:
+#Get paths of .vhd files from command line arguments
+def get_filepaths(output_log: logging.Logger, paths: List[str]) -> List[str]:
     try:
-        #D:\Work\Coding\VHDLTranslatorData\VHDL_Examples\hcms2905_driver_fsm.vhd
-        #D:\Work\Coding\VHDLTranslatorData\To_Test\CaseIfExample.vhd
-        #D:\Work\Coding\VHDLTranslatorData\To_Test\ConcurrentAssignmentExample.vhd
-        #D:\Work\Coding\VHDLTranslatorData\To_Test\TypeUsageExample.vhd
-        filepath = "D:\Work\Coding\VHDLTranslatorData\To_Test\CaseIfExample.vhd"
-        #filepath = sys.argv[1]
-        output_log.info(f"Reading file {filepath}")
-
-        if os.path.exists(filepath):
-            return filepath
+        filepaths : List[str] = BatchTranslator.collect_files(output_log, paths)
+
+        if filepaths:
+            output_log.info(f"{len(filepaths)} files found")
+            return filepaths
             
         output_log.error("Invalid path or file name")
-        sys.exit()
-
-    except IndexError:
-        output_log.error("Not enough arguments, file path expected")
-        sys.exit()
+        sys.exit(1)
         
     except Exception:
         output_log.error("Details:", exc_info=True)
-        sys.exit()
+        sys.exit(1)
   
 #Read .vhd file using ANTLR
-def translate_file(output_log : logging.Logger, filepath: str) -> VHDLData:
+def translate_file(output_log : logging.Logger, filepath: str, source: Source = None) -> VHDLData:
+    from antlr4 import CommonTokenStream
+    from ANTLR.vhdlLexer import vhdlLexer
+    from CustomVhdlVisitor import CustomVhdlVisitor
+
+    owns_source : bool = source is None
+
     try:
-        file_stream : FileStream = None
-        
-        encoding : str = Debug.detect_encoding(output_log, filepath)
+        if owns_source:
+            source = InputLoader.read_source(filepath)
 
-        if encoding == 'utf-8':
-            file_stream = UTF8FileStream(filepath)      # Use UTF-8 encoding
-        else:
-            file_stream = FileStream(filepath)          # Use ASCII encoding as default
+        input_stream : InputStream = InputLoader.get_input_stream(output_log, source)
 
-        lexer   = vhdlLexer(file_stream)
+        # The lexer takes the decision DFA of vhdlLexer when it is created, so the cache must be loaded first
+        ParserManager.load_pending_dfa_cache(output_log)
+
+        lexer   = vhdlLexer(input_stream)
         stream  = CommonTokenStream(lexer)
-        parser  = vhdlParser(stream)
-        
-        tree = parser.design_file()
+
+        with PhaseTimer.measure("lexing"):
+            stream.fill()
         
         custom_visitor : CustomVhdlVisitor = CustomVhdlVisitor()
-        custom_visitor.visit(tree)
+
+        if const.SPLIT_DESIGN_UNITS:
+            custom_visitor.visit_design_units(ParserManager.parse_design_units(output_log, stream))
+        else:
+            design_file : vhdlParser.Design_fileContext = ParserManager.parse_design_file(output_log, stream)
+
+            with PhaseTimer.measure("visiting"):
+                custom_visitor.visit(design_file)
         
         vhdlData       : VHDLData          = custom_visitor.get_vhdl_data()
         return vhdlData
@@ -78,6 +112,59 @@ def translate_file(output_log : logging.Logger, filepath: str) -> VHDLData:
     except Exception:
         output_log.error("Details:",exc_info=True)
 
+    finally:
+        if owns_source and source is not None:
+            InputLoader.close_source(source)
+
+#Read .vhd file using ANTLR and write every design to the result files right after it is visited
+def stream_file_to_result(output_log : logging.Logger, source: Source, result_path: str, creators: List[ResultFile]) -> bool:
+    from antlr4 import CommonTokenStream
+    from ANTLR.vhdlLexer import vhdlLexer
+    from CustomVhdlVisitor import CustomVhdlVisitor
+
+    try:
+        for creator in creators:
+            with PhaseTimer.measure(type(creator).__name__):
+                creator.open_result(result_path)
+
+        input_stream : InputStream = InputLoader.get_input_stream(output_log, source)
+
+        # The lexer takes the decision DFA of vhdlLexer when it is created, so the cache must be loaded first
+        ParserManager.load_pending_dfa_cache(output_log)
+
+        lexer   = vhdlLexer(input_stream)
+        stream  = CommonTokenStream(lexer)
+
+        with PhaseTimer.measure("lexing"):
+            stream.fill()
+
+        custom_visitor : CustomVhdlVisitor = CustomVhdlVisitor()
+
+        def write_design(design: VHDLDesign) -> None:
+            for creator in creators:
+                with PhaseTimer.measure(type(creator).__name__):
+                    creator.write_design(design)
+
+        custom_visitor.visit_design_units(ParserManager.parse_design_units(output_log, stream), write_design)
+
+        # The environment is written last, it needs the declarations and agents of all designs
+        vhdlData : VHDLData = custom_visitor.get_vhdl_data()
+
+        for creator in creators:
+            with PhaseTimer.measure(type(creator).__name__):
+                creator.close_result(vhdlData)
+
+    except Exception:
+        output_log.error("Details:", exc_info=True)
+
+        for creator in creators:
+            creator.abort_result()
+
+        return False
+
+    output_log.info("Streamed result status ... Success")
+    return True
+
 def get_result_path(output_log : logging.Logger, vhd_path: str) -> str:
     try:
         result_path = os.path.join(os.getcwd(), "result")   #get 'result' folder path in program directory
@@ -91,29 +178,152 @@ def get_result_path(output_log : logging.Logger, vhd_path: str) -> str:
     except Exception:
         output_log.error("Details:", exc_info=True)
 
-def main():
-    output_log : logging.Logger = Debug.get_logger("VHDLTranslator")
-    
+#Translate .vhd file and write result files
+#source and result_path are given by the translation server, for inline sources and replies
+#incremental keeps the design units in memory and translates only the changed ones next time, for watch and server mode
+def translate_to_result(output_log : logging.Logger, vhdl_path: str, use_cache: bool = const.USE_TRANSLATION_CACHE, stream: bool = const.STREAM_DESIGNS,
+                        source: Source = None, result_path: str = None, incremental: bool = False) -> bool:
+    output_log.info(f"Reading file {vhdl_path}")
+
+    if result_path is None:
+        result_path = get_result_path(output_log, vhdl_path)
+
+    translation_cache   : TranslationCache = None
+    cache_key           : str = None
+
+    vhdlData : VHDLData = None
+    success  : bool = False
+
+    if source is None:
+        with PhaseTimer.measure("reading"):
+            source = InputLoader.read_source(vhdl_path)     # read once, for the cache key and the lexer
+
     try:
-        vhdl_path : str = get_filepath(output_log)
+        if use_cache:
+            translation_cache = TranslationCache()
+            cache_key = translation_cache.get_key(source)
 
-        vhdlData = translate_file(output_log, vhdl_path)    
+            if translation_cache.load(output_log, cache_key, result_path):
+                return True
 
-        result_path = get_result_path(output_log, vhdl_path)
+        from ResultCreators.ActionCreator import ActionCreator
+        from ResultCreators.BehaviourCreator import BehaviourCreator
+        from ResultCreators.EnvironmentCreator import EnvironmentCreator
 
         action_creator      : ActionCreator = ActionCreator()
         behaviour_creator   : BehaviourCreator = BehaviourCreator()
         environment_creator : EnvironmentCreator = EnvironmentCreator()
-        
-        action_creator.create_result(result_path, vhdlData)
-        behaviour_creator.create_result(result_path, vhdlData)
-        environment_creator.create_result(result_path, vhdlData)
+
+        if incremental and const.SPLIT_DESIGN_UNITS:
+            from IncrementalTranslator import IncrementalTranslator
+
+            success = IncrementalTranslator.translate(output_log, vhdl_path, source, result_path, [action_creator, behaviour_creator, environment_creator])
+        elif stream and const.SPLIT_DESIGN_UNITS:
+            success = stream_file_to_result(output_log, source, result_path, [action_creator, behaviour_creator, environment_creator])
+        else:
+            vhdlData = translate_file(output_log, vhdl_path, source)
+
+    finally:
+        InputLoader.close_source(source)
+
+    if vhdlData is not None:
+        creator_results : List[bool] = []
+
+        for creator in (action_creator, behaviour_creator, environment_creator):
+            with PhaseTimer.measure(type(creator).__name__):
+                creator_results.append(creator.create_result(result_path, vhdlData))
+
+        success = all(creator_results)
+
+    if success and use_cache:
+        translation_cache.store(output_log, cache_key, result_path)
+
+    return success
+
+#Translate the files and every change to them until interrupted, returns the latest result of every file
+def watch(output_log : logging.Logger, paths: List[str], translate_function) -> List[BatchResult]:
+    from FileWatcher import FileWatcher
+
+    watcher = FileWatcher(output_log, paths, translate_function)
+    watcher.watch()
+
+    return [watcher.results[path] for path in sorted(watcher.results)]
+
+#Translate requests until stdin is closed or the socket server is stopped
+def serve(output_log : logging.Logger, arguments: argparse.Namespace, translate_function, use_dfa_cache: bool, configure_worker) -> None:
+    from TranslationServer import TranslationServer
+
+    server = TranslationServer(output_log, arguments.jobs, translate_function, get_result_path, use_dfa_cache, configure_worker)
+
+    if arguments.socket:
+        server.serve_socket(arguments.socket)
+    else:
+        server.serve_stdio(sys.stdin, sys.stdout)
+
+    # Only the workers parse, they saved their DFA when the pool was shut down
+    if use_dfa_cache:
+        ParserManager.collect_worker_dfa_caches(output_log, const.DFA_CACHE_PATH)
+
+def main():
+    arguments  : argparse.Namespace = get_arguments()
+    output_log : logging.Logger = Debug.get_logger("VHDLTranslator")
+
+    use_dfa_cache : bool = const.USE_DFA_CACHE and not arguments.no_dfa_cache
+    use_cache     : bool = const.USE_TRANSLATION_CACHE and not arguments.no_cache
+    stream        : bool = const.STREAM_DESIGNS or arguments.stream
+
+    configure_worker = functools.partial(configure_debug, const.TRACE_VISITS or arguments.trace, arguments.rule_statistics, arguments.phase_timing, arguments.decision_profile)
+    configure_worker()
+    
+    try:
+        if use_dfa_cache:
+            ParserManager.use_dfa_cache(const.DFA_CACHE_PATH)
+
+        # Watch and server mode run for long, they keep the design units of the files for the next translation
+        incremental : bool = arguments.watch or arguments.serve or bool(arguments.socket)
+
+        translate_function = functools.partial(translate_to_result, use_cache=use_cache, stream=stream, incremental=incremental)
+
+        if arguments.serve or arguments.socket:
+            serve(output_log, arguments, translate_function, use_dfa_cache, configure_worker)
+            return
+
+        if arguments.watch:
+            results : List[BatchResult] = watch(output_log, arguments.paths, translate_function)
+        else:
+            vhdl_paths : List[str] = get_filepaths(output_log, arguments.paths)
+
+            results : List[BatchResult] = BatchTranslator.translate_files(output_log, vhdl_paths, arguments.jobs, translate_function, use_dfa_cache, configure_worker)
+
+            if len(results) > 1:
+                BatchTranslator.write_summary(output_log, results)
         
     except Exception:
         output_log.error("Details:", exc_info=True)
-    else:
-        output_log.info("Code succesfully translated")
-        output_log.info("Check 'result' folder in program directory")
+        sys.exit(1)
+
+    if use_dfa_cache:
+        ParserManager.save_dfa_cache(output_log, const.DFA_CACHE_PATH)
+
+    if use_cache:
+        TranslationCache().evict(output_log)
+
+    ParserManager.write_statistics_to_log(output_log)
+
+    if arguments.rule_statistics:
+        Debug.write_rule_statistics(output_log, const.RULE_STATISTICS_PATH)
+
+    if arguments.decision_profile:
+        DecisionProfiler.write_report(output_log, const.DECISION_PROFILE_PATH)
+
+    if arguments.phase_timing:
+        PhaseTimer.write_report(output_log, const.PHASE_TIMING_PATH, {result.vhdl_path : result.phase_statistics for result in results})
+
+    if not all(result.success for result in results):
+        sys.exit(1)
+
+    output_log.info("Code succesfully translated")
+    output_log.info("Check 'result' folder in program directory")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()